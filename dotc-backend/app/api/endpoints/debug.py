@@ -2,7 +2,9 @@ from fastapi import APIRouter, Body, status, Depends, Request, HTTPException
 from enum import Enum
 
 from app.game.helpers.notificators import Notificator
-from ...dependencies.dependencies import get_notificator
+from app.websockets.interfaces import IConnectionManager
+from app.websockets.slow_consumers import WebSocketStats
+from ...dependencies.dependencies import get_notificator, get_websocket_manager
 
 
 # --- ENUM de tipos de notificación ---
@@ -117,3 +119,17 @@ async def trigger_notification(
         )
 
     return {"status": "ok", "type_triggered": notif_type.value}
+
+
+@router.get("/debug/websockets", response_model=WebSocketStats)
+async def websocket_stats(
+    manager: IConnectionManager = Depends(get_websocket_manager),
+):
+    """
+    Contadores de las colas de salida de los websockets, por partida:
+    profundidad, bytes pendientes, segundos desde el último envío exitoso,
+    desalojos, resyncs y mensajes descartados por la política de
+    consumidores lentos. En `lifecycle`, los sockets abiertos (lobby y
+    partidas), conexiones, reconexiones y sockets cosechados por silencio.
+    """
+    return manager.get_stats()
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body, Path, status, Depends
+from fastapi import APIRouter, Body, Path, Query, status, Depends
 from ...game.game_manager import GameManager
 from ...game.services.game_state_service import GameStateService
 from ...dependencies.dependencies import (
@@ -7,11 +7,13 @@ from ...dependencies.dependencies import (
 )
 
 from ...api.schemas import (
+    ANY_GAME_STATUS,
     CreateGameRequest,
     CreateGameResponse,
     LeaveGameRequest,
     LeaveGameResponse,
     ListGamesResponse,
+    LobbyFilter,
     JoinGameRequest,
     JoinGameResponse,
     StartGameResponse,
@@ -28,12 +30,14 @@ from ...api.schemas import (
     GeneralActionResponse,
     DrawCardRequest,
     ConsultDeckSizeResponse,
+    LegalMovesResponse,
     VoteRequest,
     ExchangeCardRequest,
 )
 
 from ...domain.models import PlayerInGame
-from typing import List
+from ...domain.enums import GameStatus
+from typing import List, Literal, Optional, Union
 
 # Router para el módulo de partidas
 router = APIRouter(prefix="/games", tags=["Games"])
@@ -52,9 +56,37 @@ async def create_game(
 
 
 @router.get("", response_model=ListGamesResponse)
-def list_games(game_manager: GameManager = Depends(get_game_manager)):
-    """Lista todas las partidas que están en estado LOBBY."""
-    return game_manager.list_games()
+def list_games(
+    game_status: Union[GameStatus, Literal["ANY"]] = Query(
+        GameStatus.LOBBY,
+        alias="status",
+        description=f"Estado de la partida ({ANY_GAME_STATUS}: cualquiera).",
+    ),
+    name_prefix: Optional[str] = Query(
+        None, description="Comienzo del nombre (sin distinguir mayúsculas)."
+    ),
+    has_free_seats: Optional[bool] = Query(
+        None, description="Solo partidas con (o sin) lugares libres."
+    ),
+    cursor: Optional[int] = Query(
+        None, description="`next_cursor` de la página anterior."
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=200, description="Tamaño de página (sin él, todas)."
+    ),
+    game_manager: GameManager = Depends(get_game_manager),
+):
+    """
+    Lista las partidas del lobby (por defecto, las que están en LOBBY).
+    Sin `limit` devuelve todas, como siempre; con `limit`, una página y
+    el `next_cursor` para pedir la siguiente.
+    """
+    filters = LobbyFilter(
+        status=None if game_status == ANY_GAME_STATUS else game_status,
+        name_prefix=name_prefix,
+        has_free_seats=has_free_seats,
+    )
+    return game_manager.list_games(filters, cursor, limit)
 
 
 @router.post("/{game_id}/join", response_model=JoinGameResponse)
@@ -127,6 +159,23 @@ def get_player_secrets(
     return game_manager.get_player_secrets(request)
 
 
+@router.get(
+    "/{game_id}/players/{player_id}/legal-moves",
+    response_model=LegalMovesResponse,
+)
+def get_legal_moves(
+    game_id: int = Path(...),
+    player_id: int = Path(...),
+    game_manager: GameManager = Depends(get_game_manager),
+):
+    """
+    Lista los sets, agregados a sets y eventos que el jugador puede jugar
+    ahora con su mano (vacía fuera de su turno o con una acción en curso).
+    """
+    request = PlayerActionRequest(game_id=game_id, player_id=player_id)
+    return game_manager.get_legal_moves(request)
+
+
 @router.get(
     "/{game_id}/size_deck",
     response_model=ConsultDeckSizeResponse,
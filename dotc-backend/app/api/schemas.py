@@ -1,5 +1,5 @@
 from datetime import date
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Literal
 from enum import Enum
 
@@ -317,14 +317,51 @@ class GameLobbyInfo(BaseModel):  # TODO: deberia ser una response?
     game_status: GameStatus
 
 
+# Valor de `status` en GET /api/games para listar partidas en cualquier estado
+ANY_GAME_STATUS = "ANY"
+
+
+class LobbyFilter(BaseModel):
+    """
+    Filtros del listado del lobby (GET /api/games y /ws/mainscreen).
+    Un campo en None no filtra.
+    - status: Optional[GameStatus]
+    - name_prefix: Optional[str] (sin distinguir mayúsculas)
+    - has_free_seats: Optional[bool]
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    status: Optional[GameStatus] = None
+    name_prefix: Optional[str] = None
+    has_free_seats: Optional[bool] = None
+
+    def matches(self, game: GameLobbyInfo) -> bool:
+        """Indica si la partida pasa los filtros (misma regla que la query)."""
+        if self.status is not None and game.game_status != self.status:
+            return False
+        if self.name_prefix and not game.name.lower().startswith(
+            self.name_prefix.lower()
+        ):
+            return False
+        if self.has_free_seats is not None:
+            free = game.player_count < game.max_players
+            if free != self.has_free_seats:
+                return False
+        return True
+
+
 class ListGamesResponse(GeneralActionResponse):
     """
     Respuesta con el listado de partidas disponibles en el lobby.
     - detail: Optional[str]
-    - games: List[GameLobbyInfo]
+    - games: List[GameLobbyInfo] (ordenadas por id)
+    - next_cursor: Optional[int] (pasarlo como `cursor` para la página
+      siguiente; None si no hay más)
     """
 
     games: List[GameLobbyInfo]
+    next_cursor: Optional[int] = None
 
 
 class GameStateResponse(GeneralActionResponse):
@@ -367,6 +404,35 @@ class PlayerSecretsResponse(GeneralActionResponse):
     secrets: Optional[List[SecretCard]]
 
 
+class LegalMove(BaseModel):
+    """
+    Una jugada que el jugador puede hacer ahora con las cartas de su mano.
+    Se manda tal cual a la acción indicada (HTTP o RPC), agregando los
+    objetivos que pida el efecto.
+    - action: str ("play" o "play-nsf", como en las acciones RPC)
+    - action_type: PlayCardActionType
+    - card_ids: List[int]
+    - target_set_id: Optional[int] # solo en ADD_TO_EXISTING_SET
+    - effect: Optional[str] # efecto que dispara (None para NSF)
+    """
+
+    action: str
+    action_type: PlayCardActionType
+    card_ids: List[int]
+    target_set_id: Optional[int] = None
+    effect: Optional[str] = None
+
+
+class LegalMovesResponse(GeneralActionResponse):
+    """
+    Respuesta con las jugadas legales de un jugador en el estado actual.
+    - detail: Optional[str]
+    - moves: List[LegalMove]
+    """
+
+    moves: List[LegalMove]
+
+
 class GetCurrentTurnResponse(GeneralActionResponse):
     """
     Respuesta que indica el ID del jugador que tiene el turno actual.
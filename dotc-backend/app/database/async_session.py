@@ -0,0 +1,150 @@
+"""
+Capa asíncrona de la base de datos (SQLAlchemy AsyncSession + aiosqlite).
+
+Los servicios hablan con la BD a través de IQueryManager / ICommandManager,
+cuyas firmas son síncronas. En lugar de duplicar las dos implementaciones,
+las mismas clases concretas (DatabaseQueryManager / DatabaseCommandManager)
+se montan sobre la `sync_session` de una AsyncSession con driver aiosqlite.
+
+Para que cada viaje a la BD libere el event loop en vez de bloquearlo, la
+request HTTP completa corre dentro de un greenlet (`GreenletBridgeMiddleware`):
+cada `execute`/`commit` del driver se "awaitea" contra el loop mediante
+`await_only`, exactamente igual que lo hace internamente `AsyncSession`.
+
+Los endpoints `def` (síncronos) que FastAPI ejecuta en el threadpool no
+están dentro del greenlet; para ellos `GreenletRoutingSession` enruta la
+conexión al engine síncrono (pysqlite) sobre el mismo archivo.
+"""
+
+import os
+from typing import Any, Awaitable, Coroutine, TypeVar
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.util.concurrency import await_only, greenlet_spawn, in_greenlet
+
+from .engine_settings import get_db_echo, install_sqlite_pragmas
+from .orm_models import SQLITE_SETTINGS, engine
+
+_T = TypeVar("_T")
+
+# --- Selección del driver ---
+# "sqlite" (por defecto): Session síncrona clásica sobre pysqlite.
+# "aiosqlite": AsyncSession sobre aiosqlite, con IO no bloqueante.
+DB_DRIVER_ENV = "DOTC_DB_DRIVER"
+SYNC_DRIVER = "sqlite"
+ASYNC_DRIVER = "aiosqlite"
+
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./sistema.db"
+
+
+def get_db_driver() -> str:
+    """Devuelve el driver de BD configurado por variable de entorno."""
+    return os.getenv(DB_DRIVER_ENV, SYNC_DRIVER).lower()
+
+
+# ═══════════════════════════════════════════════════════════
+# 🔀 SESIÓN CON ENRUTAMIENTO SEGÚN CONTEXTO
+# ═══════════════════════════════════════════════════════════
+
+
+class GreenletRoutingSession(Session):
+    """
+    Session síncrona que elige el engine según dónde se ejecuta:
+    - Dentro del puente de greenlets -> engine async (aiosqlite).
+    - Fuera (threadpool de endpoints `def`) -> engine sync (pysqlite).
+    El engine sync de respaldo viaja en `info["sync_bind"]`.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw) -> Any:
+        if in_greenlet():
+            return super().get_bind(mapper, clause=clause, **kw)
+        return self.info["sync_bind"]
+
+
+def make_async_sessionmaker(
+    async_engine: AsyncEngine, sync_engine: Engine
+) -> async_sessionmaker:
+    """Crea una fábrica de AsyncSession cuya sync_session sabe enrutarse."""
+    return async_sessionmaker(
+        bind=async_engine,
+        sync_session_class=GreenletRoutingSession,
+        autoflush=False,
+        info={"sync_bind": sync_engine},
+    )
+
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    echo=get_db_echo(),
+)
+install_sqlite_pragmas(async_engine.sync_engine, SQLITE_SETTINGS)
+AsyncSessionLocal = make_async_sessionmaker(async_engine, engine)
+
+
+# ═══════════════════════════════════════════════════════════
+# 🌉 PUENTE CORRUTINA <-> GREENLET
+# ═══════════════════════════════════════════════════════════
+
+
+class _Yielded:
+    """Re-emite hacia el event loop lo que la corrutina interna cedió."""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __await__(self):
+        return (yield self.value)
+
+
+def _drive(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Ejecuta `coro` paso a paso dentro del greenlet actual. Cada vez que
+    la corrutina cede (un Future, un sleep(0)...), se lo entregamos al
+    loop con `await_only` y le devolvemos el resultado (o la excepción).
+    """
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            if error is not None:
+                yielded = coro.throw(error)
+            else:
+                yielded = coro.send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            value, error = await_only(_Yielded(yielded)), None
+        except BaseException as e:
+            value, error = None, e
+
+
+async def run_in_greenlet(awaitable: Awaitable[_T]) -> _T:
+    """
+    Corre una corrutina dentro de un greenlet de SQLAlchemy, de modo que
+    el IO síncrono de la Session sobre aiosqlite no bloquee el loop.
+    """
+    return await greenlet_spawn(_drive, awaitable.__await__())
+
+
+class GreenletBridgeMiddleware:
+    """
+    Middleware ASGI que ejecuta cada request HTTP dentro del puente de
+    greenlets. Solo se instala con DOTC_DB_DRIVER=aiosqlite: con el driver
+    sync no hay nada que awaitear.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await run_in_greenlet(self.app(scope, receive, send))
@@ -1,11 +1,14 @@
 from typing import Any, List, Optional, cast
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import update
+from sqlalchemy import bindparam, delete, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.api.schemas import PlayCardRequest
 
 from .interfaces import ICommandManager, IQueryManager
+from . import unit_of_work
+from .unit_of_work import UnitOfWork, get_unit_of_work
 from .orm_models import (
     GameTable,
     PendingActionTable,
@@ -13,13 +16,14 @@ from .orm_models import (
     CardTable,
     SecretCardTable,
     PlayerInGameTable,
+    VoteTable,
     GameStatus,
     CardLocation,
     CardType,
 )
 
 # Importa los modelos y Enums necesarios para las firmas
-from ..domain.models import Card, Avatar, PlayerRole
+from ..domain.models import Card, CardMove, Avatar, PlayerRole, SecretAssignment
 from ..domain.enums import ResponseStatus, GameActionState
 
 """
@@ -47,6 +51,18 @@ class DatabaseCommandManager(ICommandManager):
         self.queries = queries
         self.session: Session = cast(Any, queries).session
 
+    # ═══════════════════════════════════════════════════════════
+    # 🧾 UNIDAD DE TRABAJO
+    # ═══════════════════════════════════════════════════════════
+
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Devuelve la unidad de trabajo de la sesión. Dentro de un
+        `with commands.unit_of_work():` los commands no commitean: se hace
+        un único commit al salir, o rollback de todo si hubo una excepción.
+        """
+        return get_unit_of_work(self.session)
+
     # ═══════════════════════════════════════════════════════════
     # 👤 COMMANDS DE JUGADORES (PlayerTable)
     # ═══════════════════════════════════════════════════════════
@@ -62,11 +78,11 @@ class DatabaseCommandManager(ICommandManager):
                 player_avatar=avatar,
             )
             self.session.add(db_player)
-            self.session.commit()
+            self._commit()
             self.session.refresh(db_player)
             return cast(int, db_player.player_id)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al crear un nuevo jugador: {e}")
             return None
 
@@ -78,10 +94,10 @@ class DatabaseCommandManager(ICommandManager):
                 return ResponseStatus.PLAYER_NOT_FOUND
 
             self.session.delete(jugador_a_borrar)
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al eliminar el jugador: {e}")
             return ResponseStatus.ERROR
 
@@ -98,11 +114,11 @@ class DatabaseCommandManager(ICommandManager):
 
             jugador.player_role = role
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al setear el rol: {e}")
             return ResponseStatus.ERROR
 
@@ -117,11 +133,11 @@ class DatabaseCommandManager(ICommandManager):
 
             jugador.social_disgrace = is_disgraced
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al setear el rol: {e}")
             return ResponseStatus.ERROR
 
@@ -159,12 +175,12 @@ class DatabaseCommandManager(ICommandManager):
             )
 
             self.session.add(host_association)
-            self.session.commit()
+            self._commit()
             self.session.refresh(db_game)
 
             return cast(int, db_game.game_id)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al crear la partida: {e}")
             return None
 
@@ -174,10 +190,10 @@ class DatabaseCommandManager(ICommandManager):
             if not partida_a_borrar:
                 return ResponseStatus.GAME_NOT_FOUND
             self.session.delete(partida_a_borrar)
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al eliminar la partida: {e}")
             return ResponseStatus.ERROR
 
@@ -196,10 +212,10 @@ class DatabaseCommandManager(ICommandManager):
                 player_id=player_id, game_id=game_id
             )
             self.session.add(player_in_game)
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error en add_player_to_game: {e}")
             return ResponseStatus.ERROR
 
@@ -215,10 +231,10 @@ class DatabaseCommandManager(ICommandManager):
                 return ResponseStatus.PLAYER_NOT_IN_GAME
 
             self.session.delete(player_in_game_to_remove)
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error en remove_player_from_game: {e}")
             return ResponseStatus.ERROR
 
@@ -233,10 +249,10 @@ class DatabaseCommandManager(ICommandManager):
 
             partida.game_status = new_status
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al cambiar el estado de la partida: {e}")
             return ResponseStatus.ERROR
 
@@ -249,10 +265,10 @@ class DatabaseCommandManager(ICommandManager):
 
             partida.current_player = player_id
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al setear el turno: {e}")
             return ResponseStatus.ERROR
 
@@ -287,7 +303,7 @@ class DatabaseCommandManager(ICommandManager):
 
             # 2. Añadimos, confirmamos y refrescamos.
             self.session.add(db_card)
-            self.session.commit()
+            self._commit()
             self.session.refresh(db_card)
 
             # 3. Devolvemos el 'card_id' que la BD acaba de generar.
@@ -295,7 +311,7 @@ class DatabaseCommandManager(ICommandManager):
             return cast(int, db_card.card_id)
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             # Cambié el mensaje de error para que sea más útil
             print(f"Error al crear la carta: {e}")
             return None
@@ -327,12 +343,12 @@ class DatabaseCommandManager(ICommandManager):
                 self.session.bulk_insert_mappings(
                     CardTable.__mapper__, card_mappings
                 )
-                self.session.commit()
+                self._commit()
 
             return ResponseStatus.OK
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error en create_deck_for_game: {e}")
             return ResponseStatus.ERROR
 
@@ -354,11 +370,62 @@ class DatabaseCommandManager(ICommandManager):
             carta.player_id = owner_id
             carta.set_id = set_id
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
             print(f"Error al mover la carta: {e}")
-            self.session.rollback()
+            self._rollback()
+            return ResponseStatus.ERROR
+
+    def move_cards(
+        self, game_id: int, moves: List[CardMove]
+    ) -> ResponseStatus:
+        """
+        Mueve varias cartas con un único UPDATE ejecutado en lote
+        (executemany), en vez de un SELECT + UPDATE + commit por carta.
+        El WHERE incluye el game_id: si alguna carta no es de la partida,
+        el rowcount no cierra y se revierte todo el lote.
+        """
+        if not moves:
+            return ResponseStatus.OK
+        try:
+            stmt = (
+                update(CardTable)
+                .where(
+                    CardTable.card_id == bindparam("b_card_id"),
+                    CardTable.game_id == bindparam("b_game_id"),
+                )
+                .values(
+                    location=bindparam("b_location"),
+                    player_id=bindparam("b_owner_id"),
+                    set_id=bindparam("b_set_id"),
+                    # position=None conserva la posición actual de la carta
+                    position=func.coalesce(
+                        bindparam("b_position"), CardTable.position
+                    ),
+                )
+            )
+            params = [
+                {
+                    "b_card_id": move.card_id,
+                    "b_game_id": game_id,
+                    "b_location": move.location,
+                    "b_owner_id": move.owner_id,
+                    "b_set_id": move.set_id,
+                    "b_position": move.position,
+                }
+                for move in moves
+            ]
+            result = self.session.connection().execute(stmt, params)
+            if result.rowcount != len(moves):
+                self._rollback()
+                return ResponseStatus.CARD_NOT_FOUND
+
+            self._commit()
+            return ResponseStatus.OK
+        except Exception as e:
+            print(f"Error al mover las cartas en lote: {e}")
+            self._rollback()
             return ResponseStatus.ERROR
 
     def update_card_position(
@@ -372,11 +439,11 @@ class DatabaseCommandManager(ICommandManager):
 
             carta.position = new_position
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
             print(f"Error al cambiar la posicion de la carta: {e}")
-            self.session.rollback()
+            self._rollback()
             return ResponseStatus.ERROR
 
     def update_cards_to_set(
@@ -405,15 +472,15 @@ class DatabaseCommandManager(ICommandManager):
 
             # Debe asegurarse de que todas las cartas requeridas fueron actualizadas (atomicidad)
             if result.rowcount != len(card_ids):
-                self.session.rollback()
+                self._rollback()
                 return (
                     ResponseStatus.INVALID_ACTION
                 )  # Algo falló (ej. el jugador no tenía todas las cartas)
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al crear el set de cartas: {e}")
             return ResponseStatus.ERROR
 
@@ -426,11 +493,11 @@ class DatabaseCommandManager(ICommandManager):
             if not card:
                 return ResponseStatus.CARD_NOT_FOUND
             card.set_id = target_set_id
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al setear el set de la carta: {e}")
             return ResponseStatus.ERROR
 
@@ -450,10 +517,10 @@ class DatabaseCommandManager(ICommandManager):
                 .values(set_id=new_set_id)
             )
             self.session.execute(stmt)
-            self.session.commit()
+            self._commit()
             return new_set_id
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al crear el set: {e}")
             return -1
 
@@ -468,9 +535,9 @@ class DatabaseCommandManager(ICommandManager):
                 .values(set_id=set_id)
             )
             self.session.execute(stmt)
-            self.session.commit()
+            self._commit()
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al agregar la carta al set: {e}")
 
     def steal_set(self, set_id: int, new_owner_id: int, game_id: int) -> None:
@@ -484,9 +551,9 @@ class DatabaseCommandManager(ICommandManager):
                 .values(player_id=new_owner_id)
             )
             self.session.execute(stmt)
-            self.session.commit()
+            self._commit()
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al robar el set: {e}")
 
     # ═══════════════════════════════════════════════════════════
@@ -509,16 +576,71 @@ class DatabaseCommandManager(ICommandManager):
             )
 
             self.session.add(db_secret)
-            self.session.commit()
+            self._commit()
             self.session.refresh(db_secret)
 
             return cast(int, db_secret.secret_id)
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al crear el secreto: {e}")
             return None
 
+    def deal_secrets(
+        self, game_id: int, assignments: List[SecretAssignment]
+    ) -> ResponseStatus:
+        """
+        Asigna los roles (un UPDATE ejecutado en lote) e inserta todos los
+        secretos (bulk_insert_mappings) con un único commit, igual que
+        create_deck_for_game con las cartas.
+        """
+        if not assignments:
+            return ResponseStatus.OK
+        try:
+            stmt = (
+                update(PlayerInGameTable)
+                .where(
+                    PlayerInGameTable.game_id == bindparam("b_game_id"),
+                    PlayerInGameTable.player_id == bindparam("b_player_id"),
+                )
+                .values(player_role=bindparam("b_role"))
+            )
+            result = self.session.connection().execute(
+                stmt,
+                [
+                    {
+                        "b_game_id": game_id,
+                        "b_player_id": assignment.player_id,
+                        "b_role": assignment.role,
+                    }
+                    for assignment in assignments
+                ],
+            )
+            if result.rowcount != len(assignments):
+                self._rollback()
+                return ResponseStatus.PLAYER_NOT_FOUND
+
+            secret_mappings = [
+                {
+                    "game_id": game_id,
+                    "player_id": assignment.player_id,
+                    "role": role,
+                    "is_revealed": False,
+                }
+                for assignment in assignments
+                for role in assignment.secrets
+            ]
+            self.session.bulk_insert_mappings(
+                SecretCardTable.__mapper__, secret_mappings
+            )
+
+            self._commit()
+            return ResponseStatus.OK
+        except Exception as e:
+            self._rollback()
+            print(f"Error al repartir los secretos: {e}")
+            return ResponseStatus.ERROR
+
     def reveal_secret_card(
         self, secret_id: int, game_id: int, is_revealed: bool
     ) -> ResponseStatus:
@@ -533,11 +655,11 @@ class DatabaseCommandManager(ICommandManager):
 
             secreto.is_revealed = is_revealed
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
 
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al setear el revelado del secreto: {e}")
             return ResponseStatus.ERROR
 
@@ -561,10 +683,10 @@ class DatabaseCommandManager(ICommandManager):
             if not secret:
                 return ResponseStatus.ERROR
             secret.player_id = new_owner_id
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al cambiar el propietario del secreto: {e}")
             return ResponseStatus.ERROR
 
@@ -593,12 +715,12 @@ class DatabaseCommandManager(ICommandManager):
                 )
             )
             result = self.session.execute(stmt)
-            self.session.commit()
+            self._commit()
             if result.rowcount == 0:
                 return ResponseStatus.ERROR
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al setear el estado de acción del juego: {e}")
             return ResponseStatus.ERROR
 
@@ -617,12 +739,12 @@ class DatabaseCommandManager(ICommandManager):
                 )
             )
             result = self.session.execute(stmt)
-            self.session.commit()
+            self._commit()
             if result.rowcount == 0:
                 return ResponseStatus.ERROR
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al limpiar el estado de acción del juego: {e}")
             return ResponseStatus.ERROR
 
@@ -630,6 +752,14 @@ class DatabaseCommandManager(ICommandManager):
     # 🔧 HELPERS PRIVADOS (para uso interno de los comandos)
     # ═══════════════════════════════════════════════════════════
 
+    def _commit(self) -> None:
+        """Commit, o solo flush si hay una unidad de trabajo abierta."""
+        unit_of_work.commit(self.session)
+
+    def _rollback(self) -> None:
+        """Rollback; si hay una unidad de trabajo abierta, la invalida."""
+        unit_of_work.rollback(self.session)
+
     def _get_game_by_id(self, game_id: int) -> Optional[GameTable]:
         return (
             self.session.query(GameTable)
@@ -691,14 +821,69 @@ class DatabaseCommandManager(ICommandManager):
                 .values(pending_saga=saga_data)
             )
             self.session.execute(stmt)
-            self.session.commit()
+            self._commit()
             print(
                 f"Saga pendiente actualizada para la partida {game_id}: {saga_data}"
             )
             return ResponseStatus.OK
         except Exception as e:
             print(f"Error en update_pending_saga: {e}")
-            self.session.rollback()
+            self._rollback()
+            return ResponseStatus.ERROR
+
+    # ═══════════════════════════════════════════════════════════
+    # 🗳️ COMMANDS DE VOTACIONES (VoteTable)
+    # ═══════════════════════════════════════════════════════════
+
+    def cast_vote(
+        self,
+        game_id: int,
+        round_id: int,
+        voter_id: int,
+        voted_player_id: Optional[int],
+    ) -> ResponseStatus:
+        """
+        Registra un voto con un único INSERT. Si el jugador ya votó en la
+        ronda, la unique constraint descarta la fila (ON CONFLICT DO NOTHING)
+        y se devuelve ALREADY_VOTED sin tocar el voto original.
+        """
+        try:
+            stmt = (
+                sqlite_insert(VoteTable)
+                .values(
+                    game_id=game_id,
+                    round_id=round_id,
+                    voter_id=voter_id,
+                    voted_player_id=voted_player_id,
+                )
+                .on_conflict_do_nothing(
+                    index_elements=["game_id", "round_id", "voter_id"]
+                )
+            )
+            result = cast(Any, self.session.execute(stmt))
+            if result.rowcount == 0:
+                return ResponseStatus.ALREADY_VOTED
+            self._commit()
+            return ResponseStatus.OK
+        except Exception as e:
+            print(f"Error en cast_vote: {e}")
+            self._rollback()
+            return ResponseStatus.ERROR
+
+    def clear_votes(self, game_id: int, round_id: int) -> ResponseStatus:
+        """Borra los votos de una ronda ya resuelta."""
+        try:
+            self.session.execute(
+                delete(VoteTable).where(
+                    VoteTable.game_id == game_id,
+                    VoteTable.round_id == round_id,
+                )
+            )
+            self._commit()
+            return ResponseStatus.OK
+        except Exception as e:
+            print(f"Error en clear_votes: {e}")
+            self._rollback()
             return ResponseStatus.ERROR
         
     # ═══════════════════════════════════════════════════════════
@@ -718,7 +903,7 @@ class DatabaseCommandManager(ICommandManager):
 
             if len(cards_to_link) != len(request.card_ids):
                 # Si no encontramos todas las cartas, algo está mal.
-                self.session.rollback()
+                self._rollback()
                 return ResponseStatus.CARD_NOT_FOUND
 
             # Creamos la acción pendiente
@@ -738,10 +923,10 @@ class DatabaseCommandManager(ICommandManager):
             )
             
             self.session.add(new_action)
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al crear la acción pendiente: {e}")
             return ResponseStatus.ERROR
 
@@ -758,10 +943,10 @@ class DatabaseCommandManager(ICommandManager):
                 action.responses_count = 0 
                 action.last_action_player_id = player_id
 
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al incrementar las respuestas NSF: {e}")
             return ResponseStatus.ERROR
 
@@ -782,9 +967,9 @@ class DatabaseCommandManager(ICommandManager):
                 self.session.query(PendingActionTable).filter_by(
                     game_id=game_id).delete()
             
-            self.session.commit()
+            self._commit()
             return ResponseStatus.OK
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             print(f"Error al limpiar la acción pendiente: {e}")
             return ResponseStatus.ERROR       
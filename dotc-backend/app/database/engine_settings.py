@@ -0,0 +1,133 @@
+"""
+Ajustes de los engines SQLite (pragmas y echo), configurables por entorno.
+
+Por defecto SQLite usa journal en modo DELETE y `synchronous=FULL`: cada
+commit hace varios fsync y un escritor bloquea a todos los lectores. Con
+los endpoints `def` corriendo en el threadpool eso termina en
+`database is locked`. Los pragmas se aplican en el evento "connect" de
+cada engine, así valen para TODAS las conexiones del pool (sync y
+aiosqlite).
+
+Variables de entorno:
+- DOTC_SQLITE_PROFILE: perfil base ("tuned" por defecto, "durable" o
+  "legacy" para el comportamiento anterior, sin pragmas).
+- DOTC_SQLITE_<PRAGMA>: pisa un pragma puntual del perfil, p. ej.
+  DOTC_SQLITE_SYNCHRONOUS=FULL o DOTC_SQLITE_BUSY_TIMEOUT=10000.
+- DOTC_DB_ECHO: "1"/"true" para loguear el SQL (apagado por defecto).
+"""
+
+import os
+from typing import Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Engine, event
+
+PROFILE_ENV = "DOTC_SQLITE_PROFILE"
+PRAGMA_ENV_PREFIX = "DOTC_SQLITE_"
+ECHO_ENV = "DOTC_DB_ECHO"
+
+DEFAULT_PROFILE = "tuned"
+
+
+class SQLiteSettings(BaseModel):
+    """
+    Pragmas a aplicar en cada conexión nueva. None = no tocarlo (queda el
+    valor por defecto de SQLite).
+    - busy_timeout: ms que un escritor espera el lock antes de fallar.
+    - journal_mode: WAL permite lectores concurrentes con un escritor.
+    - synchronous: NORMAL en WAL solo hace fsync en los checkpoints.
+    - mmap_size: bytes del archivo mapeados en memoria para lecturas.
+    - cache_size: páginas (>0) o KiB (<0) de caché por conexión.
+    - temp_store: dónde van las tablas/índices temporales.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    busy_timeout: Optional[int] = None
+    journal_mode: Optional[
+        Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+    ] = None
+    synchronous: Optional[Literal["OFF", "NORMAL", "FULL", "EXTRA"]] = None
+    mmap_size: Optional[int] = None
+    cache_size: Optional[int] = None
+    temp_store: Optional[Literal["DEFAULT", "FILE", "MEMORY"]] = None
+
+    def pragmas(self) -> List[Tuple[str, object]]:
+        """
+        Pares (pragma, valor) a ejecutar, en orden de declaración:
+        busy_timeout va primero para que el cambio a WAL también espere.
+        """
+        return [
+            (name, value)
+            for name, value in self.model_dump().items()
+            if value is not None
+        ]
+
+
+PROFILES: Dict[str, SQLiteSettings] = {
+    # Comportamiento anterior: sin pragmas.
+    "legacy": SQLiteSettings(),
+    # WAL + synchronous=NORMAL: un commit no hace fsync (puede perderse la
+    # última transacción ante un corte de luz, nunca se corrompe la BD).
+    "tuned": SQLiteSettings(
+        busy_timeout=5000,
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        temp_store="MEMORY",
+    ),
+    # Igual que "tuned" pero con fsync en cada commit.
+    "durable": SQLiteSettings(
+        busy_timeout=5000,
+        journal_mode="WAL",
+        synchronous="FULL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        temp_store="MEMORY",
+    ),
+}
+
+
+def load_sqlite_settings() -> SQLiteSettings:
+    """Arma los ajustes a partir del perfil y los overrides del entorno."""
+    profile = os.getenv(PROFILE_ENV, DEFAULT_PROFILE).lower()
+    if profile not in PROFILES:
+        raise ValueError(
+            f"{PROFILE_ENV}={profile!r} no existe. "
+            f"Perfiles válidos: {', '.join(PROFILES)}"
+        )
+    values = PROFILES[profile].model_dump()
+    for name in SQLiteSettings.model_fields:
+        override = os.getenv(PRAGMA_ENV_PREFIX + name.upper())
+        if override is not None:
+            values[name] = override.upper() if override.isalpha() else override
+    return SQLiteSettings.model_validate(values)
+
+
+def get_db_echo() -> bool:
+    """SQL echo del engine: apagado salvo que DOTC_DB_ECHO lo pida."""
+    return os.getenv(ECHO_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def apply_sqlite_pragmas(dbapi_connection, settings: SQLiteSettings) -> None:
+    """Ejecuta los pragmas sobre una conexión DBAPI recién abierta."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in settings.pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def install_sqlite_pragmas(engine: Engine, settings: SQLiteSettings) -> None:
+    """
+    Registra los pragmas en el evento "connect" del engine. Para un
+    AsyncEngine se pasa su `sync_engine`.
+    """
+    if not settings.pragmas():
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, settings)
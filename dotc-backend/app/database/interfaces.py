@@ -1,21 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 
 # Importa los modelos Pydantic y Enums que se usan en las firmas de los métodos
 from ..domain.models import (
     Game,
+    GameHeader,
+    GameSnapshot,
     PlayerInfo,
     Card,
+    CardMove,
     SecretCard,
     Avatar,
     PlayerRole,
     PlayerInGame,
     PendingAction,
+    SecretAssignment,
+    VoteTally,
 )
 from ..domain.enums import GameActionState
-from ..api.schemas import GameLobbyInfo, PlayCardRequest
+from ..api.schemas import GameLobbyInfo, LobbyFilter, PlayCardRequest
 from ..domain.enums import GameStatus, CardLocation, CardType, ResponseStatus
+from .unit_of_work import UnitOfWork
 
 
 # --- INTERFAZ PARA OPERACIONES DE LECTURA (QUERIES) ---
@@ -50,10 +56,35 @@ class IQueryManager(ABC):
         pass
 
     @abstractmethod
-    def list_games_in_lobby(self) -> List[GameLobbyInfo]:
+    def get_game_header(self, game_id: int) -> Optional[GameHeader]:
         """
-        Devuelve una lista de DTOs 'GameLobbyInfo' solo para las partidas
-        en estado LOBBY, optimizada para mostrar en un listado.
+        Obtiene solo la cabecera de una partida (estado, turno, acción en
+        curso y cantidad de jugadores) en una única query, sin cargar cartas
+        ni jugadores. Devuelve None si la partida no existe.
+        """
+        pass
+
+    @abstractmethod
+    def get_game_snapshot(self, game_id: int) -> Optional[GameSnapshot]:
+        """
+        Obtiene la foto compacta que usa el motor de reglas: cabecera,
+        jugadores (sin manos) y todas las cartas como tuplas, en tres queries
+        de columnas y sin armar objetos ORM. Devuelve None si la partida no
+        existe.
+        """
+        pass
+
+    @abstractmethod
+    def list_games_in_lobby(
+        self,
+        filters: Optional[LobbyFilter] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[GameLobbyInfo]:
+        """
+        Devuelve una lista de DTOs 'GameLobbyInfo' ordenada por id, optimizada
+        para mostrar en un listado. Sin filtros, solo las partidas en LOBBY.
+        Paginada por cursor: ids mayores a `after_id`, a lo sumo `limit`.
         """
         pass
 
@@ -72,6 +103,16 @@ class IQueryManager(ABC):
         """Obtiene el 'pending_saga' de la partida (si existe)."""
         pass
 
+    @abstractmethod
+    def get_vote_tally(
+        self, game_id: int, round_id: int, initiator_id: Optional[int] = None
+    ) -> VoteTally:
+        """
+        Recuento de una ronda de votación: total de votos emitidos, votos
+        por jugador y a quién votó el iniciador (para desempatar).
+        """
+        pass
+
     # ═══════════════════════════════════════════════════════════
     # 👤 QUERIES DE JUGADORES (PlayerTable)
     # ═══════════════════════════════════════════════════════════
@@ -131,14 +172,38 @@ class IQueryManager(ABC):
         especifico específicas por su ID dentro de una partida."""
         pass
 
+    @abstractmethod
+    def get_sets(self, game_id: int) -> Dict[int, List[Card]]:
+        """Obtiene todos los sets jugados de una partida: {set_id: cartas}."""
+        pass
+
     @abstractmethod
     def get_player_hand(self, game_id: int, player_id: int) -> List[Card]:
         """Obtiene todas las cartas en la mano de un jugador."""
         pass
 
     @abstractmethod
-    def get_deck(self, game_id: int) -> List[Card]:
-        """Obtiene todas las cartas del mazo de robo de una partida."""
+    def get_deck(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Card]:
+        """
+        Obtiene las cartas del mazo de robo de una partida, ordenadas del
+        tope hacia el fondo (mayor 'position' primero). Con `limit`, solo
+        las primeras `limit` cartas.
+        """
+        pass
+
+    @abstractmethod
+    def get_top_card(self, game_id: int) -> Optional[Card]:
+        """
+        Obtiene la carta del tope del mazo de robo (la de mayor 'position').
+        Devuelve None si el mazo está vacío.
+        """
+        pass
+
+    @abstractmethod
+    def get_draft(self, game_id: int) -> List[Card]:
+        """Obtiene las cartas del draft (cartas boca arriba) de una partida."""
         pass
 
     @abstractmethod
@@ -181,6 +246,11 @@ class IQueryManager(ABC):
         """Verifica si un jugador es parte de una partida. Usa una consulta EXISTS para ser eficiente."""
         pass
 
+    @abstractmethod
+    def is_player_in_social_disgrace(self, game_id: int, player_id: int) -> bool:
+        """Indica si el jugador está en desgracia social en la partida."""
+        pass
+
     @abstractmethod
     def is_player_host(self, game_id: int, player_id: int) -> bool:
         """Verifica si un jugador es el anfitrión (host) de una partida."""
@@ -221,6 +291,20 @@ class ICommandManager(ABC):
     en la base de datos. Cada método representa una operación atómica y simple.
     """
 
+    # ═══════════════════════════════════════════════════════════
+    # 🧾 UNIDAD DE TRABAJO
+    # ═══════════════════════════════════════════════════════════
+
+    @abstractmethod
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Context manager que agrupa los commands ejecutados dentro en una sola
+        transacción: un commit al salir, rollback de todo ante una excepción.
+        Es reentrante (las acciones anidadas comparten la transacción) y
+        `savepoint()` deshace solo un bloque sin abortar la unidad.
+        """
+        pass
+
     # ═══════════════════════════════════════════════════════════
     # 👤 COMMANDS DE JUGADORES (PlayerTable)
     # ═══════════════════════════════════════════════════════════
@@ -338,6 +422,18 @@ class ICommandManager(ABC):
         """
         pass
 
+    @abstractmethod
+    def move_cards(
+        self, game_id: int, moves: List[CardMove]
+    ) -> ResponseStatus:
+        """
+        Aplica varios movimientos de carta de una sola vez (un único
+        UPDATE ejecutado en lote). Si alguna carta no pertenece a la
+        partida no se mueve ninguna y devuelve CARD_NOT_FOUND.
+        """
+        # Optimización para evitar N llamadas a update_card_location.
+        pass
+
     @abstractmethod
     def update_cards_to_set(
         self,
@@ -391,6 +487,17 @@ class ICommandManager(ABC):
         """Crea una nueva carta secreta en una partida en la base de datos."""
         pass
 
+    @abstractmethod
+    def deal_secrets(
+        self, game_id: int, assignments: List[SecretAssignment]
+    ) -> ResponseStatus:
+        """
+        Reparte los secretos y asigna los roles de todos los jugadores de
+        una vez (un INSERT en lote y un UPDATE en lote, un solo commit).
+        """
+        # Optimización para evitar N llamadas a create_secret_card/set_player_role.
+        pass
+
     @abstractmethod
     def reveal_secret_card(
         self, secret_id: int, game_id: int, is_revealed: bool
@@ -442,6 +549,29 @@ class ICommandManager(ABC):
         Usado para manejar acciones de múltiples pasos como votaciones o trades.
         """
         pass
+
+    # ═══════════════════════════════════════════════════════════
+    # 🗳️ COMMANDS DE VOTACIONES (VoteTable)
+    # ═══════════════════════════════════════════════════════════
+
+    @abstractmethod
+    def cast_vote(
+        self,
+        game_id: int,
+        round_id: int,
+        voter_id: int,
+        voted_player_id: Optional[int],
+    ) -> ResponseStatus:
+        """
+        Registra el voto de un jugador en una ronda (None = abstención).
+        Devuelve ALREADY_VOTED si el jugador ya había votado en esa ronda.
+        """
+        pass
+
+    @abstractmethod
+    def clear_votes(self, game_id: int, round_id: int) -> ResponseStatus:
+        """Borra los votos de una ronda de votación ya resuelta."""
+        pass
     
 
     # ═══════════════════════════════════════════════════════════
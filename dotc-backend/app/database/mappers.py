@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from app.database.orm_models import (
     GameTable,
     PendingActionTable,
@@ -9,6 +9,8 @@ from app.database.orm_models import (
 )
 from app.domain.models import (
     Game,
+    GameHeader,
+    GameSnapshot,
     PendingAction,
     PlayerInfo,
     PlayerInGame,
@@ -60,68 +62,149 @@ def map_player_in_game_orm_to_dto(
     return PlayerInGame.model_validate(player_data, from_attributes=True)
 
 
-def map_game_orm_to_lobby_dto(game_orm: GameTable) -> GameLobbyInfo:
-    """Mapeo optimizado de GameTable a GameLobbyInfo DTO."""
+def map_lobby_row_to_dto(row) -> GameLobbyInfo:
+    """Mapea una fila de la proyección de list_games_in_lobby a GameLobbyInfo."""
     return GameLobbyInfo(
-        id=game_orm.game_id,
-        name=game_orm.game_name,
-        min_players=game_orm.min_players,
-        max_players=game_orm.max_players,
-        player_count=len(game_orm.player_details),
-        host_id=game_orm.host_id,
-        game_status=game_orm.game_status,
-        password=game_orm.game_password,
+        id=row.game_id,
+        name=row.game_name,
+        min_players=row.min_players,
+        max_players=row.max_players,
+        player_count=row.player_count,
+        host_id=row.host_id,
+        game_status=row.game_status,
+        password=row.game_password,
     )
 
+def map_game_row_to_header(row) -> GameHeader:
+    """Mapea una fila de la proyección de get_game_header a GameHeader."""
+    return GameHeader(
+        id=row.game_id,
+        name=row.game_name,
+        min_players=row.min_players,
+        max_players=row.max_players,
+        host_id=row.host_id,
+        status=row.game_status,
+        player_count=row.player_count,
+        current_turn_player_id=row.current_player,
+        action_state=row.action_state,
+        action_initiator_id=row.action_initiator_id,
+        prompted_player_id=row.prompted_player_id,
+    )
+
+
+def map_snapshot_rows(
+    header: GameHeader, game_id: int, player_rows, card_rows
+) -> GameSnapshot:
+    """Arma un GameSnapshot confiable (sin validación) desde las filas."""
+    players = [
+        PlayerInGame.model_construct(
+            player_id=row.player_id,
+            player_name=row.player_name,
+            player_birth_date=row.player_birth_date,
+            player_avatar=row.player_avatar,
+            game_id=game_id,
+            player_role=row.player_role,
+            hand=[],
+            secrets=[],
+            social_disgrace=bool(row.social_disgrace),
+        )
+        for row in player_rows
+    ]
+    return GameSnapshot.model_construct(
+        header=header,
+        players=players,
+        cards=[tuple(row) for row in card_rows],
+    )
+
+
 # --- Mapper Principal ---
 
+_CARD_FIELDS = tuple(Card.model_fields)
+_MISSING = object()
+
+
+def _construct_card(card_orm: CardTable) -> Card:
+    """
+    Construye un Card confiable con `Card.model_construct`, sin validación
+    Pydantic: los valores vienen de la BD ya tipados por el ORM (enums,
+    ints), validar es trabajo repetido.
+
+    Las columnas ya cargadas se leen directo del estado de la instancia
+    (sin pasar por el descriptor instrumentado). Si alguna está expirada o
+    sin cargar, cae al getattr normal.
+    """
+    state = card_orm.__dict__
+    values = {}
+    for name in _CARD_FIELDS:
+        value = state.get(name, _MISSING)
+        values[name] = getattr(card_orm, name) if value is _MISSING else value
+    return Card.model_construct(**values)
+
+
+def _construct_player_in_game(
+    detail_orm: PlayerInGameTable, hand: List[Card]
+) -> PlayerInGame:
+    """Construye un PlayerInGame confiable (sin validación) desde la BD."""
+    player = detail_orm.player
+    return PlayerInGame.model_construct(
+        player_id=player.player_id,
+        player_name=player.player_name,
+        player_birth_date=player.player_birth_date,
+        player_avatar=player.player_avatar,
+        game_id=detail_orm.game_id,
+        player_role=detail_orm.player_role,
+        hand=hand,
+        social_disgrace=bool(detail_orm.social_disgrace),
+    )
+
+
 def map_game_orm_to_domain(db_game: GameTable) -> Game:
-    """Mapea el objeto GameTable completo, con relaciones, a un Game DTO."""
+    """
+    Mapea el objeto GameTable completo, con relaciones, a un Game DTO.
+    Recorre las cartas UNA sola vez, repartiéndolas por ubicación (y por
+    dueño para las manos), y arma cartas y jugadores con model_construct.
+    """
     # Mapear el host - validar que existe Y que tiene datos válidos
     if db_game.host is None or db_game.host.player_name is None:
         host_info = None  # Será manejado en el constructor de Game
     else:
         host_info = map_player_orm_to_info_dto(db_game.host)
 
-    # Mapear jugadores y sus manos
-    players_in_game = []
-    for detail in db_game.player_details:
-        # Validar que el player existe y tiene datos válidos antes de intentar mapear
-        if detail.player is None or detail.player.player_name is None:
-            continue  # Saltar players con datos NULL
-        
-        player_hand = [
-            map_card_orm_to_dto(c)
-            for c in db_game.cards
-            if c.player_id == detail.player_id
-            and c.location == CardLocation.IN_HAND
-        ]
-        players_in_game.append(
-            map_player_in_game_orm_to_dto(detail, player_hand)
-        )
+    # Una pasada sobre las cartas: mazos por ubicación y manos por jugador
+    hands: Dict[int, List[Card]] = {}
+    piles: Dict[CardLocation, List[Card]] = {
+        CardLocation.DRAW_PILE: [],
+        CardLocation.DISCARD_PILE: [],
+        CardLocation.DRAFT: [],
+    }
+    for card_orm in db_game.cards:
+        location = card_orm.location
+        if location == CardLocation.IN_HAND:
+            hands.setdefault(card_orm.player_id, []).append(
+                _construct_card(card_orm)
+            )
+        elif location in piles:
+            piles[location].append(_construct_card(card_orm))
+
+    # El mazo va del tope al fondo: game.deck[0] es la próxima carta a robar
+    piles[CardLocation.DRAW_PILE].sort(
+        key=lambda c: -1 if c.position is None else c.position, reverse=True
+    )
 
-    # Mapear mazos
-    deck = [
-        map_card_orm_to_dto(c)
-        for c in db_game.cards
-        if c.location == CardLocation.DRAW_PILE
-    ]
-    discard_pile = [
-        map_card_orm_to_dto(c)
-        for c in db_game.cards
-        if c.location == CardLocation.DISCARD_PILE
-    ]
-    draft = [
-        map_card_orm_to_dto(c)
-        for c in db_game.cards
-        if c.location == CardLocation.DRAFT
+    # Mapear jugadores con sus manos ya agrupadas
+    players_in_game = [
+        _construct_player_in_game(detail, hands.get(detail.player_id, []))
+        for detail in db_game.player_details
+        # Saltar players con datos NULL
+        if detail.player is not None and detail.player.player_name is not None
     ]
 
     action_state_enum = (
         GameActionState(db_game.action_state) if db_game.action_state else None
     )
 
-    # Construir y devolver el objeto final
+    # Construir y devolver el objeto final (los hijos ya son instancias
+    # del modelo, Pydantic no los vuelve a validar)
     return Game(
         id=db_game.game_id,
         name=db_game.game_name,
@@ -130,9 +213,9 @@ def map_game_orm_to_domain(db_game: GameTable) -> Game:
         host=host_info,
         status=db_game.game_status,
         players=players_in_game,
-        draft=draft,
-        deck=deck,
-        discard_pile=discard_pile,
+        draft=piles[CardLocation.DRAFT],
+        deck=piles[CardLocation.DRAW_PILE],
+        discard_pile=piles[CardLocation.DISCARD_PILE],
         current_turn_player_id=db_game.current_player,
         action_state=action_state_enum,
         action_initiator_id=db_game.action_initiator_id,
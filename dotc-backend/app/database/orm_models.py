@@ -3,11 +3,13 @@ from typing import List, Optional
 from sqlalchemy import (
     create_engine,
     ForeignKey,
+    Index,
     String,
     Date,
     Boolean,
     Enum,
     JSON,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import (
     declarative_base,
@@ -17,6 +19,11 @@ from sqlalchemy.orm import (
     mapped_column,
 )
 
+from .engine_settings import (
+    get_db_echo,
+    install_sqlite_pragmas,
+    load_sqlite_settings,
+)
 from ..domain.enums import (
     GameStatus,
     PlayerRole,
@@ -29,11 +36,13 @@ from ..domain.enums import (
 
 # --- (Configuración de la BD no cambia) ---
 SQLALCHEMY_DATABASE_URL = "sqlite:///./sistema.db"
+SQLITE_SETTINGS = load_sqlite_settings()
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    echo=True,
+    echo=get_db_echo(),
 )
+install_sqlite_pragmas(engine, SQLITE_SETTINGS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -78,6 +87,10 @@ class GameTable(Base):
     """
 
     __tablename__ = "games"
+    __table_args__ = (
+        # Listado del lobby paginado por cursor (status + id > cursor).
+        Index("ix_games_status_id", "game_status", "game_id"),
+    )
 
     game_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     game_name: Mapped[str] = mapped_column(String, unique=True, index=True)
@@ -116,6 +129,9 @@ class GameTable(Base):
     secrets: Mapped[List["SecretCardTable"]] = relationship(
         back_populates="game", cascade="all, delete-orphan"
     )
+    votes: Mapped[List["VoteTable"]] = relationship(
+        back_populates="game", cascade="all, delete-orphan"
+    )
 
     # El jugador al que se le ha pedido una acción (la víctima/objetivo)
     prompted_player_id: Mapped[Optional[int]] = mapped_column(
@@ -171,6 +187,21 @@ class PlayerTable(Base):
 # --- CardTable y SecretCardTable no necesitan cambios ---
 class CardTable(Base):
     __tablename__ = "cards"
+    # Índices para las queries calientes (mano, mazo, descarte, sets).
+    # Sin ellos cada lookup recorre las cartas de TODAS las partidas.
+    __table_args__ = (
+        Index(
+            "ix_cards_game_location_player", "game_id", "location", "player_id"
+        ),
+        Index("ix_cards_game_set", "game_id", "set_id"),
+        # Tope del mazo: ORDER BY position DESC LIMIT 1 sin ordenar en memoria.
+        Index(
+            "ix_cards_game_location_position",
+            "game_id",
+            "location",
+            "position",
+        ),
+    )
     card_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     game_id: Mapped[int] = mapped_column(
         ForeignKey("games.game_id"), nullable=False
@@ -190,6 +221,9 @@ class CardTable(Base):
 
 class SecretCardTable(Base):
     __tablename__ = "secrets"
+    __table_args__ = (
+        Index("ix_secrets_game_player", "game_id", "player_id"),
+    )
     secret_id: Mapped[int] = mapped_column(
         primary_key=True, index=True, autoincrement=True
     )
@@ -201,6 +235,32 @@ class SecretCardTable(Base):
     player: Mapped["PlayerTable"] = relationship(back_populates="secrets")
 
 
+class VoteTable(Base):
+    """
+    Un voto de una ronda de votación (Point Your Suspicions). Cada voto es
+    una fila propia: votos simultáneos no se pisan entre sí y la unique
+    constraint impide que un jugador vote dos veces en la misma ronda.
+    """
+
+    __tablename__ = "votes"
+    __table_args__ = (
+        UniqueConstraint(
+            "game_id", "round_id", "voter_id", name="uq_votes_round_voter"
+        ),
+    )
+    vote_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("games.game_id", ondelete="CASCADE")
+    )
+    round_id: Mapped[int] = mapped_column()
+    voter_id: Mapped[int] = mapped_column(ForeignKey("players.player_id"))
+    # None = el jugador se abstuvo.
+    voted_player_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("players.player_id"), nullable=True
+    )
+    game: Mapped["GameTable"] = relationship(back_populates="votes")
+
+
 class PendingActionCardLinkTable(Base):
     __tablename__ = "pending_action_card_link"
     
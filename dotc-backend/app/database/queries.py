@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import select, func
 
 from .interfaces import IQueryManager
+from . import unit_of_work
 from .orm_models import (
     GameTable,
     PendingActionTable,
@@ -10,12 +11,13 @@ from .orm_models import (
     PlayerTable,
     CardTable,
     SecretCardTable,
+    VoteTable,
     GameStatus,
     CardLocation,
     PlayerRole,
 )
-from ..domain.models import Game, PendingAction, PlayerInfo, Card, SecretCard, PlayerInGame
-from ..api.schemas import GameLobbyInfo
+from ..domain.models import Game, GameHeader, GameSnapshot, PendingAction, PlayerInfo, Card, SecretCard, PlayerInGame, VoteTally
+from ..api.schemas import GameLobbyInfo, LobbyFilter
 
 from app.database import mappers
 
@@ -37,6 +39,10 @@ class DatabaseQueryManager(IQueryManager):
     def __init__(self, session: Session):
         self.session = session
 
+    def _rollback(self) -> None:
+        """Rollback tras un error de lectura (invalida la unidad de trabajo)."""
+        unit_of_work.rollback(self.session)
+
     # ═══════════════════════════════════════════════════════════
     # 🎮 QUERIES DE PARTIDAS (GameTable)
     # ═══════════════════════════════════════════════════════════
@@ -92,30 +98,146 @@ class DatabaseQueryManager(IQueryManager):
                 return mappers.map_game_orm_to_domain(db_game_simple)
             except Exception as e2:
                 print(f"Error en get_game (fallback sin players): {e2}")
-                self.session.rollback()
+                self._rollback()
                 return None
 
-    def list_games_in_lobby(self) -> List[GameLobbyInfo]:
-        """Devuelve una lista optimizada de partidas en estado LOBBY."""
+    def get_game_header(self, game_id: int) -> Optional[GameHeader]:
+        """
+        Obtiene la cabecera de la partida en una sola query: columnas de
+        GameTable más la cantidad de jugadores, sin cartas ni manos.
+        """
         try:
-            # Usamos options() para cargar eficientemente el host y los detalles del jugador.
-            lobby_games_orm = (
-                self.session.query(GameTable)
-                .options(
-                    joinedload(GameTable.host),
-                    selectinload(GameTable.player_details),
+            player_count = (
+                select(func.count())
+                .select_from(PlayerInGameTable)
+                .where(PlayerInGameTable.game_id == GameTable.game_id)
+                .scalar_subquery()
+            )
+            stmt = select(
+                GameTable.game_id,
+                GameTable.game_name,
+                GameTable.min_players,
+                GameTable.max_players,
+                GameTable.host_id,
+                GameTable.game_status,
+                player_count.label("player_count"),
+                GameTable.current_player,
+                GameTable.action_state,
+                GameTable.action_initiator_id,
+                GameTable.prompted_player_id,
+            ).where(GameTable.game_id == game_id)
+            row = self.session.execute(stmt).one_or_none()
+            if row is None:
+                return None
+            return mappers.map_game_row_to_header(row)
+        except Exception as e:
+            print(f"Error en get_game_header: {e}")
+            self._rollback()
+            return None
+
+    def get_game_snapshot(self, game_id: int) -> Optional[GameSnapshot]:
+        """
+        Cabecera + jugadores + cartas en tres SELECT de columnas. Las cartas
+        viajan como tuplas: ni objetos ORM ni Card de Pydantic.
+        """
+        try:
+            header = self.get_game_header(game_id)
+            if header is None:
+                return None
+            player_rows = self.session.execute(
+                select(
+                    PlayerInGameTable.player_id,
+                    PlayerTable.player_name,
+                    PlayerTable.player_birth_date,
+                    PlayerTable.player_avatar,
+                    PlayerInGameTable.player_role,
+                    PlayerInGameTable.social_disgrace,
                 )
-                .filter(GameTable.game_status == GameStatus.LOBBY)
-                .all()
+                .join(
+                    PlayerTable,
+                    PlayerTable.player_id == PlayerInGameTable.player_id,
+                )
+                .where(PlayerInGameTable.game_id == game_id)
+                .order_by(PlayerInGameTable.player_id)
+            ).all()
+            card_rows = self.session.execute(
+                select(
+                    CardTable.card_id,
+                    CardTable.card_type,
+                    CardTable.location,
+                    CardTable.player_id,
+                    CardTable.position,
+                ).where(CardTable.game_id == game_id)
+            ).all()
+            return mappers.map_snapshot_rows(
+                header, game_id, player_rows, card_rows
+            )
+        except Exception as e:
+            print(f"Error en get_game_snapshot: {e}")
+            self._rollback()
+            return None
+
+    def list_games_in_lobby(
+        self,
+        filters: Optional[LobbyFilter] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[GameLobbyInfo]:
+        """
+        Lista partidas para el lobby ordenadas por id, en una sola query
+        (la cantidad de jugadores sale de una subconsulta, sin cargar filas).
+        Sin filtros devuelve las que están en LOBBY. Paginado por cursor:
+        `after_id` es el último id de la página anterior.
+        """
+        if filters is None:
+            filters = LobbyFilter(status=GameStatus.LOBBY)
+        try:
+            player_count = (
+                select(func.count())
+                .select_from(PlayerInGameTable)
+                .where(PlayerInGameTable.game_id == GameTable.game_id)
+                .scalar_subquery()
             )
+            stmt = select(
+                GameTable.game_id,
+                GameTable.game_name,
+                GameTable.min_players,
+                GameTable.max_players,
+                GameTable.host_id,
+                GameTable.game_status,
+                GameTable.game_password,
+                player_count.label("player_count"),
+            ).order_by(GameTable.game_id)
+            if filters.status is not None:
+                stmt = stmt.where(GameTable.game_status == filters.status)
+            if filters.name_prefix:
+                pattern = (
+                    filters.name_prefix.lower()
+                    .replace("\\", "\\\\")
+                    .replace("%", "\\%")
+                    .replace("_", "\\_")
+                )
+                stmt = stmt.where(
+                    func.lower(GameTable.game_name).like(
+                        pattern + "%", escape="\\"
+                    )
+                )
+            if filters.has_free_seats is True:
+                stmt = stmt.where(player_count < GameTable.max_players)
+            elif filters.has_free_seats is False:
+                stmt = stmt.where(player_count >= GameTable.max_players)
+            if after_id is not None:
+                stmt = stmt.where(GameTable.game_id > after_id)
+            if limit is not None:
+                stmt = stmt.limit(limit)
 
             return [
-                mappers.map_game_orm_to_lobby_dto(game_orm)
-                for game_orm in lobby_games_orm
+                mappers.map_lobby_row_to_dto(row)
+                for row in self.session.execute(stmt)
             ]
         except Exception as e:
             print(f"Error al listar las partidas: {e}")
-            self.session.rollback()
+            self._rollback()
             return []
 
     def get_game_status(self, game_id: int) -> Optional[GameStatus]:
@@ -129,7 +251,7 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.execute(stmt).scalar_one_or_none()
         except Exception as e:
             print(f"Error en get_game_status: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_current_turn(self, game_id: int) -> Optional[int]:
@@ -143,7 +265,7 @@ class DatabaseQueryManager(IQueryManager):
 
         except Exception as e:
             print(f"Error en get_current_turn: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_pending_saga(self, game_id: int) -> Optional[dict]:
@@ -156,9 +278,43 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.execute(stmt).scalar_one_or_none()
         except Exception as e:
             print(f"Error en get_pending_saga: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
+    def get_vote_tally(
+        self, game_id: int, round_id: int, initiator_id: Optional[int] = None
+    ) -> VoteTally:
+        """
+        Recuento de una ronda en UNA query agregada (GROUP BY por votado).
+        `max(voter_id = initiator)` marca el grupo donde cayó el voto del
+        iniciador, que se usa para desempatar.
+        """
+        try:
+            stmt = (
+                select(
+                    VoteTable.voted_player_id,
+                    func.count(),
+                    func.max(VoteTable.voter_id == initiator_id),
+                )
+                .where(
+                    VoteTable.game_id == game_id,
+                    VoteTable.round_id == round_id,
+                )
+                .group_by(VoteTable.voted_player_id)
+            )
+            tally = VoteTally()
+            for voted_id, count, has_initiator in self.session.execute(stmt):
+                tally.total_votes += count
+                if voted_id is not None:
+                    tally.counts[voted_id] = count
+                if has_initiator:
+                    tally.initiator_vote = voted_id
+            return tally
+        except Exception as e:
+            print(f"Error en get_vote_tally: {e}")
+            self._rollback()
+            return VoteTally()
+
     # ═══════════════════════════════════════════════════════════
     # 👤 QUERIES DE JUGADORES (PlayerTable)
     # ═══════════════════════════════════════════════════════════
@@ -178,7 +334,7 @@ class DatabaseQueryManager(IQueryManager):
             )
         except Exception as e:
             print(f"Error en get_player: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_players_in_game(self, game_id: int) -> List[PlayerInGame]:
@@ -222,7 +378,7 @@ class DatabaseQueryManager(IQueryManager):
 
         except Exception as e:
             print(f"Error en get_players_in_game: {e}")
-            self.session.rollback()
+            self._rollback()
             return []
 
     def get_player_name(self, player_id: int) -> Optional[str]:
@@ -253,7 +409,7 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.execute(stmt).scalar_one_or_none()
         except Exception as e:
             print(f"Error en get_player_role: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_murderer_id(self, game_id: int) -> Optional[int]:
@@ -266,7 +422,7 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.execute(stmt).scalar_one_or_none()
         except Exception as e:
             print(f"Error en get_murderer_id: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_accomplice_id(self, game_id: int) -> Optional[int]:
@@ -279,7 +435,7 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.execute(stmt).scalar_one_or_none()
         except Exception as e:
             print(f"Error en get_accomplice_id: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     # ═══════════════════════════════════════════════════════════
@@ -296,7 +452,7 @@ class DatabaseQueryManager(IQueryManager):
             return mappers.map_card_orm_to_dto(card_orm) if card_orm else None
         except Exception as e:
             print(f"Error en get_card: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_secret(self, secret_id: int, game_id: int) -> Optional[SecretCard]:
@@ -310,7 +466,7 @@ class DatabaseQueryManager(IQueryManager):
             return mappers.map_secret_card_orm_to_dto(secret_orm) if secret_orm else None
         except Exception as e:
             print(f"Error en get_secret: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_set(self, set_id: int, game_id: int) -> List[Card]:
@@ -327,8 +483,29 @@ class DatabaseQueryManager(IQueryManager):
             return [mappers.map_card_orm_to_dto(c) for c in cards_orm]
         except Exception as e:
             print(f"Error al obtener las cartas del set: {e}")
-            self.session.rollback()
+            self._rollback()
             return []
+
+    def get_sets(self, game_id: int) -> Dict[int, List[Card]]:
+        """Obtiene todos los sets de una partida en una sola query."""
+        try:
+            stmt = (
+                select(CardTable)
+                .where(
+                    CardTable.game_id == game_id,
+                    CardTable.set_id.is_not(None),
+                )
+                .order_by(CardTable.set_id, CardTable.card_id)
+            )
+            sets: Dict[int, List[Card]] = {}
+            for card_orm in self.session.execute(stmt).scalars():
+                card = mappers.map_card_orm_to_dto(card_orm)
+                sets.setdefault(card.set_id, []).append(card)
+            return sets
+        except Exception as e:
+            print(f"Error al obtener los sets de la partida: {e}")
+            self._rollback()
+            return {}
     
     def get_player_hand(self, game_id: int, player_id: int) -> List[Card]:
         """Obtiene todas las cartas en la mano de un jugador."""
@@ -342,21 +519,68 @@ class DatabaseQueryManager(IQueryManager):
             return [mappers.map_card_orm_to_dto(c) for c in cards_orm]
         except Exception as e:
             print(f"Error al obtener la mano del jugador: {e}")
-            self.session.rollback()
+            self._rollback()
+            return []
+
+    def get_deck(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Card]:
+        """
+        Obtiene las cartas del mazo de robo de una partida, del tope hacia
+        el fondo. Con `limit` lee solo esas cartas del tope, por el índice
+        (game_id, location, position).
+        """
+        try:
+            stmt = (
+                select(CardTable)
+                .where(
+                    CardTable.game_id == game_id,
+                    CardTable.location == CardLocation.DRAW_PILE,
+                )
+                .order_by(CardTable.position.desc())
+                .limit(limit)
+            )
+            cards_orm = self.session.execute(stmt).scalars().all()
+            return [mappers.map_card_orm_to_dto(c) for c in cards_orm]
+        except Exception as e:
+            print(f"Error al obtener el mazo de robo: {e}")
+            self._rollback()
             return []
 
-    def get_deck(self, game_id: int) -> List[Card]:
-        """Obtiene todas las cartas del mazo de robo de una partida."""
+    def get_top_card(self, game_id: int) -> Optional[Card]:
+        """
+        Obtiene la carta del tope del mazo de robo (mayor 'position').
+        Usa el índice (game_id, location, position): lee una sola fila.
+        """
+        try:
+            stmt = (
+                select(CardTable)
+                .where(
+                    CardTable.game_id == game_id,
+                    CardTable.location == CardLocation.DRAW_PILE,
+                )
+                .order_by(CardTable.position.desc())
+                .limit(1)
+            )
+            card_orm = self.session.execute(stmt).scalars().first()
+            return mappers.map_card_orm_to_dto(card_orm) if card_orm else None
+        except Exception as e:
+            print(f"Error al obtener el tope del mazo: {e}")
+            self._rollback()
+            return None
+
+    def get_draft(self, game_id: int) -> List[Card]:
+        """Obtiene las cartas del draft de una partida."""
         try:
             stmt = select(CardTable).where(
                 CardTable.game_id == game_id,
-                CardTable.location == CardLocation.DRAW_PILE,
+                CardTable.location == CardLocation.DRAFT,
             )
             cards_orm = self.session.execute(stmt).scalars().all()
             return [mappers.map_card_orm_to_dto(c) for c in cards_orm]
         except Exception as e:
-            print(f"Error al obtener el mazo de robo: {e}")
-            self.session.rollback()
+            print(f"Error al obtener el draft: {e}")
+            self._rollback()
             return []
 
     def get_discard_pile(self, game_id: int) -> List[Card]:
@@ -370,7 +594,7 @@ class DatabaseQueryManager(IQueryManager):
             return [mappers.map_card_orm_to_dto(c) for c in cards_orm]
         except Exception as e:
             print(f"Error al obtener el mazo de descarte: {e}")
-            self.session.rollback()
+            self._rollback()
             return []
 
     def get_player_secrets(
@@ -390,7 +614,7 @@ class DatabaseQueryManager(IQueryManager):
             return [mappers.map_secret_card_orm_to_dto(s) for s in secrets_orm]
         except Exception as e:
             print(f"Error al obtener los secretos del jugador: {e}")
-            self.session.rollback()
+            self._rollback()
             return []
 
     # ═══════════════════════════════════════════════════════════
@@ -411,7 +635,7 @@ class DatabaseQueryManager(IQueryManager):
             return max_set_id
         except Exception as e:
             print(f"Error al obtener el set_id máximo: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
 
     def get_size_deck(self, game_id: int) -> int:
@@ -434,7 +658,7 @@ class DatabaseQueryManager(IQueryManager):
             return deck_size
         except Exception as e:
             print(f"Error al obtener el tamaño del mazo: {e}")
-            self.session.rollback()
+            self._rollback()
             return 0
 
     # ═══════════════════════════════════════════════════════════
@@ -453,7 +677,20 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.query(stmt.exists()).scalar()
         except Exception as e:
             print(f"Error al verificar si el jugador está en la partida: {e}")
-            self.session.rollback()
+            self._rollback()
+            return False
+
+    def is_player_in_social_disgrace(self, game_id: int, player_id: int) -> bool:
+        """Lee solo la columna social_disgrace del jugador en la partida."""
+        try:
+            stmt = select(PlayerInGameTable.social_disgrace).where(
+                PlayerInGameTable.game_id == game_id,
+                PlayerInGameTable.player_id == player_id,
+            )
+            return bool(self.session.execute(stmt).scalar_one_or_none())
+        except Exception as e:
+            print(f"Error al verificar la desgracia social del jugador: {e}")
+            self._rollback()
             return False
 
     def is_player_host(self, game_id: int, player_id: int) -> bool:
@@ -466,7 +703,7 @@ class DatabaseQueryManager(IQueryManager):
             return host_id == player_id
         except Exception as e:
             print(f"Error en is_player_host: {e}")
-            self.session.rollback()
+            self._rollback()
             return False
 
     def game_name_exists(self, game_name: str) -> bool:
@@ -477,7 +714,7 @@ class DatabaseQueryManager(IQueryManager):
             return self.session.query(stmt.exists()).scalar()
         except Exception as e:
             print(f"Error en game_name_exists: {e}")
-            self.session.rollback()
+            self._rollback()
             # En caso de error, es más seguro asumir que existe para evitar duplicados.
             return True
         
@@ -498,5 +735,5 @@ class DatabaseQueryManager(IQueryManager):
             return mappers.map_pending_action_orm_to_dto(orm_obj)
         except Exception as e:
             print(f"Error en get_pending_action: {e}")
-            self.session.rollback()
+            self._rollback()
             return None
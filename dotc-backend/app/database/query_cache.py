@@ -0,0 +1,253 @@
+"""
+Caché de lecturas por request (identity map de objetos de dominio).
+
+En un mismo request las mismas lecturas se repiten: `play_card` valida la
+partida con `get_game` y después los efectos la vuelven a pedir; la mano,
+los jugadores o una carta se leen varias veces con los mismos IDs.
+`CachedQueryManager` envuelve al gestor de queries y memoriza cada lectura
+por (método, argumentos): la segunda vez devuelve el mismo objeto, sin SQL.
+
+La invalidación es por tabla y partida. Cada lectura declara de qué tablas
+depende (READ_TABLES) y cada command qué tablas escribe (WRITE_TABLES). El
+gestor de comandos se envuelve con `track`, y después de cada command se
+descartan solo las lecturas de esa partida que dependían de esas tablas.
+Los commands que no figuran en WRITE_TABLES y los que crean o borran
+partidas o jugadores vacían la caché entera. Un rollback de la sesión
+también la vacía, porque lo leído después de escribir ya no vale.
+
+La caché vive lo que vive el gestor de queries, es decir, un request HTTP
+o una acción RPC. Se desactiva con DOTC_QUERY_CACHE=off.
+"""
+
+import inspect
+import os
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from sqlalchemy import event
+
+from .interfaces import ICommandManager, IQueryManager
+
+QUERY_CACHE_ENV = "DOTC_QUERY_CACHE"
+
+# --- Tablas (las unidades de invalidación) ---
+GAMES = "games"
+PLAYERS = "players"
+CARDS = "cards"
+SECRETS = "secrets"
+VOTES = "votes"
+PENDING = "pending_actions"
+
+# Lecturas que no dependen de una partida: no se memorizan
+UNCACHED_READS = frozenset({"list_games_in_lobby", "game_name_exists"})
+
+# Lecturas memorizadas y las tablas de las que depende cada una
+READ_TABLES: Dict[str, Tuple[str, ...]] = {
+    "get_game": (GAMES, PLAYERS, CARDS, SECRETS),
+    "get_game_header": (GAMES, PLAYERS),
+    "get_game_snapshot": (GAMES, PLAYERS, CARDS),
+    "get_game_status": (GAMES,),
+    "get_current_turn": (GAMES,),
+    "get_pending_saga": (GAMES,),
+    "get_vote_tally": (VOTES,),
+    "get_player": (PLAYERS,),
+    "get_player_name": (PLAYERS,),
+    "get_players_in_game": (PLAYERS, CARDS, SECRETS),
+    "get_player_role": (PLAYERS,),
+    "get_murderer_id": (PLAYERS,),
+    "get_accomplice_id": (PLAYERS,),
+    "get_card": (CARDS,),
+    "get_secret": (SECRETS,),
+    "get_set": (CARDS,),
+    "get_sets": (CARDS,),
+    "get_player_hand": (CARDS,),
+    "get_deck": (CARDS,),
+    "get_top_card": (CARDS,),
+    "get_draft": (CARDS,),
+    "get_discard_pile": (CARDS,),
+    "get_player_secrets": (SECRETS,),
+    "get_max_set_id": (CARDS,),
+    "get_size_deck": (CARDS,),
+    "is_player_in_game": (PLAYERS,),
+    "is_player_host": (GAMES,),
+    "is_player_in_social_disgrace": (PLAYERS,),
+    "get_pending_action": (PENDING, CARDS),
+}
+
+# Commands y las tablas que escriben. Una tupla vacía vacía toda la caché.
+WRITE_TABLES: Dict[str, Tuple[str, ...]] = {
+    "create_player": (),
+    "delete_player": (),
+    "create_game": (),
+    "delete_game": (),
+    "set_player_role": (PLAYERS,),
+    "set_player_social_disgrace": (PLAYERS,),
+    "add_player_to_game": (PLAYERS,),
+    "remove_player_from_game": (PLAYERS,),
+    "update_game_status": (GAMES,),
+    "set_current_turn": (GAMES,),
+    "set_game_action_state": (GAMES,),
+    "clear_game_action_state": (GAMES,),
+    "update_pending_saga": (GAMES,),
+    "create_card": (CARDS,),
+    "create_deck_for_game": (CARDS,),
+    "update_card_location": (CARDS,),
+    "move_cards": (CARDS,),
+    "update_cards_to_set": (CARDS,),
+    "setear_set_id": (CARDS,),
+    "update_card_position": (CARDS,),
+    "create_set": (CARDS,),
+    "add_card_to_set": (CARDS,),
+    "steal_set": (CARDS,),
+    "create_secret_card": (SECRETS,),
+    "deal_secrets": (SECRETS,),
+    "reveal_secret_card": (SECRETS,),
+    "change_secret_owner": (SECRETS,),
+    "cast_vote": (VOTES,),
+    "clear_votes": (VOTES,),
+    "create_pending_action": (PENDING,),
+    "increment_nsf_responses": (PENDING,),
+    "clear_pending_action": (PENDING,),
+}
+
+CacheKey = Tuple[Hashable, ...]
+Tag = Tuple[str, Optional[int]]
+
+
+def query_cache_enabled() -> bool:
+    """Indica si la caché de lecturas está activa (variable de entorno)."""
+    value = os.getenv(QUERY_CACHE_ENV, "on").lower()
+    if value not in ("on", "off"):
+        raise ValueError(
+            f"{QUERY_CACHE_ENV}={value!r} no existe. Valores válidos: on, off"
+        )
+    return value == "on"
+
+
+def _signatures(interface: type, names) -> Dict[str, inspect.Signature]:
+    return {name: inspect.signature(getattr(interface, name)) for name in names}
+
+
+_READ_SIGNATURES = _signatures(IQueryManager, READ_TABLES)
+_WRITE_SIGNATURES = _signatures(ICommandManager, WRITE_TABLES)
+
+
+def _bind(
+    signature: inspect.Signature, args: tuple, kwargs: dict
+) -> Dict[str, Any]:
+    """Argumentos con nombre (sin self) y con sus defaults aplicados."""
+    bound = signature.bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self")
+    return arguments
+
+
+class CachedQueryManager:
+    """
+    Proxy del gestor de queries que memoriza las lecturas de READ_TABLES.
+    Todo lo demás (incluida la `session` que usa DatabaseCommandManager) se
+    delega tal cual.
+    """
+
+    def __init__(self, queries: IQueryManager):
+        self.queries = queries
+        self._entries: Dict[CacheKey, Any] = {}
+        self._tags: Dict[Tag, Set[CacheKey]] = {}
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        session = getattr(queries, "session", None)
+        if session is not None:
+            event.listen(session, "after_soft_rollback", self._on_rollback)
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.queries, name)
+        if name not in READ_TABLES:
+            return attribute
+        return self._memoized(name, attribute)
+
+    def track(
+        self, commands: ICommandManager
+    ) -> "CacheInvalidatingCommandManager":
+        """Envuelve el gestor de comandos para que invalide esta caché."""
+        return CacheInvalidatingCommandManager(commands, self)
+
+    # --- Memoización ---
+
+    def _memoized(self, name: str, read: Callable) -> Callable:
+        def cached_read(*args, **kwargs):
+            arguments = _bind(_READ_SIGNATURES[name], args, kwargs)
+            key = (name, *arguments.values())
+            if key in self._entries:
+                self.hits[name] += 1
+                return self._entries[key]
+            self.misses[name] += 1
+            value = read(*args, **kwargs)
+            # None suele ser un error de BD ya logueado: no se memoriza
+            if value is not None:
+                game_id = arguments.get("game_id")
+                self._store(key, game_id, READ_TABLES[name], value)
+            return value
+
+        return cached_read
+
+    def _store(self, key: CacheKey, game_id, tables, value) -> None:
+        self._entries[key] = value
+        for table in tables:
+            self._tags.setdefault((table, game_id), set()).add(key)
+
+    # --- Invalidación ---
+
+    def invalidate(
+        self, game_id: Optional[int], tables: Tuple[str, ...]
+    ) -> None:
+        """Descarta las lecturas de `game_id` que dependen de `tables`."""
+        if not tables:
+            self.clear()
+            return
+        for table in tables:
+            for key in self._tags.pop((table, game_id), ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def _on_rollback(self, session, previous_transaction) -> None:
+        self.clear()
+
+
+class CacheInvalidatingCommandManager:
+    """
+    Proxy del gestor de comandos que, después de cada command, invalida en
+    la caché lo que ese command pudo cambiar. Todo lo demás se delega tal
+    cual.
+    """
+
+    # Atributos del gestor que no escriben
+    PASSTHROUGH = frozenset({"unit_of_work", "session", "queries"})
+
+    def __init__(self, commands: ICommandManager, cache: CachedQueryManager):
+        self.commands = commands
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.commands, name)
+        if name in self.PASSTHROUGH or not callable(attribute):
+            return attribute
+
+        def invalidating_write(*args, **kwargs):
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                self._invalidate(name, args, kwargs)
+
+        return invalidating_write
+
+    def _invalidate(self, name: str, args: tuple, kwargs: dict) -> None:
+        if name not in WRITE_TABLES:
+            # Command desconocido: no se sabe qué tocó
+            self.cache.clear()
+            return
+        arguments = _bind(_WRITE_SIGNATURES[name], args, kwargs)
+        self.cache.invalidate(arguments.get("game_id"), WRITE_TABLES[name])
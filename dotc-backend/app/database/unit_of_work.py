@@ -0,0 +1,135 @@
+"""
+Unidad de trabajo (Unit of Work) sobre la Session de SQLAlchemy.
+
+Cada command de DatabaseCommandManager hace su propio commit. Eso está bien
+para operaciones sueltas, pero una acción de juego (jugar un set, Dead Card
+Folly, repartir...) encadena muchos commands: muchos fsync y, si algo falla
+a mitad de camino, un estado a medio aplicar.
+
+Mientras haya una UnitOfWork abierta sobre la sesión:
+- `commit(session)` solo hace flush (y expira la identity map, igual que un
+  commit real), así las queries siguientes ven los cambios.
+- `rollback(session)` marca la unidad como fallida.
+- Al cerrar la unidad se hace UN commit, o rollback de todo si hubo una
+  excepción (p. ej. un GameError) o un command fallido. En este último caso
+  se lanza InternalGameError: quien abrió la unidad no puede seguir como si
+  la acción se hubiera aplicado (ni notificar un estado revertido).
+
+La unidad es reentrante: una acción que llama a otra (p. ej. Dead Card
+Folly re-jugando una carta) comparte la misma transacción.
+
+`savepoint()` abre un SAVEPOINT dentro de la unidad: si el bloque lanza,
+se deshace solo lo escrito en él y la acción puede seguir (p. ej. anular
+una jugada cuyo efecto rechazó los targets después de escribir).
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from ..game.exceptions import InternalGameError
+
+_SESSION_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """Agrupa todos los commands de una acción en una sola transacción."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.depth = 0
+        self.failed = False
+
+    @property
+    def active(self) -> bool:
+        return self.depth > 0
+
+    def __enter__(self) -> "UnitOfWork":
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.depth -= 1
+        if self.depth > 0:
+            return False
+        failed, self.failed = self.failed, False
+        if exc_type is not None or failed:
+            self.session.rollback()
+        else:
+            self.session.commit()
+        if failed and exc_type is None:
+            raise InternalGameError(
+                "Falló una operación de la base de datos; la acción se revirtió"
+            )
+        return False
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Deshace lo escrito en el bloque si lanza una excepción, sin tocar lo
+        anterior de la unidad. La excepción se relanza igual.
+        """
+        # El driver de sqlite3 recién abre la transacción en el primer
+        # INSERT/UPDATE: un SAVEPOINT antes de eso ES la transacción, y su
+        # RELEASE commitea. Abrimos el BEGIN a mano si todavía no hubo.
+        connection = self.session.connection()
+        if not _in_transaction(connection.connection.dbapi_connection):
+            connection.exec_driver_sql("BEGIN")
+        nested = self.session.begin_nested()
+        try:
+            yield
+        except Exception:
+            if nested.is_active:
+                nested.rollback()
+            self.session.expire_all()
+            raise
+        if nested.is_active:
+            nested.commit()
+
+    def checkpoint(self) -> None:
+        """
+        Commitea lo escrito hasta ahora sin cerrar la unidad. Sirve para
+        persistir una corrección de estado antes de lanzar un error que, si
+        no, la revertiría junto con todo lo demás.
+        """
+        if self.failed:
+            return
+        self.session.commit()
+
+
+def _in_transaction(dbapi_connection) -> bool:
+    """Si la conexión sqlite3 (o la de aiosqlite, adaptada) ya hizo BEGIN."""
+    raw = getattr(dbapi_connection, "_connection", dbapi_connection)
+    return bool(getattr(raw, "in_transaction", True))
+
+
+def get_unit_of_work(session: Session) -> UnitOfWork:
+    """Devuelve la unidad de trabajo de la sesión (una sola por sesión)."""
+    uow = session.info.get(_SESSION_KEY)
+    if uow is None:
+        uow = UnitOfWork(session)
+        session.info[_SESSION_KEY] = uow
+    return uow
+
+
+def _active_unit(session: Session) -> UnitOfWork | None:
+    uow = session.info.get(_SESSION_KEY)
+    return uow if uow is not None and uow.active else None
+
+
+def commit(session: Session) -> None:
+    """Commit de un command: dentro de una UnitOfWork solo hace flush."""
+    if _active_unit(session) is None:
+        session.commit()
+        return
+    session.flush()
+    session.expire_all()
+
+
+def rollback(session: Session) -> None:
+    """Rollback de un command/query: dentro de una UnitOfWork la invalida."""
+    uow = _active_unit(session)
+    if uow is not None:
+        uow.failed = True
+    session.rollback()
@@ -1,5 +1,17 @@
-from fastapi import Depends, FastAPI
-from typing import Annotated, Generator
+import inspect
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from fastapi import Depends, FastAPI, WebSocket, params
+from typing import (
+    Annotated,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    get_args,
+)
 from sqlalchemy.orm import Session
 
 # --------------------------------------------------------------------------
@@ -9,16 +21,30 @@ from sqlalchemy.orm import Session
 # Interfaces y clases concretas de la capa de Base de Datos
 from ..database.interfaces import IQueryManager, ICommandManager
 from ..database.orm_models import SessionLocal
+from ..database.async_session import (
+    AsyncSessionLocal,
+    ASYNC_DRIVER,
+    get_db_driver,
+)
 from ..database.queries import DatabaseQueryManager
 from ..database.commands import DatabaseCommandManager
+from ..database.query_cache import CachedQueryManager, query_cache_enabled
 
 # Interfaz y clase concreta de la capa de WebSockets
 from ..websockets.interfaces import IConnectionManager
 from ..websockets.connection_manager import ConnectionManager
+from ..websockets.broker import load_broker
+from ..websockets.lobby_publisher import load_lobby_publisher
+from ..websockets.rpc import RpcDispatcher
 
 # Helpers reutilizables
 from ..game.helpers.validators import GameValidator
 from ..game.helpers.notificators import Notificator
+from ..game.helpers.state_deltas import (
+    DELTA_MODE,
+    StateDeltas,
+    get_state_sync_mode,
+)
 from ..game.helpers.turn_utils import TurnUtils
 from ..game.effect_executor import EffectExecutor
 
@@ -39,7 +65,11 @@ from ..game.interfaces import IGameManager
 # --------------------------------------------------------------------------
 
 # --- Singleton para WebSocket Manager ---
-websocket_manager_singleton = ConnectionManager()
+# Con varios workers de uvicorn, DOTC_BROKER=unix conecta los singletons
+# de cada proceso (ver websockets/broker.py).
+websocket_manager_singleton = ConnectionManager(
+    lobby_publisher=load_lobby_publisher(), broker=load_broker()
+)
 
 
 def get_websocket_manager() -> IConnectionManager:
@@ -48,8 +78,19 @@ def get_websocket_manager() -> IConnectionManager:
 
 
 # --- sesion de BD por request ---
-def get_db_session() -> Generator[Session, None, None]:
-    """Generador de sesión de BD. Crea una nueva sesión por petición y la cierra al finalizar."""
+async def get_db_session() -> AsyncGenerator[Session, None]:
+    """
+    Generador de sesión de BD. Crea una nueva sesión por petición y la cierra
+    al finalizar. El driver se elige con la variable DOTC_DB_DRIVER:
+    - "sqlite" (default): Session síncrona sobre pysqlite.
+    - "aiosqlite": la `sync_session` de una AsyncSession sobre aiosqlite,
+      cuyo IO se awaitea en el loop gracias al GreenletBridgeMiddleware.
+    Los gestores de BD reciben una Session en ambos casos.
+    """
+    if get_db_driver() == ASYNC_DRIVER:
+        async with AsyncSessionLocal() as async_db:
+            yield async_db.sync_session
+        return
     db = SessionLocal()
     try:
         yield db
@@ -61,18 +102,45 @@ def get_db_session() -> Generator[Session, None, None]:
 def get_query_manager(
     session: Annotated[Session, Depends(get_db_session)],
 ) -> IQueryManager:
-    """Factoría que crea el gestor de queries con una sesión fresca."""
-    return DatabaseQueryManager(session=session)
+    """
+    Factoría que crea el gestor de queries con una sesión fresca. Salvo con
+    DOTC_QUERY_CACHE=off, las lecturas se memorizan durante el request
+    (ver database/query_cache.py).
+    """
+    queries = DatabaseQueryManager(session=session)
+    if not query_cache_enabled():
+        return queries
+    return CachedQueryManager(queries)
+
+
+def get_state_deltas(
+    queries: Annotated[IQueryManager, Depends(get_query_manager)],
+) -> Optional[StateDeltas]:
+    """
+    Registro de cambios por request para el modo delta (DOTC_STATE_SYNC).
+    None en modo refetch. Lo comparten el gestor de comandos y el Notificator.
+    """
+    if get_state_sync_mode() != DELTA_MODE:
+        return None
+    return StateDeltas(queries=queries)
 
 
 def get_command_manager(
     queries: Annotated[IQueryManager, Depends(get_query_manager)],
+    deltas: Annotated[Optional[StateDeltas], Depends(get_state_deltas)],
 ) -> ICommandManager:
     """
     Factoría que crea el gestor de comandos.
     Ya no necesita una sesión propia, la tomará del gestor de queries.
+    Si las lecturas se memorizan, se envuelve para invalidar lo que escribe;
+    en modo delta, además, para anotar los cambios que aplica.
     """
-    return DatabaseCommandManager(queries=queries)
+    commands = DatabaseCommandManager(queries=queries)
+    if isinstance(queries, CachedQueryManager):
+        commands = queries.track(commands)
+    if deltas is None:
+        return commands
+    return deltas.track(commands)
 
 # --------------------------------------------------------------------------
 # --- 3. Factorías de Helpers (Herramientas de Apoyo) ---
@@ -88,9 +156,10 @@ def get_validator(
 
 def get_notificator(
     ws_manager: Annotated[IConnectionManager, Depends(get_websocket_manager)],
+    deltas: Annotated[Optional[StateDeltas], Depends(get_state_deltas)],
 ) -> Notificator:
     """Factoría para crear el Notificator, inyectándole el gestor de websockets."""
-    return Notificator(ws_manager=ws_manager)
+    return Notificator(ws_manager=ws_manager, deltas=deltas)
 
 def get_turn_utils() -> TurnUtils:
     """Factoría que crea el gestor de turnos."""
@@ -221,6 +290,72 @@ def get_game_manager(
     )
 
 
+@asynccontextmanager
+async def open_game_manager(
+    session_source: Callable[[], AsyncGenerator[Session, None]] = get_db_session,
+    overrides: Optional[Mapping[Callable, Callable]] = None,
+) -> AsyncIterator[GameManager]:
+    """
+    Arma el grafo de `get_game_manager` fuera de un request HTTP (las
+    acciones RPC del websocket y el simulador). Recorre las mismas
+    factorías y sus `Depends`, así que los dos caminos comparten el
+    cableado. `overrides` funciona como `app.dependency_overrides`;
+    `session_source` reemplaza a `get_db_session`.
+    """
+    overrides = {**(overrides or {}), get_db_session: session_source}
+    async with AsyncExitStack() as stack:
+        yield await _resolve(get_game_manager, overrides, stack, {})
+
+
+async def _resolve(
+    provider: Callable,
+    overrides: Mapping[Callable, Callable],
+    stack: AsyncExitStack,
+    cache: Dict[Callable, Any],
+) -> Any:
+    """
+    Resuelve una factoría como FastAPI: primero sus parámetros
+    `Annotated[..., Depends(f)]`, cada factoría una sola vez por grafo, y
+    las que son generadores (la sesión) quedan abiertas hasta cerrar `stack`.
+    """
+    if provider in cache:
+        return cache[provider]
+    factory = overrides.get(provider, provider)
+    kwargs = {}
+    for name, param in inspect.signature(factory).parameters.items():
+        metadata = get_args(param.annotation)[1:]
+        depends = next(
+            (m for m in metadata if isinstance(m, params.Depends)), None
+        )
+        if depends is None:
+            raise TypeError(
+                f"{factory.__name__}: el parámetro '{name}' no es un Depends."
+            )
+        kwargs[name] = await _resolve(depends.dependency, overrides, stack, cache)
+    if inspect.isasyncgenfunction(factory):
+        value = await stack.enter_async_context(
+            asynccontextmanager(factory)(**kwargs)
+        )
+    elif inspect.isgeneratorfunction(factory):
+        value = stack.enter_context(contextmanager(factory)(**kwargs))
+    elif inspect.iscoroutinefunction(factory):
+        value = await factory(**kwargs)
+    else:
+        value = factory(**kwargs)
+    cache[provider] = value
+    return value
+
+
+def get_rpc_dispatcher(websocket: WebSocket) -> RpcDispatcher:
+    """
+    Dispatcher de acciones RPC para un websocket de partida. Respeta los
+    overrides de dependencias que tenga la app (tests y benchmarks).
+    """
+    overrides = websocket.app.dependency_overrides
+    session_source = overrides.get(get_db_session, get_db_session)
+    return RpcDispatcher(lambda: open_game_manager(session_source, overrides))
+
+
 # --------------------------------------------------------------------------
 # --- 6. Configuración de la App de FastAPI ---
 # --------------------------------------------------------------------------
@@ -133,6 +133,7 @@ class ResponseStatus(enum.Enum):
     - PLAYER_NOT_FOUND
     - PLAYER_NOT_IN_GAME
     - GAME_DOES_NOT_EXIST
+    - ALREADY_VOTED
     """
 
     OK = "OK"
@@ -150,6 +151,7 @@ class ResponseStatus(enum.Enum):
     PLAYER_NOT_FOUND = "PLAYER_NOT_FOUND"
     PLAYER_NOT_IN_GAME = "PLAYER_NOT_IN_GAME"
     GAME_DOES_NOT_EXIST = "GAME_DOES_NOT_EXIST"
+    ALREADY_VOTED = "ALREADY_VOTED"
 
 
 class GameFlowStatus(enum.Enum):
@@ -1,6 +1,6 @@
 from datetime import date
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from app.domain.enums import PlayCardActionType
 
@@ -56,6 +56,23 @@ class Card(BaseModel):
     set_id: Optional[int] = None
 
 
+class CardMove(BaseModel):
+    """
+    Un movimiento de carta para aplicar en lote (ver ICommandManager.move_cards).
+    - card_id: int
+    - location: CardLocation (nueva ubicación)
+    - owner_id: Optional[int] (nuevo dueño; None si no queda en una mano/set)
+    - set_id: Optional[int]
+    - position: Optional[int] (None conserva la posición actual)
+    """
+
+    card_id: int
+    location: CardLocation
+    owner_id: Optional[int] = None
+    set_id: Optional[int] = None
+    position: Optional[int] = None
+
+
 class SecretCard(BaseModel):
     """
     Representa una carta de rol secreto asignada a un jugador.
@@ -75,6 +92,20 @@ class SecretCard(BaseModel):
     is_revealed: bool = False
 
 
+class SecretAssignment(BaseModel):
+    """
+    Rol y secretos que recibe un jugador al iniciar la partida
+    (ver ICommandManager.deal_secrets).
+    - player_id: int
+    - role: PlayerRole (rol del jugador en la partida)
+    - secrets: List[PlayerRole] (un secreto por elemento, sin revelar)
+    """
+
+    player_id: int
+    role: PlayerRole
+    secrets: List[PlayerRole]
+
+
 class PlayerInGame(PlayerInfo):
     """
     Representa el estado de un jugador dentro de una partida específica.
@@ -137,7 +168,69 @@ class Game(BaseModel):
     action_initiator_id: Optional[int] = None
     prompted_player_id: Optional[int] = None
     pending_saga: Optional[Dict[str, Any]] = None
-      
+
+
+class GameHeader(BaseModel):
+    """
+    Proyección liviana de una partida: solo sus columnas escalares, sin
+    cartas ni manos. Alcanza para validar turno, estado y acción en curso.
+    - id: int
+    - name: str
+    - min_players: int
+    - max_players: int
+    - host_id: int
+    - status: GameStatus
+    - player_count: int
+    - current_turn_player_id: Optional[int]
+    - action_state: Optional[GameActionState]
+    - action_initiator_id: Optional[int]
+    - prompted_player_id: Optional[int]
+    """
+
+    id: int
+    name: str
+    min_players: int
+    max_players: int
+    host_id: int
+    status: GameStatus
+    player_count: int = 0
+    current_turn_player_id: Optional[int] = None
+    action_state: Optional[GameActionState] = None
+    action_initiator_id: Optional[int] = None
+    prompted_player_id: Optional[int] = None
+
+
+# (card_id, card_type, location, player_id, position)
+CardRow = Tuple[int, CardType, CardLocation, Optional[int], Optional[int]]
+
+
+class GameSnapshot(BaseModel):
+    """
+    Foto compacta de una partida para el motor de reglas (app/game/engine),
+    leída con tres queries de columnas (ver IQueryManager.get_game_snapshot).
+    - header: GameHeader
+    - players: List[PlayerInGame] (sin mano ni secretos, ordenados por id)
+    - cards: List[CardRow] (todas las cartas de la partida)
+    """
+
+    header: GameHeader
+    players: List[PlayerInGame] = []
+    cards: List[CardRow] = []
+
+
+class VoteTally(BaseModel):
+    """
+    Recuento de una ronda de votación (ver IQueryManager.get_vote_tally).
+    - total_votes: int (votos emitidos, abstenciones incluidas)
+    - counts: Dict[int, int] (player_id votado -> cantidad de votos)
+    - initiator_vote: Optional[int] (a quién votó el iniciador; desempata)
+    """
+
+    total_votes: int = 0
+    counts: Dict[int, int] = {}
+    initiator_vote: Optional[int] = None
+
+
 class PendingAction(BaseModel):
     """Representa una acción pendiente de resolución por NSF. Ahora con una lista de cartas real."""
     model_config = ConfigDict(from_attributes=True)
@@ -84,6 +84,13 @@ class SocialFauxPasEffect(BaseCardEffect):
             game_id=game_id, player_id=player_id, card_discarded=card
         )
 
+        # Sin secretos ocultos no hay nada que revelar: el pedido la trabaría
+        secrets = self.queries.get_player_secrets(
+            game_id=game_id, player_id=player_id
+        )
+        if all(s.is_revealed for s in secrets):
+            return GameFlowStatus.CONTINUE
+
         # --- PASO 2: Forzar a la víctima a revelar un secreto de su elección ---
         # ¡LÓGICA REUTILIZADA de RevealChosenSecretEffect! ¡Elegancia pura!
         self.commands.set_game_action_state(
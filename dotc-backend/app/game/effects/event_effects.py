@@ -2,7 +2,7 @@ from typing import Annotated, Optional, List, TYPE_CHECKING, Literal
 from ...database.interfaces import IQueryManager, ICommandManager
 from ...game.helpers.notificators import Notificator
 from .interfaces import ICardEffect
-from ...domain.models import Card
+from ...domain.models import Card, CardMove
 from ...domain.enums import (
     ResponseStatus,  # mantenido para comprobaciones internas si quedan
     CardLocation,
@@ -157,10 +157,14 @@ class AnotherVictimEffect(BaseCardEffectWithExecutor):
             raise ResourceNotFound(
                 "No se encontró un set con el ID especificado."
             )
-        victim_id = stolen_set_cards[0].player_id
-        if victim_id is None or any(
-            c.player_id != victim_id for c in stolen_set_cards
-        ):
+        # Ariadne Oliver puede estar en el set de otro: no cuenta como dueña
+        owners = {
+            c.player_id
+            for c in stolen_set_cards
+            if c.card_type != CardType.ARIADNE_OLIVER
+        } or {c.player_id for c in stolen_set_cards}
+        victim_id = owners.pop() if len(owners) == 1 else None
+        if victim_id is None:
             raise InternalGameError(
                 "El set está corrupto o no tiene un propietario único."
             )
@@ -248,14 +252,17 @@ class CardsOffTheTableEffect(BaseCardEffect):
             if card.card_type == CardType.NOT_SO_FAST
         ]
 
-        # 2. Descarta las cartas encontradas
-        for card in not_so_fast_cards:
-            status = self.commands.update_card_location(
-                card_id=card.card_id,
-                game_id=game_id,
-                new_location=CardLocation.DISCARD_PILE,
-                owner_id=None,
-                set_id=None,
+        # 2. Descarta las cartas encontradas (un solo UPDATE en lote)
+        if not_so_fast_cards:
+            status = self.commands.move_cards(
+                game_id,
+                [
+                    CardMove(
+                        card_id=card.card_id,
+                        location=CardLocation.DISCARD_PILE,
+                    )
+                    for card in not_so_fast_cards
+                ],
             )
             if status != ResponseStatus.OK:
                 raise InternalGameError(
@@ -384,24 +391,33 @@ class DelayTheMurdererEscapeEffect(BaseCardEffect):
         # 3. Barajar las cartas seleccionadas
         random.shuffle(cards_to_move)
 
-        # 4. Mover cada carta al mazo de robo
-        for card in cards_to_move:
-            status = self.commands.update_card_location(
-                card_id=card.card_id,
-                game_id=game_id,
-                new_location=CardLocation.DRAW_PILE,
-                owner_id=None,
-                set_id=None,  # Limpiamos el set_id por si acaso
-            )
-            if status != ResponseStatus.OK:
-                raise InternalGameError(
-                    f"La DB no pudo mover la carta {card.card_id} al mazo."
+        # 4. Poner las cartas sobre el tope del mazo de robo, todas en un
+        #    solo UPDATE en lote (set_id se limpia por si acaso)
+        top_card = self.queries.get_top_card(game_id=game_id)
+        top_position = (
+            top_card.position
+            if top_card is not None and top_card.position is not None
+            else -1
+        )
+        status = self.commands.move_cards(
+            game_id,
+            [
+                CardMove(
+                    card_id=card.card_id,
+                    location=CardLocation.DRAW_PILE,
+                    position=top_position + 1 + i,
                 )
+                for i, card in enumerate(cards_to_move)
+            ],
+        )
+        if status != ResponseStatus.OK:
+            raise InternalGameError(
+                "La DB no pudo mover las cartas del descarte al mazo."
+            )
 
         # 5. Notificar el cambio en el tamaño del mazo
-        # Calculamos el nuevo tamaño esperado para la notificación
-        new_deck_size = len(
-            self.queries.get_deck(game_id=game_id)
+        new_deck_size = self.queries.get_size_deck(
+            game_id=game_id
         )  # Ya tiene las cartas nuevas
         await self.notifier.notify_deck_updated(
             game_id=game_id, deck_size=new_deck_size
@@ -437,19 +453,20 @@ class EarlyTrainToPaddingtonEffect(BaseCardEffect):
 
         cards_to_move = deck[:num_to_move]
 
-        # 3. Mover cada carta a la pila de descarte
-        for card in cards_to_move:
-            status = self.commands.update_card_location(
-                card_id=card.card_id,
-                game_id=game_id,
-                new_location=CardLocation.DISCARD_PILE,
-                owner_id=None,
-                set_id=None,
-            )
-            if status != ResponseStatus.OK:
-                raise InternalGameError(
-                    f"La DB no pudo mover la carta {card.card_id} al descarte."
+        # 3. Mover las cartas a la pila de descarte (un solo UPDATE en lote)
+        status = self.commands.move_cards(
+            game_id,
+            [
+                CardMove(
+                    card_id=card.card_id, location=CardLocation.DISCARD_PILE
                 )
+                for card in cards_to_move
+            ],
+        )
+        if status != ResponseStatus.OK:
+            raise InternalGameError(
+                "La DB no pudo mover las cartas del mazo al descarte."
+            )
 
         # 4. Notificar el cambio en el tamaño del mazo
         new_deck_size = len(deck) - num_to_move
@@ -479,11 +496,18 @@ class PointYourSuspicionsEffect(BaseCardEffect):
         print(
             f"!!! [CENSUS_EFFECT] Censo realizado: {len(eligible_voters)} votantes elegibles: {eligible_voters}"
         )
+        # Los votos viven en la tabla `votes`, agrupados por ronda. La ronda
+        # es la carta jugada, que puede volver a jugarse: se arranca sin los
+        # votos que hayan quedado de una ronda anterior con la misma carta.
+        round_id = card_ids[0]
+        status = self.commands.clear_votes(game_id, round_id)
+        if status != ResponseStatus.OK:
+            raise InternalGameError("No se pudo abrir la ronda de votación.")
         votation_saga = {
             "type": "point_your_suspicions",
             "source_card_id": card_ids[0],
+            "round_id": round_id,
             "initiator_id": player_id,
-            "votes": {},
             "eligible_voters": eligible_voters,
         }
         self.commands.update_pending_saga(game_id, votation_saga)
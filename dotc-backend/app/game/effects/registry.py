@@ -0,0 +1,241 @@
+"""
+Registro de efectos de cartas, armado una sola vez por proceso.
+
+Qué efecto dispara una jugada depende solo de los tipos de carta jugados,
+nunca de la partida. Por eso las reglas viven acá como datos inmutables y
+la clasificación de sets se precompila en una tabla:
+
+    firma de la jugada -> clase de efecto (o None si no es un set válido)
+
+La firma es el conteo de cartas por tipo empaquetado en un entero (un
+"dígito" de SIGNATURE_BITS bits por cada tipo que aparece en alguna regla;
+los demás tipos no cambian el resultado y no suman). Así `classify` es una
+suma sobre las cartas y un acceso a dict.
+
+La tabla se arma resolviendo cada firma con PrioritizedCommutativeDict, que
+sigue siendo la definición de qué regla gana. Las firmas de más de
+MAX_PRECOMPILED_CARDS cartas (sets que crecieron agregando cartas) se
+resuelven igual la primera vez y quedan memorizadas.
+"""
+
+from itertools import combinations_with_replacement
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ...domain.enums import CardType
+from ...domain.models import Card
+from ..helpers.commutative_dict import PrioritizedCommutativeDict
+from .devious_effects import SocialFauxPasEffect
+from .event_effects import (
+    AndThenThereWasOneMoreEffect,
+    AnotherVictimEffect,
+    CardsOffTheTableEffect,
+    CardTradeEffect,
+    DeadCardFollyEffect,
+    DelayTheMurdererEscapeEffect,
+    EarlyTrainToPaddingtonEffect,
+    LookIntoTheAshesEffect,
+    PointYourSuspicionsEffect,
+)
+from .interfaces import ICardEffect
+from .set_effects import (
+    BeresfordUncancellableEffect,
+    HideSecretEffect,
+    RevealChosenSecretEffect,
+    RevealSpecificSecretEffect,
+    StealSecretEffect,
+)
+
+EffectClass = Callable[..., ICardEffect]
+Signature = int
+SetRule = Tuple[int, Dict[CardType, int], EffectClass]
+
+# Una mano tiene 6 cartas: cualquier set nuevo entra en la tabla
+MAX_PRECOMPILED_CARDS = 6
+# Bits por tipo de carta en la firma (hasta 255 cartas de un mismo tipo)
+SIGNATURE_BITS = 8
+
+_MISSING = object()
+
+# --- EVENT EFFECTS (se juegan de a una) ---
+EVENT_EFFECTS: Mapping[CardType, EffectClass] = MappingProxyType(
+    {
+        CardType.DEAD_CARD_FOLLY: DeadCardFollyEffect,
+        CardType.ANOTHER_VICTIM: AnotherVictimEffect,
+        CardType.LOOK_INTO_THE_ASHES: LookIntoTheAshesEffect,
+        CardType.CARDS_OFF_THE_TABLE: CardsOffTheTableEffect,
+        CardType.THERE_WAS_ONE_MORE: AndThenThereWasOneMoreEffect,
+        CardType.DELAY_MURDERER_ESCAPE: DelayTheMurdererEscapeEffect,
+        CardType.EARLY_TRAIN: EarlyTrainToPaddingtonEffect,
+        CardType.POINT_YOUR_SUSPICIONS: PointYourSuspicionsEffect,
+        CardType.SOCIAL_FAUX_PAS: SocialFauxPasEffect,
+        # CardType.BLACKMAILED: BlackmailedEffect,
+        CardType.CARD_TRADE: CardTradeEffect,
+        # Caso especial: Ariadne Oliver sola se juega como un set
+        CardType.ARIADNE_OLIVER: RevealChosenSecretEffect,
+    }
+)
+
+# --- SET EFFECTS: (prioridad, cartas requeridas, efecto) ---
+SET_RULES: Tuple[SetRule, ...] = (
+    # Priority 20: Most specific combos
+    (
+        20,
+        {CardType.TOMMY_BERESFORD: 1, CardType.TUPPENCE_BERESFORD: 1},
+        BeresfordUncancellableEffect,
+    ),
+    (
+        20,
+        {CardType.MR_SATTERTHWAITE: 1, CardType.HARLEY_QUIN: 1},
+        StealSecretEffect,
+    ),
+    # Priority 10: Combos with Wildcard (Harley Quin)
+    (
+        10,
+        {CardType.HERCULE_POIROT: 2, CardType.HARLEY_QUIN: 1},
+        RevealSpecificSecretEffect,
+    ),
+    (
+        10,
+        {CardType.HERCULE_POIROT: 1, CardType.HARLEY_QUIN: 2},
+        RevealSpecificSecretEffect,
+    ),
+    (
+        10,
+        {CardType.MISS_MARPLE: 2, CardType.HARLEY_QUIN: 1},
+        RevealSpecificSecretEffect,
+    ),
+    (
+        10,
+        {CardType.MISS_MARPLE: 1, CardType.HARLEY_QUIN: 2},
+        RevealSpecificSecretEffect,
+    ),
+    (
+        10,
+        {CardType.TUPPENCE_BERESFORD: 1, CardType.HARLEY_QUIN: 1},
+        RevealChosenSecretEffect,
+    ),
+    (
+        10,
+        {CardType.TOMMY_BERESFORD: 1, CardType.HARLEY_QUIN: 1},
+        RevealChosenSecretEffect,
+    ),
+    (
+        10,
+        {CardType.LADY_EILEEN: 1, CardType.HARLEY_QUIN: 1},
+        RevealChosenSecretEffect,
+    ),
+    (10, {CardType.PARKER_PYNE: 1, CardType.HARLEY_QUIN: 1}, HideSecretEffect),
+    # Priority 0: Base sets (exact quantities)
+    (0, {CardType.HERCULE_POIROT: 3}, RevealSpecificSecretEffect),
+    (0, {CardType.MISS_MARPLE: 3}, RevealSpecificSecretEffect),
+    (0, {CardType.MR_SATTERTHWAITE: 2}, RevealChosenSecretEffect),
+    (0, {CardType.TOMMY_BERESFORD: 2}, RevealChosenSecretEffect),
+    (0, {CardType.TUPPENCE_BERESFORD: 2}, RevealChosenSecretEffect),
+    (0, {CardType.LADY_EILEEN: 2}, RevealChosenSecretEffect),
+    (0, {CardType.PARKER_PYNE: 2}, HideSecretEffect),
+)
+
+
+class EffectRegistry:
+    """
+    Tablas de clasificación de jugadas. Se arma una vez (ver
+    EFFECT_REGISTRY) y no tiene métodos que la modifiquen: para otras
+    reglas (p. ej. en tests) se arma otro registro. Las tablas internas son
+    dicts comunes porque `classify` está en el camino de cada jugada; hacia
+    afuera solo se exponen vistas de lectura.
+    """
+
+    def __init__(
+        self,
+        event_effects: Mapping[CardType, EffectClass],
+        set_rules: Sequence[SetRule],
+        max_precompiled_cards: int = MAX_PRECOMPILED_CARDS,
+    ):
+        self._events = dict(event_effects)
+        self._rules = PrioritizedCommutativeDict()
+        weights: Dict[CardType, int] = {}
+        for priority, combo, effect in set_rules:
+            self._rules.set(combo, effect, priority=priority)
+            for card_type in combo:
+                weights.setdefault(
+                    card_type, 1 << (SIGNATURE_BITS * len(weights))
+                )
+        self._weights = weights
+        self._sets = self._compile(max_precompiled_cards)
+        self._overflow: Dict[Signature, Optional[EffectClass]] = {}
+
+    def classify(self, played_cards: Sequence[Card]) -> Optional[EffectClass]:
+        """El efecto de la jugada, o None si la combinación no tiene efecto."""
+        if len(played_cards) == 1:
+            return self._events.get(played_cards[0].card_type)
+        weight = self._weights.get
+        signature = 0
+        for card in played_cards:
+            signature += weight(card.card_type, 0)
+        effect = self._sets.get(signature, _MISSING)
+        if effect is not _MISSING:
+            return effect
+        return self._classify_overflow(signature)
+
+    def classify_signature(self, signature: Signature) -> Optional[EffectClass]:
+        """Como `classify` para un set (2+ cartas) ya reducido a su firma."""
+        effect = self._sets.get(signature, _MISSING)
+        if effect is not _MISSING:
+            return effect
+        return self._classify_overflow(signature)
+
+    def _classify_overflow(self, signature: Signature) -> Optional[EffectClass]:
+        if signature not in self._overflow:
+            self._overflow[signature] = self._resolve(signature)
+        return self._overflow[signature]
+
+    def signature(self, card_types: Iterable[CardType]) -> Signature:
+        """Firma canónica: el conteo por tipo, sin importar el orden."""
+        weight = self._weights.get
+        return sum(weight(card_type, 0) for card_type in card_types)
+
+    @property
+    def set_card_types(self) -> FrozenSet[CardType]:
+        """Los tipos que aparecen en alguna regla de set."""
+        return frozenset(self._weights)
+
+    @property
+    def event_effects(self) -> Mapping[CardType, EffectClass]:
+        return MappingProxyType(self._events)
+
+    @property
+    def set_table(self) -> Mapping[Signature, Optional[EffectClass]]:
+        """La tabla precompilada (solo lectura)."""
+        return MappingProxyType(self._sets)
+
+    def _compile(
+        self, max_cards: int
+    ) -> Dict[Signature, Optional[EffectClass]]:
+        """Resuelve todas las firmas de hasta `max_cards` cartas."""
+        table: Dict[Signature, Optional[EffectClass]] = {}
+        for size in range(max_cards + 1):
+            for combo in combinations_with_replacement(self._weights, size):
+                signature = self.signature(combo)
+                table[signature] = self._resolve(signature)
+        return table
+
+    def _resolve(self, signature: Signature) -> Optional[EffectClass]:
+        mask = (1 << SIGNATURE_BITS) - 1
+        counts = {
+            card_type: (signature // weight) & mask
+            for card_type, weight in self._weights.items()
+        }
+        return self._rules.get_matching_effect(counts)
+
+
+EFFECT_REGISTRY = EffectRegistry(EVENT_EFFECTS, SET_RULES)
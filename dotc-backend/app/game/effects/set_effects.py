@@ -47,6 +47,12 @@ class BaseCardEffect(ICardEffect):
             "El método execute debe ser implementado por la subclase."
         )
 
+    def _require_hidden_secret(self, game_id: int, player_id: int) -> None:
+        """Sin secretos ocultos, el pedido de revelar uno trabaría la partida."""
+        secrets = self.read.get_player_secrets(game_id=game_id, player_id=player_id)
+        if not any(not s.is_revealed for s in secrets):
+            raise InvalidAction("El jugador objetivo no tiene secretos ocultos.")
+
 
 # =================================================================
 # --- CLASES DE EFECTO CONCRETAS ---
@@ -181,6 +187,7 @@ class RevealChosenSecretEffect(BaseCardEffect):
     ) -> GameFlowStatus:
         if target_player_id is None:
             raise InvalidAction("Este efecto requiere un jugador objetivo.")
+        self._require_hidden_secret(game_id, target_player_id)
 
         # Por congruencia, solo el turn_service se encarga de hacer updates de CardLocation
         # await self._move_cards_to_played_area(game_id, card_ids, player_id)
@@ -310,9 +317,10 @@ class StealSecretEffect(BaseCardEffect):
         trade_direction: Optional[Literal["left", "right"]] = None,
     ) -> GameFlowStatus:
         # ... validaciones ...
+        assert target_player_id
+        self._require_hidden_secret(game_id, target_player_id)
 
         # 1. Poner el juego en estado de "espera de robo"
-        assert target_player_id
         self.write.set_game_action_state(
             game_id=game_id,
             state=GameActionState.AWAITING_REVEAL_FOR_STEAL,
@@ -0,0 +1,94 @@
+"""
+Acciones que entiende el motor y eventos que produce al aplicarlas.
+
+Las acciones son las mismas que llegan por HTTP/RPC pero sin `game_id`
+(el estado ya es de una partida). Los eventos describen qué pasó; el
+adaptador de la BD los traduce a notificaciones y el simulador solo los
+cuenta.
+"""
+
+from typing import Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from ...api.schemas import DrawSource
+
+
+class EngineAction(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    player_id: int
+
+
+class DrawCard(EngineAction):
+    """Robar del mazo, del draft o (tras Look into the ashes) del descarte."""
+
+    source: DrawSource
+    card_id: Optional[int] = None
+
+
+class DiscardCard(EngineAction):
+    card_id: int
+
+
+class FinishTurn(EngineAction):
+    pass
+
+
+GameAction = Union[DrawCard, DiscardCard, FinishTurn]
+
+
+# =================================================================
+# 📣 EVENTOS
+# =================================================================
+
+
+class EngineEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+
+class CardDrawn(EngineEvent):
+    player_id: int
+    card_id: int
+    source: DrawSource
+
+
+class DraftRefilled(EngineEvent):
+    """Un slot del draft se repuso con el tope del mazo (o quedó vacío)."""
+
+    card_taken_id: int
+    new_card_id: Optional[int] = None
+
+
+class CardDiscarded(EngineEvent):
+    player_id: int
+    card_id: int
+
+
+class DiscardEffectTriggered(EngineEvent):
+    """La carta descartada tiene efecto al descartarse (Early train)."""
+
+    player_id: int
+    card_id: int
+
+
+class TurnPassed(EngineEvent):
+    player_id: int
+    next_player_id: int
+
+
+class MurdererEscaped(EngineEvent):
+    """No quedan cartas en el mazo ni en el draft: gana el asesino."""
+
+    murderer_id: int
+    accomplice_id: Optional[int] = None
+
+
+GameEvent = Union[
+    CardDrawn,
+    DraftRefilled,
+    CardDiscarded,
+    DiscardEffectTriggered,
+    TurnPassed,
+    MurdererEscaped,
+]
@@ -0,0 +1,218 @@
+"""
+Reglas del ciclo de turno como una función pura:
+
+    apply(state, action) -> (nuevo_state, eventos)
+
+No hay BD, notificador ni await: validar y aplicar una acción cuesta
+microsegundos. Las violaciones de reglas lanzan las mismas GameError (y
+con el mismo mensaje) que lanzaban los services, así el adaptador no
+cambia los códigos HTTP.
+
+Las acciones de turn_actions (DrawCardAction, DiscardCardAction,
+FinishTurnAction) son adaptadores: cargan el estado con GameStateStore,
+aplican la acción, persisten el diff y traducen los eventos a
+notificaciones. Los efectos de cartas, sets, NSF y votaciones siguen en los
+services.
+"""
+
+from typing import Callable, Dict, List, Tuple, Type
+
+from ...api.schemas import DrawSource
+from ...domain.enums import CardType, GameActionState, GameStatus
+from ..exceptions import (
+    ActionConflict,
+    CardNotFound,
+    InternalGameError,
+    InvalidAction,
+    NotYourCard,
+    NotYourTurn,
+    PlayerNotInGame,
+)
+from .actions import (
+    CardDiscarded,
+    CardDrawn,
+    DiscardCard,
+    DiscardEffectTriggered,
+    DraftRefilled,
+    DrawCard,
+    EngineAction,
+    EngineEvent,
+    FinishTurn,
+    MurdererEscaped,
+    TurnPassed,
+)
+from .state import GameState
+
+HAND_SIZE = 6
+
+# Cartas cuyo efecto se dispara al descartarlas
+DISCARD_EFFECTS = frozenset({CardType.EARLY_TRAIN})
+
+Transition = Tuple[GameState, List[EngineEvent]]
+
+
+def apply(state: GameState, action: EngineAction) -> Transition:
+    """Valida `action` contra `state` y devuelve el estado resultante."""
+    rule = _RULES.get(type(action))
+    if rule is None:
+        raise InvalidAction(f"Acción desconocida: {type(action).__name__}")
+    if state.status is GameStatus.FINISHED:
+        raise ActionConflict("La partida ya terminó.")
+    _check_turn(state, action.player_id)
+    return rule(state, action)
+
+
+def _check_turn(state: GameState, player_id: int) -> None:
+    if player_id not in state.hands:
+        raise PlayerNotInGame(
+            f"El jugador {player_id} no forma parte de la partida {state.game_id}."
+        )
+    if state.current_turn_player_id != player_id:
+        raise NotYourTurn("No es tu turno para realizar esta acción.")
+
+
+# =================================================================
+# 🃏 ROBAR
+# =================================================================
+
+
+def _draw(state: GameState, action: DrawCard) -> Transition:
+    player_id = action.player_id
+    hand = state.hands[player_id]
+    if len(hand) >= HAND_SIZE:
+        raise InvalidAction("No puedes alzar una carta más si ya tienes 6.")
+
+    update: dict = {}
+    events: List[EngineEvent] = []
+    if action.source is DrawSource.DISCARD:
+        awaiting = GameActionState.AWAITING_SELECTION_FOR_CARD
+        if state.action_state is not awaiting:
+            raise InvalidAction(
+                "No estás en un estado que te permita robar del descarte."
+            )
+        card_id = _required_card_id(action, "descarte")
+        if card_id not in state.discard_pile:
+            raise CardNotFound(
+                f"La carta {card_id} no está en la pila de descarte."
+            )
+        update["discard_pile"] = _without(state.discard_pile, card_id)
+        update["action_state"] = GameActionState.NONE
+    elif action.source is DrawSource.DECK:
+        if not state.deck:
+            raise InvalidAction("No quedan cartas en el mazo de robo.")
+        card_id = state.deck[0]
+        update["deck"] = state.deck[1:]
+    else:
+        card_id = _required_card_id(action, "draft")
+        if card_id not in state.draft:
+            raise CardNotFound(f"La carta {card_id} no está en el draft.")
+        # El slot se repone con el tope del mazo, en el mismo lugar
+        new_card_id = state.deck[0] if state.deck else None
+        draft = list(state.draft)
+        slot = draft.index(card_id)
+        if new_card_id is None:
+            del draft[slot]
+        else:
+            draft[slot] = new_card_id
+        update["deck"] = state.deck[1:]
+        update["draft"] = tuple(draft)
+        events.append(
+            DraftRefilled(card_taken_id=card_id, new_card_id=new_card_id)
+        )
+
+    update["hands"] = {**state.hands, player_id: hand + (card_id,)}
+    events.insert(
+        0, CardDrawn(player_id=player_id, card_id=card_id, source=action.source)
+    )
+    new_state = state.model_copy(update=update)
+
+    # Se robó la última carta del mazo o del draft: no queda nada.
+    if (
+        action.source is not DrawSource.DISCARD
+        and not new_state.deck
+        and not new_state.draft
+    ):
+        if new_state.murderer_id is None:
+            raise InternalGameError("No se pudo obtener el ID del asesino.")
+        new_state = new_state.model_copy(update={"status": GameStatus.FINISHED})
+        events.append(
+            MurdererEscaped(
+                murderer_id=new_state.murderer_id,
+                accomplice_id=new_state.accomplice_id,
+            )
+        )
+    return new_state, events
+
+
+def _required_card_id(action: DrawCard, source_name: str) -> int:
+    if action.card_id is None:
+        raise InvalidAction(
+            f"Se requiere el ID de la carta para robar del {source_name}."
+        )
+    return action.card_id
+
+
+# =================================================================
+# 🗑️ DESCARTAR
+# =================================================================
+
+
+def _discard(state: GameState, action: DiscardCard) -> Transition:
+    player_id = action.player_id
+    card_id = action.card_id
+    hand = state.hands[player_id]
+    if card_id not in hand:
+        raise NotYourCard(
+            f"El jugador {player_id} no tiene la carta {card_id} en su mano."
+        )
+    new_state = state.model_copy(
+        update={
+            "hands": {**state.hands, player_id: _without(hand, card_id)},
+            "discard_pile": state.discard_pile + (card_id,),
+        }
+    )
+    events: List[EngineEvent] = [
+        CardDiscarded(player_id=player_id, card_id=card_id)
+    ]
+    if state.card_types[card_id] in DISCARD_EFFECTS:
+        events.append(
+            DiscardEffectTriggered(player_id=player_id, card_id=card_id)
+        )
+    return new_state, events
+
+
+# =================================================================
+# 🔄 TERMINAR EL TURNO
+# =================================================================
+
+
+def _finish_turn(state: GameState, action: FinishTurn) -> Transition:
+    player_id = action.player_id
+    if len(state.hands[player_id]) < HAND_SIZE:
+        raise InvalidAction(
+            "No puedes terminar tu turno con menos de 6 cartas en la mano."
+        )
+    if player_id not in state.turn_order:
+        raise InternalGameError(
+            "El jugador del turno actual no está en la lista de jugadores."
+        )
+    index = state.turn_order.index(player_id)
+    next_player_id = state.turn_order[(index + 1) % len(state.turn_order)]
+    new_state = state.model_copy(
+        update={"current_turn_player_id": next_player_id}
+    )
+    return new_state, [
+        TurnPassed(player_id=player_id, next_player_id=next_player_id)
+    ]
+
+
+def _without(zone: Tuple[int, ...], card_id: int) -> Tuple[int, ...]:
+    index = zone.index(card_id)
+    return zone[:index] + zone[index + 1 :]
+
+
+_RULES: Dict[Type[EngineAction], Callable[..., Transition]] = {
+    DrawCard: _draw,
+    DiscardCard: _discard,
+    FinishTurn: _finish_turn,
+}
@@ -0,0 +1,170 @@
+"""
+Estado en memoria de una partida para el motor de reglas.
+
+Es una foto inmutable y compacta: las cartas son solo ids (el tipo está en
+`card_types`, que se comparte entre todos los estados de la misma partida)
+y cada zona es una tupla. `apply` nunca modifica un estado: devuelve uno
+nuevo que reutiliza todo lo que no cambió.
+
+Solo se modelan las zonas que tocan las reglas del motor (manos, mazo,
+draft y descarte). Las cartas jugadas en sets o sobre la mesa quedan fuera:
+no aparecen en el estado ni en los diffs.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from ...domain.enums import (
+    CardLocation,
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayerRole,
+)
+from ...domain.models import Card, CardMove, GameSnapshot
+from ..helpers.turn_utils import birthday_distance
+
+# Zona de una carta: (ubicación, dueño)
+Placement = Tuple[CardLocation, Optional[int]]
+
+
+class GameState(BaseModel):
+    """
+    Estado de una partida tal como lo ve el motor.
+    - turn_order: Tuple[int, ...] (player_ids en orden de turno)
+    - card_types: Mapping[int, CardType] (card_id -> tipo; no cambia)
+    - hands: Mapping[int, Tuple[int, ...]] (player_id -> card_ids)
+    - deck: Tuple[int, ...] (del tope hacia el fondo)
+    - draft: Tuple[int, ...]
+    - discard_pile: Tuple[int, ...] (por 'position'; la última es el tope)
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    game_id: int
+    status: GameStatus = GameStatus.IN_PROGRESS
+    turn_order: Tuple[int, ...] = ()
+    current_turn_player_id: Optional[int] = None
+    action_state: GameActionState = GameActionState.NONE
+    murderer_id: Optional[int] = None
+    accomplice_id: Optional[int] = None
+    card_types: Mapping[int, CardType] = {}
+    hands: Mapping[int, Tuple[int, ...]] = {}
+    deck: Tuple[int, ...] = ()
+    draft: Tuple[int, ...] = ()
+    discard_pile: Tuple[int, ...] = ()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot) -> "GameState":
+        """Arma el estado a partir de la foto que lee la BD."""
+        header = snapshot.header
+        players = snapshot.players
+        hands: Dict[int, List[int]] = {p.player_id: [] for p in players}
+        card_types: Dict[int, CardType] = {}
+        deck: List[Tuple[int, int]] = []
+        draft: List[int] = []
+        discard: List[Tuple[int, int]] = []
+        for card_id, card_type, location, owner_id, position in sorted(
+            snapshot.cards, key=lambda row: row[0]
+        ):
+            card_types[card_id] = card_type
+            if location == CardLocation.IN_HAND and owner_id in hands:
+                hands[owner_id].append(card_id)
+            elif location == CardLocation.DRAW_PILE:
+                deck.append((position or 0, card_id))
+            elif location == CardLocation.DRAFT:
+                draft.append(card_id)
+            elif location == CardLocation.DISCARD_PILE:
+                discard.append((-1 if position is None else position, card_id))
+        # Mismo orden que TurnUtils.sort_players_by_turn_order
+        ordered = sorted(
+            players, key=lambda p: birthday_distance(p.player_birth_date)
+        )
+        roles = {p.player_role: p.player_id for p in players}
+        return cls.model_construct(
+            game_id=header.id,
+            status=header.status,
+            turn_order=tuple(p.player_id for p in ordered),
+            current_turn_player_id=header.current_turn_player_id,
+            action_state=header.action_state or GameActionState.NONE,
+            murderer_id=roles.get(PlayerRole.MURDERER),
+            accomplice_id=roles.get(PlayerRole.ACCOMPLICE),
+            card_types=card_types,
+            hands={pid: tuple(ids) for pid, ids in hands.items()},
+            # El tope es la carta de mayor 'position'
+            deck=tuple(card_id for _, card_id in sorted(deck, reverse=True)),
+            draft=tuple(draft),
+            # Igual que los efectos: por 'position', None como la más vieja
+            discard_pile=tuple(card_id for _, card_id in sorted(discard)),
+        )
+
+    def placements(self) -> Dict[int, Placement]:
+        """card_id -> (ubicación, dueño) de cada carta modelada."""
+        result: Dict[int, Placement] = {}
+        for player_id, hand in self.hands.items():
+            for card_id in hand:
+                result[card_id] = (CardLocation.IN_HAND, player_id)
+        for zone, location in (
+            (self.deck, CardLocation.DRAW_PILE),
+            (self.draft, CardLocation.DRAFT),
+            (self.discard_pile, CardLocation.DISCARD_PILE),
+        ):
+            for card_id in zone:
+                result[card_id] = (location, None)
+        return result
+
+    def card(self, card_id: int) -> Card:
+        """La carta como Card de dominio, con su ubicación en este estado."""
+        location, owner_id = self.placements().get(
+            card_id, (CardLocation.PLAYED, None)
+        )
+        return Card(
+            card_id=card_id,
+            game_id=self.game_id,
+            card_type=self.card_types[card_id],
+            location=location,
+            player_id=owner_id,
+        )
+
+
+class StateDiff(BaseModel):
+    """
+    Lo que hay que escribir en la BD para pasar de un estado a otro.
+    - moves: List[CardMove] (cartas que cambiaron de zona o de dueño)
+    - current_turn_player_id: Optional[int] (solo si cambió el turno)
+    - action_state_cleared: bool
+    """
+
+    moves: List[CardMove] = []
+    current_turn_player_id: Optional[int] = None
+    action_state_cleared: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            not self.moves
+            and self.current_turn_player_id is None
+            and not self.action_state_cleared
+        )
+
+
+def diff(before: GameState, after: GameState) -> StateDiff:
+    """Compara dos estados de la misma partida."""
+    old = before.placements()
+    moves = [
+        CardMove(card_id=card_id, location=location, owner_id=owner_id)
+        for card_id, (location, owner_id) in after.placements().items()
+        if old.get(card_id) != (location, owner_id)
+    ]
+    turn_changed = after.current_turn_player_id != before.current_turn_player_id
+    return StateDiff(
+        moves=moves,
+        current_turn_player_id=(
+            after.current_turn_player_id if turn_changed else None
+        ),
+        action_state_cleared=(
+            after.action_state is GameActionState.NONE
+            and before.action_state is not GameActionState.NONE
+        ),
+    )
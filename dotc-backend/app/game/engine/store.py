@@ -0,0 +1,87 @@
+"""
+Puente entre el motor y la BD: carga el GameState de una partida y
+persiste el diff entre dos estados. Es la única parte del motor que
+toca IQueryManager / ICommandManager.
+"""
+
+from ...api.schemas import DrawSource
+from ...database.interfaces import ICommandManager, IQueryManager
+from ...domain.enums import GameActionState, ResponseStatus
+from ..exceptions import GameNotFound, InternalGameError
+from .state import GameState, diff
+
+
+class GameStateStore:
+    def __init__(self, queries: IQueryManager, commands: ICommandManager):
+        self.read = queries
+        self.write = commands
+
+    def load(self, game_id: int) -> GameState:
+        """Lee la foto de la partida y arma su estado."""
+        snapshot = self.read.get_game_snapshot(game_id)
+        if snapshot is None:
+            raise GameNotFound(detail=f"La partida {game_id} no existe.")
+        return GameState.from_snapshot(snapshot)
+
+    def load_draw(
+        self, game_id: int, player_id: int, source: DrawSource
+    ) -> GameState:
+        """
+        Arma solo lo que lee la regla de robo, sin traer todas las cartas:
+        la mano de quien roba, las dos cartas del tope del mazo (alcanzan
+        para saber si el robo lo vacía), el draft y, si se roba de ahí, el
+        descarte. Las otras manos y el resto del mazo quedan afuera, así
+        que este estado sirve para `DrawCard` y nada más.
+        """
+        header = self.read.get_game_header(game_id)
+        if header is None:
+            raise GameNotFound(detail=f"La partida {game_id} no existe.")
+        hands = {}
+        if self.read.is_player_in_game(game_id=game_id, player_id=player_id):
+            hands[player_id] = self.read.get_player_hand(
+                game_id=game_id, player_id=player_id
+            )
+        deck = self.read.get_deck(game_id=game_id, limit=2)
+        draft = self.read.get_draft(game_id=game_id)
+        discard = (
+            self.read.get_discard_pile(game_id=game_id)
+            if source is DrawSource.DISCARD
+            else []
+        )
+        cards = [*deck, *draft, *discard, *(c for h in hands.values() for c in h)]
+        return GameState.model_construct(
+            game_id=header.id,
+            status=header.status,
+            current_turn_player_id=header.current_turn_player_id,
+            action_state=header.action_state or GameActionState.NONE,
+            murderer_id=self.read.get_murderer_id(game_id=game_id),
+            accomplice_id=self.read.get_accomplice_id(game_id=game_id),
+            card_types={c.card_id: c.card_type for c in cards},
+            hands={
+                pid: tuple(c.card_id for c in hand) for pid, hand in hands.items()
+            },
+            deck=tuple(c.card_id for c in deck),
+            draft=tuple(c.card_id for c in draft),
+            discard_pile=tuple(c.card_id for c in discard),
+        )
+
+    def persist(self, before: GameState, after: GameState) -> None:
+        """Escribe solo lo que cambió de `before` a `after`."""
+        changes = diff(before, after)
+        game_id = after.game_id
+        if changes.moves:
+            status = self.write.move_cards(game_id, changes.moves)
+            if status != ResponseStatus.OK:
+                raise InternalGameError(
+                    "La DB no pudo actualizar la ubicación de las cartas."
+                )
+        if changes.current_turn_player_id is not None:
+            status = self.write.set_current_turn(
+                game_id, changes.current_turn_player_id
+            )
+            if status != ResponseStatus.OK:
+                raise InternalGameError(
+                    "No se pudo actualizar el turno en la base de datos."
+                )
+        if changes.action_state_cleared:
+            self.write.clear_game_action_state(game_id=game_id)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 # --------------------------------------------------------------------------
 # --- Importaciones de la Lógica de Negocio (Los Servicios) ---
 # --------------------------------------------------------------------------
@@ -24,6 +26,7 @@ from ..api.schemas import (
     LeaveGameResponse,
     PlayCardRequest,
     ListGamesResponse,
+    LobbyFilter,
     RevealSecretRequest,
     StartGameResponse,
     GameStateResponse,
@@ -34,6 +37,7 @@ from ..api.schemas import (
     GeneralActionResponse,
     PlayerSecretsResponse,
     ConsultDeckSizeResponse,
+    LegalMovesResponse,
     SubmitTradeChoiceRequest,
     VoteRequest,
     ExchangeCardRequest,
@@ -81,9 +85,14 @@ class GameManager(IGameManager):
         Notifica por WS en caso de lograr crear la partida."""
         return await self.lobby_service.create_game(request)
 
-    def list_games(self) -> ListGamesResponse:
+    def list_games(
+        self,
+        filters: Optional[LobbyFilter] = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> ListGamesResponse:
         """Delega el listado de partidas al servicio de lobby."""
-        return self.lobby_service.list_games()
+        return self.lobby_service.list_games(filters, cursor, limit)
 
     async def join_game(self, request: JoinGameRequest) -> JoinGameResponse:
         """Delega la unión a una partida al servicio de lobby.
@@ -131,6 +140,14 @@ class GameManager(IGameManager):
             game_id=request.game_id, player_id=request.player_id
         )
 
+    def get_legal_moves(
+        self, request: PlayerActionRequest
+    ) -> LegalMovesResponse:
+        """Delega la enumeración de jugadas legales al servicio de estado."""
+        return self.game_state_service.get_legal_moves(
+            game_id=request.game_id, player_id=request.player_id
+        )
+
     def get_size_deck(self, game_id: int) -> ConsultDeckSizeResponse:
         """Delega la obtención del tamaño del mazo de una partida al servicio de estado."""
         return self.game_state_service.get_size_deck(game_id)
@@ -0,0 +1,268 @@
+"""
+Jugadas legales de un jugador (GET /games/{id}/players/{pid}/legal-moves).
+
+Antes el cliente averiguaba si un set o evento era válido mandándolo a
+/actions/play y esperando el 4xx de `classify_effect`. Acá se enumeran de
+una vez, con las mismas reglas de `TurnService.play_card`:
+
+- Sets nuevos: subconjuntos de la mano (2+ cartas de tipos que aparecen en
+  alguna regla de set, nunca Ariadne Oliver).
+- Agregar a un set: una carta a un set propio si el set agrandado tiene
+  efecto (como en play_card), o Ariadne Oliver a cualquier set de la mesa.
+- Eventos: una carta con efecto de evento (las devious se disparan solas).
+- En desgracia social solo quedan Point Your Suspicions y Card Trade.
+- Fuera del turno o con una acción en curso no hay jugadas; en PENDING_NSF
+  se ofrecen los NSF de la mano a quien no hizo la última jugada.
+
+Las cartas del mismo tipo son intercambiables: la enumeración se hace sobre
+el conteo por tipo (a lo sumo 2^6 combinaciones con una mano de 6) y cada
+jugada se lista una vez, con las cartas de menor id. La firma de cada
+combinación sale del EffectRegistry, así clasificarla es un acceso a dict.
+
+El resultado se cachea por (partida, jugador) junto con la huella de lo que
+lo determina: turno, estado de acción, mano, sets de la mesa y desgracia
+social. Mientras nada de eso cambie se devuelve la misma lista sin volver a
+enumerar; la huella se recalcula en cada pedido, así la caché no necesita
+enterarse de las escrituras (ni de otros workers).
+"""
+
+from collections import OrderedDict
+from itertools import product
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from ...api.schemas import LegalMove
+from ...domain.enums import (
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayCardActionType,
+)
+from ...domain.models import Card, GameHeader
+from ..effects.registry import EFFECT_REGISTRY, EffectClass, EffectRegistry
+
+PLAY_ACTION = "play"
+NSF_ACTION = "play-nsf"
+
+# Se disparan por un intercambio, no se juegan desde la mano
+DEVIOUS_TYPES = frozenset({CardType.BLACKMAILED, CardType.SOCIAL_FAUX_PAS})
+# Eventos permitidos en desgracia social (el NSF va por su propia ventana)
+DISGRACE_EVENTS = frozenset(
+    {CardType.POINT_YOUR_SUSPICIONS, CardType.CARD_TRADE}
+)
+# Entradas (partida, jugador) que guarda la caché
+LEGAL_MOVES_CACHE_SIZE = 2048
+
+Fingerprint = Hashable
+
+
+class LegalMoveFinder:
+    """Enumera las jugadas legales y las cachea hasta que cambie la mano o el estado."""
+
+    def __init__(
+        self,
+        registry: EffectRegistry = EFFECT_REGISTRY,
+        cache_size: int = LEGAL_MOVES_CACHE_SIZE,
+    ):
+        self.registry = registry
+        self.cache_size = cache_size
+        # (game_id, player_id) -> (huella, jugadas), en orden de uso (LRU)
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def find(
+        self,
+        header: GameHeader,
+        player_id: int,
+        hand: Sequence[Card],
+        sets: Dict[int, List[Card]],
+        social_disgrace: bool,
+        nsf_blocked: bool = False,
+    ) -> Tuple[LegalMove, ...]:
+        """
+        Las jugadas legales de `player_id`. `nsf_blocked` indica que el
+        jugador hizo la última jugada de la cadena NSF en curso.
+        """
+        key = (header.id, player_id)
+        fingerprint = self.fingerprint(
+            header, player_id, hand, sets, social_disgrace, nsf_blocked
+        )
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        moves = self.enumerate_moves(
+            header, player_id, hand, sets, social_disgrace, nsf_blocked
+        )
+        self._cache[key] = (fingerprint, moves)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return moves
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def fingerprint(
+        header: GameHeader,
+        player_id: int,
+        hand: Sequence[Card],
+        sets: Dict[int, List[Card]],
+        social_disgrace: bool,
+        nsf_blocked: bool,
+    ) -> Fingerprint:
+        """Todo lo que determina las jugadas, en una tupla comparable."""
+        return (
+            header.status,
+            header.action_state,
+            header.current_turn_player_id == player_id,
+            social_disgrace,
+            nsf_blocked,
+            tuple(sorted((c.card_id, c.card_type) for c in hand)),
+            tuple(
+                (set_id, cards[0].player_id, tuple(c.card_type for c in cards))
+                for set_id, cards in sorted(sets.items())
+                if cards
+            ),
+        )
+
+    def enumerate_moves(
+        self,
+        header: GameHeader,
+        player_id: int,
+        hand: Sequence[Card],
+        sets: Dict[int, List[Card]],
+        social_disgrace: bool,
+        nsf_blocked: bool = False,
+    ) -> Tuple[LegalMove, ...]:
+        """Enumera las jugadas sin pasar por la caché."""
+        if header.status != GameStatus.IN_PROGRESS:
+            return ()
+
+        by_type: Dict[CardType, List[Card]] = {}
+        for card in sorted(hand, key=lambda c: c.card_id):
+            by_type.setdefault(card.card_type, []).append(card)
+
+        if header.action_state == GameActionState.PENDING_NSF:
+            if nsf_blocked:
+                return ()
+            return tuple(
+                LegalMove(
+                    action=NSF_ACTION,
+                    action_type=PlayCardActionType.INSTANT,
+                    card_ids=[card.card_id],
+                )
+                for card in by_type.get(CardType.NOT_SO_FAST, [])[:1]
+            )
+
+        if header.action_state not in (None, GameActionState.NONE):
+            return ()
+        if header.current_turn_player_id != player_id:
+            return ()
+
+        moves = self._events(by_type, social_disgrace)
+        if not social_disgrace:
+            moves += self._new_sets(by_type)
+            moves += self._additions(by_type, sets, player_id)
+        return tuple(moves)
+
+    # --- Enumeración por tipo de jugada ---
+
+    def _events(
+        self, by_type: Dict[CardType, List[Card]], social_disgrace: bool
+    ) -> List[LegalMove]:
+        moves = []
+        for card_type, cards in by_type.items():
+            if card_type in DEVIOUS_TYPES:
+                continue
+            if card_type == CardType.ARIADNE_OLIVER:
+                continue  # se ofrece como agregado a un set
+            if social_disgrace and card_type not in DISGRACE_EVENTS:
+                continue
+            effect = self.registry.classify(cards[:1])
+            if effect is not None:
+                moves.append(
+                    _move(PlayCardActionType.PLAY_EVENT, cards[:1], effect)
+                )
+        return moves
+
+    def _new_sets(self, by_type: Dict[CardType, List[Card]]) -> List[LegalMove]:
+        """Recorre los conteos por tipo: una combinación por multiconjunto."""
+        set_types = self.registry.set_card_types
+        types = [t for t in by_type if t in set_types]
+        units = [self.registry.signature([t]) for t in types]
+        moves = []
+        for counts in product(*(range(len(by_type[t]) + 1) for t in types)):
+            if sum(counts) < 2:
+                continue
+            signature = sum(n * unit for n, unit in zip(counts, units))
+            effect = self.registry.classify_signature(signature)
+            if effect is None:
+                continue
+            cards = [
+                card
+                for card_type, n in zip(types, counts)
+                for card in by_type[card_type][:n]
+            ]
+            moves.append(_move(PlayCardActionType.FORM_NEW_SET, cards, effect))
+        return moves
+
+    def _additions(
+        self,
+        by_type: Dict[CardType, List[Card]],
+        sets: Dict[int, List[Card]],
+        player_id: int,
+    ) -> List[LegalMove]:
+        moves = []
+        for card_type, cards in by_type.items():
+            card = cards[0]
+            for set_id, set_cards in sorted(sets.items()):
+                if not set_cards:
+                    continue
+                if card_type == CardType.ARIADNE_OLIVER:
+                    # Ariadne se juega sola, sobre el set de cualquiera
+                    checked = [card]
+                elif all(
+                    c.player_id == player_id
+                    for c in set_cards
+                    if c.card_type != CardType.ARIADNE_OLIVER
+                ):
+                    # Igual que play_card: el registry decide si el set
+                    # agrandado tiene efecto (Tommy suma a Tuppence, etc.)
+                    checked = set_cards + [card]
+                else:
+                    continue
+                effect = self.registry.classify(checked)
+                if effect is not None:
+                    moves.append(
+                        _move(
+                            PlayCardActionType.ADD_TO_EXISTING_SET,
+                            [card],
+                            effect,
+                            target_set_id=set_id,
+                        )
+                    )
+        return moves
+
+
+def _move(
+    action_type: PlayCardActionType,
+    cards: Sequence[Card],
+    effect: EffectClass,
+    target_set_id: Optional[int] = None,
+) -> LegalMove:
+    return LegalMove(
+        action=PLAY_ACTION,
+        action_type=action_type,
+        card_ids=[card.card_id for card in cards],
+        target_set_id=target_set_id,
+        effect=effect.__name__,
+    )
+
+
+LEGAL_MOVE_FINDER = LegalMoveFinder()
@@ -1,4 +1,5 @@
-from typing import List, Optional, Literal
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Literal
 
 # Dependencia de la interfaz, no de la implementación concreta
 from ...websockets.interfaces import IConnectionManager
@@ -15,6 +16,34 @@ from ...domain.enums import PlayerRole
 
 from ...api.schemas import GameLobbyInfo
 
+from .state_deltas import StateDeltas
+
+
+class _DeferredConnectionManager:
+    """
+    Proxy del gestor de WebSockets que encola los envíos en vez de hacerlos.
+    Lo usa `Notificator.deferred()` para publicar recién cuando la acción
+    terminó (y su transacción se commiteó).
+    """
+
+    def __init__(self, manager: IConnectionManager):
+        self.manager = manager
+        self.pending: list = []
+
+    async def broadcast_to_game(self, *args, **kwargs) -> None:
+        self.pending.append((self.manager.broadcast_to_game, args, kwargs))
+
+    async def broadcast_to_lobby(self, *args, **kwargs) -> None:
+        self.pending.append((self.manager.broadcast_to_lobby, args, kwargs))
+
+    async def send_to_player(self, *args, **kwargs) -> None:
+        self.pending.append((self.manager.send_to_player, args, kwargs))
+
+    async def flush(self) -> None:
+        for send, args, kwargs in self.pending:
+            await send(*args, **kwargs)
+        self.pending.clear()
+
 
 class Notificator:
     """
@@ -23,8 +52,85 @@ class Notificator:
     y de la implementación del WebSocket Manager.
     """
 
-    def __init__(self, ws_manager: IConnectionManager):
+    def __init__(
+        self,
+        ws_manager: IConnectionManager,
+        deltas: Optional[StateDeltas] = None,
+    ):
         self.manager = ws_manager
+        # Solo en modo delta (ver helpers/state_deltas.py).
+        self.deltas = deltas
+
+    @asynccontextmanager
+    async def deferred(self) -> AsyncIterator[None]:
+        """
+        Retiene las notificaciones emitidas dentro del bloque y las envía,
+        en orden, al salir sin errores. Si el bloque lanza una excepción se
+        descartan: la acción se revirtió y no hay nada que anunciar.
+        Es reentrante: un bloque anidado usa la cola del bloque exterior.
+        En modo delta, antes de la cola se publican los parches de estado.
+        """
+        if isinstance(self.manager, _DeferredConnectionManager):
+            yield
+            return
+        outbox = _DeferredConnectionManager(self.manager)
+        self.manager = outbox
+        try:
+            yield
+        except BaseException:
+            if self.deltas is not None:
+                self.deltas.discard()
+            raise
+        finally:
+            self.manager = outbox.manager
+        await self.notify_state_patches()
+        await outbox.flush()
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """
+        Par de `UnitOfWork.savepoint()`: si el bloque lanza, descarta lo que
+        encoló (y los cambios que anotó en modo delta) y relanza.
+        """
+        outbox = self.manager
+        queued = (
+            len(outbox.pending)
+            if isinstance(outbox, _DeferredConnectionManager)
+            else None
+        )
+        changes = self.deltas.mark() if self.deltas is not None else None
+        try:
+            yield
+        except BaseException:
+            if queued is not None:
+                del outbox.pending[queued:]
+            if changes is not None:
+                self.deltas.rollback_to(changes)
+            raise
+
+    async def notify_state_patches(self):
+        """
+        Publica los cambios anotados por `StateDeltas`: un STATE_PATCH
+        público por partida y uno privado a cada dueño de cartas en mano o
+        secretos ocultos que cambiaron. No hace nada fuera del modo delta.
+        """
+        if self.deltas is None:
+            return
+        for game_id, patches in self.deltas.collect().items():
+            if patches.public:
+                message = WSMessage(
+                    details=details.StatePatchDetails(patches=patches.public)
+                )
+                await self.manager.broadcast_to_game(
+                    game_id=game_id, message=message
+                )
+            for player_id, private in patches.private.items():
+                message = WSMessage(
+                    details=details.StatePatchDetails(patches=private)
+                )
+                await self.manager.send_to_player(
+                    message=message, game_id=game_id, player_id=player_id
+                )
 
     # --- Métodos para notificar al Lobby (Broadcast to Lobby) ---
 
@@ -409,6 +515,12 @@ class Notificator:
         await self.manager.broadcast_to_game(message=message, game_id=game_id)
 
     async def notify_hands_updated(self, game_id: int):
+        """
+        Avisa a todos que las manos cambiaron para que las vuelvan a pedir.
+        En modo delta no hace falta: los movimientos ya van en STATE_PATCH.
+        """
+        if self.deltas is not None:
+            return
         details_model = details.HandsUpdatedDetails()
         message = WSMessage(details=details_model)
         await self.manager.broadcast_to_game(message=message, game_id=game_id)
@@ -0,0 +1,292 @@
+"""
+Sincronización por deltas (modo "delta").
+
+En el modo clásico ("refetch") los clientes, ante cada evento, vuelven a
+pedir por HTTP la partida, su mano y los secretos. En modo delta los
+services no cambian: el gestor de comandos se envuelve con
+`DeltaTrackingCommandManager`, que anota qué cartas, sets, secretos, turno y
+desgracias sociales tocó cada command que salió bien. Al terminar la acción
+(ya commiteada) el `Notificator` le pide a `StateDeltas` los parches y los
+publica como un único STATE_PATCH por partida.
+
+Los parches se arman leyendo el estado ya persistido de cada elemento
+tocado (una lectura por elemento), así reflejan exactamente lo commiteado.
+Las cartas en mano o en el mazo y los secretos ocultos viajan sin tipo/rol
+en el broadcast; su dueño recibe además un parche privado completo.
+
+El modo se elige con la variable DOTC_STATE_SYNC ("refetch" por defecto).
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ...database.interfaces import ICommandManager, IQueryManager
+from ...domain.enums import CardLocation, ResponseStatus
+from ...domain.models import Card, CardMove, SecretCard
+from ...websockets.protocol.details import (
+    CardPatch,
+    SecretPatch,
+    SocialDisgracePatch,
+    TurnPatch,
+)
+
+STATE_SYNC_ENV = "DOTC_STATE_SYNC"
+REFETCH_MODE = "refetch"
+DELTA_MODE = "delta"
+
+# Ubicaciones cuyo contenido no es público.
+HIDDEN_LOCATIONS = {CardLocation.IN_HAND, CardLocation.DRAW_PILE}
+
+
+def get_state_sync_mode() -> str:
+    """Devuelve el modo de sincronización configurado por variable de entorno."""
+    mode = os.getenv(STATE_SYNC_ENV, REFETCH_MODE).lower()
+    if mode not in (REFETCH_MODE, DELTA_MODE):
+        raise ValueError(
+            f"{STATE_SYNC_ENV}={mode!r} no existe. "
+            f"Modos válidos: {REFETCH_MODE}, {DELTA_MODE}"
+        )
+    return mode
+
+
+class GameChanges(BaseModel):
+    """Lo que tocaron los commands en una partida, en orden de llegada."""
+
+    card_ids: List[int] = Field(default_factory=list)
+    set_ids: List[int] = Field(default_factory=list)
+    secret_ids: List[int] = Field(default_factory=list)
+    turn_player_id: Optional[int] = None
+    disgrace: Dict[int, bool] = Field(default_factory=dict)
+
+
+class StatePatches(BaseModel):
+    """Parches de una partida: los públicos y los privados de cada jugador."""
+
+    public: List = Field(default_factory=list)
+    private: Dict[int, List] = Field(default_factory=dict)
+
+
+class StateDeltas:
+    """Registro por request de los cambios y armado de los parches."""
+
+    def __init__(self, queries: IQueryManager):
+        self.read = queries
+        self.changes: Dict[int, GameChanges] = {}
+
+    def track(self, commands: ICommandManager) -> "DeltaTrackingCommandManager":
+        """Envuelve el gestor de comandos para que anote sus cambios acá."""
+        return DeltaTrackingCommandManager(commands, self)
+
+    def for_game(self, game_id: int) -> GameChanges:
+        return self.changes.setdefault(game_id, GameChanges())
+
+    def discard(self) -> None:
+        """Olvida los cambios anotados (la acción se revirtió)."""
+        self.changes.clear()
+
+    def mark(self) -> Dict[int, GameChanges]:
+        """Copia de lo anotado hasta ahora, para volver con `rollback_to`."""
+        return {
+            game_id: changes.model_copy(deep=True)
+            for game_id, changes in self.changes.items()
+        }
+
+    def rollback_to(self, mark: Dict[int, GameChanges]) -> None:
+        """Olvida lo anotado después de `mark` (se deshizo un savepoint)."""
+        self.changes = mark
+
+    def collect(self) -> Dict[int, StatePatches]:
+        """Arma los parches de cada partida tocada y vacía el registro."""
+        changes, self.changes = self.changes, {}
+        return {
+            game_id: self._build(game_id, game_changes)
+            for game_id, game_changes in changes.items()
+        }
+
+    # ═══════════════════════════════════════════════════════════
+    # 🧩 ARMADO DE PARCHES
+    # ═══════════════════════════════════════════════════════════
+
+    def _build(self, game_id: int, changes: GameChanges) -> StatePatches:
+        patches = StatePatches()
+
+        cards: Dict[int, Card] = {}
+        for set_id in dict.fromkeys(changes.set_ids):
+            for card in self.read.get_set(set_id, game_id):
+                cards[card.card_id] = card
+        for card_id in dict.fromkeys(changes.card_ids):
+            if card_id in cards:
+                continue
+            card = self.read.get_card(card_id, game_id)
+            if card is not None:
+                cards[card_id] = card
+        for card in cards.values():
+            self._add_card(patches, card)
+
+        for secret_id in dict.fromkeys(changes.secret_ids):
+            secret = self.read.get_secret(secret_id, game_id)
+            if secret is not None:
+                self._add_secret(patches, secret)
+
+        for player_id, is_disgraced in changes.disgrace.items():
+            patches.public.append(
+                SocialDisgracePatch(
+                    player_id=player_id, is_disgraced=is_disgraced
+                )
+            )
+        if changes.turn_player_id is not None:
+            patches.public.append(
+                TurnPatch(turn_player_id=changes.turn_player_id)
+            )
+        return patches
+
+    @staticmethod
+    def _add_card(patches: StatePatches, card: Card) -> None:
+        patch = CardPatch(
+            card_id=card.card_id,
+            location=card.location,
+            owner_id=card.player_id,
+            set_id=card.set_id,
+            position=card.position,
+            card_type=card.card_type,
+        )
+        if card.location not in HIDDEN_LOCATIONS:
+            patches.public.append(patch)
+            return
+        patches.public.append(patch.model_copy(update={"card_type": None}))
+        if card.location == CardLocation.IN_HAND and card.player_id is not None:
+            patches.private.setdefault(card.player_id, []).append(patch)
+
+    @staticmethod
+    def _add_secret(patches: StatePatches, secret: SecretCard) -> None:
+        patch = SecretPatch(
+            secret_id=secret.secret_id,
+            owner_id=secret.player_id,
+            is_revealed=secret.is_revealed,
+            role=secret.role,
+        )
+        if secret.is_revealed:
+            patches.public.append(patch)
+            return
+        patches.public.append(patch.model_copy(update={"role": None}))
+        patches.private.setdefault(secret.player_id, []).append(patch)
+
+
+class DeltaTrackingCommandManager:
+    """
+    Proxy del gestor de comandos que anota en `StateDeltas` lo que cambió
+    cada command exitoso. Todo lo demás se delega tal cual.
+    """
+
+    def __init__(self, commands: ICommandManager, deltas: StateDeltas):
+        self.commands = commands
+        self.deltas = deltas
+
+    def __getattr__(self, name: str):
+        return getattr(self.commands, name)
+
+    # --- Cartas ---
+
+    def update_card_location(
+        self,
+        card_id: int,
+        game_id: int,
+        new_location: CardLocation,
+        owner_id: Optional[int] = None,
+        set_id: Optional[int] = None,
+    ) -> ResponseStatus:
+        status = self.commands.update_card_location(
+            card_id, game_id, new_location, owner_id, set_id
+        )
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).card_ids.append(card_id)
+        return status
+
+    def move_cards(self, game_id: int, moves: List[CardMove]) -> ResponseStatus:
+        status = self.commands.move_cards(game_id, moves)
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).card_ids.extend(
+                move.card_id for move in moves
+            )
+        return status
+
+    def update_cards_to_set(
+        self, game_id: int, card_ids: List[int], player_id: int, set_id: int
+    ) -> ResponseStatus:
+        status = self.commands.update_cards_to_set(
+            game_id, card_ids, player_id, set_id
+        )
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).card_ids.extend(card_ids)
+        return status
+
+    def setear_set_id(
+        self, card_id: int, game_id: int, target_set_id: int
+    ) -> ResponseStatus:
+        status = self.commands.setear_set_id(card_id, game_id, target_set_id)
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).card_ids.append(card_id)
+        return status
+
+    def update_card_position(
+        self, card_id: int, game_id: int, new_position: int
+    ) -> ResponseStatus:
+        status = self.commands.update_card_position(
+            card_id, game_id, new_position
+        )
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).card_ids.append(card_id)
+        return status
+
+    def create_set(self, card_ids: List[int], game_id: int) -> int:
+        set_id = self.commands.create_set(card_ids, game_id)
+        self.deltas.for_game(game_id).card_ids.extend(card_ids)
+        return set_id
+
+    def add_card_to_set(self, card_id: int, set_id: int, game_id: int) -> None:
+        self.commands.add_card_to_set(card_id, set_id, game_id)
+        self.deltas.for_game(game_id).card_ids.append(card_id)
+
+    def steal_set(self, set_id: int, new_owner_id: int, game_id: int) -> None:
+        self.commands.steal_set(set_id, new_owner_id, game_id)
+        self.deltas.for_game(game_id).set_ids.append(set_id)
+
+    # --- Secretos ---
+
+    def reveal_secret_card(
+        self, secret_id: int, game_id: int, is_revealed: bool
+    ) -> ResponseStatus:
+        status = self.commands.reveal_secret_card(secret_id, game_id, is_revealed)
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).secret_ids.append(secret_id)
+        return status
+
+    def change_secret_owner(
+        self, secret_id: int, new_owner_id: int, game_id: int
+    ) -> ResponseStatus:
+        status = self.commands.change_secret_owner(
+            secret_id, new_owner_id, game_id
+        )
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).secret_ids.append(secret_id)
+        return status
+
+    # --- Partida y jugadores ---
+
+    def set_current_turn(self, game_id: int, player_id: int) -> ResponseStatus:
+        status = self.commands.set_current_turn(game_id, player_id)
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).turn_player_id = player_id
+        return status
+
+    def set_player_social_disgrace(
+        self, player_id: int, game_id: int, is_disgraced: bool
+    ) -> ResponseStatus:
+        status = self.commands.set_player_social_disgrace(
+            player_id, game_id, is_disgraced
+        )
+        if status == ResponseStatus.OK:
+            self.deltas.for_game(game_id).disgrace[player_id] = is_disgraced
+        return status
@@ -0,0 +1,25 @@
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+_R = TypeVar("_R")
+
+
+def game_action(
+    method: Callable[..., Awaitable[_R]],
+) -> Callable[..., Awaitable[_R]]:
+    """
+    Decorador para los métodos de servicio que ejecutan una acción de juego.
+
+    Abre una unidad de trabajo sobre `self.write` (un único commit al final,
+    rollback de todo si se lanza un GameError o cualquier otra excepción) y
+    difiere las notificaciones de `self.notifier` hasta después del commit,
+    para que los clientes nunca reaccionen a un estado que no se persistió.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> _R:
+        async with self.notifier.deferred():
+            with self.write.unit_of_work():
+                return await method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,5 +1,5 @@
 from ...database.interfaces import IQueryManager
-from ...domain.models import Game, PlayerInfo, PlayerInGame, Card
+from ...domain.models import Game, GameHeader, PlayerInfo, PlayerInGame, Card
 from ...domain.enums import GameStatus
 from ...game.exceptions import (
     ActionConflict,
@@ -12,7 +12,7 @@ from ...game.exceptions import (
     PlayerNotInGame,
     NotYourCard,
 )
-from typing import List
+from typing import List, Union
 
 
 class GameValidator:
@@ -31,6 +31,17 @@ class GameValidator:
             raise GameNotFound(detail=f"La partida {game_id} no existe.")
         return game
 
+    def validate_game_header_exists(self, game_id: int) -> GameHeader:
+        """
+        Variante liviana de validate_game_exists: devuelve solo la cabecera
+        (estado, turno, acción en curso). Usarla cuando no se necesitan las
+        cartas ni las manos de los jugadores.
+        """
+        header = self.read.get_game_header(game_id)
+        if not header:
+            raise GameNotFound(detail=f"La partida {game_id} no existe.")
+        return header
+
     def validate_player_exists(self, player_id: int) -> PlayerInfo:
         """Devuelve el objeto PlayerInfo si existe, si no, lanza una excepción."""
         player = self.read.get_player(player_id)
@@ -59,7 +70,9 @@ class GameValidator:
                 detail="Solo el host de la partida puede realizar esta acción."
             )
 
-    def validate_is_players_turn(self, game: Game, player_id: int):
+    def validate_is_players_turn(
+        self, game: Union[Game, GameHeader], player_id: int
+    ):
         """Valida que es el turno del jugador que realiza la acción."""
         if game.current_turn_player_id != player_id:
             raise NotYourTurn(
@@ -87,6 +100,34 @@ class GameValidator:
             )
         return player_in_game
 
+    def validate_player_is_in_game(self, game_id: int, player_id: int):
+        """
+        Variante de validate_player_in_game que no necesita el Game completo:
+        consulta directamente la pertenencia del jugador a la partida.
+        """
+        if not self.read.is_player_in_game(game_id, player_id):
+            raise PlayerNotInGame(
+                detail=f"El jugador {player_id} no forma parte de la partida {game_id}."
+            )
+
+    def validate_hand_has_cards(
+        self, game_id: int, player_id: int, card_ids: List[int]
+    ) -> List[Card]:
+        """
+        Variante de validate_player_has_cards que lee solo la mano del jugador
+        en lugar de recibir el PlayerInGame armado desde el Game completo.
+        """
+        hand_map = {
+            card.card_id: card
+            for card in self.read.get_player_hand(game_id, player_id)
+        }
+        missing = [card_id for card_id in card_ids if card_id not in hand_map]
+        if missing:
+            raise NotYourCard(
+                detail=f"El jugador {player_id} no tiene la carta {missing[0]} en su mano."
+            )
+        return [hand_map[card_id] for card_id in card_ids]
+
     def validate_player_has_cards(
         self, player: PlayerInGame, card_ids: List[int]
     ) -> List[Card]:
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from ..domain.enums import ResponseStatus
 from ..api.schemas import (
@@ -13,6 +14,7 @@ from ..api.schemas import (
     JoinGameRequest,
     JoinGameResponse,
     ListGamesResponse,
+    LobbyFilter,
     GameStateResponse,
     CreatePlayerRequest,
     PlayerActionRequest,
@@ -20,6 +22,7 @@ from ..api.schemas import (
     PlayerHandResponse,
     PlayerSecretsResponse,
     ConsultDeckSizeResponse,
+    LegalMovesResponse,
     LeaveGameRequest,
     LeaveGameResponse,
     ExchangeCardRequest,
@@ -45,7 +48,12 @@ class IGameManager(ABC):
         pass
 
     @abstractmethod
-    def list_games(self) -> ListGamesResponse:
+    def list_games(
+        self,
+        filters: Optional[LobbyFilter] = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> ListGamesResponse:
         pass
 
     @abstractmethod
@@ -98,6 +106,12 @@ class IGameManager(ABC):
     ) -> GeneralActionResponse:
         pass
 
+    @abstractmethod
+    def get_legal_moves(
+        self, request: PlayerActionRequest
+    ) -> LegalMovesResponse:
+        pass
+
     @abstractmethod
     def get_size_deck(self, game_id: int) -> ConsultDeckSizeResponse:
         pass
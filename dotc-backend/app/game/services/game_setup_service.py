@@ -5,8 +5,9 @@ from app.game.exceptions import InternalGameError
 from app.game.helpers.validators import GameValidator
 from app.game.helpers.notificators import Notificator
 from app.game.helpers.turn_utils import TurnUtils
+from app.game.helpers.transactions import game_action
 from ...database.interfaces import IQueryManager, ICommandManager
-from ...domain.models import Card, PlayerInGame
+from ...domain.models import Card, PlayerInGame, SecretAssignment
 from ...api.schemas import StartGameResponse, GameLobbyInfo
 from ...domain.enums import (
     GameStatus,
@@ -62,6 +63,7 @@ class GameSetupService:
         self.notifier = notifier
         self.turn_utils = turn_utils
 
+    @game_action
     async def start_game(
         self, game_id: int, player_id: int
     ) -> StartGameResponse:
@@ -243,83 +245,42 @@ class GameSetupService:
         """
         Crea y distribuye los secretos necesarios para el inicio de la partida.
         Asigna el rol a cada jugador en base a sus secretos.
+        Todo se persiste de una vez con `deal_secrets`.
         """
         players_id_to_assign = [p.player_id for p in players].copy()
         shuffle(players_id_to_assign)
+        innocent_secrets = [PlayerRole.INNOCENT] * (SECRETS_PER_PLAYER - 1)
+        assignments: List[SecretAssignment] = []
         # Manejo de jugador MURDERER
         murderer_id = players_id_to_assign.pop()
-        response = self.write.set_player_role(
-            player_id=murderer_id, game_id=game_id, role=PlayerRole.MURDERER
-        )
-        if response != ResponseStatus.OK:
-            error_msg = "Error al establecer el rol Asesino"
-            raise InternalGameError(detail=error_msg)
-        response = self.write.create_secret_card(
-            player_id=murderer_id,
-            game_id=game_id,
-            role=PlayerRole.MURDERER,
-            is_revealed=False,
-        )
-        if response is None:
-            error_msg = "Error al crear el secreto Asesino"
-            raise InternalGameError(detail=error_msg)
-        for _ in range(SECRETS_PER_PLAYER - 1):
-            response = self.write.create_secret_card(
+        assignments.append(
+            SecretAssignment(
                 player_id=murderer_id,
-                game_id=game_id,
-                role=PlayerRole.INNOCENT,
-                is_revealed=False,
+                role=PlayerRole.MURDERER,
+                secrets=[PlayerRole.MURDERER, *innocent_secrets],
             )
-            if response is None:
-                error_msg = "Error al crear los secretos Inocente del Asesino"
-                raise InternalGameError(detail=error_msg)
+        )
         # Manejo de jugador ACCOMPLICE
         if len(players) > 4:
             accomplice_id = players_id_to_assign.pop()
-            response = self.write.set_player_role(
-                player_id=accomplice_id,
-                game_id=game_id,
-                role=PlayerRole.ACCOMPLICE,
-            )
-            if response != ResponseStatus.OK:
-                error_msg = "Error al establecer el rol Complice"
-                raise InternalGameError(detail=error_msg)
-            response = self.write.create_secret_card(
-                player_id=accomplice_id,
-                game_id=game_id,
-                role=PlayerRole.ACCOMPLICE,
-                is_revealed=False,
-            )
-            if response is None:
-                error_msg = "Error al crear el secreto Complice"
-                raise InternalGameError(detail=error_msg)
-            for _ in range(SECRETS_PER_PLAYER - 1):
-                response = self.write.create_secret_card(
+            assignments.append(
+                SecretAssignment(
                     player_id=accomplice_id,
-                    game_id=game_id,
-                    role=PlayerRole.INNOCENT,
-                    is_revealed=False,
+                    role=PlayerRole.ACCOMPLICE,
+                    secrets=[PlayerRole.ACCOMPLICE, *innocent_secrets],
                 )
-            if response is None:
-                error_msg = "Error al crear los secretos Inocente del Complice"
-                raise InternalGameError(detail=error_msg)
+            )
         # Manejo de jugadores INNOCENT
         for innocent_id in players_id_to_assign:
-            response = self.write.set_player_role(
-                player_id=innocent_id,
-                game_id=game_id,
-                role=PlayerRole.INNOCENT,
-            )
-            if response != ResponseStatus.OK:
-                error_msg = "Error al establecer los roles Inocente"
-                raise InternalGameError(detail=error_msg)
-            for _ in range(SECRETS_PER_PLAYER):
-                response = self.write.create_secret_card(
+            assignments.append(
+                SecretAssignment(
                     player_id=innocent_id,
-                    game_id=game_id,
                     role=PlayerRole.INNOCENT,
-                    is_revealed=False,
+                    secrets=[PlayerRole.INNOCENT] * SECRETS_PER_PLAYER,
                 )
-                if response is None:
-                    error_msg = "Error al crear los secretos para Inocentes"
-                    raise InternalGameError(detail=error_msg)
+            )
+
+        response = self.write.deal_secrets(game_id, assignments)
+        if response != ResponseStatus.OK:
+            error_msg = "Error al repartir los roles y secretos."
+            raise InternalGameError(detail=error_msg)
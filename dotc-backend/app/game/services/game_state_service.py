@@ -1,13 +1,16 @@
 from ..helpers.validators import GameValidator
 from ..helpers.notificators import Notificator
 from ..helpers.turn_utils import TurnUtils
+from ..helpers.legal_moves import LEGAL_MOVE_FINDER, LegalMoveFinder
 from ...database.interfaces import IQueryManager, ICommandManager
 from ...api.schemas import (
     GameStateResponse,
     PlayerHandResponse,
     PlayerSecretsResponse,
-    ConsultDeckSizeResponse
+    ConsultDeckSizeResponse,
+    LegalMovesResponse,
 )
+from ...domain.enums import GameActionState
 from ...domain.models import PlayerInGame
 from typing import List
 
@@ -24,12 +27,14 @@ class GameStateService:
         validator: GameValidator,
         notifier: Notificator,
         turn_utils: TurnUtils,
+        legal_moves: LegalMoveFinder = LEGAL_MOVE_FINDER,
     ):
         self.read = queries
         self.write = commands
         self.validator = validator
         self.notifier = notifier
         self.turn_utils = turn_utils
+        self.legal_moves = legal_moves
 
     def get_game_state(self, game_id: int) -> GameStateResponse:
         """
@@ -126,6 +131,39 @@ class GameStateService:
         # --- PASO 5: Crear Response ---
         return ConsultDeckSizeResponse(size_deck=size_deck)
 
+    def get_legal_moves(
+        self, game_id: int, player_id: int
+    ) -> LegalMovesResponse:
+        """
+        Obtiene las jugadas que el jugador puede hacer ahora con su mano
+        (ver helpers/legal_moves.py). No lee el Game completo: cabecera,
+        mano, sets y desgracia social, más la acción pendiente en PENDING_NSF.
+        """
+        # --- PASO 1: Validar ---
+        header = self.validator.validate_game_header_exists(game_id)
+        self.validator.validate_player_is_in_game(game_id, player_id)
+
+        # --- PASO 2: Lectura en DB ---
+        hand = self.read.get_player_hand(game_id, player_id)
+        sets = self.read.get_sets(game_id)
+        social_disgrace = self.read.is_player_in_social_disgrace(
+            game_id, player_id
+        )
+        nsf_blocked = False
+        if header.action_state == GameActionState.PENDING_NSF:
+            pending = self.read.get_pending_action(game_id)
+            nsf_blocked = (
+                pending is None or pending.last_action_player_id == player_id
+            )
+
+        # --- PASO 3: Enumerar (o reusar lo cacheado) ---
+        moves = self.legal_moves.find(
+            header, player_id, hand, sets, social_disgrace, nsf_blocked
+        )
+
+        # --- PASO 4: Crear Response ---
+        return LegalMovesResponse(moves=list(moves))
+
     async def get_sorted_players(self, game_id: int) -> List[PlayerInGame]:
         """Devuelve la lista de jugadores ordenada por turn order."""
         # 1. Validar existencia del juego (consistencia con otros métodos)
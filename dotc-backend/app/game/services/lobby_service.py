@@ -1,3 +1,5 @@
+from typing import Optional
+
 from ...database.interfaces import IQueryManager, ICommandManager
 from ...domain.enums import GameStatus, ResponseStatus
 from ...api.schemas import (
@@ -8,10 +10,12 @@ from ...api.schemas import (
     ListGamesResponse,
     LeaveGameResponse,
     LeaveGameRequest,
+    LobbyFilter,
 )
 
 from ..helpers.validators import GameValidator
 from ..helpers.notificators import Notificator
+from ..helpers.transactions import game_action
 from ...api.schemas import GameLobbyInfo
 from ..exceptions import (
     InternalGameError,
@@ -40,6 +44,7 @@ class LobbyService:
         self.validator = validator
         self.notifier = notifier
 
+    @game_action
     async def create_game(
         self, request: CreateGameRequest
     ) -> CreateGameResponse:
@@ -79,6 +84,7 @@ class LobbyService:
         # --- PASO 5: Crear Response ---
         return CreateGameResponse(game_id=game_id)
 
+    @game_action
     async def join_game(self, request: JoinGameRequest) -> JoinGameResponse:
         """Permite a un jugador unirse a una partida en estado LOBBY."""
         # --- PASO 1: Parsear Inputs ---
@@ -128,21 +134,38 @@ class LobbyService:
         # --- PASO 5: Crear Response ---
         return JoinGameResponse(detail="Te has unido a la partida con éxito.")
 
-    def list_games(self) -> ListGamesResponse:
-        """Devuelve una lista de todas las partidas en estado LOBBY."""
-        # --- PASOS 1 y 2 (Omitidos, no hay inputs ni validaciones complejas) ---
+    def list_games(
+        self,
+        filters: Optional[LobbyFilter] = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> ListGamesResponse:
+        """
+        Devuelve las partidas del lobby que pasan los filtros (sin filtros,
+        las que están en LOBBY), una página a la vez si se pide `limit`.
+        """
+        # --- PASOS 1 y 2 (Omitidos, los inputs ya llegan validados) ---
 
         # --- PASO 3: Lectura en DB ---
-        games_in_lobby = self.read.list_games_in_lobby()
+        # Se pide una de más para saber si hay página siguiente.
+        games_in_lobby = self.read.list_games_in_lobby(
+            filters, after_id=cursor, limit=limit + 1 if limit else None
+        )
 
         # --- PASO 4 (Omitido, es una consulta) ---
+        next_cursor = None
+        if limit and len(games_in_lobby) > limit:
+            games_in_lobby = games_in_lobby[:limit]
+            next_cursor = games_in_lobby[-1].id
 
         # --- PASO 5: Crear Response ---
         return ListGamesResponse(
             detail="Listado de partidas en el lobby obtenido con éxito.",
             games=games_in_lobby,
+            next_cursor=next_cursor,
         )
 
+    @game_action
     async def leave_game(self, request: LeaveGameRequest) -> LeaveGameResponse:
         """Permite a un jugador abandonar una partida."""
         # --- PASO 1: Parsear Inputs ---
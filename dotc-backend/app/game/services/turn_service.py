@@ -23,15 +23,17 @@ from ...domain.enums import (
     GameActionState,
     PlayerRole,
 )
-from ...domain.models import Card, CardLocation, Game
+from ...domain.models import Card, CardLocation, CardMove, Game, PendingAction
 from typing import Callable, List, Optional
 from ..helpers.validators import GameValidator
 from ..helpers.notificators import Notificator
 from app.game.helpers.turn_utils import TurnUtils
+from app.game.helpers.transactions import game_action
 from ..exceptions import (
     ActionConflict,
     InternalGameError,
     InvalidAction,
+    InvalidRequest,
     ResourceNotFound,
     CardNotFound,
     ActionConflict,
@@ -64,13 +66,15 @@ class TurnService:
         self.effect_executor = effect_executor
         self.turn_utils = turn_utils
 
+    @game_action
     async def draw_card(self, request: DrawCardRequest) -> DrawCardResponse:
         from app.game.turn_actions.actions import DrawCardAction
 
         return await DrawCardAction(
-            self.read, self.write, self.validator, self.notifier
+            self.read, self.write, self.notifier
         ).execute(request)
 
+    @game_action
     async def discard_card(
         self, request: DiscardCardRequest
     ) -> GeneralActionResponse:
@@ -79,11 +83,11 @@ class TurnService:
         return await DiscardCardAction(
             self.read,
             self.write,
-            self.validator,
             self.notifier,
             self.effect_executor,
         ).execute(request)
 
+    @game_action
     async def finish_turn(
         self, request: PlayerActionRequest
     ) -> FinishTurnResponse:
@@ -92,9 +96,7 @@ class TurnService:
         return await FinishTurnAction(
             self.read,
             self.write,
-            self.validator,
             self.notifier,
-            self.turn_utils,
         ).execute(request)
 
     def _assign_next_turn(self, game_id: int) -> int:
@@ -131,6 +133,7 @@ class TurnService:
             )
         return next_player_id
 
+    @game_action
     async def play_card(
         self,
         request: PlayCardRequest,
@@ -148,6 +151,10 @@ class TurnService:
         game = self.validator.validate_game_exists(game_id)
         player = self.validator.validate_player_in_game(game, player_id)
 
+        # Con una ventana NSF abierta, una jugada nueva pisaría la pendiente
+        if game.action_state == GameActionState.PENDING_NSF:
+            raise ActionConflict("Hay una jugada pendiente de respuestas NSF.")
+
         if request.target_player_id:
             self.validator.validate_player_in_game(game,
                                                     request.target_player_id)
@@ -265,6 +272,15 @@ class TurnService:
 
             if card_to_add.card_type == CardType.ARIADNE_OLIVER:
                 cards_for_effect_check = [card_to_add]
+            elif any(
+                c.player_id != player_id
+                for c in cards_in_set_orm
+                if c.card_type != CardType.ARIADNE_OLIVER
+            ):
+                # Solo Ariadne Oliver se suma a sets ajenos
+                raise InvalidAction(
+                    "Solo puedes añadir detectives a tus propios sets."
+                )
 
         elif action_type == PlayCardActionType.PLAY_EVENT:
             if len(played_cards) != 1:
@@ -337,6 +353,7 @@ class TurnService:
 
         return GeneralActionResponse(detail="La jugada fue procesada.")
 
+    @game_action
     async def reveal_secret(self, request: RevealSecretRequest):
         game_id = request.game_id
         player_id = request.player_id
@@ -523,56 +540,55 @@ class TurnService:
             detail="Secreto revelado y acción completada."
         )
 
+    @game_action
     async def submit_vote(self, request: VoteRequest) -> GeneralActionResponse:
         """Nuevo método central para registrar votos del evento 'Point Your Suspicions'."""
         game_id = request.game_id
         voter_id = request.player_id
-        game = self.validator.validate_game_exists(game_id)
+        game = self.validator.validate_game_header_exists(game_id)
         if game.action_state != GameActionState.AWAITING_VOTES:
             raise ActionConflict("No es momento de votar.")
         saga = self.read.get_pending_saga(game_id)
         if not saga or saga.get("type") != "point_your_suspicions":
             raise InvalidSagaState("Saga de votación no encontrada.")
-        if str(voter_id) in saga.get("votes", {}):
+        round_id = saga.get("round_id")
+        if round_id is None:
+            raise InvalidSagaState("La votación no tiene ronda asignada.")
+        status = self.write.cast_vote(
+            game_id, round_id, voter_id, request.voted_player_id
+        )
+        if status == ResponseStatus.ALREADY_VOTED:
             raise ActionConflict("Ya has emitido tu voto.")
-        saga["votes"][str(voter_id)] = request.voted_player_id
-        self.write.update_pending_saga(game_id, saga)
+        if status != ResponseStatus.OK:
+            raise InternalGameError("No se pudo registrar el voto.")
+        initiator_id = saga.get("initiator_id") or saga.get(
+            "tie_breaker_player_id"
+        )
+        tally = self.read.get_vote_tally(game_id, round_id, initiator_id)
         eligible_voters = saga.get("eligible_voters", [])
-        all_votes_in = len(saga["votes"]) >= len(eligible_voters)
+        all_votes_in = tally.total_votes >= len(eligible_voters)
         print(
-            f"[SUBMIT_VOTE] Voto de {voter_id} recibido. {len(saga['votes'])} de {len(eligible_voters)}. Todos? {all_votes_in}"
+            f"[SUBMIT_VOTE] Voto de {voter_id} recibido. {tally.total_votes} de {len(eligible_voters)}. Todos? {all_votes_in}"
         )
         if all_votes_in and eligible_voters:
             print("[SUBMIT_VOTE] Todos los votos recibidos. Resolviendo...")
-            from collections import Counter
-
-            votes = saga.get("votes", {})
-            initiator_id = saga.get("initiator_id") or saga.get(
-                "tie_breaker_player_id"
-            )
-            valid_votes = [v for v in votes.values() if v is not None]
             most_voted_id = None
             is_tie = False
-            if valid_votes:
-                vote_counts = Counter(valid_votes)
-                most_common = vote_counts.most_common()
-                is_tie = (
-                    len(most_common) > 1
-                    and most_common[0][1] == most_common[1][1]
-                )
+            if tally.counts:
+                top_count = max(tally.counts.values())
+                top_voted_ids = {
+                    player_id
+                    for player_id, count in tally.counts.items()
+                    if count == top_count
+                }
+                is_tie = len(top_voted_ids) > 1
                 if not is_tie:
-                    most_voted_id = most_common[0][0]
+                    most_voted_id = top_voted_ids.pop()
                 else:
-                    tie_breaker_vote = votes.get(str(initiator_id))
-                    top_voted_ids = {
-                        item[0]
-                        for item in most_common
-                        if item[1] == most_common[0][1]
-                    }
                     most_voted_id = (
-                        tie_breaker_vote
-                        if tie_breaker_vote in top_voted_ids
-                        else sorted(list(top_voted_ids))[0]
+                        tally.initiator_vote
+                        if tally.initiator_vote in top_voted_ids
+                        else sorted(top_voted_ids)[0]
                     )
             await self.notifier.notify_vote_result(
                 game_id, most_voted_id, is_tie
@@ -581,12 +597,16 @@ class TurnService:
                 reveal_effect = RevealChosenSecretEffect(
                     self.read, self.write, self.notifier
                 )
-                await reveal_effect.execute(
-                    game_id=game_id,
-                    player_id=initiator_id,
-                    card_ids=[],
-                    target_player_id=most_voted_id,
-                )
+                try:
+                    await reveal_effect.execute(
+                        game_id=game_id,
+                        player_id=initiator_id,
+                        card_ids=[],
+                        target_player_id=most_voted_id,
+                    )
+                except InvalidAction:
+                    # El más votado ya no tiene secretos ocultos que revelar
+                    self.write.clear_game_action_state(game_id)
             else:
                 self.write.clear_game_action_state(game_id)
             source_card_id = saga.get("source_card_id")
@@ -597,11 +617,13 @@ class TurnService:
                 card_obj = self.read.get_card(source_card_id, game_id)
                 if card_obj:
                     await self.notifier.notify_cards_played(
-                        game_id, initiator_id, [card_obj]
+                        game_id, initiator_id, [card_obj], is_cancellable=False
                     )
+            self.write.clear_votes(game_id, round_id)
             self.write.update_pending_saga(game_id, None)
         return GeneralActionResponse(detail="Voto registrado con éxito.")
 
+    @game_action
     async def submit_trade_choice(
         self, request: SubmitTradeChoiceRequest
     ) -> GeneralActionResponse:
@@ -655,8 +677,9 @@ class TurnService:
 
         Esta función es el supervisor del campo de minas. Su lógica es:
         1.  CALCULAR: Determina el nuevo dueño de cada carta basado en el orden y la dirección.
-        2.  MOVER Y DETECTAR: Actualiza la ubicación de cada carta en la DB. Si una
-            carta es "Devious", la añade a una lista para procesamiento posterior.
+        2.  MOVER Y DETECTAR: Mueve todas las cartas en la DB con un único
+            `move_cards`. Si una carta es "Devious", la añade a una lista para
+            procesamiento posterior.
         3.  LIMPIAR Y NOTIFICAR: Resetea el estado de acción del juego y notifica
             a los clientes que sus manos han sido actualizadas.
         4.  DELEGAR: Itera sobre las Devious Cards detectadas y las "re-juega"
@@ -702,19 +725,34 @@ class TurnService:
             }
 
         # --- PASO 2: MOVER Y DETECTAR MINAS ---
+        # Todas las cartas cambian de mano en un único UPDATE en lote.
+        status = self.write.move_cards(
+            game.id,
+            [
+                CardMove(
+                    card_id=card_id,
+                    location=CardLocation.IN_HAND,
+                    owner_id=move["new_owner_id"],
+                )
+                for card_id, move in card_movements.items()
+            ],
+        )
+        if status != ResponseStatus.OK:
+            raise InternalGameError(
+                "La DB no pudo mover las cartas del intercambio."
+            )
+
+        # Las cartas elegidas estaban en las manos de `game`: no hace falta
+        # volver a leerlas una por una para saber si son bombas.
+        cards_in_hands = {
+            c.card_id: c for p in game.players for c in p.hand
+        }
         devious_cards_to_reroute = []
 
         for card_id, move in card_movements.items():
-            # Actualizamos la posesión de la carta en la base de datos.
-            self.write.update_card_location(
-                card_id=card_id,
-                game_id=game.id,
-                new_location=CardLocation.IN_HAND,
-                owner_id=move["new_owner_id"],
+            card_obj = cards_in_hands.get(card_id) or self.read.get_card(
+                card_id, game.id
             )
-
-            # Ahora, verificamos si es una bomba. Necesitamos el objeto completo.
-            card_obj = self.read.get_card(card_id, game.id)
             if card_obj and card_obj.card_type in {
                 CardType.BLACKMAILED,
                 CardType.SOCIAL_FAUX_PAS,
@@ -735,7 +773,8 @@ class TurnService:
         self.write.clear_game_action_state(game.id)
 
         # Notificamos a TODOS que sus manos han cambiado.
-        # Los clientes ahora deben volver a pedir su mano actualizada.
+        # Los clientes ahora deben volver a pedir su mano actualizada
+        # (en modo delta no hace falta: los movimientos van en STATE_PATCH).
         await self.notifier.notify_hands_updated(game.id)
 
         # --- PASO 4: DELEGAR LAS BOMBAS AL CUARTEL GENERAL (`play_card`) ---
@@ -774,6 +813,7 @@ class TurnService:
             # ¡Llamada al Cuartel General con la llave maestra!
             await self.play_card(request=reroute_request)
 
+    @game_action
     async def exchange_card(
         self, request: ExchangeCardRequest
     ) -> GeneralActionResponse:
@@ -965,19 +1005,22 @@ class TurnService:
                 detail="Intercambio de cartas completado exitosamente."
             )
         
+    @game_action
     async def play_nsf(self, request: PlayCardRequest) -> GeneralActionResponse:
         """Procesa una jugada NSF o la decisión de no jugarlo ('pasar')."""
         game_id = request.game_id
         player_id = request.player_id
 
         # --- PASO 1: VALIDACIONES ---
-        game = self.validator.validate_game_exists(game_id)
+        game = self.validator.validate_game_header_exists(game_id)
         if game.action_state != GameActionState.PENDING_NSF:
             raise ActionConflict("No hay una acción pendiente para cancelar.")
 
         pending_action = self.read.get_pending_action(game_id)
         if not pending_action:
+            # Destrabamos la partida aunque la acción falle
             self.write.clear_game_action_state(game_id)
+            self.write.unit_of_work().checkpoint()
             raise InternalGameError("No se encontró la acción pendiente en BD")
 
         if pending_action.last_action_player_id == player_id:
@@ -988,9 +1031,9 @@ class TurnService:
             # El jugador ha decidido jugar una carta NSF.
             if len(request.card_ids) != 1:
                 raise InvalidAction("Solo puedes jugar una carta NSF a la vez.")
-            player = self.validator.validate_player_in_game(game, player_id)
-            played_nsf_card = self.validator.validate_player_has_cards(
-                player, request.card_ids)[0]
+            self.validator.validate_player_is_in_game(game_id, player_id)
+            played_nsf_card = self.validator.validate_hand_has_cards(
+                game_id, player_id, request.card_ids)[0]
             if played_nsf_card.card_type != CardType.NOT_SO_FAST:
                 raise InvalidAction("Solo puedes jugar una carta 'NSF' ahora.")
 
@@ -1002,7 +1045,8 @@ class TurnService:
             )
             await self.notifier.notify_cards_played(
                 game_id, player_id, [played_nsf_card], is_cancellable=True,
-                player_name=player.player_name, action_id=pending_action.id
+                player_name=self.read.get_player_name(player_id),
+                action_id=pending_action.id
             )
             self.write.increment_nsf_responses(game_id, player_id, add_nsf=True)
         else:
@@ -1014,7 +1058,7 @@ class TurnService:
         if not updated_action:
             raise InternalGameError("La acción pendiente no existe.")
 
-        required_responses = len(game.players) - 1
+        required_responses = game.player_count - 1
         
         print(f"[TURN_SERVICE] Verificando si cadena NSF terminó: responses_count={updated_action.responses_count}, required={required_responses}, nsf_count={updated_action.nsf_count}")
 
@@ -1064,76 +1108,55 @@ class TurnService:
             else:
                 print(f"[TURN_SERVICE] Acción RESUELTA, ejecutando lógica original")
                 
-                # Caso especial: Card Trade requiere selección de jugador objetivo ANTES de ejecutar efecto
-                card_type = updated_action.cards[0].card_type if updated_action.cards else None
-                if card_type == CardType.CARD_TRADE:
-                    print(f"[TURN_SERVICE] Card Trade detectado, moviendo carta y esperando selección de jugador objetivo")
-                    # 1. Mover carta a DISCARD_PILE
-                    card_to_discard = updated_action.cards[0]
-                    self.write.update_card_location(
-                        card_to_discard.card_id, 
-                        game_id, 
-                        CardLocation.DISCARD_PILE
-                    )
-                    
-                    # 2. Leer carta actualizada para notificación
-                    updated_card = self.read.get_card(
-                        card_id=card_to_discard.card_id, 
-                        game_id=game_id
-                    )
-                    updated_cards = [updated_card] if updated_card else []
-                    
-                    # 3. Cambiar estado para esperar selección de jugador objetivo
-                    self.write.set_game_action_state(
-                        game_id=game_id,
-                        state=GameActionState.AWAITING_SELECTION_FOR_CARD_TRADE,
-                        prompted_player_id=updated_action.player_id,
-                        initiator_id=updated_action.player_id,
-                    )
-                    
-                    # 4. Notificar que acción se resolvió (cierra ventana NSF)
-                    await self.notifier.notify_action_resolved(
-                        game_id=game_id,
-                        player_id=updated_action.player_id,
-                        cards=updated_cards,
-                        action_id=updated_action.id
-                    )
-                    
-                    # 5. Notificar que debe seleccionar jugador objetivo
-                    # TODO: Implementar notificación específica para selección de jugador objetivo
-                    # Por ahora, el frontend debe detectar el estado AWAITING_SELECTION_FOR_CARD_TRADE
-                else:
-                    # Flujo normal: ejecutar efecto de la carta
-                    play_request = PlayCardRequest(
-                        player_id=updated_action.player_id,
-                        game_id=updated_action.game_id,
-                        action_type=updated_action.action_type,
-                        card_ids=[card.card_id for card in updated_action.cards],
-                        target_player_id=updated_action.target_player_id,
-                        target_secret_id=updated_action.target_secret_id,
-                        target_card_id=updated_action.target_card_id,
-                        target_set_id=updated_action.target_set_id,
-                    )
-                    # Ejecutamos la lógica y obtenemos las cartas actualizadas
-                    updated_cards = await self._execute_play_card_logic(
-                        play_request, updated_action.cards
-                    )
-                    # Notificamos SIEMPRE que la acción se resolvió para que el frontend cierre ventana NSF
-                    # Para cartas de evento que requieren selección, updated_cards puede estar vacío pero igual
-                    # debemos notificar que la cadena NSF terminó exitosamente
-                    await self.notifier.notify_action_resolved(
-                        game_id=game_id,
-                        player_id=updated_action.player_id,
-                        cards=updated_cards if updated_cards else [],
-                        action_id=updated_action.id
+                # Card Trade también pasa por su efecto: es el que guarda la
+                # saga del intercambio y le pide la carta al jugador objetivo.
+                play_request = PlayCardRequest(
+                    player_id=updated_action.player_id,
+                    game_id=updated_action.game_id,
+                    action_type=updated_action.action_type,
+                    card_ids=[card.card_id for card in updated_action.cards],
+                    target_player_id=updated_action.target_player_id,
+                    target_secret_id=updated_action.target_secret_id,
+                    target_card_id=updated_action.target_card_id,
+                    target_set_id=updated_action.target_set_id,
+                )
+                # Ejecutamos la lógica y obtenemos las cartas actualizadas
+                try:
+                    # Un savepoint: si el efecto escribió antes de rechazar
+                    # la jugada, eso (y lo que notificó) se deshace acá.
+                    async with self.notifier.savepoint():
+                        with self.write.unit_of_work().savepoint():
+                            updated_cards = await self._execute_play_card_logic(
+                                play_request, updated_action.cards
+                            )
+                except (InvalidRequest, ResourceNotFound, ActionConflict) as e:
+                    # Los targets ya no sirven (o nunca sirvieron): la jugada
+                    # se anula sin efecto y las cartas vuelven a la mano. Si
+                    # relanzáramos, el rollback de toda la acción dejaría la
+                    # partida trabada en PENDING_NSF.
+                    print(f"Error en jugada resuelta sin efecto: {e.detail}")
+                    await self._void_resolved_action(game_id, updated_action)
+                    return GeneralActionResponse(
+                        detail=f"La jugada se anuló sin efecto: {e.detail}"
                     )
+                # Notificamos SIEMPRE que la acción se resolvió para que el frontend cierre ventana NSF
+                # Para cartas de evento que requieren selección, updated_cards puede estar vacío pero igual
+                # debemos notificar que la cadena NSF terminó exitosamente
+                await self.notifier.notify_action_resolved(
+                    game_id=game_id,
+                    player_id=updated_action.player_id,
+                    cards=updated_cards if updated_cards else [],
+                    action_id=updated_action.id
+                )
 
             # Limpiamos la pending_action
             self.write.clear_pending_action(game_id)
             
             # Solo limpiamos el estado del juego si NO quedó en un estado especial
             # (ej: AWAITING_SELECTION_FOR_CARD, AWAITING_REVEAL_FOR_CHOICE, etc.)
-            game_after_effect = self.validator.validate_game_exists(game_id)
+            game_after_effect = self.validator.validate_game_header_exists(
+                game_id
+            )
             if game_after_effect.action_state == GameActionState.PENDING_NSF:
                 # Si aún está en PENDING_NSF, lo limpiamos
                 self.write.clear_game_action_state(game_id)
@@ -1141,6 +1164,25 @@ class TurnService:
 
         return GeneralActionResponse(detail="Respuesta NSF registrada.")
 
+    async def _void_resolved_action(
+        self, game_id: int, action: PendingAction
+    ) -> None:
+        """
+        Anula una jugada que pasó la cadena NSF pero cuyo efecto rechazó los
+        targets: cierra la ventana NSF y le devuelve la mano al jugador.
+        """
+        self.write.clear_pending_action(game_id)
+        self.write.clear_game_action_state(game_id)
+        await self.notifier.notify_action_cancelled(
+            game_id=game_id, player_id=action.player_id, cards=action.cards
+        )
+        hand = self.read.get_player_hand(
+            game_id=game_id, player_id=action.player_id
+        )
+        await self.notifier.notify_hand_updated(
+            game_id=game_id, player_id=action.player_id, hand=hand
+        )
+
     async def _move_cards_after_play(
         self,
         game_id: int,
@@ -1169,12 +1211,22 @@ class TurnService:
                 raise InternalGameError(
                     "La base de datos falló al crear un nuevo set.")
             
-            for card in cards_played:
-                # Al mover la carta, también le asignamos su nuevo set_id
-                self.write.update_card_location(card.card_id,
-                                                game_id,
-                                                CardLocation.PLAYED,
-                                                player_id, set_id=new_set_id)
+            # Al mover las cartas, también les asignamos su nuevo set_id
+            status = self.write.move_cards(
+                game_id,
+                [
+                    CardMove(
+                        card_id=card.card_id,
+                        location=CardLocation.PLAYED,
+                        owner_id=player_id,
+                        set_id=new_set_id,
+                    )
+                    for card in cards_played
+                ],
+            )
+            if status != ResponseStatus.OK:
+                raise InternalGameError(
+                    "La base de datos falló al mover las cartas del set.")
             
             # Para la notificación, volvemos a leer el set completo desde la BD.
             cards_to_notify = self.read.get_set(set_id=new_set_id,
@@ -1,44 +1,31 @@
-from typing import List, Optional, TYPE_CHECKING, Callable
+from typing import List, Optional
 from app.api.schemas import (
     DrawCardRequest,
+    DrawCardResponse,
     DiscardCardRequest,
-    DrawSource,
     FinishTurnResponse,
-    PlayCardRequest,
     RevealSecretRequest,
     PlayerActionRequest,
-    SubmitTradeChoiceRequest,
     GeneralActionResponse,
-    PlayCardActionType,
-    VoteRequest,
 )
-from app.domain.models import Card, Game, CardLocation
 from app.domain.enums import (
     ResponseStatus,
     GameActionState,
-    CardType,
     PlayerRole,
-    GameFlowStatus,
 )
-from app.game.effects.interfaces import ICardEffect
 from app.game.exceptions import (
-    InvalidAction,
     InternalGameError,
-    CardNotFound,
     ResourceNotFound,
-    ForbiddenAction,
-    ActionConflict,
-    InvalidSagaState,
 )
 from app.game.effect_executor import EffectExecutor
-from app.game.helpers.turn_utils import TurnUtils
 from app.game.helpers.notificators import Notificator
 from app.game.helpers.validators import GameValidator
 from app.database.interfaces import IQueryManager, ICommandManager
-from ..effects.set_effects import RevealChosenSecretEffect
+from ..engine import actions as engine_actions
+from ..engine import reducer as engine
+from ..engine.state import GameState
+from ..engine.store import GameStateStore
 
-if TYPE_CHECKING:
-    from ..services.turn_service import TurnService
 # Handlers -------------------------------------------------------------
 
 
@@ -47,180 +34,66 @@ class DrawCardAction:
         self,
         queries: IQueryManager,
         commands: ICommandManager,
-        validator: GameValidator,
         notifier: Notificator,
     ):
         self.read = queries
         self.write = commands
-        self.validator = validator
         self.notifier = notifier
+        self.store = GameStateStore(queries, commands)
 
     async def execute(self, request: DrawCardRequest):
-        game_id = request.game_id
-        player_id = request.player_id
-        game = self.validator.validate_game_exists(game_id)
-        self.validator.validate_player_in_game(game, player_id)
-        self.validator.validate_is_players_turn(game, player_id)
-
-        hand_cards = self.read.get_player_hand(
-            game_id=game_id, player_id=player_id
+        # Solo las filas que toca el robo, no la partida entera
+        before = self.store.load_draw(
+            request.game_id, request.player_id, request.source
         )
-        if len(hand_cards) >= 6:
-            raise InvalidAction("No puedes alzar una carta más si ya tienes 6.")
-
-        if request.source == request.source.DISCARD:
-            if (
-                game.action_state
-                is not GameActionState.AWAITING_SELECTION_FOR_CARD
-            ):
-                raise InvalidAction(
-                    "No estás en un estado que te permita robar del descarte."
-                )
-            if request.card_id is None:
-                raise InvalidAction(
-                    "Se requiere el ID de la carta para robar del descarte."
-                )
-            card_in_discard = next(
-                (c for c in game.discard_pile if c.card_id == request.card_id),
-                None,
-            )
-            if not card_in_discard:
-                raise CardNotFound(
-                    f"La carta {request.card_id} no está en la pila de descarte."
-                )
-            card_to_draw = card_in_discard
-            self.write.clear_game_action_state(game_id=game_id)
-        elif request.source == request.source.DECK:
-            self.validator.validate_deck_has_cards(game)
-            card_to_draw = game.deck[0]
-        elif request.source == request.source.DRAFT:
-            if request.card_id is None:
-                raise InvalidAction(
-                    "Se requiere el ID de la carta para robar del draft."
-                )
-            draft_card = next(
-                (c for c in game.draft if c.card_id == request.card_id), None
-            )
-            if not draft_card:
-                raise CardNotFound(
-                    f"La carta {request.card_id} no está en el draft."
-                )
-            card_to_draw = draft_card
-            await self._refill_draft_slot(game, card_to_draw)
-        else:
-            raise InvalidAction("Fuente de robo desconocida.")
-
-        status = self.write.update_card_location(
-            card_id=card_to_draw.card_id,
-            game_id=game_id,
-            new_location=CardLocation.IN_HAND,
-            owner_id=player_id,
+        deck_size = self.read.get_size_deck(game_id=request.game_id)
+        after, events = engine.apply(
+            before,
+            engine_actions.DrawCard(
+                player_id=request.player_id,
+                source=request.source,
+                card_id=request.card_id,
+            ),
         )
-        if status != ResponseStatus.OK:
-            raise InternalGameError(
-                "La DB no pudo actualizar la ubicación de la carta robada."
-            )
-        await self.notifier.notify_player_drew(
-            game_id, player_id, len(game.deck) - 1
+        self.store.persist(before, after)
+        # El estado trae solo el tope del mazo: lo que queda se descuenta
+        deck_size -= len(before.deck) - len(after.deck)
+        await _publish_engine_events(
+            self.write, self.notifier, after, events, deck_size=deck_size
         )
-        from app.api.schemas import DrawCardResponse
-
-        # --- Verificaciones fin de partida ---
-        murderer_id = self.read.get_murderer_id(game_id)
-        accomplice_id = self.read.get_accomplice_id(game_id)
-        if not murderer_id:
-            raise InternalGameError("No se pudo obtener el ID del asesino.")
-
-        if (
-            request.source == DrawSource.DECK
-            and not game.draft
-            and len(game.deck) == 1
-        ) or (
-            request.source == DrawSource.DRAFT
-            and not game.deck
-            and len(game.draft) == 1
-        ):
-            await self.notifier.notify_murderer_wins(
-                game_id=game.id,
-                murderer_id=murderer_id,
-                accomplice_id=accomplice_id,
-            )
-            status = self.write.delete_game(game_id=game_id)
-            if status != ResponseStatus.OK:
-                error_message = "La base de datos no pudo eliminar la partida."
-                raise InternalGameError(detail=error_message)
-            await self.notifier.notify_game_removed(game_id)
-
-        return DrawCardResponse(drawn_card=card_to_draw)
-
-    async def _refill_draft_slot(self, game: Game, card_taken: Card):
-        if not game.deck:
-            await self.notifier.notify_draft_updated(
-                game.id, card_taken.card_id, None
-            )
-            return
-        new_card = game.deck[0]
-        self.write.update_card_location(
-            card_id=new_card.card_id,
-            game_id=game.id,
-            new_location=CardLocation.DRAFT,
-        )
-        new_card.location = CardLocation.DRAFT
-        await self.notifier.notify_draft_updated(
-            game.id, card_taken.card_id, new_card
+        drawn = next(
+            e for e in events if isinstance(e, engine_actions.CardDrawn)
         )
+        return DrawCardResponse(drawn_card=after.card(drawn.card_id))
+
 
 class DiscardCardAction:
     def __init__(
         self,
         queries: IQueryManager,
         commands: ICommandManager,
-        validator: GameValidator,
         notifier: Notificator,
         effect_executor: EffectExecutor,
     ):
-        self.read = queries
         self.write = commands
-        self.validator = validator
         self.notifier = notifier
         self.effect_executor = effect_executor
+        self.store = GameStateStore(queries, commands)
 
     async def execute(self, request: DiscardCardRequest):
-        game_id = request.game_id
-        player_id = request.player_id
-        card_id = request.card_id
-        game = self.validator.validate_game_exists(game_id)
-        player = self.validator.validate_player_in_game(game, player_id)
-        self.validator.validate_is_players_turn(game, player_id)
-        self.validator.validate_player_has_cards(player, [card_id])
-        status = self.write.update_card_location(
-            card_id=card_id,
-            game_id=game_id,
-            new_location=CardLocation.DISCARD_PILE,
-            owner_id=None,
-        )
-        if status != ResponseStatus.OK:
-            raise InternalGameError(
-                "La DB no pudo actualizar la ubicación de la carta."
-            )
-        card_to_discard = next(
-            (c for c in player.hand if c.card_id == card_id), None
+        before = self.store.load(request.game_id)
+        after, events = engine.apply(
+            before,
+            engine_actions.DiscardCard(
+                player_id=request.player_id, card_id=request.card_id
+            ),
         )
-        if not card_to_discard:
-            raise InternalGameError(
-                "La carta estaba en la mano para validar pero no para notificar."
-            )
-        await self.notifier.notify_card_discarded(
-            game_id, player_id, card_to_discard
+        self.store.persist(before, after)
+        await _publish_engine_events(
+            self.write, self.notifier, after, events, self.effect_executor
         )
-        if card_to_discard.card_type == CardType.EARLY_TRAIN:
-            await self.effect_executor.execute_effect(
-                game_id=game_id,
-                played_cards=[card_to_discard],
-                player_id=player_id,
-            )
         return GeneralActionResponse(
-            detail=f"Carta {card_to_discard.card_id} descartada con éxito."
+            detail=f"Carta {request.card_id} descartada con éxito."
         )
 
 
@@ -229,63 +102,76 @@ class FinishTurnAction:
         self,
         queries: IQueryManager,
         commands: ICommandManager,
-        validator: GameValidator,
         notifier: Notificator,
-        turn_utils: TurnUtils,
     ):
-        self.read = queries
         self.write = commands
-        self.validator = validator
         self.notifier = notifier
-        self.turn_utils = turn_utils
+        self.store = GameStateStore(queries, commands)
 
     async def execute(self, request: PlayerActionRequest):
-        game_id = request.game_id
-        player_id = request.player_id
-        game = self.validator.validate_game_exists(game_id)
-        self.validator.validate_player_in_game(game, player_id)
-        self.validator.validate_is_players_turn(game, player_id)
-        hand_cards = self.read.get_player_hand(
-            game_id=game_id, player_id=player_id
+        before = self.store.load(request.game_id)
+        after, events = engine.apply(
+            before, engine_actions.FinishTurn(player_id=request.player_id)
         )
-        if len(hand_cards) < 6:
-            raise InvalidAction(
-                "No puedes terminar tu turno con menos de 6 cartas en la mano."
-            )
-        next_player_id = self._assign_next_turn(game_id)
-        await self.notifier.notify_new_turn(game_id, next_player_id)
-        return FinishTurnResponse(next_player_id=next_player_id)
+        self.store.persist(before, after)
+        await _publish_engine_events(self.write, self.notifier, after, events)
+        return FinishTurnResponse(next_player_id=after.current_turn_player_id)
+
 
-    def _assign_next_turn(self, game_id: int) -> int:
-        players = self.read.get_players_in_game(game_id)
-        if not players:
-            raise InternalGameError(
-                "No se encontraron jugadores en la partida."
+async def _publish_engine_events(
+    commands: ICommandManager,
+    notifier: Notificator,
+    state: GameState,
+    events: List[engine_actions.EngineEvent],
+    effect_executor: Optional[EffectExecutor] = None,
+    deck_size: Optional[int] = None,
+):
+    """
+    Traduce los eventos del motor (ya persistido el diff) a notificaciones,
+    efectos de descarte y, si ganó el asesino, al borrado de la partida.
+    `deck_size` hace falta cuando `state` no trae el mazo entero.
+    """
+    game_id = state.game_id
+    for event in events:
+        if isinstance(event, engine_actions.CardDrawn):
+            await notifier.notify_player_drew(
+                game_id,
+                event.player_id,
+                len(state.deck) if deck_size is None else deck_size,
             )
-        ordered_players = self.turn_utils.sort_players_by_turn_order(players)
-        actual_player_id = self.read.get_current_turn(game_id)
-        if actual_player_id is None:
-            raise InternalGameError(
-                "No se pudo obtener el jugador con turno actual."
+        elif isinstance(event, engine_actions.DraftRefilled):
+            new_card = (
+                state.card(event.new_card_id)
+                if event.new_card_id is not None
+                else None
             )
-        try:
-            current_player_index = next(
-                i
-                for i, p in enumerate(ordered_players)
-                if p.player_id == actual_player_id
+            await notifier.notify_draft_updated(
+                game_id, event.card_taken_id, new_card
             )
-        except ValueError:
-            raise InternalGameError(
-                "El jugador del turno actual no está en la lista de jugadores."
+        elif isinstance(event, engine_actions.CardDiscarded):
+            await notifier.notify_card_discarded(
+                game_id, event.player_id, state.card(event.card_id)
             )
-        next_player_index = (current_player_index + 1) % len(ordered_players)
-        next_player_id = ordered_players[next_player_index].player_id
-        response = self.write.set_current_turn(game_id, next_player_id)
-        if response != ResponseStatus.OK:
-            raise InternalGameError(
-                "No se pudo actualizar el turno en la base de datos."
+        elif isinstance(event, engine_actions.DiscardEffectTriggered):
+            await effect_executor.execute_effect(
+                game_id=game_id,
+                played_cards=[state.card(event.card_id)],
+                player_id=event.player_id,
             )
-        return next_player_id
+        elif isinstance(event, engine_actions.TurnPassed):
+            await notifier.notify_new_turn(game_id, event.next_player_id)
+        elif isinstance(event, engine_actions.MurdererEscaped):
+            await notifier.notify_murderer_wins(
+                game_id=game_id,
+                murderer_id=event.murderer_id,
+                accomplice_id=event.accomplice_id,
+            )
+            status = commands.delete_game(game_id=game_id)
+            if status != ResponseStatus.OK:
+                error_message = "La base de datos no pudo eliminar la partida."
+                raise InternalGameError(detail=error_message)
+            await notifier.notify_game_removed(game_id)
+
 
 class RevealSecretAction:
     def __init__(
@@ -1,10 +1,19 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api.router import api_router
 from .database.orm_models import Base, engine
+from .database.async_session import (
+    ASYNC_DRIVER,
+    GreenletBridgeMiddleware,
+    async_engine,
+    get_db_driver,
+)
 from .websockets.router import router as websocket_router
+from .dependencies.dependencies import websocket_manager_singleton
 
 # Excepciones
 from .game.exceptions import (
@@ -27,6 +36,19 @@ from .api.exception_handlers import (
 # --- Creación de Tablas ---
 Base.metadata.create_all(bind=engine)
 
+
+# --- Ciclo de vida ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Escucha los mensajes de los otros workers (si hay broker entre procesos)
+    await websocket_manager_singleton.start()
+    yield
+    # Detiene las tareas escritoras de los websockets
+    await websocket_manager_singleton.shutdown()
+    # Cierra las conexiones de aiosqlite (cada una vive en su propio hilo)
+    await async_engine.dispose()
+
+
 # --- Configuración de Middlewares ---
 middleware = [
     Middleware(
@@ -35,14 +57,19 @@ middleware = [
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-    )
+    ),
 ]
+if get_db_driver() == ASYNC_DRIVER:
+    # Corre cada request en un greenlet para que el driver aiosqlite no
+    # bloquee el event loop. Con el driver sync no hace falta.
+    middleware.append(Middleware(GreenletBridgeMiddleware))
 
 # --- Creación de la Aplicación FastAPI ---
 app = FastAPI(
     title="Death on the Cards - Backend",
     description="Laboratorio de Ingeniería de Software I - 2025",
     middleware=middleware,
+    lifespan=lifespan,
     # Registra los manejadores de excepciones al crear la app
     exception_handlers={
         ResourceNotFound: resource_not_found_handler,
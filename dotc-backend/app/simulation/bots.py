@@ -0,0 +1,405 @@
+"""
+Bots del simulador: dado lo que hay sobre la mesa, proponen jugadas.
+
+Los bots son omniscientes (ven todas las manos y secretos) porque no
+buscan ganar: buscan recorrer todas las cartas de INITIAL_DECK y todos los
+estados de acción de la partida. Cada jugada es un pedido RPC
+(`action` de RPC_ACTIONS + `payload`), el mismo que mandaría un cliente por
+el websocket.
+
+`RandomBot.moves` devuelve jugadas en orden de preferencia: el simulador
+prueba la primera y, si la partida la rechaza, la siguiente.
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from ..domain.enums import CardType, GameActionState, PlayCardActionType
+from ..domain.models import Card, Game, PendingAction, PlayerInGame, SecretCard
+
+DETECTIVES = frozenset(
+    {
+        CardType.HARLEY_QUIN,
+        CardType.ARIADNE_OLIVER,
+        CardType.MISS_MARPLE,
+        CardType.PARKER_PYNE,
+        CardType.TOMMY_BERESFORD,
+        CardType.LADY_EILEEN,
+        CardType.TUPPENCE_BERESFORD,
+        CardType.HERCULE_POIROT,
+        CardType.MR_SATTERTHWAITE,
+    }
+)
+# Comodín: completa el set de cualquier otro detective
+WILDCARD = CardType.HARLEY_QUIN
+
+
+class TableView(BaseModel):
+    """
+    Lo que ve el simulador antes de cada jugada.
+    - game: Game (con las manos de todos)
+    - secrets: Dict[int, List[SecretCard]] (por jugador)
+    - sets: Dict[int, List[Card]] (sets en la mesa, por set_id)
+    - saga: Optional[dict] (votación o intercambio en curso)
+    - pending: Optional[PendingAction] (jugada esperando NSF)
+    """
+
+    game: Game
+    secrets: Dict[int, List[SecretCard]] = {}
+    sets: Dict[int, List[Card]] = {}
+    saga: Optional[Dict[str, Any]] = None
+    pending: Optional[PendingAction] = None
+
+
+class Move(BaseModel):
+    """
+    Una jugada, tal como llegaría por el canal RPC.
+    - player_id: int (quién la hace)
+    - action: str (clave de RPC_ACTIONS)
+    - payload: dict
+    - label: str (para agrupar latencias: acción y, si aplica, carta)
+    """
+
+    player_id: int
+    action: str
+    payload: Dict[str, Any] = {}
+    label: str
+
+
+class RandomBot:
+    """
+    Bot aleatorio con heurísticas mínimas para que la partida avance:
+    roba hasta 6, juega eventos y sets con objetivos al azar, contesta los
+    pedidos (NSF, votos, donaciones, secretos) y termina el turno.
+
+    - play_rate: probabilidad de intentar jugar cartas en el turno.
+    - nsf_rate: probabilidad de contestar con un NSF si se tiene uno.
+    - chaos_rate: probabilidad de proponer primero una jugada fuera de
+      turno o de estado, que la partida debería rechazar.
+    """
+
+    def __init__(
+        self,
+        rng: random.Random,
+        play_rate: float = 0.6,
+        nsf_rate: float = 0.3,
+        chaos_rate: float = 0.05,
+    ):
+        self.rng = rng
+        self.play_rate = play_rate
+        self.nsf_rate = nsf_rate
+        self.chaos_rate = chaos_rate
+
+    def moves(self, view: TableView) -> List[Move]:
+        game = view.game
+        state = game.action_state or GameActionState.NONE
+        prompts = {
+            GameActionState.NONE: self._turn_moves,
+            GameActionState.PENDING_NSF: self._nsf_moves,
+            GameActionState.AWAITING_VOTES: self._vote_moves,
+            GameActionState.AWAITING_CARD_DONATIONS: self._donation_moves,
+            GameActionState.AWAITING_SELECTION_FOR_CARD_TRADE: self._trade_moves,
+            GameActionState.AWAITING_SELECTION_FOR_CARD: self._ashes_moves,
+            GameActionState.AWAITING_REVEAL_FOR_CHOICE: self._reveal_moves,
+            GameActionState.AWAITING_REVEAL_FOR_STEAL: self._reveal_moves,
+        }
+        moves = prompts[state](view)
+        if self.rng.random() < self.chaos_rate:
+            moves.insert(0, self._chaos_move(view))
+        return moves
+
+    # =================================================================
+    # 🎲 TURNO NORMAL
+    # =================================================================
+
+    def _turn_moves(self, view: TableView) -> List[Move]:
+        me = self._player(view.game, view.game.current_turn_player_id)
+        if me is None:
+            return []
+        moves: List[Move] = []
+        if me.hand and self.rng.random() < self.play_rate:
+            plays = self._plays(view, me)
+            self.rng.shuffle(plays)
+            moves.extend(plays[:3])
+        if len(me.hand) < 6:
+            moves.extend(self._draws(view.game, me.player_id))
+        elif self.rng.random() < 0.3:
+            moves.append(self._discard(me))
+            moves.append(self._finish(me.player_id))
+        else:
+            moves.append(self._finish(me.player_id))
+            moves.append(self._discard(me))
+        return moves
+
+    def _draws(self, game: Game, player_id: int) -> List[Move]:
+        deck = Move(
+            player_id=player_id,
+            action="draw",
+            payload={"source": "deck"},
+            label="draw:deck",
+        )
+        if not game.draft or self.rng.random() < 0.5:
+            return [deck]
+        card = self.rng.choice(game.draft)
+        return [
+            Move(
+                player_id=player_id,
+                action="draw",
+                payload={"source": "draft", "card_id": card.card_id},
+                label="draw:draft",
+            ),
+            deck,
+        ]
+
+    def _discard(self, me: PlayerInGame) -> Move:
+        card = self.rng.choice(me.hand)
+        return Move(
+            player_id=me.player_id,
+            action="discard",
+            payload={"card_id": card.card_id},
+            label="discard",
+        )
+
+    def _finish(self, player_id: int) -> Move:
+        return Move(player_id=player_id, action="finish-turn", label="finish-turn")
+
+    # =================================================================
+    # 🃏 JUGAR CARTAS
+    # =================================================================
+
+    def _plays(self, view: TableView, me: PlayerInGame) -> List[Move]:
+        """Eventos de la mano, sets nuevos y cartas para sets existentes."""
+        plays: List[Move] = []
+        by_type: Dict[CardType, List[Card]] = {}
+        for card in me.hand:
+            by_type.setdefault(card.card_type, []).append(card)
+        wildcards = by_type.get(WILDCARD, [])
+
+        for card in me.hand:
+            if card.card_type in DETECTIVES or card.card_type == CardType.NOT_SO_FAST:
+                continue
+            plays.append(
+                self._play(view, me, PlayCardActionType.PLAY_EVENT, [card])
+            )
+
+        for card_type, cards in by_type.items():
+            if card_type not in DETECTIVES or card_type == WILDCARD:
+                continue
+            group = cards + wildcards
+            if len(group) >= 2:
+                plays.append(
+                    self._play(view, me, PlayCardActionType.FORM_NEW_SET, group)
+                )
+        beresfords = by_type.get(CardType.TOMMY_BERESFORD, [])[:1] + by_type.get(
+            CardType.TUPPENCE_BERESFORD, []
+        )[:1]
+        if len(beresfords) == 2:
+            plays.append(
+                self._play(view, me, PlayCardActionType.FORM_NEW_SET, beresfords)
+            )
+
+        detectives = [c for c in me.hand if c.card_type in DETECTIVES]
+        if detectives and view.sets:
+            plays.append(
+                self._play(
+                    view,
+                    me,
+                    PlayCardActionType.ADD_TO_EXISTING_SET,
+                    [self.rng.choice(detectives)],
+                )
+            )
+        return plays
+
+    def _play(
+        self,
+        view: TableView,
+        me: PlayerInGame,
+        action_type: PlayCardActionType,
+        cards: List[Card],
+    ) -> Move:
+        """Arma la jugada con objetivos al azar (jugador, secreto, set, carta)."""
+        game = view.game
+        others = [p.player_id for p in game.players if p.player_id != me.player_id]
+        target_player_id = self.rng.choice(others) if others else None
+        target_secrets = view.secrets.get(target_player_id, [])
+        hidden = [s for s in target_secrets if not s.is_revealed]
+        candidates = hidden or target_secrets
+        payload: Dict[str, Any] = {
+            "action_type": action_type.value,
+            "card_ids": [c.card_id for c in cards],
+            "target_player_id": target_player_id,
+            "target_secret_id": (
+                self.rng.choice(candidates).secret_id if candidates else None
+            ),
+            "target_set_id": (
+                self.rng.choice(list(view.sets)) if view.sets else None
+            ),
+            "target_card_id": self._target_card_id(game, cards[0], target_player_id),
+            "trade_direction": self.rng.choice(["left", "right"]),
+        }
+        if action_type == PlayCardActionType.PLAY_EVENT:
+            label = f"play:{cards[0].card_type.name}"
+        else:
+            label = f"play:{action_type.name}"
+        return Move(
+            player_id=me.player_id, action="play", payload=payload, label=label
+        )
+
+    def _target_card_id(
+        self, game: Game, card: Card, target_player_id: Optional[int]
+    ) -> Optional[int]:
+        """Card trade pide una carta del otro jugador; el resto, una del descarte."""
+        if card.card_type == CardType.CARD_TRADE:
+            target = self._player(game, target_player_id)
+            pool = target.hand if target else []
+        else:
+            pool = game.discard_pile
+        return self.rng.choice(pool).card_id if pool else None
+
+    # =================================================================
+    # ✋ RESPUESTAS A PEDIDOS DE LA PARTIDA
+    # =================================================================
+
+    def _nsf_moves(self, view: TableView) -> List[Move]:
+        """Cada jugador (menos el autor de la última jugada) juega NSF o pasa."""
+        last = view.pending.last_action_player_id if view.pending else None
+        moves = []
+        for player in self._shuffled(view.game.players):
+            if player.player_id == last:
+                continue
+            nsf = [c for c in player.hand if c.card_type == CardType.NOT_SO_FAST]
+            if nsf and self.rng.random() < self.nsf_rate:
+                moves.append(
+                    Move(
+                        player_id=player.player_id,
+                        action="play-nsf",
+                        payload={
+                            "action_type": PlayCardActionType.INSTANT.value,
+                            "card_ids": [nsf[0].card_id],
+                        },
+                        label="play-nsf:nsf",
+                    )
+                )
+            moves.append(
+                Move(
+                    player_id=player.player_id,
+                    action="play-nsf",
+                    payload={
+                        "action_type": PlayCardActionType.INSTANT.value,
+                        "card_ids": [],
+                    },
+                    label="play-nsf:pass",
+                )
+            )
+        return moves
+
+    def _vote_moves(self, view: TableView) -> List[Move]:
+        saga = view.saga or {}
+        player_ids = [p.player_id for p in view.game.players]
+        voters = saga.get("eligible_voters") or player_ids
+        return [
+            Move(
+                player_id=voter_id,
+                action="vote",
+                payload={"voted_player_id": self.rng.choice(player_ids)},
+                label="vote",
+            )
+            for voter_id in self.rng.sample(voters, len(voters))
+        ]
+
+    def _donation_moves(self, view: TableView) -> List[Move]:
+        chosen = (view.saga or {}).get("choices", {})
+        return [
+            Move(
+                player_id=player.player_id,
+                action="donate-card",
+                payload={"card_id": self.rng.choice(player.hand).card_id},
+                label="donate-card",
+            )
+            for player in self._shuffled(view.game.players)
+            if player.hand and str(player.player_id) not in chosen
+        ]
+
+    def _trade_moves(self, view: TableView) -> List[Move]:
+        """El jugador pedido elige qué carta de la mano del iniciador recibe."""
+        prompted = self._player(view.game, view.game.prompted_player_id)
+        initiator = self._player(view.game, view.game.action_initiator_id)
+        if prompted is None or initiator is None or not initiator.hand:
+            return []
+        return [
+            Move(
+                player_id=prompted.player_id,
+                action="exchange-card",
+                payload={"card_id": self.rng.choice(initiator.hand).card_id},
+                label="exchange-card",
+            )
+        ]
+
+    def _ashes_moves(self, view: TableView) -> List[Move]:
+        game = view.game
+        if not game.discard_pile:
+            return []
+        card = self.rng.choice(game.discard_pile[-5:])
+        return [
+            Move(
+                player_id=game.current_turn_player_id,
+                action="draw",
+                payload={"source": "discard", "card_id": card.card_id},
+                label="draw:discard",
+            )
+        ]
+
+    def _reveal_moves(self, view: TableView) -> List[Move]:
+        """Revela un secreto oculto del jugador al que se le pidió."""
+        game = view.game
+        prompted = game.prompted_player_id
+        player_ids = [prompted] if prompted else [p.player_id for p in game.players]
+        moves = []
+        for player_id in player_ids:
+            hidden = [
+                s for s in view.secrets.get(player_id, []) if not s.is_revealed
+            ]
+            if hidden:
+                moves.append(
+                    Move(
+                        player_id=player_id,
+                        action="reveal-secret",
+                        payload={"secret_id": self.rng.choice(hidden).secret_id},
+                        label="reveal-secret",
+                    )
+                )
+        return moves
+
+    # =================================================================
+    # 💥 JUGADAS INVÁLIDAS A PROPÓSITO
+    # =================================================================
+
+    def _chaos_move(self, view: TableView) -> Move:
+        """Una jugada de un jugador cualquiera, sin mirar turno ni estado."""
+        game = view.game
+        player = self.rng.choice(game.players)
+        if player.hand and self.rng.random() < 0.5:
+            card = self.rng.choice(player.hand)
+            move = self._play(view, player, PlayCardActionType.PLAY_EVENT, [card])
+            move.label = "chaos:play"
+            return move
+        if self.rng.random() < 0.5:
+            return Move(
+                player_id=player.player_id,
+                action="draw",
+                payload={"source": "deck"},
+                label="chaos:draw",
+            )
+        return Move(
+            player_id=player.player_id, action="finish-turn", label="chaos:finish-turn"
+        )
+
+    def _player(
+        self, game: Game, player_id: Optional[int]
+    ) -> Optional[PlayerInGame]:
+        return next((p for p in game.players if p.player_id == player_id), None)
+
+    def _shuffled(self, items: List[Any]) -> List[Any]:
+        return self.rng.sample(items, len(items))
@@ -0,0 +1,376 @@
+"""
+Simulador de partidas sin cabeza (self-play): bots aleatorios juegan
+partidas completas contra el GameManager real, sobre una BD SQLite propia.
+
+Sirve para dos cosas:
+- Benchmark de throughput: partidas/s, acciones/s y latencia por tipo de
+  acción (p50/p99), con N procesos jugando en paralelo.
+- Fuzzer de los efectos: cada jugada que termina en InternalGameError o en
+  una excepción que no es GameError es un error de reglas, y se reporta con
+  la seed de la partida para reproducirlo. Los GameError "esperados"
+  (404/409/403/400, ver rpc.ERROR_STATUS) son rechazos normales.
+
+Cada jugada pasa por el mismo camino que una acción RPC del websocket:
+RPC_ACTIONS -> request -> open_game_manager -> método del GameManager.
+"""
+
+import asyncio
+import contextlib
+import math
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import AsyncGenerator, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..api.schemas import (
+    CreateGameRequest,
+    CreatePlayerRequest,
+    JoinGameRequest,
+    PlayerActionRequest,
+)
+from ..database.engine_settings import install_sqlite_pragmas, load_sqlite_settings
+from ..database.orm_models import Base
+from ..database.queries import DatabaseQueryManager
+from ..dependencies.dependencies import open_game_manager
+from ..domain.enums import GameActionState, GameStatus
+from ..game.exceptions import GameError
+from ..websockets.rpc import ERROR_STATUS, RPC_ACTIONS
+from .bots import Move, RandomBot, TableView
+
+SessionSource = Callable[[], AsyncGenerator[Session, None]]
+
+# Errores de negocio que son un rechazo válido de la jugada
+EXPECTED_ERRORS = tuple(kind for kind, _ in ERROR_STATUS)
+
+# Estados cuyo detalle vive en la saga pendiente
+SAGA_STATES = (
+    GameActionState.AWAITING_VOTES,
+    GameActionState.AWAITING_CARD_DONATIONS,
+)
+
+
+class SimulationConfig(BaseModel):
+    """
+    - games: partidas a jugar en total.
+    - workers: procesos en paralelo (cada uno con su propia BD).
+    - players: jugadores por partida (None: al azar entre 2 y 6).
+    - seed: seed base; la partida i usa seed + i.
+    - max_actions: tope de jugadas por partida (la partida se corta).
+    - max_idle_rounds: rondas seguidas sin ninguna jugada aceptada antes
+      de dar la partida por trabada.
+    - quiet: silencia los print de los services mientras se juega.
+    """
+
+    games: int = 20
+    workers: int = 1
+    players: Optional[int] = 4
+    seed: int = 0
+    max_actions: int = 3000
+    max_idle_rounds: int = 50
+    quiet: bool = True
+
+
+class SimulationReport(BaseModel):
+    """Resultados acumulados; los de cada proceso se combinan con merge()."""
+
+    games: int = 0
+    finished: int = 0
+    stalled: int = 0
+    truncated: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    wall_seconds: float = 0.0
+    latencies_ms: Dict[str, List[float]] = {}
+    rejections: Dict[str, int] = {}
+    # "label [ESTADO] Tipo: detalle" -> veces, y la primera seed que lo dio
+    rule_errors: Dict[str, int] = {}
+    error_seeds: Dict[str, int] = {}
+    # estado de acción en el que se trabó la partida -> veces
+    stalls: Dict[str, int] = {}
+
+    @property
+    def actions(self) -> int:
+        return self.accepted + self.rejected
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def actions_per_second(self) -> float:
+        return self.actions / self.wall_seconds if self.wall_seconds else 0.0
+
+    def merge(self, other: "SimulationReport") -> None:
+        counters = ("games", "finished", "stalled", "truncated", "accepted", "rejected")
+        for name in counters:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for label, samples in other.latencies_ms.items():
+            self.latencies_ms.setdefault(label, []).extend(samples)
+        for counter in ("rejections", "rule_errors", "stalls"):
+            mine = getattr(self, counter)
+            for key, count in getattr(other, counter).items():
+                mine[key] = mine.get(key, 0) + count
+        for key, seed in other.error_seeds.items():
+            self.error_seeds.setdefault(key, seed)
+
+    def render(self) -> str:
+        lines = [
+            f"[sim] {self.games} partidas en {self.wall_seconds:.1f}s: "
+            f"{self.games_per_second:.2f} partidas/s, "
+            f"{self.actions_per_second:.0f} acciones/s",
+            f"[sim] terminadas={self.finished} trabadas={self.stalled} "
+            f"cortadas={self.truncated} | aceptadas={self.accepted} "
+            f"rechazadas={self.rejected}",
+            f"[sim] {'acción':<34}{'n':>7}{'p50 ms':>9}{'p99 ms':>9}{'rech.':>7}",
+        ]
+        for label in sorted(self.latencies_ms):
+            samples = self.latencies_ms[label]
+            lines.append(
+                f"[sim] {label:<34}{len(samples):>7}"
+                f"{_percentile(samples, 50):>9.2f}{_percentile(samples, 99):>9.2f}"
+                f"{self.rejections.get(label, 0):>7}"
+            )
+        for state, count in sorted(self.stalls.items()):
+            lines.append(f"[sim] trabada en {state}: {count}x")
+        lines.append(f"[sim] errores de reglas distintos: {len(self.rule_errors)}")
+        for key, count in sorted(self.rule_errors.items(), key=lambda kv: -kv[1]):
+            lines.append(f"[sim]   {count}x {key} (seed {self.error_seeds[key]})")
+        return "\n".join(lines)
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    """Percentil por el método nearest-rank (q en [0, 100])."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# =================================================================
+# 🎮 UNA PARTIDA
+# =================================================================
+
+
+async def play_game(
+    session_source: SessionSource,
+    seed: int,
+    config: SimulationConfig,
+    report: SimulationReport,
+) -> None:
+    """Crea, inicia y juega una partida hasta que termina, se traba o se corta."""
+    rng = random.Random(seed)
+    # El reparto de start_game usa el random global: lo fijamos también
+    # para que la seed reproduzca la partida entera.
+    random.seed(seed)
+    players = config.players or rng.randint(2, 6)
+    game_id = await _start_game(session_source, seed, players)
+    bot = RandomBot(rng)
+
+    report.games += 1
+    actions = 0
+    idle_rounds = 0
+    while actions < config.max_actions:
+        view = await observe(session_source, game_id)
+        if view is None or view.game.status == GameStatus.FINISHED:
+            report.finished += 1
+            return
+        state = (view.game.action_state or GameActionState.NONE).name
+        progressed = False
+        reason = "sin jugadas posibles"
+        for move in bot.moves(view):
+            actions += 1
+            reason = await _attempt(
+                session_source, game_id, move, state, seed, report
+            )
+            if reason is None:
+                progressed = True
+                break
+        idle_rounds = 0 if progressed else idle_rounds + 1
+        if idle_rounds >= config.max_idle_rounds:
+            # El último rechazo suele explicar por qué no avanza
+            key = f"{state}: {reason[:120]}"
+            report.stalled += 1
+            report.stalls[key] = report.stalls.get(key, 0) + 1
+            return
+    report.truncated += 1
+
+
+async def _start_game(session_source: SessionSource, seed: int, players: int) -> int:
+    async with open_game_manager(session_source) as manager:
+        player_ids = [
+            manager.create_player(
+                CreatePlayerRequest(
+                    name=f"bot-{seed}-{i}", birth_date=date(1990 + i, 1 + i, 1)
+                )
+            ).player_id
+            for i in range(players)
+        ]
+    async with open_game_manager(session_source) as manager:
+        created = await manager.create_game(
+            CreateGameRequest(
+                host_id=player_ids[0],
+                game_name=f"sim-{seed}",
+                min_players=2,
+                max_players=6,
+            )
+        )
+    for guest_id in player_ids[1:]:
+        async with open_game_manager(session_source) as manager:
+            await manager.join_game(
+                JoinGameRequest(player_id=guest_id, game_id=created.game_id)
+            )
+    async with open_game_manager(session_source) as manager:
+        await manager.start_game(
+            PlayerActionRequest(player_id=player_ids[0], game_id=created.game_id)
+        )
+    return created.game_id
+
+
+async def observe(session_source: SessionSource, game_id: int) -> Optional[TableView]:
+    """Lee la mesa completa (manos, secretos, sets y pedidos pendientes)."""
+    async with asynccontextmanager(session_source)() as session:
+        queries = DatabaseQueryManager(session)
+        game = queries.get_game(game_id)
+        if game is None:
+            return None
+        sets = {}
+        for set_id in range(1, (queries.get_max_set_id(game_id) or 0) + 1):
+            cards = queries.get_set(set_id, game_id)
+            if cards:
+                sets[set_id] = cards
+        state = game.action_state
+        return TableView(
+            game=game,
+            secrets={
+                p.player_id: queries.get_player_secrets(game_id, p.player_id)
+                for p in game.players
+            },
+            sets=sets,
+            saga=(
+                queries.get_pending_saga(game_id)
+                if state in SAGA_STATES
+                else None
+            ),
+            pending=(
+                queries.get_pending_action(game_id)
+                if state == GameActionState.PENDING_NSF
+                else None
+            ),
+        )
+
+
+async def _attempt(
+    session_source: SessionSource,
+    game_id: int,
+    move: Move,
+    state: str,
+    seed: int,
+    report: SimulationReport,
+) -> Optional[str]:
+    """
+    Ejecuta una jugada y la anota. Devuelve None si la partida la aceptó o
+    el motivo del rechazo.
+    """
+    model, method = RPC_ACTIONS[move.action]
+    request = model.model_validate(
+        {**move.payload, "game_id": game_id, "player_id": move.player_id}
+    )
+    is_rule_error = False
+    start = time.perf_counter()
+    try:
+        async with open_game_manager(session_source) as manager:
+            await getattr(manager, method)(request)
+    except EXPECTED_ERRORS as e:
+        reason = f"{type(e).__name__}: {e.detail}"
+        report.rejections[move.label] = report.rejections.get(move.label, 0) + 1
+    except GameError as e:
+        reason, is_rule_error = f"{type(e).__name__}: {e.detail}", True
+    except Exception as e:
+        reason, is_rule_error = f"{type(e).__name__}: {e}", True
+    else:
+        report.accepted += 1
+        return None
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        report.latencies_ms.setdefault(move.label, []).append(elapsed_ms)
+
+    report.rejected += 1
+    if is_rule_error:
+        key = f"{move.label} [{state}] {reason[:160]}"
+        report.rule_errors[key] = report.rule_errors.get(key, 0) + 1
+        report.error_seeds.setdefault(key, seed)
+    return reason
+
+
+# =================================================================
+# 🏭 MUCHAS PARTIDAS, EN PARALELO
+# =================================================================
+
+
+async def play_games(
+    session_source: SessionSource, seeds: List[int], config: SimulationConfig
+) -> SimulationReport:
+    """Juega las partidas de `seeds` una tras otra sobre la misma BD."""
+    report = SimulationReport()
+    start = time.perf_counter()
+    for seed in seeds:
+        await play_game(session_source, seed, config, report)
+    report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def run_worker(config: SimulationConfig, seeds: List[int]) -> SimulationReport:
+    """Punto de entrada de un proceso: BD SQLite propia en un directorio temporal."""
+    with tempfile.TemporaryDirectory(prefix="dotc-sim-") as tmp:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp, 'sim.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        install_sqlite_pragmas(engine, load_sqlite_settings())
+        Base.metadata.create_all(bind=engine)
+        SimSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        async def session_source():
+            db = SimSession()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        output = open(os.devnull, "w") if config.quiet else None
+        try:
+            silenced = (
+                contextlib.redirect_stdout(output)
+                if output
+                else contextlib.nullcontext()
+            )
+            with silenced:
+                return asyncio.run(play_games(session_source, seeds, config))
+        finally:
+            if output:
+                output.close()
+            engine.dispose()
+
+
+def run_simulation(config: SimulationConfig) -> SimulationReport:
+    """Reparte las partidas entre `config.workers` procesos y junta los reportes."""
+    seeds = [config.seed + i for i in range(config.games)]
+    workers = max(1, min(config.workers, config.games))
+    chunks = [seeds[i::workers] for i in range(workers)]
+    report = SimulationReport()
+    start = time.perf_counter()
+    if workers == 1:
+        report.merge(run_worker(config, chunks[0]))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(run_worker, [config] * workers, chunks):
+                report.merge(partial)
+    report.wall_seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,262 @@
+"""
+Broker de mensajes entre procesos para el ConnectionManager.
+
+Cada worker de uvicorn tiene su propio ConnectionManager con los sockets que
+le tocaron. Si un request entra por el worker A y el jugador está conectado
+al worker B, el mensaje tiene que cruzar de proceso. El ConnectionManager no
+entrega directo: publica un `BrokerEnvelope` (destino + mensaje) en el
+broker, y el broker se lo devuelve a `deliver` en TODOS los workers (incluido
+el que lo publicó), que lo entregan a los sockets que tengan.
+
+Backends:
+- "inprocess" (default): un solo proceso; publicar es entregar.
+- "unix": varios procesos en la misma máquina. Cada worker escucha en un
+  socket Unix de datagramas dentro de DOTC_BROKER_DIR; publicar es mandar un
+  datagrama a cada socket del directorio. No hay proceso central: los workers
+  se descubren por el directorio (la lista se cachea y se relee cada
+  PEER_REFRESH_S o cuando falla un envío) y los sockets de workers muertos
+  se borran al primer envío fallido.
+
+Los números de secuencia de las partidas son de cada worker: con el broker
+"unix", un `?since=` que llega a otro worker recibe un resync (ver
+ConnectionManager._replay).
+
+Variables de entorno: DOTC_BROKER ("inprocess" | "unix") y DOTC_BROKER_DIR.
+"""
+
+import asyncio
+import os
+import socket
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable, List, Literal, Optional
+
+from pydantic import BaseModel
+
+from .protocol.messages import WSMessage
+
+BROKER_ENV = "DOTC_BROKER"
+BROKER_DIR_ENV = "DOTC_BROKER_DIR"
+INPROCESS_BROKER = "inprocess"
+UNIX_BROKER = "unix"
+SOCKET_SUFFIX = ".sock"
+# Buffer de recepción pedido al kernel: aguanta ráfagas mientras el loop
+# del worker está ocupado.
+RECEIVE_BUFFER_BYTES = 4 * 1024 * 1024
+# Cada cuánto se vuelve a leer el directorio para descubrir workers nuevos
+PEER_REFRESH_S = 1.0
+
+
+class BrokerEnvelope(BaseModel):
+    """
+    Un mensaje y a quién va dirigido.
+    - target: "game" | "player" | "lobby"
+    - game_id: Optional[int]
+    - player_id: Optional[int] (solo para "player")
+    - message: WSMessage
+    """
+
+    target: Literal["game", "player", "lobby"]
+    game_id: Optional[int] = None
+    player_id: Optional[int] = None
+    message: WSMessage
+
+
+class BrokerStats(BaseModel):
+    """
+    Contadores del broker.
+    - backend: "inprocess" | "unix"
+    - peers: workers conocidos (sin contar este)
+    - sent / received: datagramas enviados y recibidos
+    - dropped: mensajes que no llegaron a otro worker (socket lleno o error)
+    """
+
+    backend: str = INPROCESS_BROKER
+    peers: int = 0
+    sent: int = 0
+    received: int = 0
+    dropped: int = 0
+
+
+class MessageBroker(ABC):
+    """Reparte los mensajes publicados entre todos los workers."""
+
+    def __init__(self):
+        self._deliver: Optional[Callable[[BrokerEnvelope], None]] = None
+
+    def bind(self, deliver: Callable[[BrokerEnvelope], None]) -> None:
+        """Función que entrega un mensaje a los sockets de este worker."""
+        self._deliver = deliver
+
+    def deliver_locally(self, envelope: BrokerEnvelope) -> None:
+        if self._deliver is not None:
+            self._deliver(envelope)
+
+    @property
+    def spans_processes(self) -> bool:
+        """True si hay (o puede haber) sockets en otros procesos."""
+        return False
+
+    @abstractmethod
+    def publish(self, envelope: BrokerEnvelope) -> None:
+        """Entrega el mensaje en este worker y lo manda a los demás."""
+        pass
+
+    def stats(self) -> BrokerStats:
+        return BrokerStats()
+
+    async def start(self) -> None:
+        """Empieza a recibir lo que publican los demás workers."""
+
+    async def stop(self) -> None:
+        """Deja de recibir y libera lo que haya tomado."""
+
+
+class InProcessBroker(MessageBroker):
+    """Un solo proceso: publicar es entregar."""
+
+    def publish(self, envelope: BrokerEnvelope) -> None:
+        self.deliver_locally(envelope)
+
+
+class UnixSocketBroker(MessageBroker):
+    """
+    Varios procesos en la misma máquina, sobre sockets Unix de datagramas.
+    Un datagrama = un mensaje, sin framing; el kernel descarta los sockets
+    llenos sin bloquear al que publica (se cuentan en `dropped`).
+    """
+
+    def __init__(self, directory: str, peer_refresh_s: float = PEER_REFRESH_S):
+        super().__init__()
+        self.directory = directory
+        self.peer_refresh_s = peer_refresh_s
+        self.address = os.path.join(
+            directory, f"worker-{os.getpid()}-{uuid.uuid4().hex[:8]}{SOCKET_SUFFIX}"
+        )
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+        self._receiver: Optional[socket.socket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Lista de peers cacheada y cuándo se leyó (None = hay que leerla)
+        self._peer_cache: List[str] = []
+        self._peers_read_at: Optional[float] = None
+
+    @property
+    def spans_processes(self) -> bool:
+        return True
+
+    def stats(self) -> BrokerStats:
+        return BrokerStats(
+            backend=UNIX_BROKER,
+            peers=len(self._peer_cache),
+            sent=self.sent,
+            received=self.received,
+            dropped=self.dropped,
+        )
+
+    async def start(self) -> None:
+        if self._receiver is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        receiver.setblocking(False)
+        receiver.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_BYTES
+        )
+        receiver.bind(self.address)
+        self._receiver = receiver
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(receiver.fileno(), self._on_readable)
+
+    async def stop(self) -> None:
+        if self._receiver is None:
+            return
+        self._loop.remove_reader(self._receiver.fileno())
+        self._receiver.close()
+        self._receiver = None
+        try:
+            os.unlink(self.address)
+        except FileNotFoundError:
+            pass
+
+    def _peers(self) -> List[str]:
+        """Sockets de los otros workers (cacheados por PEER_REFRESH_S)."""
+        now = time.monotonic()
+        if (
+            self._peers_read_at is None
+            or now - self._peers_read_at >= self.peer_refresh_s
+        ):
+            self._peer_cache = self._scan_peers()
+            self._peers_read_at = now
+        return self._peer_cache
+
+    def _scan_peers(self) -> List[str]:
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return []
+        return [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(SOCKET_SUFFIX) and entry.path != self.address
+        ]
+
+    def publish(self, envelope: BrokerEnvelope) -> None:
+        self.deliver_locally(envelope)
+        data = envelope.model_dump_json().encode()
+        failed = False
+        for peer in list(self._peers()):
+            try:
+                self._sender.sendto(data, peer)
+                self.sent += 1
+            except BlockingIOError:
+                self.dropped += 1
+                print(f"WARN: Broker: el worker {peer} no da abasto, se descarta un mensaje.")
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Nadie escucha en ese socket: el worker murió sin limpiar.
+                failed = True
+                try:
+                    os.unlink(peer)
+                except FileNotFoundError:
+                    pass
+            except OSError as e:
+                failed = True
+                self.dropped += 1
+                print(f"Error en broker al publicar a {peer}: {e}")
+        if failed:
+            # La próxima publicación vuelve a leer el directorio
+            self._peers_read_at = None
+
+    def _on_readable(self) -> None:
+        while self._receiver is not None:
+            try:
+                data = self._receiver.recv(RECEIVE_BUFFER_BYTES)
+            except BlockingIOError:
+                return
+            self.received += 1
+            try:
+                envelope = BrokerEnvelope.model_validate_json(data)
+            except ValueError as e:
+                print(f"Error en broker al leer un mensaje: {e}")
+                continue
+            self.deliver_locally(envelope)
+
+
+def load_broker() -> MessageBroker:
+    """Arma el broker según DOTC_BROKER y DOTC_BROKER_DIR."""
+    kind = os.getenv(BROKER_ENV, INPROCESS_BROKER).lower()
+    if kind == INPROCESS_BROKER:
+        return InProcessBroker()
+    if kind == UNIX_BROKER:
+        directory = os.getenv(
+            BROKER_DIR_ENV, os.path.join(tempfile.gettempdir(), "dotc-broker")
+        )
+        return UnixSocketBroker(directory)
+    raise ValueError(
+        f"{BROKER_ENV} debe ser '{INPROCESS_BROKER}' o '{UNIX_BROKER}': {kind}"
+    )
@@ -1,85 +1,653 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
 from fastapi import WebSocket
-from typing import Dict, Set, Optional
+from typing import Callable, Dict, Set, Optional, Tuple
+from ..api.schemas import GameLobbyInfo
+from ..domain.enums import GameStatus
+from .protocol.details import (
+    GameCreatedDetails,
+    GameRemovedDetails,
+    GameUpdatedDetails,
+    HeartbeatDetails,
+    LobbyDiffDetails,
+    ResyncRequiredDetails,
+)
+from .protocol.events import WSEvent
 from .protocol.messages import WSMessage
 from .interfaces import IConnectionManager
+from .broker import BrokerEnvelope, InProcessBroker, MessageBroker
+from .heartbeat import (
+    CLOSE_CODE_IDLE,
+    RECONNECT_WINDOW_S,
+    HeartbeatPolicy,
+    LifecycleStats,
+    is_pong,
+    load_heartbeat_policy,
+)
+from .lobby_publisher import LobbyPublisher
+from .lobby_subscriptions import LobbySubscription
+from .replay import GameReplayBuffer
+from .slow_consumers import (
+    ChannelStats,
+    ConnectionStats,
+    SlowConsumerPolicy,
+    WebSocketStats,
+    load_slow_consumer_policy,
+)
+
+# Código de cierre "Try Again Later": el cliente se quedó atrás y debe
+# reconectarse (y volver a pedir el estado) en lugar de seguir recibiendo.
+CLOSE_CODE_TOO_SLOW = 1013
+
+RESYNC_FRAME = WSMessage(
+    details=ResyncRequiredDetails(reason="Cola de salida desbordada.")
+).model_dump_json()
+
+
+class OutboundConnection:
+    """
+    Un socket con su cola de salida y su tarea escritora.
+
+    Los broadcasts solo encolan el frame ya serializado (`enqueue` no
+    bloquea); la tarea escritora lo envía cuando el socket puede. Así un
+    cliente lento o colgado no demora a los demás. Los límites de la cola
+    los pone la SlowConsumerPolicy; si un envío falla o el socket se pasa
+    de los límites, la conexión se da por muerta y se avisa a `on_dead`.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_dead: Callable[[WebSocket], None],
+        policy: SlowConsumerPolicy,
+        counters: Counter,
+        game_id: Optional[int] = None,
+        player_id: Optional[int] = None,
+    ):
+        self.websocket = websocket
+        self.policy = policy
+        self.game_id = game_id
+        self.player_id = player_id
+        # (frame, bytes) en orden de envío.
+        self.queue: asyncio.Queue[Tuple[str, int]] = asyncio.Queue()
+        self.closed = False
+        # Pendientes = encolados + el que se está enviando.
+        self.pending_frames = 0
+        self.pending_bytes = 0
+        self.frames_sent = 0
+        self.last_send_at = time.monotonic()
+        # Último frame recibido del cliente (ver heartbeat.py).
+        self.last_seen = self.last_send_at
+        self.acks_heartbeats = False
+        self.resync_pending = False
+        self._pending_since = self.last_send_at
+        self._counters = counters
+        self._on_dead = on_dead
+        self._task = asyncio.create_task(self._writer())
+
+    def stalled_for(self, now: float) -> float:
+        """Segundos sin un envío exitoso teniendo frames pendientes."""
+        if not self.pending_frames:
+            return 0.0
+        return now - max(self.last_send_at, self._pending_since)
+
+    def enqueue(self, frame: str, size: Optional[int] = None) -> bool:
+        """
+        Encola un frame sin esperar (`size` en bytes, si ya se conoce).
+        False si el frame no se encoló: conexión cerrada, desalojada o
+        degradada a resync.
+        """
+        if self.closed:
+            return False
+        now = time.monotonic()
+        if self.stalled_for(now) > self.policy.max_send_lag_s:
+            self._evict("sin envíos exitosos")
+            return False
+        if self.resync_pending:
+            self._counters["frames_dropped"] += 1
+            return False
+        size = len(frame.encode()) if size is None else size
+        if (
+            self.pending_frames + 1 > self.policy.max_queue_depth
+            or self.pending_bytes + size > self.policy.max_pending_bytes
+        ):
+            if self.policy.on_limit == "resync":
+                self._downgrade()
+            else:
+                self._evict("cola de salida llena")
+            return False
+        self._put(frame, size, now)
+        return True
+
+    def _put(self, frame: str, size: int, now: float) -> None:
+        if not self.pending_frames:
+            self._pending_since = now
+        self.pending_frames += 1
+        self.pending_bytes += size
+        self.queue.put_nowait((frame, size))
+
+    def _discard_queued(self) -> int:
+        """Saca de la cola todo lo que todavía no empezó a enviarse."""
+        dropped = 0
+        while not self.queue.empty():
+            _, size = self.queue.get_nowait()
+            self.queue.task_done()
+            self.pending_frames -= 1
+            self.pending_bytes -= size
+            dropped += 1
+        return dropped
+
+    def _downgrade(self) -> None:
+        """Reemplaza lo pendiente (y el frame nuevo) por un aviso de resync."""
+        dropped = self._discard_queued() + 1
+        print(
+            f"WARN: Socket lento (partida {self.game_id}, jugador {self.player_id}): "
+            f"se descartan {dropped} mensajes y se pide resync."
+        )
+        self._counters["frames_dropped"] += dropped
+        self._counters["resyncs"] += 1
+        self.resync_pending = True
+        self._put(RESYNC_FRAME, len(RESYNC_FRAME), time.monotonic())
+
+    def _evict(self, reason: str) -> None:
+        print(
+            f"WARN: Socket lento (partida {self.game_id}, jugador {self.player_id}): {reason}; se desconecta."
+        )
+        self._counters["evicted"] += 1
+        asyncio.create_task(self._close_socket())
+        self._on_dead(self.websocket)
+
+    async def _writer(self):
+        while True:
+            frame, size = await self.queue.get()
+            try:
+                await self.websocket.send_text(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"WARN: Falló el envío a un socket, se desconecta: {e}")
+                self._on_dead(self.websocket)
+                return
+            else:
+                self.frames_sent += 1
+                self.last_send_at = time.monotonic()
+                if frame is RESYNC_FRAME:
+                    self.resync_pending = False
+            finally:
+                self.pending_frames -= 1
+                self.pending_bytes -= size
+                self.queue.task_done()
+
+    async def _close_socket(self, code: int = CLOSE_CODE_TOO_SLOW):
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    def close(self):
+        """Detiene la tarea escritora y descarta lo que quedó en la cola."""
+        if self.closed:
+            return
+        self.closed = True
+        self._task.cancel()
+        self._discard_queued()
+
+    async def drain(self):
+        """Espera a que se envíe todo lo encolado hasta ahora."""
+        if not self.closed:
+            await self.queue.join()
+
+    def stats(self, now: float) -> ConnectionStats:
+        return ConnectionStats(
+            player_id=self.player_id,
+            queue_depth=self.pending_frames,
+            bytes_pending=self.pending_bytes,
+            seconds_since_last_send=round(now - self.last_send_at, 3),
+            frames_sent=self.frames_sent,
+            resync_pending=self.resync_pending,
+        )
 
 
 class ConnectionManager(IConnectionManager):
-    def __init__(self):
-        # La nueva estructura: game_id -> { player_id -> WebSocket }
-        self.connections_by_game: Dict[int, Dict[int, WebSocket]] = {}
+    def __init__(
+        self,
+        policy: Optional[SlowConsumerPolicy] = None,
+        lobby_publisher: Optional[LobbyPublisher] = None,
+        broker: Optional[MessageBroker] = None,
+        heartbeat: Optional[HeartbeatPolicy] = None,
+    ):
+        # game_id -> { player_id -> sockets abiertos (una pestaña = un socket) }
+        self.connections_by_game: Dict[int, Dict[int, Set[WebSocket]]] = {}
         self.lobby_connections: Set[WebSocket] = set()
+        # Filtros/página de los sockets del lobby que los pidieron; el resto
+        # recibe todos los cambios.
+        self.lobby_subscriptions: Dict[WebSocket, LobbySubscription] = {}
+        # Último estado conocido de cada partida del lobby, para saber si un
+        # cambio hace que entre o salga del filtro de un suscriptor.
+        self.lobby_games: Dict[int, GameLobbyInfo] = {}
+        # Índice inverso socket -> conexión. Cada OutboundConnection sabe a
+        # qué (game_id, player_id) pertenece, así disconnect es O(1).
+        self.outbound: Dict[WebSocket, OutboundConnection] = {}
+        self.policy = policy or load_slow_consumer_policy()
+        # Contadores acumulados por partida (None = lobby).
+        self.counters: Dict[Optional[int], Counter] = defaultdict(Counter)
+        # Secuencia y últimos frames de cada partida (ver replay.py). Se
+        # descarta cuando la partida termina o se borra.
+        self.replay: Dict[int, GameReplayBuffer] = {}
+        # Si está, los cambios de partidas del lobby salen agrupados por
+        # tick (ver lobby_publisher.py); si no, cada uno en el momento.
+        self.lobby_publisher = lobby_publisher
+        if lobby_publisher is not None:
+            lobby_publisher.bind(self._send_to_lobby)
+        # Los broadcasts no van directo a los sockets: pasan por el broker,
+        # que los entrega en este worker y en los demás (ver broker.py).
+        self.broker = broker or InProcessBroker()
+        self.broker.bind(self._deliver)
+        # Latidos y cosecha de sockets en silencio (ver heartbeat.py).
+        self.heartbeat_policy = heartbeat or load_heartbeat_policy()
+        self.lifecycle: Counter = Counter()
+        # (game_id, player_id) -> cuándo se fue, para contar reconexiones.
+        self.recently_disconnected: Dict[Tuple[int, int], float] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """
+        Empieza a recibir los mensajes de los otros workers y a mandar
+        latidos (si están activados).
+        """
+        await self.broker.start()
+        if self.heartbeat_policy.enabled and self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_policy.interval_s)
+            try:
+                self.heartbeat()
+            except Exception as e:
+                print(f"Error en heartbeat de websockets: {e}")
+
+    def heartbeat(self) -> None:
+        """
+        Un latido: cosecha los sockets con latido que se quedaron en
+        silencio y le manda un HEARTBEAT al resto.
+        """
+        now = time.monotonic()
+        frame = WSMessage(
+            details=HeartbeatDetails(
+                interval_s=self.heartbeat_policy.interval_s
+            )
+        ).model_dump_json()
+        size = len(frame.encode())
+        for websocket, outbound in list(self.outbound.items()):
+            silent_for = now - outbound.last_seen
+            if (
+                outbound.acks_heartbeats
+                and silent_for > self.heartbeat_policy.max_silence_s
+            ):
+                self._reap(websocket, outbound, silent_for)
+            else:
+                outbound.enqueue(frame, size)
+        self._prune_disconnected(now)
+
+    def _prune_disconnected(self, now: float) -> None:
+        """
+        Olvida las salidas más viejas que la ventana de reconexión. Corre
+        en cada latido y también en connect/disconnect, así no crece sin
+        límite aunque los latidos estén apagados. El dict está en orden de
+        salida: basta con recorrerlo hasta la primera que sigue vigente.
+        """
+        expired = []
+        for key, left_at in self.recently_disconnected.items():
+            if now - left_at <= RECONNECT_WINDOW_S:
+                break
+            expired.append(key)
+        for key in expired:
+            del self.recently_disconnected[key]
+
+    def _reap(
+        self, websocket: WebSocket, outbound: "OutboundConnection", silent_for: float
+    ) -> None:
+        print(
+            f"WARN: Socket sin responder hace {silent_for:.0f}s (partida "
+            f"{outbound.game_id}, jugador {outbound.player_id}); se cosecha."
+        )
+        self.lifecycle["reaped"] += 1
+        asyncio.create_task(outbound._close_socket(CLOSE_CODE_IDLE))
+        self.disconnect(websocket)
+
+    def touch(self, websocket: WebSocket, frame: str) -> None:
+        """Registra un frame recibido del cliente (lo mantiene vivo)."""
+        outbound = self.outbound.get(websocket)
+        if outbound is None:
+            return
+        outbound.last_seen = time.monotonic()
+        if not outbound.acks_heartbeats and is_pong(frame):
+            outbound.acks_heartbeats = True
+
+    def is_connected(self, websocket: WebSocket) -> bool:
+        return websocket in self.outbound
 
     async def connect(
         self,
         websocket: WebSocket,
         game_id: Optional[int] = None,
         player_id: Optional[int] = None,
+        since: Optional[int] = None,
+        subscription: Optional[LobbySubscription] = None,
     ):
-        """Registra una conexión. Si tiene game_id y player_id, la asocia. Si no, va al lobby."""
+        """
+        Registra una conexión. Si tiene game_id y player_id, la asocia (un
+        jugador puede tener varios sockets abiertos). Si no, va al lobby.
+        Con `since`, le repite al socket los mensajes de la partida con
+        seq > since (o le pide un resync si ya no están en memoria).
+        Con `subscription`, un socket del lobby solo recibe los cambios de
+        las partidas que pasan sus filtros (ver lobby_subscriptions.py).
+        """
         await websocket.accept()
-        if game_id is not None and player_id is not None:
-            if game_id not in self.connections_by_game:
-                self.connections_by_game[game_id] = {}
-            self.connections_by_game[game_id][player_id] = websocket
+        in_game = game_id is not None and player_id is not None
+        channel = game_id if in_game else None
+        self.outbound[websocket] = OutboundConnection(
+            websocket,
+            self.disconnect,
+            self.policy,
+            self.counters[channel],
+            game_id=channel,
+            player_id=player_id if in_game else None,
+        )
+        self.lifecycle["connects"] += 1
+        self._prune_disconnected(time.monotonic())
+        if in_game:
+            left_at = self.recently_disconnected.pop((game_id, player_id), None)
+            if since is not None or left_at is not None:
+                self.lifecycle["reconnects"] += 1
+            players = self.connections_by_game.setdefault(game_id, {})
+            players.setdefault(player_id, set()).add(websocket)
+            if since is not None:
+                # Sin awaits entre el registro y la repetición: ningún
+                # broadcast nuevo puede colarse antes que lo repetido.
+                self._replay(websocket, game_id, player_id, since)
         else:
             self.lobby_connections.add(websocket)
+            if subscription is not None and not subscription.is_everything():
+                self.lobby_subscriptions[websocket] = subscription
 
     def disconnect(self, websocket: WebSocket):
         """
         Desconecta un websocket, ya sea este de lobby o de partida.
         Este método no depende de argumentos externos.
         """
-        # Si el websocket está en el lobby.
-        self.lobby_connections.discard(websocket)
+        outbound = self.outbound.pop(websocket, None)
+        if outbound is not None:
+            self.lifecycle["disconnects"] += 1
+        if outbound is None or outbound.game_id is None:
+            # Socket del lobby (o que nunca se registró).
+            self.lobby_connections.discard(websocket)
+            self.lobby_subscriptions.pop(websocket, None)
+            if outbound is not None:
+                outbound.close()
+            return
+        outbound.close()
 
-        # Si el websocket está en alguna partida.
-        game_to_delete_from = None
-        player_to_delete = None
+        game_id, player_id = outbound.game_id, outbound.player_id
+        players = self.connections_by_game.get(game_id, {})
+        sockets = players.get(player_id, set())
+        sockets.discard(websocket)
+        if not sockets:
+            players.pop(player_id, None)
+            now = time.monotonic()
+            self._prune_disconnected(now)
+            # Al final del dict, para que siga en orden de salida
+            self.recently_disconnected.pop((game_id, player_id), None)
+            self.recently_disconnected[(game_id, player_id)] = now
+        # Si la partida queda sin jugadores, la elimina del diccionario de Websockets.
+        if not players:
+            self.connections_by_game.pop(game_id, None)
+            self.counters.pop(game_id, None)
+            # Solo se conserva la secuencia, no los frames.
+            if game_id in self.replay:
+                self.replay[game_id].frames.clear()
 
-        for g_id, players in self.connections_by_game.items():
-            for p_id, ws in players.items():
-                if ws is websocket:
-                    game_to_delete_from = g_id
-                    player_to_delete = p_id
-                    break
-            if game_to_delete_from:
-                break
+    def _enqueue(self, websocket: WebSocket, frame: str, size: int) -> None:
+        outbound = self.outbound.get(websocket)
+        if outbound is not None:
+            outbound.enqueue(frame, size)
 
-        # Se elimina solo si encuentra una coincidencia
-        if game_to_delete_from is not None and player_to_delete is not None:
-            del self.connections_by_game[game_to_delete_from][player_to_delete]
-            # Si la partida queda sin jugadores, la elimina del diccionario de Websockets.
-            if not self.connections_by_game[game_to_delete_from]:
-                del self.connections_by_game[game_to_delete_from]
+    def _stamp(
+        self, message: WSMessage, game_id: int, player_id: Optional[int] = None
+    ) -> str:
+        """
+        Numera el mensaje dentro de la partida y lo serializa. El frame solo
+        se guarda si la partida tiene sockets: sin nadie conectado basta con
+        la secuencia (quien reconecte va a necesitar un resync igual).
+        """
+        buffer = self.replay.setdefault(game_id, GameReplayBuffer())
+        seq = buffer.next_seq()
+        frame = message.model_copy(update={"seq": seq}).model_dump_json()
+        if game_id in self.connections_by_game:
+            buffer.record(seq, frame, player_id)
+        return frame
+
+    def _forget_game(self, game_id: int) -> None:
+        """Descarta la secuencia y los frames de una partida terminada."""
+        self.replay.pop(game_id, None)
+
+    def _replay(
+        self, websocket: WebSocket, game_id: int, player_id: int, since: int
+    ) -> None:
+        buffer = self.replay.get(game_id) or GameReplayBuffer()
+        if self.broker.spans_processes:
+            # Cada worker numera por su cuenta: el `since` puede venir de
+            # otro worker y no corresponde a esta secuencia.
+            frames = None
+            reason = "La secuencia es de otro worker."
+        else:
+            frames = buffer.frames_since(since, player_id)
+            reason = "Los mensajes perdidos ya no están en memoria."
+        if frames is None:
+            frames = [
+                WSMessage(
+                    details=ResyncRequiredDetails(reason=reason),
+                    seq=buffer.last_seq,
+                ).model_dump_json()
+            ]
+        for frame in frames:
+            self._enqueue(websocket, frame, len(frame.encode()))
 
     async def broadcast_to_game(self, message: WSMessage, game_id: int):
-        """Envía un mensaje a TODOS los jugadores de una partida."""
-        if game_id in self.connections_by_game:
-            json_message = message.model_dump_json()
-            # Iteramos sobre los sockets del diccionario interno
-            for connection in self.connections_by_game[game_id].values():
-                await connection.send_text(json_message)
+        """Envía un mensaje a TODOS los jugadores de una partida, en todos los workers."""
+        self.broker.publish(
+            BrokerEnvelope(target="game", game_id=game_id, message=message)
+        )
 
     async def broadcast_to_lobby(self, message: WSMessage):
-        json_message = message.model_dump_json()
-        for connection in self.lobby_connections:
-            await connection.send_text(json_message)
+        """Envía un mensaje a todos los sockets del lobby, en todos los workers."""
+        self.broker.publish(BrokerEnvelope(target="lobby", message=message))
 
     async def send_to_player(
         self, message: WSMessage, game_id: int, player_id: int
     ):
-        """Envía un mensaje a un jugador específico dentro de una partida."""
-        if (
-            game_id in self.connections_by_game
-            and player_id in self.connections_by_game[game_id]
+        """
+        Envía un mensaje a un jugador específico dentro de una partida, en
+        todos los sockets que tenga abiertos (en cualquier worker).
+        """
+        self.broker.publish(
+            BrokerEnvelope(
+                target="player",
+                game_id=game_id,
+                player_id=player_id,
+                message=message,
+            )
+        )
+
+    def send_reply(self, websocket: WebSocket, frame: str) -> None:
+        """
+        Encola un frame para un socket puntual de este worker (la respuesta
+        a un pedido RPC), detrás de lo que ya tenga pendiente.
+        """
+        self._enqueue(websocket, frame, len(frame.encode()))
+
+    def _deliver(self, envelope: BrokerEnvelope) -> None:
+        """Entrega a los sockets de este worker lo que llegó por el broker."""
+        if envelope.target == "game":
+            self._deliver_to_game(envelope.message, envelope.game_id)
+        elif envelope.target == "player":
+            self._deliver_to_player(
+                envelope.message, envelope.game_id, envelope.player_id
+            )
+        else:
+            self._deliver_to_lobby(envelope.message)
+
+    def _deliver_to_game(self, message: WSMessage, game_id: int) -> None:
+        """
+        Serializa una sola vez y encola en cada socket de la partida: no
+        espera a ningún cliente.
+        """
+        json_message = self._stamp(message, game_id)
+        if game_id in self.connections_by_game:
+            size = len(json_message.encode())
+            # Copia: un socket desbordado se desconecta durante el recorrido.
+            connections = [
+                connection
+                for sockets in self.connections_by_game[game_id].values()
+                for connection in sockets
+            ]
+            for connection in connections:
+                self._enqueue(connection, json_message, size)
+        if message.details.event == WSEvent.GAME_OVER:
+            self._forget_game(game_id)
+
+    def _deliver_to_lobby(self, message: WSMessage) -> None:
+        if self.lobby_publisher is not None and self.lobby_publisher.publish(
+            message
         ):
-            connection = self.connections_by_game[game_id][player_id]
-            json_message = message.model_dump_json()
-            await connection.send_text(json_message)
+            return
+        self._send_to_lobby(message)
+
+    def _send_to_lobby(self, message: WSMessage) -> None:
+        """
+        Manda el mensaje completo a los sockets sin filtros y a cada
+        suscriptor su vista. Cada vista distinta se serializa una sola vez.
+        """
+        json_message = message.model_dump_json()
+        size = len(json_message.encode())
+        views: Dict[LobbySubscription, Optional[Tuple[str, int]]] = {}
+        for connection in list(self.lobby_connections):
+            subscription = self.lobby_subscriptions.get(connection)
+            if subscription is None:
+                self._enqueue(connection, json_message, size)
+                continue
+            if subscription not in views:
+                details = subscription.view(message.details, self.lobby_games)
+                if details is None:
+                    views[subscription] = None
+                else:
+                    frame = message.model_copy(
+                        update={"details": details}
+                    ).model_dump_json()
+                    views[subscription] = (frame, len(frame.encode()))
+            view = views[subscription]
+            if view is not None:
+                self._enqueue(connection, *view)
+        self._remember_lobby_games(message.details)
+
+    def _remember_lobby_games(self, details) -> None:
+        """Actualiza `lobby_games` con el cambio que se acaba de mandar."""
+        if isinstance(details, LobbyDiffDetails):
+            games = details.created + details.updated
+            removed = details.removed
+        elif isinstance(details, (GameCreatedDetails, GameUpdatedDetails)):
+            games, removed = [details.game], []
+        elif isinstance(details, GameRemovedDetails):
+            games, removed = [], [details.game_id]
         else:
+            return
+        for game in games:
+            if game.game_status == GameStatus.FINISHED:
+                self.lobby_games.pop(game.id, None)
+                self._forget_game(game.id)
+            else:
+                self.lobby_games[game.id] = game
+        for game_id in removed:
+            self.lobby_games.pop(game_id, None)
+            self._forget_game(game_id)
+
+    def _deliver_to_player(
+        self, message: WSMessage, game_id: int, player_id: int
+    ) -> None:
+        json_message = self._stamp(message, game_id, player_id)
+        sockets = self.connections_by_game.get(game_id, {}).get(player_id)
+        if sockets:
+            size = len(json_message.encode())
+            for connection in list(sockets):
+                self._enqueue(connection, json_message, size)
+        elif not self.broker.spans_processes:
+            # Con varios workers el jugador puede estar conectado a otro.
             # Podrías loggear un warning acá. Significa que intentaste mandarle
             # un mensaje a un jugador que no está conectado.
             print(
                 f"WARN: Intento de enviar mensaje a jugador {player_id} en partida {game_id}, pero no se encontró conexión."
             )
+
+    def get_stats(self) -> WebSocketStats:
+        """Profundidad de cola, bytes pendientes y atraso de cada socket."""
+        now = time.monotonic()
+        channels: Dict[Optional[int], ChannelStats] = {
+            channel: ChannelStats(
+                evicted=counters["evicted"],
+                resyncs=counters["resyncs"],
+                frames_dropped=counters["frames_dropped"],
+            )
+            for channel, counters in self.counters.items()
+        }
+        for outbound in self.outbound.values():
+            channel = channels.setdefault(outbound.game_id, ChannelStats())
+            stats = outbound.stats(now)
+            channel.connections.append(stats)
+            channel.queue_depth_max = max(
+                channel.queue_depth_max, stats.queue_depth
+            )
+            channel.bytes_pending += stats.bytes_pending
+            channel.max_seconds_since_last_send = max(
+                channel.max_seconds_since_last_send,
+                stats.seconds_since_last_send,
+            )
+        lobby = channels.pop(None, ChannelStats())
+        lifecycle = LifecycleStats(
+            lobby_sockets=len(self.lobby_connections),
+            game_sockets=len(self.outbound) - len(self.lobby_connections),
+            games=len(self.connections_by_game),
+            heartbeat_clients=sum(
+                o.acks_heartbeats for o in self.outbound.values()
+            ),
+            connects=self.lifecycle["connects"],
+            disconnects=self.lifecycle["disconnects"],
+            reconnects=self.lifecycle["reconnects"],
+            reaped=self.lifecycle["reaped"],
+        )
+        return WebSocketStats(
+            policy=self.policy,
+            heartbeat=self.heartbeat_policy,
+            lifecycle=lifecycle,
+            broker=self.broker.stats(),
+            lobby=lobby,
+            games={game_id: stats for game_id, stats in channels.items()},
+        )
+
+    async def drain(self):
+        """Espera a que todas las colas de salida se vacíen."""
+        await asyncio.gather(
+            *(outbound.drain() for outbound in list(self.outbound.values()))
+        )
+
+    async def shutdown(self):
+        """Detiene todas las tareas escritoras (al apagar el servidor)."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self.lobby_publisher is not None:
+            self.lobby_publisher.flush()
+        for websocket in list(self.outbound):
+            self.disconnect(websocket)
+        await self.broker.stop()
@@ -0,0 +1,88 @@
+"""
+Latidos del servidor y cosecha de sockets inactivos.
+
+Una conexión TCP medio abierta (el cliente se fue sin cerrar: wifi caído,
+laptop suspendida) no da ningún error del lado del servidor: el socket sigue
+en `connections_by_game` / `lobby_connections` y cada broadcast trabaja para
+nadie. Cada `interval_s` el ConnectionManager manda un HEARTBEAT a todos los
+sockets:
+
+- El latido pasa por la cola de salida, así que un socket que no logra
+  enviar nada termina desalojado por la SlowConsumerPolicy (`max_send_lag_s`)
+  aunque la partida esté quieta.
+- Los clientes que contestan {"type": "pong"} se vuelven "con latido": si
+  pasan `interval_s + grace_s` sin mandar ningún frame, se los cosecha
+  (cierre 1001) y se los saca de los índices. Los clientes que nunca
+  contestaron (el frontend actual) no se cosechan por silencio, porque no
+  mandan nada por el socket.
+
+Variables de entorno: DOTC_WS_HEARTBEAT_INTERVAL_S (0 desactiva los
+latidos) y DOTC_WS_HEARTBEAT_GRACE_S.
+"""
+
+import json
+import os
+
+from pydantic import BaseModel, ConfigDict
+
+HEARTBEAT_ENV_PREFIX = "DOTC_WS_HEARTBEAT_"
+# Código de cierre "Going Away" para los sockets cosechados.
+CLOSE_CODE_IDLE = 1001
+# Una reconexión es un connect del mismo jugador dentro de esta ventana.
+RECONNECT_WINDOW_S = 120.0
+
+
+class HeartbeatPolicy(BaseModel):
+    """Cada cuánto latir y cuánto silencio se tolera después."""
+
+    model_config = ConfigDict(frozen=True)
+
+    interval_s: float = 25.0
+    grace_s: float = 35.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_s > 0
+
+    @property
+    def max_silence_s(self) -> float:
+        return self.interval_s + self.grace_s
+
+
+def load_heartbeat_policy() -> HeartbeatPolicy:
+    """Arma la política a partir de los defaults y del entorno."""
+    values = {}
+    for name in HeartbeatPolicy.model_fields:
+        override = os.getenv(HEARTBEAT_ENV_PREFIX + name.upper())
+        if override is not None:
+            values[name] = override
+    return HeartbeatPolicy.model_validate(values)
+
+
+def is_pong(frame: str) -> bool:
+    """True si el frame es la respuesta de un cliente a un latido."""
+    if "pong" not in frame:
+        return False
+    try:
+        data = json.loads(frame)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and data.get("type") == "pong"
+
+
+class LifecycleStats(BaseModel):
+    """
+    Sockets abiertos ahora y contadores acumulados del ciclo de vida.
+    - reconnects: connects de un jugador que se había desconectado hace
+      menos de RECONNECT_WINDOW_S (o que pidió `since`).
+    - reaped: sockets cosechados por silencio.
+    """
+
+    lobby_sockets: int = 0
+    game_sockets: int = 0
+    games: int = 0
+    heartbeat_clients: int = 0
+    connects: int = 0
+    disconnects: int = 0
+    reconnects: int = 0
+    reaped: int = 0
@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from fastapi import WebSocket
 from typing import Optional
 
+from .lobby_subscriptions import LobbySubscription
 from .protocol.messages import WSMessage
+from .slow_consumers import WebSocketStats
 
 
 class IConnectionManager(ABC):
@@ -17,8 +19,14 @@ class IConnectionManager(ABC):
         websocket: WebSocket,
         game_id: Optional[int] = None,
         player_id: Optional[int] = None,
+        since: Optional[int] = None,
+        subscription: Optional[LobbySubscription] = None,
     ) -> None:
-        """Genera una nueva conexion WebSocket, ya sea al lobby inicial o a una partida."""
+        """
+        Genera una nueva conexion WebSocket, ya sea al lobby inicial o a una partida.
+        `since`: último seq que recibió el cliente; se le repite lo posterior.
+        `subscription`: filtros y página de un socket del lobby.
+        """
         pass
 
     @abstractmethod
@@ -45,3 +53,26 @@ class IConnectionManager(ABC):
     ):
         """Envía un mensaje a un jugador específico dentro de una partida."""
         pass
+
+    @abstractmethod
+    def send_reply(self, websocket: WebSocket, frame: str) -> None:
+        """Envía un frame ya serializado a un socket puntual (respuestas RPC)."""
+        pass
+
+    @abstractmethod
+    def touch(self, websocket: WebSocket, frame: str) -> None:
+        """Registra un frame recibido del cliente (para los latidos)."""
+        pass
+
+    @abstractmethod
+    def is_connected(self, websocket: WebSocket) -> bool:
+        """False si el socket ya se desconectó o se cosechó."""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> WebSocketStats:
+        """
+        Devuelve el estado de las colas de salida (profundidad, bytes
+        pendientes, atraso) y los contadores de desalojos, por partida.
+        """
+        pass
@@ -0,0 +1,131 @@
+"""
+Publicación agrupada de los cambios del lobby.
+
+Cada create/join/leave/start/delete de una partida genera un GAME_CREATED,
+GAME_UPDATED o GAME_CANCELLED para todos los sockets de /ws/mainscreen. En
+hora pico eso es una tormenta de mensajes. El `LobbyPublisher` junta esos
+cambios durante un tick (p. ej. 100 ms) y manda UN solo LOBBY_DIFF con el
+último estado de cada partida tocada. Así el tráfico del lobby queda
+acotado a un frame por tick, sin importar cuánto movimiento haya.
+
+Reglas de fusión dentro de un tick (por game_id):
+- creada y después actualizada  -> creada, con el último estado;
+- creada y después eliminada    -> no se manda nada;
+- eliminada y después creada    -> actualizada (SQLite puede reusar el id).
+
+Variable de entorno: DOTC_LOBBY_TICK_MS. Por defecto es 0: el agrupado
+está apagado y cada cambio sale en el momento, con su evento original,
+porque el frontend todavía no entiende LOBBY_DIFF. Activarlo solo cuando
+los clientes lo manejen.
+"""
+
+import asyncio
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+from ..api.schemas import GameLobbyInfo
+from .protocol.details import (
+    GameCreatedDetails,
+    GameRemovedDetails,
+    GameUpdatedDetails,
+    LobbyDiffDetails,
+)
+from .protocol.messages import WSMessage
+
+LOBBY_TICK_ENV = "DOTC_LOBBY_TICK_MS"
+# Apagado hasta que los clientes manejen LOBBY_DIFF
+DEFAULT_LOBBY_TICK_MS = 0
+# Tick que usa el publisher si se lo crea sin indicar uno
+LOBBY_TICK_MS = 100
+
+CREATED, UPDATED, REMOVED = "created", "updated", "removed"
+
+
+class LobbyPublisher:
+    """Junta los cambios de partidas del lobby y los publica una vez por tick."""
+
+    def __init__(self, tick_s: float = LOBBY_TICK_MS / 1000):
+        self.tick_s = tick_s
+        # game_id -> (tipo de cambio, último estado o None si se eliminó)
+        self.pending: Dict[int, Tuple[str, Optional[GameLobbyInfo]]] = {}
+        self.changes_received = 0
+        self.frames_sent = 0
+        self._send: Optional[Callable[[WSMessage], None]] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, send: Callable[[WSMessage], None]) -> None:
+        """Función que entrega un mensaje a todos los sockets del lobby."""
+        self._send = send
+
+    def publish(self, message: WSMessage) -> bool:
+        """
+        Anota el cambio si es de los que se agrupan y programa el envío.
+        Devuelve False si el mensaje no se agrupa (hay que mandarlo ya).
+        """
+        details = message.details
+        if isinstance(details, GameCreatedDetails):
+            self._merge(details.game.id, CREATED, details.game)
+        elif isinstance(details, GameUpdatedDetails):
+            self._merge(details.game.id, UPDATED, details.game)
+        elif isinstance(details, GameRemovedDetails):
+            self._merge(details.game_id, REMOVED, None)
+        else:
+            return False
+        self.changes_received += 1
+        loop = asyncio.get_running_loop()
+        # Un timer de otro loop (ya cerrado, p. ej. en tests) nunca va a
+        # dispararse: se reprograma en el loop actual.
+        if self._timer is None or self._timer_loop is not loop:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer_loop = loop
+            self._timer = loop.call_later(self.tick_s, self.flush)
+        return True
+
+    def _merge(
+        self, game_id: int, kind: str, game: Optional[GameLobbyInfo]
+    ) -> None:
+        previous = self.pending.get(game_id, (None, None))[0]
+        if previous == CREATED and kind == REMOVED:
+            # Nadie llegó a verla: no hay nada que anunciar.
+            del self.pending[game_id]
+            return
+        if previous == CREATED:
+            kind = CREATED
+        elif previous == REMOVED and kind == CREATED:
+            kind = UPDATED
+        self.pending[game_id] = (kind, game)
+
+    def flush(self) -> None:
+        """Manda lo acumulado como un único LOBBY_DIFF (si hay algo)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self.pending:
+            return
+        diff = LobbyDiffDetails()
+        for game_id, (kind, game) in self.pending.items():
+            if kind == REMOVED:
+                diff.removed.append(game_id)
+            elif kind == CREATED:
+                diff.created.append(game)
+            else:
+                diff.updated.append(game)
+        self.pending.clear()
+        self.frames_sent += 1
+        if self._send is not None:
+            self._send(WSMessage(details=diff))
+
+
+def load_lobby_publisher() -> Optional[LobbyPublisher]:
+    """
+    Arma el publisher según DOTC_LOBBY_TICK_MS.
+    None si el agrupado está desactivado (tick 0).
+    """
+    tick_ms = float(os.getenv(LOBBY_TICK_ENV, DEFAULT_LOBBY_TICK_MS))
+    if tick_ms < 0:
+        raise ValueError(f"{LOBBY_TICK_ENV} no puede ser negativo: {tick_ms}")
+    if tick_ms == 0:
+        return None
+    return LobbyPublisher(tick_s=tick_ms / 1000)
@@ -0,0 +1,118 @@
+"""
+Suscripciones filtradas al lobby (/ws/mainscreen).
+
+Un cliente del lobby puede pedir solo las partidas que le interesan, con los
+mismos filtros que GET /api/games (estado, prefijo del nombre, lugares libres)
+y acotado a la página que está mirando: `after` es el cursor con el que pidió
+la página (exclusivo) y `until` el id de la última partida de esa página
+(inclusivo; None = hasta el final).
+
+El `ConnectionManager` le manda a cada suscriptor su propia vista de cada
+cambio. Como un cambio puede hacer que una partida entre o salga del filtro,
+la vista depende también del estado anterior de la partida:
+
+- antes no pasaba el filtro y ahora sí -> GAME_CREATED;
+- antes lo pasaba y ahora no           -> GAME_REMOVED;
+- lo pasaba y lo sigue pasando         -> GAME_UPDATED;
+- no lo pasaba ni lo pasa              -> no se manda nada.
+
+Si el estado anterior no se conoce (p. ej. el servidor recién arrancó) se
+asume que la partida podía estar en la vista del cliente: se manda el
+GAME_UPDATED (el frontend lo toma como alta o modificación) o el
+GAME_REMOVED (que ignora si no la tenía).
+"""
+
+from typing import Dict, Optional
+
+from ..api.schemas import GameLobbyInfo, LobbyFilter
+from .protocol.details import (
+    GameCreatedDetails,
+    GameRemovedDetails,
+    GameUpdatedDetails,
+    LobbyDiffDetails,
+)
+
+
+class LobbySubscription(LobbyFilter):
+    """
+    Filtros y página de un socket del lobby.
+    - after: Optional[int] (cursor de la página, exclusivo)
+    - until: Optional[int] (último id de la página, inclusivo)
+    """
+
+    after: Optional[int] = None
+    until: Optional[int] = None
+
+    def in_page(self, game_id: int) -> bool:
+        if self.after is not None and game_id <= self.after:
+            return False
+        return self.until is None or game_id <= self.until
+
+    def is_everything(self) -> bool:
+        """True si no filtra nada (equivale a no estar suscripto)."""
+        return self == LobbySubscription()
+
+    def _was_visible(
+        self, game_id: int, previous: Dict[int, GameLobbyInfo]
+    ) -> Optional[bool]:
+        """Si la partida pasaba el filtro antes del cambio (None = no se sabe)."""
+        old = previous.get(game_id)
+        return None if old is None else self.matches(old)
+
+    def _view_game(
+        self, game: GameLobbyInfo, previous: Dict[int, GameLobbyInfo]
+    ):
+        was_visible = self._was_visible(game.id, previous)
+        if self.matches(game):
+            if was_visible is False:
+                return GameCreatedDetails(game=game)
+            return GameUpdatedDetails(game=game)
+        if was_visible is False:
+            return None
+        return GameRemovedDetails(game_id=game.id)
+
+    def view(self, details, previous: Dict[int, GameLobbyInfo]):
+        """
+        Lo que este suscriptor debe recibir de un cambio del lobby, o None
+        si no le corresponde nada. `previous` es el último estado conocido
+        de cada partida, antes de aplicar el cambio.
+        """
+        if isinstance(details, LobbyDiffDetails):
+            diff = LobbyDiffDetails()
+            for game in details.created:
+                if self.in_page(game.id) and self.matches(game):
+                    diff.created.append(game)
+            for game in details.updated:
+                if not self.in_page(game.id):
+                    continue
+                single = self._view_game(game, previous)
+                if isinstance(single, GameCreatedDetails):
+                    diff.created.append(single.game)
+                elif isinstance(single, GameUpdatedDetails):
+                    diff.updated.append(single.game)
+                elif isinstance(single, GameRemovedDetails):
+                    diff.removed.append(single.game_id)
+            for game_id in details.removed:
+                if self.in_page(game_id) and self._was_visible(
+                    game_id, previous
+                ) is not False:
+                    diff.removed.append(game_id)
+            if not (diff.created or diff.updated or diff.removed):
+                return None
+            return diff
+        if isinstance(details, GameCreatedDetails):
+            if self.in_page(details.game.id) and self.matches(details.game):
+                return details
+            return None
+        if isinstance(details, GameUpdatedDetails):
+            if not self.in_page(details.game.id):
+                return None
+            return self._view_game(details.game, previous)
+        if isinstance(details, GameRemovedDetails):
+            if self.in_page(details.game_id) and self._was_visible(
+                details.game_id, previous
+            ) is not False:
+                return details
+            return None
+        # El resto de los mensajes del lobby no se filtra.
+        return details
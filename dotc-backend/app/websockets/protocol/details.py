@@ -1,9 +1,9 @@
 from pydantic import BaseModel, Field
-from typing import Literal, List
+from typing import Annotated, Literal, List, Union
 
 from .events import WSEvent
 from ...domain.models import Card
-from ...domain.enums import PlayerRole
+from ...domain.enums import CardLocation, CardType, PlayerRole
 from ...api.schemas import GameLobbyInfo
 from typing import Optional
 
@@ -65,6 +65,25 @@ class GameRemovedDetails(BaseModel):
     game_id: int = Field(..., description="ID de la partida que fue eliminada.")
 
 
+class LobbyDiffDetails(BaseModel):
+    """
+    Destinatarios: Broadcast a todos en el Lobby.
+    Todos los GAME_CREATED / GAME_UPDATED / GAME_CANCELLED de un tick,
+    fusionados: cada partida aparece a lo sumo una vez y con su último estado.
+    """
+
+    event: Literal[WSEvent.LOBBY_DIFF] = WSEvent.LOBBY_DIFF
+    created: List[GameLobbyInfo] = Field(
+        default_factory=list, description="Partidas nuevas."
+    )
+    updated: List[GameLobbyInfo] = Field(
+        default_factory=list, description="Partidas que cambiaron."
+    )
+    removed: List[int] = Field(
+        default_factory=list, description="IDs de partidas que ya no están."
+    )
+
+
 """
 Modelos de Detalles para Eventos de Partida (InGame)
 Estos eventos son enviados por broadcast únicamente a los jugadores dentro de una partida específica.
@@ -205,11 +224,12 @@ class GameStartedDetails(BaseModel):
 class HandsUpdatedDetails(BaseModel):
     """
     Destinatarios: Broadcast a los jugadores de la partida.
-    Notifica que la mano del destinatario ha sido actualizada.
-    No da mas informacion.
+    Notifica que las manos de los jugadores han sido actualizadas.
+    No da mas informacion: cada cliente vuelve a pedir su mano.
+    En modo delta no se envía (lo reemplaza STATE_PATCH).
     """
 
-    event: Literal[WSEvent.HAND_UPDATED] = WSEvent.HAND_UPDATED
+    event: Literal[WSEvent.HANDS_UPDATED] = WSEvent.HANDS_UPDATED
 
 
 class DraftUpdatedDetails(BaseModel):
@@ -437,3 +457,94 @@ class PlayerActionResolvedDetails(BaseModel):
     action_id: Optional[int] = Field(
         None, description="ID de la acción que fue resuelta."
     )
+
+
+class ResyncRequiredDetails(BaseModel):
+    """
+    Destinatarios: un único socket que se atrasó demasiado.
+    Los mensajes que tenía pendientes se descartaron; el cliente debe volver
+    a pedir el estado completo (partida, mano, lobby) por HTTP.
+    """
+
+    event: Literal[WSEvent.RESYNC_REQUIRED] = WSEvent.RESYNC_REQUIRED
+    reason: str = Field(..., description="Motivo del descarte.")
+
+
+class HeartbeatDetails(BaseModel):
+    """
+    Destinatarios: cada socket abierto, cada `interval_s` segundos.
+    Mantiene viva la conexión. Un cliente que contesta {"type": "pong"}
+    queda sujeto a la cosecha: si deja de contestar se lo desconecta.
+    """
+
+    event: Literal[WSEvent.HEARTBEAT] = WSEvent.HEARTBEAT
+    interval_s: float = Field(..., description="Segundos entre latidos.")
+
+
+"""
+Parches de estado (modo delta, ver game/helpers/state_deltas.py).
+Cada parche describe el estado ACTUAL de un elemento que cambió, así
+aplicarlo dos veces (por ejemplo al repetir frames tras reconectar) no rompe nada.
+"""
+
+
+class CardPatch(BaseModel):
+    """Dónde quedó una carta que se movió."""
+
+    op: Literal["card"] = "card"
+    card_id: int
+    location: CardLocation
+    owner_id: Optional[int] = None
+    set_id: Optional[int] = None
+    position: Optional[int] = None
+    card_type: Optional[CardType] = Field(
+        None,
+        description="None si el destinatario no puede verla (mazo o mano ajena).",
+    )
+
+
+class SecretPatch(BaseModel):
+    """Estado de un secreto que se reveló, se ocultó o cambió de dueño."""
+
+    op: Literal["secret"] = "secret"
+    secret_id: int
+    owner_id: int
+    is_revealed: bool
+    role: Optional[PlayerRole] = Field(
+        None, description="None si el secreto está oculto para el destinatario."
+    )
+
+
+class TurnPatch(BaseModel):
+    """Cambió el jugador de turno."""
+
+    op: Literal["turn"] = "turn"
+    turn_player_id: int
+
+
+class SocialDisgracePatch(BaseModel):
+    """Un jugador entró o salió de la desgracia social."""
+
+    op: Literal["social_disgrace"] = "social_disgrace"
+    player_id: int
+    is_disgraced: bool
+
+
+AnyPatch = Annotated[
+    Union[CardPatch, SecretPatch, TurnPatch, SocialDisgracePatch],
+    Field(discriminator="op"),
+]
+
+
+class StatePatchDetails(BaseModel):
+    """
+    Destinatarios: Broadcast a los jugadores de la partida (versión pública)
+    y mensaje privado al dueño de las cartas/secretos ocultos (versión completa).
+    Lista de cambios que dejó una acción, ya commiteados. El cliente los
+    aplica sobre su copia del estado en vez de volver a pedirlo por HTTP.
+    """
+
+    event: Literal[WSEvent.STATE_PATCH] = WSEvent.STATE_PATCH
+    patches: List[AnyPatch] = Field(
+        ..., description="Cambios en el orden en que se aplicaron."
+    )
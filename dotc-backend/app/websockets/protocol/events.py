@@ -11,6 +11,7 @@ class WSEvent(str, enum.Enum):
     GAME_CREATED = "GAME_CREATED"
     GAME_UPDATED = "GAME_UPDATED"  # Ej: cambió el numero de jugadores
     GAME_REMOVED = "GAME_CANCELLED"
+    LOBBY_DIFF = "LOBBY_DIFF"  # Los tres anteriores, agrupados por tick (ver lobby_publisher.py)
 
     # Eventos Ingame (Broadcast al game o mensaje privado a un jugador)
     NEW_TURN = "NEW_TURN"
@@ -38,12 +39,18 @@ class WSEvent(str, enum.Enum):
         "TRADE_REQUESTED"  # Notificación PRIVADA para intercambio de cartas.
     )
     HAND_UPDATED = "HAND_UPDATED"  # Notificación PRIVADA de mano actualizada.
+    HANDS_UPDATED = "HANDS_UPDATED"  # Notificación PÚBLICA: cambiaron las manos, hay que volver a pedirlas.
+    STATE_PATCH = "STATE_PATCH"  # Cambios puntuales de estado (modo delta), sin volver a pedir nada por HTTP.
 
     VOTE_STARTED = "VOTE_STARTED"
     VOTE_ENDED = "VOTE_ENDED"
     ACTION_RESOLVED = "ACTION_RESOLVED"  # Notificación PÚBLICA de que se resolvió una acción NSF.
     ACTION_CANCELLED = "ACTION_CANCELLED"  # Notificación PÚBLICA de que se canceló una acción NSF.
     
+    # Eventos de control de la conexión (mensaje privado a un socket)
+    RESYNC_REQUIRED = "RESYNC_REQUIRED"  # El cliente se atrasó: debe volver a pedir el estado completo.
+    HEARTBEAT = "HEARTBEAT"  # Latido del servidor; el cliente puede contestar {"type": "pong"}.
+
     """ Algunos eventos necesitan actualizar ambos canales """
 
     # Eventos de pantalla principal y partida (Broadcast a Lobby y a Game)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Union
+from typing import Optional, Union
 
 from . import details  # Importo todo de details
 
@@ -9,6 +9,7 @@ AnyDetails = Union[
     details.GameCreatedDetails,
     details.GameUpdatedDetails,
     details.GameRemovedDetails,
+    details.LobbyDiffDetails,
     # Modelos de Partida (Públicos)
     details.NewTurnDetails,
     details.CardPlayedDetails,
@@ -34,11 +35,16 @@ AnyDetails = Union[
     details.VoteStartedDetails,
     details.VoteEndedDetails,
     details.HandUpdatedDetails,
+    details.HandsUpdatedDetails,
     details.TradeRequestedDetails,
+    details.StatePatchDetails,
     # Modelos que afectan a ambos
     details.PlayerJoinedDetails,
     details.PlayerLeftDetails,
     details.GameStartedDetails,
+    # Control de la conexión
+    details.ResyncRequiredDetails,
+    details.HeartbeatDetails,
 ]
 
 
@@ -46,3 +52,6 @@ class WSMessage(BaseModel):
     # Usamos Field con 'discriminator' para que Pydantic sepa como
     # validar y serializar el modelo correcto dentro de la Union.
     details: AnyDetails = Field(..., discriminator="event")
+    # Número de secuencia dentro de la partida (None en mensajes del lobby).
+    # Lo asigna el ConnectionManager al enviar; ver websockets/replay.py.
+    seq: Optional[int] = None
@@ -0,0 +1,52 @@
+"""
+Números de secuencia por partida y buffer de repetición (ring buffer).
+
+Cada mensaje que sale hacia una partida (broadcast o privado) lleva un
+`seq` creciente por partida. Los últimos frames ya serializados quedan en
+memoria, así un jugador que reconecta con `?since=<seq>` recibe solo lo que
+se perdió, sin volver a pedir partida, mano y secretos por HTTP. Los
+mensajes privados se guardan con su destinatario y solo se le repiten a él.
+
+Si el buffer ya no cubre `since` (se pisó, o el servidor se reinició y la
+secuencia volvió a empezar), hace falta un resync completo.
+"""
+
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+REPLAY_BUFFER_SIZE = 256
+
+
+class GameReplayBuffer:
+    """Secuencia y últimos frames de una partida."""
+
+    def __init__(self, last_seq: int = 0, maxlen: int = REPLAY_BUFFER_SIZE):
+        self.last_seq = last_seq
+        # (seq, destinatario o None si fue broadcast, frame)
+        self.frames: Deque[Tuple[int, Optional[int], str]] = deque(
+            maxlen=maxlen
+        )
+
+    def next_seq(self) -> int:
+        self.last_seq += 1
+        return self.last_seq
+
+    def record(self, seq: int, frame: str, player_id: Optional[int] = None):
+        self.frames.append((seq, player_id, frame))
+
+    def frames_since(self, since: int, player_id: int) -> Optional[List[str]]:
+        """
+        Frames con seq > `since` que le corresponden a `player_id`, en orden.
+        None si el buffer ya no alcanza para cubrir el hueco.
+        """
+        if since == self.last_seq:
+            return []
+        if since > self.last_seq:
+            return None
+        if not self.frames or self.frames[0][0] > since + 1:
+            return None
+        return [
+            frame
+            for seq, to, frame in self.frames
+            if seq > since and (to is None or to == player_id)
+        ]
@@ -1,23 +1,62 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from .connection_manager import ConnectionManager
-from ..dependencies.dependencies import get_websocket_manager
+from .lobby_subscriptions import LobbySubscription
+from ..domain.enums import GameStatus
+from .rpc import RpcDispatcher, parse_rpc_frame
+from ..dependencies.dependencies import get_rpc_dispatcher, get_websocket_manager
 
 router = APIRouter()
 
 
+async def receive_frames(
+    websocket: WebSocket, manager: ConnectionManager
+) -> AsyncIterator[str]:
+    """
+    Frames del cliente hasta que se desconecta (WebSocketDisconnect) o se lo
+    cosecha. Cada frame lo mantiene vivo. Con latidos activos la espera se
+    corta cada `interval_s` para notar la cosecha: un socket medio abierto
+    nunca entrega el disconnect.
+    """
+    policy = manager.heartbeat_policy
+    timeout = policy.interval_s if policy.enabled else None
+    while manager.is_connected(websocket):
+        try:
+            frame = await asyncio.wait_for(websocket.receive_text(), timeout)
+        except asyncio.TimeoutError:
+            continue
+        manager.touch(websocket, frame)
+        yield frame
+
+
 @router.websocket("/ws/game/{game_id}/player/{player_id}")
 async def websocket_endpoint_game(
     websocket: WebSocket,
     game_id: int,
     player_id: int,
+    since: Optional[int] = None,
     manager: ConnectionManager = Depends(get_websocket_manager),
+    rpc: RpcDispatcher = Depends(get_rpc_dispatcher),
 ):
-    """Endpoint para conexiones WebSocket de un jugador específico en una partida."""
-    await manager.connect(websocket, game_id=game_id, player_id=player_id)
+    """
+    Endpoint para conexiones WebSocket de un jugador específico en una partida.
+    Al reconectar, `?since=<seq>` repite los mensajes que se perdió.
+    El jugador también puede mandar sus acciones por acá (ver rpc.py); se
+    atienden de a una, en el orden en que llegan. Contestar los HEARTBEAT
+    con {"type": "pong"} habilita la cosecha por silencio (ver heartbeat.py).
+    """
+    await manager.connect(
+        websocket, game_id=game_id, player_id=player_id, since=since
+    )
     try:
-        while True:
-            # En este juego, el servidor solo envía, no recibe.
-            await websocket.receive_text()
+        async for frame in receive_frames(websocket, manager):
+            data = parse_rpc_frame(frame)
+            if data is None:
+                continue
+            response = await rpc.handle(data, game_id, player_id)
+            manager.send_reply(websocket, response.model_dump_json())
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
@@ -25,12 +64,29 @@ async def websocket_endpoint_game(
 @router.websocket("/ws/mainscreen")
 async def websocket_endpoint_lobby(
     websocket: WebSocket,
+    status: Optional[GameStatus] = None,
+    name_prefix: Optional[str] = None,
+    has_free_seats: Optional[bool] = None,
+    after: Optional[int] = None,
+    until: Optional[int] = None,
     manager: ConnectionManager = Depends(get_websocket_manager),
 ):
-    """Endpoint para conexiones WebSocket en el lobby general."""
-    await manager.connect(websocket)
+    """
+    Endpoint para conexiones WebSocket en el lobby general.
+    Acepta los mismos filtros que GET /api/games y la página que se está
+    mirando (`after` = cursor de la página, `until` = último id de ella):
+    solo llegan los cambios de esas partidas. Sin parámetros, llega todo.
+    """
+    subscription = LobbySubscription(
+        status=status,
+        name_prefix=name_prefix,
+        has_free_seats=has_free_seats,
+        after=after,
+        until=until,
+    )
+    await manager.connect(websocket, subscription=subscription)
     try:
-        while True:
-            await websocket.receive_text()
+        async for _ in receive_frames(websocket, manager):
+            pass
     except WebSocketDisconnect:
         manager.disconnect(websocket)
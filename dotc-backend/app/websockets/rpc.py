@@ -0,0 +1,179 @@
+"""
+Acciones de partida por el websocket del jugador (canal RPC).
+
+Además de recibir eventos, el cliente puede mandar por el mismo socket las
+acciones que hoy hace por HTTP. Cada frame es un pedido:
+
+    {"id": 7, "action": "draw", "payload": {"source": "deck"}}
+
+y el servidor contesta con un frame correlacionado por `id`:
+
+    {"type": "rpc_result", "id": 7, "ok": true, "status": 200,
+     "result": {...la misma respuesta que el endpoint HTTP...}}
+
+Las acciones son las de POST /api/games/{game_id}/actions/<acción> y llegan
+a los mismos métodos del GameManager, con una sesión de BD nueva por pedido.
+`game_id` y `player_id` los pone el servidor a partir del socket (no se
+puede actuar en nombre de otro jugador). Los errores de negocio vuelven con
+el mismo código que daría HTTP (404, 409, 403, 400, 500; 422 si el payload
+no valida).
+
+La respuesta se encola en la misma cola de salida que los eventos: el
+cliente recibe primero los eventos que generó la acción y después su
+respuesta. Los frames que no son pedidos RPC (sin `id` o sin `action`) se
+ignoran, como antes.
+"""
+
+import json
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, ValidationError
+
+from ..api.schemas import (
+    DiscardCardRequest,
+    DrawCardRequest,
+    ExchangeCardRequest,
+    PlayCardRequest,
+    PlayerActionRequest,
+    RevealSecretRequest,
+    SubmitTradeChoiceRequest,
+    VoteRequest,
+)
+from ..database.async_session import ASYNC_DRIVER, get_db_driver, run_in_greenlet
+from ..game.exceptions import (
+    ActionConflict,
+    ForbiddenAction,
+    GameError,
+    InvalidRequest,
+    ResourceNotFound,
+)
+from ..game.game_manager import GameManager
+
+# acción -> (modelo del payload, método del GameManager)
+RPC_ACTIONS: Dict[str, Tuple[Type[PlayerActionRequest], str]] = {
+    "discard": (DiscardCardRequest, "discard_card"),
+    "draw": (DrawCardRequest, "draw_card"),
+    "finish-turn": (PlayerActionRequest, "finish_turn"),
+    "play": (PlayCardRequest, "play_card"),
+    "play-nsf": (PlayCardRequest, "play_nsf"),
+    "reveal-secret": (RevealSecretRequest, "reveal_secret"),
+    "vote": (VoteRequest, "submit_vote"),
+    "donate-card": (SubmitTradeChoiceRequest, "submit_trade_choice"),
+    "exchange-card": (ExchangeCardRequest, "exchange_card"),
+}
+
+# Mismo mapeo que los manejadores de api/exception_handlers.py
+ERROR_STATUS = (
+    (ResourceNotFound, 404),
+    (ActionConflict, 409),
+    (ForbiddenAction, 403),
+    (InvalidRequest, 400),
+)
+
+
+class RpcRequest(BaseModel):
+    """
+    Pedido de acción recibido por el websocket.
+    - id: int | str (lo elige el cliente)
+    - action: str (ver RPC_ACTIONS)
+    - payload: dict (cuerpo del request HTTP equivalente)
+    """
+
+    id: Union[int, str]
+    action: str
+    payload: Dict[str, Any] = {}
+
+
+class RpcResponse(BaseModel):
+    """
+    Respuesta a un RpcRequest, con el mismo `id`.
+    - ok: bool
+    - status: int (el código HTTP equivalente)
+    - result: Optional[dict] (la respuesta del endpoint, si ok)
+    - detail: Optional[str] (el motivo, si no)
+    """
+
+    type: str = "rpc_result"
+    id: Optional[Union[int, str]] = None
+    ok: bool
+    status: int
+    result: Optional[Dict[str, Any]] = None
+    detail: Optional[str] = None
+
+
+def parse_rpc_frame(frame: str) -> Optional[dict]:
+    """El frame como dict si es un pedido RPC; None si no lo es."""
+    try:
+        data = json.loads(frame)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or "id" not in data or "action" not in data:
+        return None
+    return data
+
+
+class RpcDispatcher:
+    """Ejecuta los pedidos RPC contra el GameManager."""
+
+    def __init__(
+        self, open_game_manager: Callable[[], AsyncContextManager[GameManager]]
+    ):
+        self.open_game_manager = open_game_manager
+
+    async def handle(
+        self, data: dict, game_id: int, player_id: int
+    ) -> RpcResponse:
+        """Valida el pedido, lo ejecuta y arma la respuesta (nunca lanza)."""
+        request_id = data.get("id")
+        try:
+            rpc = RpcRequest.model_validate(data)
+        except ValidationError as e:
+            return RpcResponse(id=request_id, ok=False, status=422, detail=str(e))
+        if rpc.action not in RPC_ACTIONS:
+            return RpcResponse(
+                id=rpc.id,
+                ok=False,
+                status=400,
+                detail=f"Acción desconocida: {rpc.action}",
+            )
+        model, method = RPC_ACTIONS[rpc.action]
+        try:
+            request = model.model_validate(
+                {**rpc.payload, "game_id": game_id, "player_id": player_id}
+            )
+        except ValidationError as e:
+            return RpcResponse(id=rpc.id, ok=False, status=422, detail=str(e))
+
+        call = self._call(method, request)
+        if get_db_driver() == ASYNC_DRIVER:
+            # Igual que el GreenletBridgeMiddleware para los requests HTTP.
+            call = run_in_greenlet(call)
+        try:
+            result = await call
+        except GameError as e:
+            status = next(
+                (code for kind, code in ERROR_STATUS if isinstance(e, kind)),
+                500,
+            )
+            return RpcResponse(id=rpc.id, ok=False, status=status, detail=e.detail)
+        except Exception as e:
+            print(f"Error en RPC '{rpc.action}' (partida {game_id}): {e}")
+            return RpcResponse(
+                id=rpc.id, ok=False, status=500, detail="Error interno."
+            )
+        return RpcResponse(
+            id=rpc.id, ok=True, status=200, result=result.model_dump(mode="json")
+        )
+
+    async def _call(self, method: str, request: PlayerActionRequest):
+        async with self.open_game_manager() as game_manager:
+            return await getattr(game_manager, method)(request)
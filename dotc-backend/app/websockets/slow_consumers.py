@@ -0,0 +1,95 @@
+"""
+Política de consumidores lentos para las colas de salida de los websockets.
+
+Cada conexión acumula frames en su cola mientras el cliente no los lee.
+Sin límites, un cliente colgado retiene memoria para siempre. La política
+define cuánto puede atrasarse un socket (frames, bytes y segundos sin un
+envío exitoso) y qué hacer cuando se pasa:
+- "resync": se descarta lo encolado y se le manda UN aviso RESYNC_REQUIRED;
+  hasta que ese aviso salga, lo nuevo también se descarta (el cliente va a
+  pedir el estado completo de todas formas).
+- "disconnect": se cierra el socket con 1013 (Try Again Later).
+Un socket que no logra enviar nada durante `max_send_lag_s` se desconecta
+siempre: tampoco va a poder recibir el aviso de resync.
+
+Variables de entorno (todas opcionales):
+- DOTC_WS_MAX_QUEUE_DEPTH, DOTC_WS_MAX_PENDING_BYTES,
+  DOTC_WS_MAX_SEND_LAG_S, DOTC_WS_ON_LIMIT ("resync" | "disconnect").
+"""
+
+import os
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .broker import BrokerStats
+from .heartbeat import HeartbeatPolicy, LifecycleStats
+
+POLICY_ENV_PREFIX = "DOTC_WS_"
+
+
+class SlowConsumerPolicy(BaseModel):
+    """Límites por conexión y acción a tomar al superarlos."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_queue_depth: int = 256
+    max_pending_bytes: int = 1024 * 1024
+    max_send_lag_s: float = 15.0
+    on_limit: Literal["resync", "disconnect"] = "resync"
+
+
+def load_slow_consumer_policy() -> SlowConsumerPolicy:
+    """Arma la política a partir de los defaults y del entorno."""
+    values = {}
+    for name in SlowConsumerPolicy.model_fields:
+        override = os.getenv(POLICY_ENV_PREFIX + name.upper())
+        if override is not None:
+            values[name] = override.lower()
+    return SlowConsumerPolicy.model_validate(values)
+
+
+# ═══════════════════════════════════════════════════════════
+# 📊 CONTADORES PUBLICADOS
+# ═══════════════════════════════════════════════════════════
+
+
+class ConnectionStats(BaseModel):
+    """Estado de la cola de salida de un socket."""
+
+    player_id: Optional[int] = None
+    queue_depth: int
+    bytes_pending: int
+    seconds_since_last_send: float
+    frames_sent: int
+    resync_pending: bool
+
+
+class ChannelStats(BaseModel):
+    """
+    Contadores de una partida (o del lobby). `evicted`, `resyncs` y
+    `frames_dropped` son acumulados: incluyen sockets ya desconectados.
+    """
+
+    connections: List[ConnectionStats] = []
+    queue_depth_max: int = 0
+    bytes_pending: int = 0
+    max_seconds_since_last_send: float = 0.0
+    evicted: int = 0
+    resyncs: int = 0
+    frames_dropped: int = 0
+
+
+class WebSocketStats(BaseModel):
+    """
+    Foto de todas las colas de salida, agrupadas por partida, del ciclo
+    de vida de las conexiones (abiertas, cosechadas, reconexiones) y de
+    los contadores del broker entre workers.
+    """
+
+    policy: SlowConsumerPolicy
+    heartbeat: HeartbeatPolicy = HeartbeatPolicy()
+    lifecycle: LifecycleStats = LifecycleStats()
+    broker: BrokerStats = BrokerStats()
+    lobby: ChannelStats
+    games: Dict[int, ChannelStats] = {}
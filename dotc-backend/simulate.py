@@ -0,0 +1,41 @@
+"""
+Corre el simulador de partidas (ver app/simulation/runner.py).
+
+    python simulate.py --games 200 --workers 4 --players 4
+
+Imprime partidas/s, acciones/s, latencia por acción y los errores de reglas
+encontrados, cada uno con la seed para reproducirlo:
+
+    python simulate.py --games 1 --seed <seed> --verbose
+"""
+
+import argparse
+
+from app.simulation.runner import SimulationConfig, run_simulation
+
+
+def parse_args() -> SimulationConfig:
+    parser = argparse.ArgumentParser(description="Self-play de bots aleatorios.")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--players", type=int, default=4, help="0: al azar entre 2 y 6"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-actions", type=int, default=3000)
+    parser.add_argument(
+        "--verbose", action="store_true", help="no silenciar los print del backend"
+    )
+    args = parser.parse_args()
+    return SimulationConfig(
+        games=args.games,
+        workers=args.workers,
+        players=args.players or None,
+        seed=args.seed,
+        max_actions=args.max_actions,
+        quiet=not args.verbose,
+    )
+
+
+if __name__ == "__main__":
+    print(run_simulation(parse_args()).render())
@@ -62,3 +62,12 @@ def test_debug_internal_error_returns_500(monkeypatch):
     resp = client.post("/api/echo", json={"type": "game_created", "game": {"id": 1}})
     assert resp.status_code == 500
     assert "Internal error while triggering notification" in resp.json()["detail"]
+
+
+def test_debug_websocket_stats_lists_policy_and_channels():
+    resp = client.get("/api/debug/websockets")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["policy"]["on_limit"] in ("resync", "disconnect")
+    assert "connections" in body["lobby"]
+    assert isinstance(body["games"], dict)
@@ -15,6 +15,9 @@ from app.api.schemas import (
     DrawCardResponse,
     GeneralActionResponse,
     ConsultDeckSizeResponse,
+    LegalMove,
+    LegalMovesResponse,
+    LobbyFilter,
 )
 from app.game.exceptions import (
     ActionConflict,
@@ -24,7 +27,13 @@ from app.game.exceptions import (
     NotYourTurn,
     NotYourCard,
 )
-from app.domain.enums import GameStatus, Avatar, CardType, CardLocation
+from app.domain.enums import (
+    GameStatus,
+    Avatar,
+    CardType,
+    CardLocation,
+    PlayCardActionType,
+)
 from app.domain.models import Game, PlayerInGame, PlayerInfo, Card
 
 client = TestClient(app)
@@ -107,6 +116,76 @@ def test_list_games_endpoint_success(game_manager_mocker: AsyncMock):
     game_manager_mocker.list_games.assert_called_once()
 
 
+def test_list_games_endpoint_passes_filters_and_cursor(
+    game_manager_mocker: AsyncMock,
+):
+    # Arrange
+    game_manager_mocker.list_games.return_value = ListGamesResponse(
+        games=[], next_cursor=None
+    )
+    # Act
+    response = client.get(
+        "/api/games",
+        params={
+            "status": "IN_PROGRESS",
+            "name_prefix": "Sal",
+            "has_free_seats": "true",
+            "cursor": 40,
+            "limit": 20,
+        },
+    )
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is None
+    game_manager_mocker.list_games.assert_called_once_with(
+        LobbyFilter(
+            status=GameStatus.IN_PROGRESS,
+            name_prefix="Sal",
+            has_free_seats=True,
+        ),
+        40,
+        20,
+    )
+
+
+def test_list_games_endpoint_is_unpaginated_by_default(
+    game_manager_mocker: AsyncMock,
+):
+    # Arrange
+    game_manager_mocker.list_games.return_value = ListGamesResponse(games=[])
+    # Act
+    response = client.get("/api/games")
+    # Assert
+    assert response.status_code == 200
+    game_manager_mocker.list_games.assert_called_once_with(
+        LobbyFilter(status=GameStatus.LOBBY), None, None
+    )
+
+
+def test_list_games_endpoint_any_status_clears_the_filter(
+    game_manager_mocker: AsyncMock,
+):
+    # Arrange
+    game_manager_mocker.list_games.return_value = ListGamesResponse(games=[])
+    # Act
+    response = client.get("/api/games", params={"status": "ANY"})
+    # Assert
+    assert response.status_code == 200
+    game_manager_mocker.list_games.assert_called_once_with(
+        LobbyFilter(status=None), None, None
+    )
+
+
+def test_list_games_endpoint_rejects_oversized_page(
+    game_manager_mocker: AsyncMock,
+):
+    # Act
+    response = client.get("/api/games", params={"limit": 1000})
+    # Assert
+    assert response.status_code == 422
+    game_manager_mocker.list_games.assert_not_called()
+
+
 # =================================================================
 # --- TESTS PARA POST /api/games/{game_id}/join (Unirse a Partida) ---
 # =================================================================
@@ -230,6 +309,54 @@ def test_get_player_hand_success(game_manager_mocker: AsyncMock):
     game_manager_mocker.get_player_hand.assert_called_once()
 
 
+# =================================================================
+# --- TESTS PARA GET /api/games/{game_id}/players/{player_id}/legal-moves ---
+# =================================================================
+
+
+def test_get_legal_moves_success(game_manager_mocker: AsyncMock):
+    # Arrange
+    game_manager_mocker.get_legal_moves.return_value = LegalMovesResponse(
+        moves=[
+            LegalMove(
+                action="play",
+                action_type=PlayCardActionType.ADD_TO_EXISTING_SET,
+                card_ids=[4],
+                target_set_id=2,
+                effect="RevealChosenSecretEffect",
+            )
+        ]
+    )
+    # Act
+    response = client.get("/api/games/101/players/1/legal-moves")
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["moves"] == [
+        {
+            "action": "play",
+            "action_type": "ADD_TO_EXISTING_SET",
+            "card_ids": [4],
+            "target_set_id": 2,
+            "effect": "RevealChosenSecretEffect",
+        }
+    ]
+    request = game_manager_mocker.get_legal_moves.call_args.args[0]
+    assert (request.game_id, request.player_id) == (101, 1)
+
+
+def test_get_legal_moves_game_not_found_returns_404(
+    game_manager_mocker: AsyncMock,
+):
+    # Arrange
+    game_manager_mocker.get_legal_moves.side_effect = GameNotFound(
+        "La partida no existe."
+    )
+    # Act
+    response = client.get("/api/games/999/players/1/legal-moves")
+    # Assert
+    assert response.status_code == 404
+
+
 # =================================================================
 # --- TESTS PARA POST /api/games/{game_id}/actions/discard ---
 # =================================================================
@@ -0,0 +1,72 @@
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database.orm_models import Base
+from app.database.async_session import (
+    ASYNC_DRIVER,
+    SYNC_DRIVER,
+    GreenletBridgeMiddleware,
+    make_async_sessionmaker,
+)
+from app.dependencies.dependencies import get_db_session
+
+# =================================================================
+# ⏱️ FIXTURES DE BENCHMARKS (BD en archivo temporal + cliente ASGI)
+# =================================================================
+
+
+@pytest_asyncio.fixture
+async def bench_engines(tmp_path):
+    """Engines sync (pysqlite) y async (aiosqlite) sobre el mismo archivo."""
+    db_file = tmp_path / "bench.db"
+    sync_engine = create_engine(
+        f"sqlite:///{db_file}", connect_args={"check_same_thread": False}
+    )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_file}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=sync_engine)
+    yield sync_engine, async_engine
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
+@pytest.fixture
+def bench_client(bench_engines):
+    """
+    Devuelve una fábrica `make_client(driver)` que apunta la app real a la
+    BD temporal usando el driver pedido ("sqlite" o "aiosqlite").
+    """
+    sync_engine, async_engine = bench_engines
+    SyncSession = sessionmaker(autoflush=False, bind=sync_engine)
+    AsyncSession = make_async_sessionmaker(async_engine, sync_engine)
+
+    async def sync_session():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def async_session():
+        async with AsyncSession() as async_db:
+            yield async_db.sync_session
+
+    overrides = {SYNC_DRIVER: sync_session, ASYNC_DRIVER: async_session}
+
+    def make_client(driver: str) -> AsyncClient:
+        app.dependency_overrides[get_db_session] = overrides[driver]
+        # La app solo trae el puente de greenlets si arrancó con aiosqlite
+        asgi_app = GreenletBridgeMiddleware(app) if driver == ASYNC_DRIVER else app
+        return AsyncClient(
+            transport=ASGITransport(app=asgi_app), base_url="http://bench"
+        )
+
+    yield make_client
+    app.dependency_overrides.pop(get_db_session, None)
@@ -0,0 +1,44 @@
+import asyncio
+import os
+
+import pytest
+
+from app.database.async_session import ASYNC_DRIVER, SYNC_DRIVER
+from tests.benchmarks.utils import create_started_game, report, timed_post
+
+pytestmark = pytest.mark.asyncio
+
+# Partidas concurrentes. La suite corre una versión reducida; el escenario
+# completo de 200 partidas se corre con DOTC_BENCH_GAMES=200.
+CONCURRENT_GAMES = int(os.getenv("DOTC_BENCH_GAMES", "20"))
+
+
+@pytest.mark.parametrize("driver", [SYNC_DRIVER, ASYNC_DRIVER])
+async def test_draw_p99_with_concurrent_games(bench_client, driver):
+    # Arrange
+    async with bench_client(driver) as client:
+        games = await asyncio.gather(
+            *(
+                create_started_game(client, f"{driver}-{i}")
+                for i in range(CONCURRENT_GAMES)
+            )
+        )
+
+        # Act: todos los jugadores de turno roban del mazo a la vez
+        results = await asyncio.gather(
+            *(
+                timed_post(
+                    client,
+                    f"/api/games/{g['game_id']}/actions/draw",
+                    {**g, "source": "deck"},
+                )
+                for g in games
+            )
+        )
+
+    # Assert
+    assert all(response.status_code == 200 for response, _ in results)
+    report(
+        f"POST /actions/draw x{CONCURRENT_GAMES} ({driver})",
+        [latency for _, latency in results],
+    )
@@ -0,0 +1,96 @@
+import time
+from collections import Counter
+from itertools import combinations_with_replacement
+
+from app.domain.enums import CardLocation, CardType
+from app.domain.models import Card
+from app.game.effects.registry import (
+    EFFECT_REGISTRY,
+    EVENT_EFFECTS,
+    SET_RULES,
+    EffectRegistry,
+)
+from app.game.helpers.commutative_dict import PrioritizedCommutativeDict
+
+# Todos los tipos que forman sets, más dos que nunca forman uno
+COMBO_CARD_TYPES = [
+    CardType.HARLEY_QUIN,
+    CardType.ARIADNE_OLIVER,
+    CardType.MISS_MARPLE,
+    CardType.PARKER_PYNE,
+    CardType.TOMMY_BERESFORD,
+    CardType.LADY_EILEEN,
+    CardType.TUPPENCE_BERESFORD,
+    CardType.HERCULE_POIROT,
+    CardType.MR_SATTERTHWAITE,
+    CardType.NOT_SO_FAST,
+    CardType.EARLY_TRAIN,
+]
+REPETITIONS = 50
+
+
+def _all_plays():
+    """Cada carta sola (de cualquier tipo) y cada combinación de 2 a 6."""
+    plays = [(card_type,) for card_type in CardType]
+    for size in range(2, 7):
+        plays.extend(combinations_with_replacement(COMBO_CARD_TYPES, size))
+    return [
+        [
+            Card.model_construct(
+                card_id=i, game_id=1, card_type=t, location=CardLocation.IN_HAND
+            )
+            for i, t in enumerate(play)
+        ]
+        for play in plays
+    ]
+
+
+def _legacy_rules() -> PrioritizedCommutativeDict:
+    """Lo que hacía cada EffectExecutor al construirse (uno por request)."""
+    rules = PrioritizedCommutativeDict()
+    for priority, combo, effect in SET_RULES:
+        rules.set(combo, effect, priority=priority)
+    return rules
+
+
+def _legacy_classify(rules, played):
+    if len(played) == 1:
+        return EVENT_EFFECTS.get(played[0].card_type)
+    return rules.get_matching_effect(Counter(c.card_type for c in played))
+
+
+def test_classify_effect_table_vs_rule_scan():
+    # Arrange
+    plays = _all_plays()
+    legacy = _legacy_rules()
+
+    # Act
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        _legacy_rules()
+    legacy_build_us = (time.perf_counter() - start) * 1e6 / REPETITIONS
+
+    start = time.perf_counter()
+    EffectRegistry(EVENT_EFFECTS, SET_RULES)
+    registry_build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    expected = [_legacy_classify(legacy, played) for played in plays]
+    legacy_us = (time.perf_counter() - start) * 1e6 / len(plays)
+
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        got = [EFFECT_REGISTRY.classify(played) for played in plays]
+    table_us = (time.perf_counter() - start) * 1e6 / (len(plays) * REPETITIONS)
+
+    # Assert
+    legal = sum(effect is not None for effect in expected)
+    print(
+        f"\n[bench] classify_effect over {len(plays)} plays ({legal} legal): "
+        f"rule scan {legacy_us:.2f}us/play, table {table_us:.2f}us/play | "
+        f"rules per request {legacy_build_us:.1f}us, "
+        f"registry once {registry_build_ms:.1f}ms "
+        f"({len(EFFECT_REGISTRY.set_table)} signatures)"
+    )
+    assert got == expected
+    assert table_us < legacy_us
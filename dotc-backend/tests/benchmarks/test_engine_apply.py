@@ -0,0 +1,67 @@
+import time
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.api.schemas import DrawSource
+from app.database.async_session import SYNC_DRIVER
+from app.database.commands import DatabaseCommandManager
+from app.database.queries import DatabaseQueryManager
+from app.game.engine.actions import DiscardCard, DrawCard, FinishTurn
+from app.game.engine.reducer import apply
+from app.game.engine.store import GameStateStore
+from tests.benchmarks.utils import StatementCounter, create_started_game, timed_post
+
+pytestmark = pytest.mark.asyncio
+
+REPETITIONS = 200
+
+
+def _turn(state):
+    """Un turno completo en memoria: robar, descartar y pasar."""
+    player_id = state.current_turn_player_id
+    state, _ = apply(state, DrawCard(player_id=player_id, source=DrawSource.DECK))
+    state, _ = apply(
+        state, DiscardCard(player_id=player_id, card_id=state.hands[player_id][0])
+    )
+    state, _ = apply(state, DrawCard(player_id=player_id, source=DrawSource.DECK))
+    state, _ = apply(state, FinishTurn(player_id=player_id))
+    return state
+
+
+async def test_rules_in_memory_vs_through_the_db(bench_client, bench_engines):
+    # Arrange: partida de 6 jugadores, el de turno con 5 cartas
+    sync_engine, _ = bench_engines
+    async with bench_client(SYNC_DRIVER) as client:
+        game = await create_started_game(client, "engine", players=6)
+        session = sessionmaker(bind=sync_engine)()
+        queries = DatabaseQueryManager(session)
+        store = GameStateStore(queries, DatabaseCommandManager(queries))
+
+        # Act
+        start = time.perf_counter()
+        for _ in range(REPETITIONS):
+            state = store.load(game["game_id"])
+        load_ms = (time.perf_counter() - start) * 1000 / REPETITIONS
+        session.close()
+
+        start = time.perf_counter()
+        for _ in range(REPETITIONS):
+            _turn(state)
+        apply_us = (time.perf_counter() - start) * 1e6 / (REPETITIONS * 4)
+
+        with StatementCounter(sync_engine) as counter:
+            response, http_ms = await timed_post(
+                client,
+                f"/api/games/{game['game_id']}/actions/draw",
+                {**game, "source": "deck"},
+            )
+
+    # Assert
+    print(
+        f"\n[bench] engine apply: {apply_us:.1f}us/action | "
+        f"GameStateStore.load: {load_ms:.2f}ms | "
+        f"POST /actions/draw: {http_ms:.1f}ms, {counter.count} statements"
+    )
+    assert response.status_code == 200, response.text
+    assert apply_us < load_ms * 1000
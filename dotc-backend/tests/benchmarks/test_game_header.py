@@ -0,0 +1,95 @@
+import time
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.database.async_session import SYNC_DRIVER
+from app.database.queries import DatabaseQueryManager
+from app.domain.models import GameHeader
+from app.game.helpers.validators import GameValidator
+from tests.benchmarks.utils import StatementCounter, create_started_game
+
+pytestmark = pytest.mark.asyncio
+
+REPETITIONS = 50
+
+
+def _header_from_full_game(self, game_id: int):
+    """Comportamiento anterior: la cabecera se sacaba de get_game."""
+    game = self.get_game(game_id)
+    if game is None:
+        return None
+    return GameHeader(
+        id=game.id,
+        name=game.name,
+        min_players=game.min_players,
+        max_players=game.max_players,
+        host_id=game.host.player_id,
+        status=game.status,
+        player_count=len(game.players),
+        current_turn_player_id=game.current_turn_player_id,
+        action_state=game.action_state,
+    )
+
+
+async def test_validator_full_game_vs_header(bench_client, bench_engines):
+    # Arrange: partida de 6 jugadores ya repartida
+    sync_engine, _ = bench_engines
+    async with bench_client(SYNC_DRIVER) as client:
+        game = await create_started_game(client, "header", players=6)
+    session = sessionmaker(bind=sync_engine)()
+    validator = GameValidator(DatabaseQueryManager(session))
+    variants = {
+        "validate_game_exists": validator.validate_game_exists,
+        "validate_game_header_exists": validator.validate_game_header_exists,
+    }
+
+    # Act
+    results = {}
+    for name, validate in variants.items():
+        with StatementCounter(sync_engine) as counter:
+            start = time.perf_counter()
+            for _ in range(REPETITIONS):
+                validate(game["game_id"])
+            elapsed = (time.perf_counter() - start) * 1000 / REPETITIONS
+        results[name] = (counter.count / REPETITIONS, elapsed)
+    session.close()
+
+    # Assert
+    for name, (queries, latency) in results.items():
+        print(f"\n[bench] {name}: {queries:.0f} queries, {latency:.2f}ms")
+    assert results["validate_game_header_exists"][0] == 1
+    assert (
+        results["validate_game_header_exists"][0]
+        < results["validate_game_exists"][0]
+    )
+
+
+@pytest.mark.parametrize("mode", ["full-game", "header"])
+async def test_finish_turn_query_count(
+    bench_client, bench_engines, monkeypatch, mode
+):
+    # Arrange
+    if mode == "full-game":
+        monkeypatch.setattr(
+            DatabaseQueryManager, "get_game_header", _header_from_full_game
+        )
+    sync_engine, _ = bench_engines
+    async with bench_client(SYNC_DRIVER) as client:
+        game = await create_started_game(client, mode, players=6)
+        url = f"/api/games/{game['game_id']}/actions"
+        body = {"player_id": game["player_id"], "game_id": game["game_id"]}
+        await client.post(f"{url}/draw", json={**body, "source": "deck"})
+
+        # Act
+        with StatementCounter(sync_engine) as counter:
+            start = time.perf_counter()
+            response = await client.post(f"{url}/finish-turn", json=body)
+            latency = (time.perf_counter() - start) * 1000
+
+    # Assert
+    assert response.status_code == 200, response.text
+    print(
+        f"\n[bench] POST /actions/finish-turn ({mode}): "
+        f"{counter.count} queries, {latency:.1f}ms"
+    )
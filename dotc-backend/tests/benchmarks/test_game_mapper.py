@@ -0,0 +1,157 @@
+import time
+from datetime import date
+
+from app.database import mappers
+from app.database.orm_models import (
+    CardTable,
+    GameTable,
+    PlayerInGameTable,
+    PlayerTable,
+)
+from app.domain.enums import (
+    Avatar,
+    CardLocation,
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayerRole,
+)
+from app.domain.models import Card, Game, PlayerInGame
+
+PLAYERS = 6
+CARDS_IN_GAME = 61
+REPETITIONS = 300
+
+
+def _build_six_player_game() -> GameTable:
+    """GameTable en memoria (sin BD) con 6 jugadores y el mazo repartido."""
+    players = [
+        PlayerTable(
+            player_id=i,
+            player_name=f"P{i}",
+            player_avatar=Avatar.DEFAULT,
+            player_birth_date=date(2000, 1, i),
+        )
+        for i in range(1, PLAYERS + 1)
+    ]
+    details = [
+        PlayerInGameTable(
+            game_id=1,
+            player_id=p.player_id,
+            player=p,
+            player_role=PlayerRole.INNOCENT,
+            social_disgrace=False,
+        )
+        for p in players
+    ]
+    card_types = list(CardType)
+    cards = []
+    for card_id in range(1, CARDS_IN_GAME + 1):
+        if card_id <= PLAYERS * 6:
+            location, owner = CardLocation.IN_HAND, (card_id - 1) % PLAYERS + 1
+        elif card_id <= PLAYERS * 6 + 3:
+            location, owner = CardLocation.DRAFT, None
+        elif card_id <= PLAYERS * 6 + 8:
+            location, owner = CardLocation.DISCARD_PILE, None
+        else:
+            location, owner = CardLocation.DRAW_PILE, None
+        cards.append(
+            CardTable(
+                card_id=card_id,
+                game_id=1,
+                card_type=card_types[card_id % len(card_types)],
+                location=location,
+                player_id=owner,
+            )
+        )
+    return GameTable(
+        game_id=1,
+        game_name="bench",
+        min_players=2,
+        max_players=6,
+        host_id=1,
+        host=players[0],
+        game_status=GameStatus.IN_PROGRESS,
+        current_player=1,
+        action_state=GameActionState.NONE,
+        player_details=details,
+        cards=cards,
+    )
+
+
+def _legacy_map_game(db_game: GameTable) -> Game:
+    """Mapper anterior: una pasada por jugador + 3 más, validando cada carta."""
+
+    def card(c):
+        return Card.model_validate(c, from_attributes=True)
+
+    players = []
+    for detail in db_game.player_details:
+        hand = [
+            card(c)
+            for c in db_game.cards
+            if c.player_id == detail.player_id
+            and c.location == CardLocation.IN_HAND
+        ]
+        players.append(
+            PlayerInGame(
+                player_id=detail.player.player_id,
+                player_name=detail.player.player_name,
+                player_birth_date=detail.player.player_birth_date,
+                player_avatar=detail.player.player_avatar,
+                game_id=detail.game_id,
+                player_role=detail.player_role,
+                hand=hand,
+                social_disgrace=detail.social_disgrace,
+            )
+        )
+    by_location = {
+        loc: [card(c) for c in db_game.cards if c.location == loc]
+        for loc in (
+            CardLocation.DRAW_PILE,
+            CardLocation.DISCARD_PILE,
+            CardLocation.DRAFT,
+        )
+    }
+    return Game(
+        id=db_game.game_id,
+        name=db_game.game_name,
+        min_players=db_game.min_players,
+        max_players=db_game.max_players,
+        host=mappers.map_player_orm_to_info_dto(db_game.host),
+        status=db_game.game_status,
+        players=players,
+        deck=by_location[CardLocation.DRAW_PILE],
+        discard_pile=by_location[CardLocation.DISCARD_PILE],
+        draft=by_location[CardLocation.DRAFT],
+        current_turn_player_id=db_game.current_player,
+        action_state=db_game.action_state,
+    )
+
+
+def _time_per_call_us(fn, db_game) -> float:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        fn(db_game)
+    return (time.perf_counter() - start) * 1e6 / REPETITIONS
+
+
+def test_map_six_player_game_single_pass():
+    # Arrange
+    db_game = _build_six_player_game()
+
+    # Act
+    legacy_us = _time_per_call_us(_legacy_map_game, db_game)
+    single_pass_us = _time_per_call_us(mappers.map_game_orm_to_domain, db_game)
+    game = mappers.map_game_orm_to_domain(db_game)
+
+    # Assert: mismo resultado que el mapper anterior
+    assert game.model_dump() == _legacy_map_game(db_game).model_dump()
+    assert len(game.players) == PLAYERS
+    assert all(len(p.hand) == 6 for p in game.players)
+    print(
+        f"\n[bench] map_game_orm_to_domain ({PLAYERS} jugadores, "
+        f"{CARDS_IN_GAME} cartas): legacy={legacy_us:.0f}us "
+        f"single-pass={single_pass_us:.0f}us "
+        f"({legacy_us / single_pass_us:.1f}x)"
+    )
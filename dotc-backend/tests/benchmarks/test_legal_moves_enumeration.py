@@ -0,0 +1,95 @@
+import random
+import time
+from itertools import combinations
+
+from app.domain.enums import CardLocation, CardType, GameActionState, GameStatus
+from app.domain.models import Card, GameHeader
+from app.game.effects.registry import EFFECT_REGISTRY
+from app.game.helpers.legal_moves import LegalMoveFinder
+
+HANDS = 2000
+HAND_SIZE = 6
+PLAYER_ID = 1
+
+
+def _random_hands():
+    """Manos de 6 cartas sacadas de un mazo con todos los tipos."""
+    rng = random.Random(0)
+    deck = [t for t in CardType for _ in range(3)]
+    return [
+        [
+            Card.model_construct(
+                card_id=i,
+                game_id=1,
+                card_type=t,
+                location=CardLocation.IN_HAND,
+                player_id=PLAYER_ID,
+            )
+            for i, t in enumerate(rng.sample(deck, HAND_SIZE))
+        ]
+        for _ in range(HANDS)
+    ]
+
+
+def _probe_every_subset(hand):
+    """Lo que hacía el cliente: probar cada subconjunto contra classify."""
+    legal = 0
+    for size in range(1, len(hand) + 1):
+        for subset in combinations(hand, size):
+            if EFFECT_REGISTRY.classify(list(subset)) is not None:
+                legal += 1
+    return legal
+
+
+def test_legal_moves_enumeration_vs_probing_subsets():
+    # Arrange
+    hands = _random_hands()
+    # Una partida por mano, así cada una ocupa su entrada de la caché
+    headers = [
+        GameHeader(
+            id=game_id,
+            name="bench",
+            min_players=2,
+            max_players=6,
+            host_id=PLAYER_ID,
+            status=GameStatus.IN_PROGRESS,
+            current_turn_player_id=PLAYER_ID,
+            action_state=GameActionState.NONE,
+        )
+        for game_id in range(len(hands))
+    ]
+    finder = LegalMoveFinder(cache_size=len(hands))
+    probes = (2**HAND_SIZE - 1) * len(hands)
+
+    # Act
+    start = time.perf_counter()
+    for hand in hands:
+        _probe_every_subset(hand)
+    probe_us = (time.perf_counter() - start) * 1e6 / len(hands)
+
+    start = time.perf_counter()
+    moves = [
+        finder.enumerate_moves(header, PLAYER_ID, hand, {}, False)
+        for header, hand in zip(headers, hands)
+    ]
+    enumerate_us = (time.perf_counter() - start) * 1e6 / len(hands)
+
+    for header, hand in zip(headers, hands):
+        finder.find(header, PLAYER_ID, hand, {}, False)
+    start = time.perf_counter()
+    for header, hand in zip(headers, hands):
+        finder.find(header, PLAYER_ID, hand, {}, False)
+    cached_us = (time.perf_counter() - start) * 1e6 / len(hands)
+
+    # Assert
+    listed = sum(len(m) for m in moves)
+    print(
+        f"\n[bench] legal moves over {len(hands)} hands ({listed} moves, "
+        f"{probes} subsets a client would probe): "
+        f"probing every subset {probe_us:.1f}us/hand, "
+        f"multiset enumeration {enumerate_us:.1f}us/hand, "
+        f"cached {cached_us:.1f}us/hand"
+    )
+    assert finder.hits == len(hands)
+    assert enumerate_us < probe_us
+    assert cached_us < enumerate_us
@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+
+from app.api.schemas import GameLobbyInfo, GameStatus
+from app.websockets.connection_manager import ConnectionManager
+from app.websockets.lobby_publisher import LobbyPublisher
+from app.websockets.protocol.details import GameCreatedDetails, GameUpdatedDetails
+from app.websockets.protocol.messages import WSMessage
+from tests.benchmarks.test_ws_fanout import FakeSocket
+
+pytestmark = pytest.mark.asyncio
+
+LOBBY_SOCKETS = 200
+GAMES = 50
+JOINS_PER_GAME = 5  # create + 5 joins por partida = 300 cambios
+STORM_S = 0.5
+TICK_S = 0.1
+
+
+def _change(game_id: int, players: int) -> WSMessage:
+    game = GameLobbyInfo(
+        id=game_id,
+        name=f"storm-{game_id}",
+        min_players=2,
+        max_players=6,
+        player_count=players,
+        host_id=1,
+        game_status=GameStatus.LOBBY,
+        password=None,
+    )
+    if players == 1:
+        return WSMessage(details=GameCreatedDetails(game=game))
+    return WSMessage(details=GameUpdatedDetails(game=game))
+
+
+async def _storm(manager: ConnectionManager) -> dict:
+    sockets = [FakeSocket() for _ in range(LOBBY_SOCKETS)]
+    for socket in sockets:
+        await manager.connect(socket)
+
+    changes = [
+        _change(game_id, players)
+        for players in range(1, JOINS_PER_GAME + 2)
+        for game_id in range(GAMES)
+    ]
+    pause = STORM_S / len(changes)
+    start = time.perf_counter()
+    for message in changes:
+        await manager.broadcast_to_lobby(message)
+        await asyncio.sleep(pause)
+    await asyncio.sleep(TICK_S * 1.5)
+    await manager.drain()
+    elapsed = time.perf_counter() - start
+    await manager.shutdown()
+    return {
+        "changes": len(changes),
+        "frames": sum(len(s.received) for s in sockets),
+        "elapsed": elapsed,
+    }
+
+
+async def test_lobby_storm_frames_immediate_vs_coalesced():
+    # Act
+    immediate = await _storm(ConnectionManager())
+    coalesced = await _storm(
+        ConnectionManager(lobby_publisher=LobbyPublisher(tick_s=TICK_S))
+    )
+
+    # Assert
+    for name, r in (("immediate", immediate), ("coalesced", coalesced)):
+        print(
+            f"\n[bench] lobby storm {name}: {r['changes']} changes -> "
+            f"{r['frames'] / LOBBY_SOCKETS:.0f} frames/socket "
+            f"({r['frames'] / LOBBY_SOCKETS / r['elapsed']:.1f} frames/s)"
+        )
+    assert immediate["frames"] == immediate["changes"] * LOBBY_SOCKETS
+    # Un frame por tick como mucho (más el del último tick parcial).
+    max_ticks = int(coalesced["elapsed"] / TICK_S) + 1
+    assert coalesced["frames"] <= max_ticks * LOBBY_SOCKETS
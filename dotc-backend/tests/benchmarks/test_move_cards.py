@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.database.async_session import SYNC_DRIVER
+from app.database.commands import DatabaseCommandManager
+from app.database.queries import DatabaseQueryManager
+from app.domain.enums import CardLocation, ResponseStatus
+from app.domain.models import CardMove
+from tests.benchmarks.utils import StatementCounter, create_started_game
+
+pytestmark = pytest.mark.asyncio
+
+
+def _rotate_left_per_card(commands, game_id, moves):
+    """Comportamiento anterior: un update_card_location por carta."""
+    for move in moves:
+        status = commands.update_card_location(
+            card_id=move.card_id,
+            game_id=game_id,
+            new_location=move.location,
+            owner_id=move.owner_id,
+        )
+        assert status == ResponseStatus.OK
+
+
+def _rotate_left_batch(commands, game_id, moves):
+    assert commands.move_cards(game_id, moves) == ResponseStatus.OK
+
+
+@pytest.mark.parametrize(
+    "variant", [_rotate_left_per_card, _rotate_left_batch], ids=["per-card", "batch"]
+)
+async def test_dead_card_folly_six_players(bench_client, bench_engines, variant):
+    # Arrange: partida de 6 jugadores; cada uno pasa una carta a la izquierda
+    sync_engine, _ = bench_engines
+    async with bench_client(SYNC_DRIVER) as client:
+        game = await create_started_game(client, variant.__name__, players=6)
+    game_id, players = game["game_id"], game["players"]
+    session = sessionmaker(bind=sync_engine)()
+    queries = DatabaseQueryManager(session)
+    commands = DatabaseCommandManager(queries)
+    moves = [
+        CardMove(
+            card_id=queries.get_player_hand(game_id, player_id)[0].card_id,
+            location=CardLocation.IN_HAND,
+            owner_id=players[(i - 1) % len(players)],
+        )
+        for i, player_id in enumerate(players)
+    ]
+
+    # Act
+    with StatementCounter(sync_engine) as counter:
+        start = time.perf_counter()
+        variant(commands, game_id, moves)
+        latency = (time.perf_counter() - start) * 1000
+
+    # Assert
+    for move in moves:
+        card = queries.get_card(move.card_id, game_id)
+        assert card is not None and card.player_id == move.owner_id
+    session.close()
+    print(
+        f"\n[bench] dead card folly x{len(players)} ({variant.__name__}): "
+        f"{counter.count} statements, {counter.commits} commits, "
+        f"{latency:.1f}ms"
+    )
+    if variant is _rotate_left_batch:
+        assert counter.count == 1
+        assert counter.commits == 1
@@ -0,0 +1,162 @@
+import random
+from typing import Dict, List, Tuple
+
+import pytest
+from sqlalchemy import update
+
+from app.database.async_session import SYNC_DRIVER
+from app.database.orm_models import CardTable
+from app.database.query_cache import QUERY_CACHE_ENV
+from app.domain.enums import CardType, PlayerRole
+from tests.benchmarks.utils import StatementCounter, create_started_game
+
+pytestmark = pytest.mark.asyncio
+
+PLAYERS = 3
+
+
+async def _count(counter: StatementCounter, call) -> Tuple[int, int]:
+    """(sentencias SQL, status) de un request."""
+    before = counter.count
+    response = await call
+    return counter.count - before, response.status_code
+
+
+async def _play_a_set_turn(make_client, engine, mode: str, monkeypatch):
+    """
+    Un turno con un set que pasa por toda la cadena: el jugador de turno
+    juega dos Lady Eileen, los demás pasan el NSF, la víctima revela y el
+    jugador roba hasta 6 y termina. Devuelve {endpoint: [(sentencias, status)]}.
+    """
+    monkeypatch.setenv(QUERY_CACHE_ENV, mode)
+    random.seed(0)  # el mismo reparto con y sin caché
+    counts: Dict[str, List[Tuple[int, int]]] = {}
+    async with make_client(SYNC_DRIVER) as http:
+        game = await create_started_game(http, f"cache-{mode}", PLAYERS)
+        game_id, turn = game["game_id"], game["player_id"]
+        victim = next(p for p in game["players"] if p != turn)
+        base = f"/api/games/{game_id}"
+        hand = (await http.get(f"{base}/players/{turn}/hand")).json()["cards"]
+        set_ids = [c["card_id"] for c in hand[:2]]
+        with engine.begin() as conn:
+            conn.execute(
+                update(CardTable)
+                .where(CardTable.card_id.in_(set_ids))
+                .values(card_type=CardType.LADY_EILEEN)
+            )
+
+        with StatementCounter(engine) as counter:
+
+            async def record(endpoint: str, call):
+                counts.setdefault(endpoint, []).append(
+                    await _count(counter, call)
+                )
+
+            await record("GET game", http.get(base))
+            await record("GET hand", http.get(f"{base}/players/{turn}/hand"))
+            await record(
+                "GET legal-moves",
+                http.get(f"{base}/players/{turn}/legal-moves"),
+            )
+            await record(
+                "POST play",
+                http.post(
+                    f"{base}/actions/play",
+                    json={
+                        "game_id": game_id,
+                        "player_id": turn,
+                        "action_type": "FORM_NEW_SET",
+                        "card_ids": set_ids,
+                        "target_player_id": victim,
+                    },
+                ),
+            )
+            for pid in game["players"]:
+                if pid == turn:
+                    continue
+                await record(
+                    "POST play-nsf",
+                    http.post(
+                        f"{base}/actions/play-nsf",
+                        json={
+                            "game_id": game_id,
+                            "player_id": pid,
+                            "action_type": "INSTANT",
+                            "card_ids": [],
+                        },
+                    ),
+                )
+            secrets = (
+                await http.get(f"{base}/players/{victim}/secrets")
+            ).json()["secrets"]
+            # Un secreto inocente, para que la partida no termine
+            hidden = next(
+                s
+                for s in secrets
+                if not s["is_revealed"] and s["role"] == PlayerRole.INNOCENT.value
+            )
+            await record(
+                "POST reveal-secret",
+                http.post(
+                    f"{base}/actions/reveal-secret",
+                    json={
+                        "game_id": game_id,
+                        "player_id": victim,
+                        "secret_id": hidden["secret_id"],
+                    },
+                ),
+            )
+            for _ in range(len(hand) - len(set_ids), 6):
+                await record(
+                    "POST draw",
+                    http.post(
+                        f"{base}/actions/draw",
+                        json={
+                            "game_id": game_id,
+                            "player_id": turn,
+                            "source": "deck",
+                        },
+                    ),
+                )
+            await record(
+                "POST finish-turn",
+                http.post(
+                    f"{base}/actions/finish-turn",
+                    json={"game_id": game_id, "player_id": turn},
+                ),
+            )
+    return counts
+
+
+async def test_sql_statements_per_endpoint_with_and_without_query_cache(
+    bench_client, bench_engines, monkeypatch
+):
+    # Arrange
+    engine, _ = bench_engines
+
+    # Act
+    results = {
+        mode: await _play_a_set_turn(bench_client, engine, mode, monkeypatch)
+        for mode in ("off", "on")
+    }
+
+    # Assert
+    total = {"off": 0, "on": 0}
+    for endpoint, off_calls in results["off"].items():
+        on_calls = results["on"][endpoint]
+        off = sum(n for n, _ in off_calls) / len(off_calls)
+        on = sum(n for n, _ in on_calls) / len(on_calls)
+        total["off"] += sum(n for n, _ in off_calls)
+        total["on"] += sum(n for n, _ in on_calls)
+        print(
+            f"\n[bench] query cache {endpoint}: "
+            f"{off:.0f} -> {on:.0f} SQL statements/request"
+        )
+        assert [s for _, s in on_calls] == [s for _, s in off_calls]
+        assert all(status == 200 for _, status in on_calls)
+        assert on <= off
+    print(
+        f"\n[bench] query cache full set turn: "
+        f"{total['off']} -> {total['on']} SQL statements"
+    )
+    assert total["on"] < total["off"]
@@ -0,0 +1,26 @@
+from app.simulation.runner import SimulationConfig, run_simulation
+
+# Fracción mínima de partidas que tienen que llegar al final: el throughput
+# de partidas trabadas o cortadas no mide el juego real.
+MIN_FINISHED_FRACTION = 0.75
+
+
+def test_self_play_throughput():
+    # Arrange: 4 partidas de 4 bots repartidas en 2 procesos
+    config = SimulationConfig(games=4, workers=2, players=4)
+
+    # Act
+    report = run_simulation(config)
+
+    # Assert
+    print(
+        f"\n[bench] self-play ({config.workers} procesos): "
+        f"{report.games_per_second:.2f} partidas/s, "
+        f"{report.actions_per_second:.0f} acciones/s, "
+        f"{len(report.rule_errors)} errores de reglas distintos"
+    )
+    print(report.render())
+    assert report.games == config.games
+    assert report.accepted > 0
+    assert not report.rule_errors, report.render()
+    assert report.finished >= MIN_FINISHED_FRACTION * report.games, report.render()
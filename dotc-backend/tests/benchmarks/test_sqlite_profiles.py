@@ -0,0 +1,118 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.commands import DatabaseCommandManager
+from app.database.engine_settings import PROFILES, install_sqlite_pragmas
+from app.database.orm_models import Base
+from app.database.queries import DatabaseQueryManager
+from app.domain.enums import Avatar, CardLocation, CardType, ResponseStatus
+from app.domain.models import Card
+from tests.benchmarks.utils import report
+
+WRITERS = 32
+ACTIONS_PER_WRITER = 8
+DECK_SIZE = ACTIONS_PER_WRITER + 2
+
+
+@pytest.fixture
+def profile_engine(tmp_path, request):
+    """Engine pysqlite sobre un archivo temporal con el perfil pedido."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'profile.db'}",
+        connect_args={"check_same_thread": False},
+        pool_size=WRITERS,
+    )
+    install_sqlite_pragmas(engine, PROFILES[request.param])
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _seed_games(Session) -> list:
+    """Una partida por escritor, con su host y un mazo de DECK_SIZE cartas."""
+    session = Session()
+    commands = DatabaseCommandManager(DatabaseQueryManager(session))
+    games = []
+    for i in range(WRITERS):
+        player_id = commands.create_player(f"W{i}", date(2000, 1, 1), Avatar.DEFAULT)
+        game_id = commands.create_game(f"profile-{i}", 2, 6, player_id)
+        deck = [
+            Card(
+                card_id=0,
+                game_id=game_id,
+                card_type=CardType.NOT_SO_FAST,
+                location=CardLocation.DRAW_PILE,
+                position=position,
+            )
+            for position in range(DECK_SIZE)
+        ]
+        assert commands.create_deck_for_game(game_id, deck) == ResponseStatus.OK
+        games.append((game_id, player_id))
+    session.close()
+    return games
+
+
+def _play_turns(Session, game_id: int, player_id: int) -> list:
+    """
+    Un escritor: ACTIONS_PER_WRITER acciones de juego, cada una en su
+    propia unidad de trabajo (leer header, robar del mazo, pasar turno).
+    """
+    latencies = []
+    session = Session()
+    queries = DatabaseQueryManager(session)
+    commands = DatabaseCommandManager(queries)
+    try:
+        for _ in range(ACTIONS_PER_WRITER):
+            start = time.perf_counter()
+            with commands.unit_of_work():
+                assert queries.get_game_header(game_id) is not None
+                top = queries.get_top_card(game_id)
+                assert top is not None
+                status = commands.update_card_location(
+                    top.card_id, game_id, CardLocation.IN_HAND, owner_id=player_id
+                )
+                assert status == ResponseStatus.OK
+                status = commands.set_current_turn(game_id, player_id)
+                assert status == ResponseStatus.OK
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        session.close()
+    return latencies
+
+
+@pytest.mark.parametrize(
+    "profile_engine", ["legacy", "durable", "tuned"], indirect=True
+)
+def test_concurrent_game_actions_per_profile(profile_engine, request):
+    # Arrange
+    Session = sessionmaker(autoflush=False, bind=profile_engine)
+    games = _seed_games(Session)
+    profile = request.node.callspec.params["profile_engine"]
+
+    # Act: 32 escritores concurrentes, cada uno sobre su partida
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WRITERS) as pool:
+        results = list(
+            pool.map(lambda game: _play_turns(Session, *game), games)
+        )
+    elapsed = time.perf_counter() - start
+
+    # Assert: todas las acciones se aplicaron (ningún "database is locked")
+    latencies = [ms for writer in results for ms in writer]
+    assert len(latencies) == WRITERS * ACTIONS_PER_WRITER
+    session = Session()
+    queries = DatabaseQueryManager(session)
+    for game_id, player_id in games:
+        hand = queries.get_player_hand(game_id, player_id)
+        assert len(hand) == ACTIONS_PER_WRITER
+    session.close()
+    report(f"sqlite profile {profile} x{WRITERS} writers", latencies)
+    print(
+        f"[bench] sqlite profile {profile}: "
+        f"{len(latencies) / elapsed:.0f} actions/s"
+    )
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database.async_session import SYNC_DRIVER
+from app.database.orm_models import SecretCardTable
+from app.domain.enums import PlayerRole, ResponseStatus
+from app.game.services.game_setup_service import (
+    SECRETS_PER_PLAYER,
+    GameSetupService,
+)
+from tests.benchmarks.utils import StatementCounter, create_lobby_game
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _legacy_set_secrets_in_game(self, players, game_id):
+    """Reparto anterior: un set_player_role y un create_secret_card por vez."""
+    ids = [p.player_id for p in players]
+    roles = {ids[0]: PlayerRole.MURDERER}
+    if len(players) > 4:
+        roles[ids[1]] = PlayerRole.ACCOMPLICE
+    for player_id in ids:
+        role = roles.get(player_id, PlayerRole.INNOCENT)
+        assert (
+            self.write.set_player_role(
+                player_id=player_id, game_id=game_id, role=role
+            )
+            == ResponseStatus.OK
+        )
+        secrets = [role] + [PlayerRole.INNOCENT] * (SECRETS_PER_PLAYER - 1)
+        for secret_role in secrets:
+            assert (
+                self.write.create_secret_card(
+                    player_id=player_id,
+                    game_id=game_id,
+                    role=secret_role,
+                    is_revealed=False,
+                )
+                is not None
+            )
+
+
+@pytest.mark.parametrize("mode", ["per-secret", "deal_secrets"])
+@pytest.mark.parametrize("players", [2, 4, 6])
+async def test_start_game_timing(
+    bench_client, bench_engines, monkeypatch, players, mode
+):
+    # Arrange
+    if mode == "per-secret":
+        monkeypatch.setattr(
+            GameSetupService,
+            "_set_secrets_in_game",
+            _legacy_set_secrets_in_game,
+        )
+    sync_engine, _ = bench_engines
+    async with bench_client(SYNC_DRIVER) as client:
+        lobby = await create_lobby_game(client, f"start-{mode}", players)
+        game_id, host_id = lobby["game_id"], lobby["host_id"]
+
+        # Act
+        with StatementCounter(sync_engine) as counter:
+            start = time.perf_counter()
+            response = await client.post(
+                f"/api/games/{game_id}/start",
+                json={"player_id": host_id, "game_id": game_id},
+            )
+            latency = (time.perf_counter() - start) * 1000
+
+    # Assert
+    assert response.status_code == 200, response.text
+    assert counter.commits == 1  # start_game es atómico
+    with sync_engine.connect() as conn:
+        dealt = conn.execute(
+            select(func.count())
+            .select_from(SecretCardTable)
+            .where(SecretCardTable.game_id == game_id)
+        ).scalar_one()
+    assert dealt == players * SECRETS_PER_PLAYER
+    print(
+        f"\n[bench] POST /start ({players} jugadores, {mode}): "
+        f"{counter.count} statements, {counter.commits} commits, "
+        f"{latency:.1f}ms"
+    )
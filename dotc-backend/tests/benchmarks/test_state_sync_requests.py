@@ -0,0 +1,201 @@
+import json
+import time
+from typing import Dict, List
+
+import pytest
+
+from app.database.async_session import SYNC_DRIVER
+from app.dependencies.dependencies import websocket_manager_singleton
+from app.domain.enums import CardLocation, CardType
+from app.game.helpers.state_deltas import DELTA_MODE, REFETCH_MODE, STATE_SYNC_ENV
+from app.websockets.protocol.events import WSEvent
+from tests.benchmarks.utils import create_started_game
+
+pytestmark = pytest.mark.asyncio
+
+PLAYERS = 4
+TURNS = 8
+
+
+class RecordingSocket:
+    """WebSocket falso que guarda los frames recibidos ya decodificados."""
+
+    def __init__(self):
+        self.frames: List[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000):
+        pass
+
+    async def send_text(self, frame: str):
+        self.frames.append(json.loads(frame))
+
+
+class Client:
+    """
+    Un jugador conectado por WS que reacciona como el frontend.
+
+    Modo refetch (lo que hace hoy dotc-frontend):
+    - después de su propio descarte o robo, GET de su mano (useTurnActions);
+    - con NEW_TURN, GET de mano y secretos del jugador que terminó
+      (refreshOpponent), salvo que sea él mismo;
+    - con HAND(S)_UPDATED o el cierre de una acción NSF, GET de su mano.
+
+    Modo delta: aplica los STATE_PATCH sobre su copia y no pide nada.
+    """
+
+    def __init__(self, http, game_id: int, player_id: int, mode: str):
+        self.http = http
+        self.game_id = game_id
+        self.player_id = player_id
+        self.mode = mode
+        self.socket = RecordingSocket()
+        self.seen = 0
+        self.requests = 0
+        self.hand: Dict[int, str] = {}
+
+    async def get(self, url: str):
+        self.requests += 1
+        return await self.http.get(url)
+
+    async def load_hand(self):
+        response = await self.http.get(
+            f"/api/games/{self.game_id}/players/{self.player_id}/hand"
+        )
+        self.hand = {c["card_id"]: c["card_type"] for c in response.json()["cards"]}
+
+    async def after_own_action(self):
+        if self.mode == REFETCH_MODE:
+            await self.get(
+                f"/api/games/{self.game_id}/players/{self.player_id}/hand"
+            )
+
+    async def react(self, previous_turn: int):
+        await websocket_manager_singleton.drain()
+        frames, self.seen = self.socket.frames[self.seen :], len(self.socket.frames)
+        for frame in frames:
+            event = frame["details"]["event"]
+            if self.mode == DELTA_MODE:
+                if event == WSEvent.STATE_PATCH.value:
+                    self.apply(frame["details"]["patches"])
+                continue
+            if event == WSEvent.NEW_TURN.value and previous_turn != self.player_id:
+                base = f"/api/games/{self.game_id}/players/{previous_turn}"
+                await self.get(f"{base}/hand")
+                await self.get(f"{base}/secrets")
+            elif event in (
+                WSEvent.HAND_UPDATED.value,
+                WSEvent.HANDS_UPDATED.value,
+                WSEvent.ACTION_RESOLVED.value,
+                WSEvent.ACTION_CANCELLED.value,
+            ):
+                await self.get(
+                    f"/api/games/{self.game_id}/players/{self.player_id}/hand"
+                )
+
+    def apply(self, patches: List[dict]):
+        for patch in patches:
+            if patch["op"] != "card":
+                continue
+            mine = (
+                patch["location"] == CardLocation.IN_HAND.value
+                and patch["owner_id"] == self.player_id
+            )
+            if not mine:
+                self.hand.pop(patch["card_id"], None)
+            elif patch["card_type"] is not None:
+                self.hand[patch["card_id"]] = patch["card_type"]
+
+
+async def _play_turns(client_factory, mode: str, monkeypatch) -> dict:
+    monkeypatch.setenv(STATE_SYNC_ENV, mode)
+    async with client_factory(SYNC_DRIVER) as http:
+        game = await create_started_game(http, f"sync-{mode}", PLAYERS)
+        game_id = game["game_id"]
+        clients = {
+            pid: Client(http, game_id, pid, mode) for pid in game["players"]
+        }
+        for client in clients.values():
+            await client.load_hand()
+            await websocket_manager_singleton.connect(
+                client.socket, game_id=game_id, player_id=client.player_id
+            )
+
+        actions = 0
+        start = time.perf_counter()
+        turn = game["player_id"]
+        for i in range(TURNS):
+            actor = clients[turn]
+            base = f"/api/games/{game_id}/actions"
+            if i > 0:
+                hand = await http.get(
+                    f"/api/games/{game_id}/players/{turn}/hand"
+                )
+                card_id = next(
+                    c["card_id"]
+                    for c in hand.json()["cards"]
+                    if c["card_type"] != CardType.EARLY_TRAIN.value
+                )
+                discarded = await http.post(
+                    f"{base}/discard",
+                    json={"player_id": turn, "game_id": game_id, "card_id": card_id},
+                )
+                assert discarded.status_code == 200
+                await actor.after_own_action()
+            drawn = await http.post(
+                f"{base}/draw",
+                json={"player_id": turn, "game_id": game_id, "source": "deck"},
+            )
+            assert drawn.status_code == 200
+            await actor.after_own_action()
+            finished = await http.post(
+                f"{base}/finish-turn",
+                json={"player_id": turn, "game_id": game_id},
+            )
+            assert finished.status_code == 200
+            actions += 3 if i > 0 else 2
+            next_turn = finished.json()["next_player_id"]
+            for client in clients.values():
+                await client.react(previous_turn=turn)
+            turn = next_turn
+        elapsed = time.perf_counter() - start
+
+        # En modo delta la copia local debe coincidir con lo que daría un GET.
+        stale = 0
+        if mode == DELTA_MODE:
+            for client in clients.values():
+                expected = dict(client.hand)
+                await client.load_hand()
+                stale += expected != client.hand
+        for client in clients.values():
+            websocket_manager_singleton.disconnect(client.socket)
+
+    return {
+        "requests": sum(c.requests for c in clients.values()),
+        "frames": sum(len(c.socket.frames) for c in clients.values()),
+        "actions": actions,
+        "elapsed": elapsed,
+        "stale": stale,
+    }
+
+
+async def test_http_requests_per_turn_refetch_vs_delta(bench_client, monkeypatch):
+    # Act
+    results = {
+        mode: await _play_turns(bench_client, mode, monkeypatch)
+        for mode in (REFETCH_MODE, DELTA_MODE)
+    }
+
+    # Assert
+    for mode, r in results.items():
+        print(
+            f"\n[bench] state sync {mode} x{PLAYERS} players: "
+            f"{r['requests'] / TURNS:.1f} HTTP GETs/turn, "
+            f"{r['frames'] / TURNS:.1f} WS frames/turn, "
+            f"{r['elapsed'] / r['actions'] * 1000:.1f}ms/action (con los GETs)"
+        )
+    assert results[DELTA_MODE]["stale"] == 0
+    assert results[DELTA_MODE]["requests"] == 0
+    assert results[REFETCH_MODE]["requests"] >= TURNS * (PLAYERS - 1) * 2
@@ -0,0 +1,83 @@
+import time
+
+import pytest
+from sqlalchemy import event
+
+from app.database.async_session import SYNC_DRIVER
+from app.database.unit_of_work import UnitOfWork
+from app.domain.enums import CardType
+from tests.benchmarks.utils import create_started_game
+
+pytestmark = pytest.mark.asyncio
+
+# Cantidad de turnos completos (descartar, robar, terminar) por modo.
+TURNS = 10
+
+
+async def _play_turns(client, game: dict, samples: dict) -> None:
+    """Juega TURNS turnos: descarta una carta, roba y pasa el turno."""
+    game_id = game["game_id"]
+    url = f"/api/games/{game_id}/actions"
+
+    async def timed(flow: str, body: dict):
+        start = time.perf_counter()
+        response = await client.post(f"{url}/{flow}", json=body)
+        samples[flow].append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text
+        return response
+
+    # El jugador inicial ya descartó: completa su turno sin medir
+    body = {"player_id": game["player_id"], "game_id": game_id}
+    await client.post(f"{url}/draw", json={**body, "source": "deck"})
+    finished = await client.post(f"{url}/finish-turn", json=body)
+
+    for _ in range(TURNS):
+        player_id = finished.json()["next_player_id"]
+        body = {"player_id": player_id, "game_id": game_id}
+        hand = await client.get(f"/api/games/{game_id}/players/{player_id}/hand")
+        card_id = next(
+            c["card_id"]
+            for c in hand.json()["cards"]
+            if c["card_type"] != CardType.EARLY_TRAIN.value
+        )
+        await timed("discard", {**body, "card_id": card_id})
+        await timed("draw", {**body, "source": "deck"})
+        finished = await timed("finish-turn", body)
+
+
+@pytest.mark.parametrize("mode", ["per-command", "unit-of-work"])
+async def test_commit_count_and_latency_per_flow(
+    bench_client, bench_engines, monkeypatch, mode
+):
+    # Arrange
+    if mode == "per-command":
+        # Simula el comportamiento anterior: cada command commitea solo
+        monkeypatch.setattr(UnitOfWork, "active", property(lambda self: False))
+    sync_engine, _ = bench_engines
+    commits = {"count": 0}
+
+    def _on_commit(conn):
+        commits["count"] += 1
+
+    event.listen(sync_engine, "commit", _on_commit)
+    samples = {"discard": [], "draw": [], "finish-turn": []}
+
+    # Act
+    async with bench_client(SYNC_DRIVER) as client:
+        before_start = commits["count"]
+        game = await create_started_game(client, mode)
+        setup_commits = commits["count"] - before_start
+        before_turns = commits["count"]
+        await _play_turns(client, game, samples)
+        turn_commits = commits["count"] - before_turns
+    event.remove(sync_engine, "commit", _on_commit)
+
+    # Assert
+    assert all(len(s) == TURNS for s in samples.values())
+    print(
+        f"\n[bench] {mode}: setup(start+discard)={setup_commits} commits, "
+        f"{TURNS} turnos={turn_commits} commits "
+        + " ".join(
+            f"{flow}={sum(s) / len(s):.1f}ms" for flow, s in samples.items()
+        )
+    )
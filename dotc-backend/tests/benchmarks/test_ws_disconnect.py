@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from app.websockets.connection_manager import ConnectionManager
+from tests.benchmarks.test_ws_fanout import FakeSocket
+
+pytestmark = pytest.mark.asyncio
+
+PLAYERS_PER_GAME = 5
+
+
+async def _reconnect_storm(total: int) -> float:
+    """Conecta `total` sockets y los desconecta todos. Devuelve µs/disconnect."""
+    manager = ConnectionManager()
+    sockets = [FakeSocket() for _ in range(total)]
+    for i, socket in enumerate(sockets):
+        await manager.connect(
+            socket, game_id=i // PLAYERS_PER_GAME, player_id=i
+        )
+
+    start = time.perf_counter()
+    for socket in sockets:
+        manager.disconnect(socket)
+    elapsed = time.perf_counter() - start
+
+    assert not manager.connections_by_game
+    assert not manager.outbound
+    return elapsed / total * 1_000_000
+
+
+async def test_disconnect_cost_does_not_grow_with_connections():
+    # Act
+    per_disconnect = {n: await _reconnect_storm(n) for n in (1_000, 10_000)}
+
+    # Assert
+    for n, micros in per_disconnect.items():
+        print(f"\n[bench] ws disconnect with {n} sockets: {micros:.1f}µs each")
+    # Con el escaneo anterior, 10x conexiones costaban ~10x por disconnect.
+    assert per_disconnect[10_000] < per_disconnect[1_000] * 3
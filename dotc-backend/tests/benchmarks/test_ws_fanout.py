@@ -0,0 +1,111 @@
+import asyncio
+import time
+from typing import Dict, List
+
+import pytest
+
+from app.api.schemas import GameLobbyInfo, GameStatus
+from app.websockets.connection_manager import ConnectionManager
+from app.websockets.protocol.details import GameCreatedDetails
+from app.websockets.protocol.messages import WSMessage
+from tests.benchmarks.utils import percentile, report
+
+pytestmark = pytest.mark.asyncio
+
+SOCKETS = 1000
+SLOW_EVERY = 100  # 1 de cada 100 sockets es lento (10 en total)
+SLOW_SEND_S = 0.005
+BROADCASTS = 20
+
+
+class FakeSocket:
+    """WebSocket falso que anota cuándo recibió cada frame."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.received: List[float] = []
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000):
+        pass
+
+    async def send_text(self, frame: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(time.perf_counter())
+
+
+def _lobby_message(i: int) -> WSMessage:
+    game = GameLobbyInfo(
+        id=i,
+        name=f"bench-{i}",
+        min_players=2,
+        max_players=6,
+        player_count=1,
+        host_id=1,
+        game_status=GameStatus.LOBBY,
+        password=None,
+    )
+    return WSMessage(details=GameCreatedDetails(game=game))
+
+
+def _make_sockets() -> List[FakeSocket]:
+    return [
+        FakeSocket(SLOW_SEND_S if i % SLOW_EVERY == 0 else 0.0)
+        for i in range(SOCKETS)
+    ]
+
+
+async def _sequential_broadcast(sockets: List[FakeSocket], message: WSMessage):
+    """Comportamiento anterior: un `await send_text` por socket, en orden."""
+    frame = message.model_dump_json()
+    for socket in sockets:
+        await socket.send_text(frame)
+
+
+async def _run(variant: str) -> Dict[str, List[float]]:
+    sockets = _make_sockets()
+    healthy = [s for s in sockets if not s.delay]
+    manager = ConnectionManager()
+    if variant == "queued":
+        for socket in sockets:
+            await manager.connect(socket)
+
+    call_ms, delivery_ms = [], []
+    for i in range(BROADCASTS):
+        message = _lobby_message(i)
+        start = time.perf_counter()
+        if variant == "queued":
+            await manager.broadcast_to_lobby(message)
+        else:
+            await _sequential_broadcast(sockets, message)
+        call_ms.append((time.perf_counter() - start) * 1000)
+        # Entrega: hasta que TODOS los clientes sanos tienen el frame i
+        while any(len(s.received) <= i for s in healthy):
+            await asyncio.sleep(0)
+        last = max(s.received[i] for s in healthy)
+        delivery_ms.append((last - start) * 1000)
+
+    await manager.drain()
+    await manager.shutdown()
+    assert all(len(s.received) == BROADCASTS for s in sockets)
+    return {"call": call_ms, "delivery": delivery_ms}
+
+
+async def test_lobby_fanout_with_slow_sockets():
+    # Act
+    results = {variant: await _run(variant) for variant in ("sequential", "queued")}
+
+    # Assert
+    for variant, samples in results.items():
+        report(f"ws fan-out {variant} broadcast call x{SOCKETS}", samples["call"])
+        report(f"ws fan-out {variant} healthy delivery x{SOCKETS}", samples["delivery"])
+    # El broadcast encolado no espera a los sockets lentos.
+    assert percentile(results["queued"]["call"], 50) < percentile(
+        results["sequential"]["call"], 50
+    )
+    assert percentile(results["queued"]["delivery"], 50) < percentile(
+        results["sequential"]["delivery"], 50
+    )
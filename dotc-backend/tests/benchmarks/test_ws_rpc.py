@@ -0,0 +1,142 @@
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+import pytest
+
+from app.database.async_session import SYNC_DRIVER
+from app.domain.enums import CardType
+from app.main import app
+from tests.benchmarks.utils import create_started_game, percentile, timed_post
+
+pytestmark = pytest.mark.asyncio
+
+PLAYERS = 4
+TURNS = 12
+
+
+class AsgiWebSocket:
+    """
+    Cliente websocket en el mismo loop, hablando ASGI directo con la app
+    (como hace ASGITransport para HTTP): sin red en ninguno de los dos lados.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.outbox: asyncio.Queue = asyncio.Queue()
+        self.next_id = 0
+
+    async def __aenter__(self):
+        scope = {
+            "type": "websocket",
+            "path": self.path,
+            "raw_path": self.path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "scheme": "ws",
+            "server": ("bench", 80),
+            "client": ("bench-client", 1),
+            "subprotocols": [],
+        }
+        self.task = asyncio.create_task(
+            app(scope, self.inbox.get, self.outbox.put)
+        )
+        await self.inbox.put({"type": "websocket.connect"})
+        accepted = await self.outbox.get()
+        assert accepted["type"] == "websocket.accept"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.inbox.put({"type": "websocket.disconnect", "code": 1000})
+        await self.task
+
+    async def call(self, action: str, payload: dict) -> dict:
+        """Manda un pedido RPC y espera su respuesta (saltea los eventos)."""
+        self.next_id += 1
+        request_id = self.next_id
+        await self.inbox.put(
+            {
+                "type": "websocket.receive",
+                "text": json.dumps(
+                    {"id": request_id, "action": action, "payload": payload}
+                ),
+            }
+        )
+        while True:
+            frame = json.loads((await self.outbox.get())["text"])
+            if frame.get("type") == "rpc_result" and frame["id"] == request_id:
+                return frame
+
+
+async def _play(bench_client, transport: str) -> Dict[str, List[float]]:
+    async with bench_client(SYNC_DRIVER) as http:
+        game = await create_started_game(http, f"rpc-{transport}", PLAYERS)
+        game_id = game["game_id"]
+        sockets = {
+            pid: AsgiWebSocket(f"/ws/game/{game_id}/player/{pid}")
+            for pid in game["players"]
+        }
+        for socket in sockets.values():
+            await socket.__aenter__()
+
+        async def act(player_id: int, action: str, payload: dict):
+            if transport == "ws":
+                start = time.perf_counter()
+                reply = await sockets[player_id].call(action, payload)
+                elapsed = (time.perf_counter() - start) * 1000
+                assert reply["ok"], reply
+                return reply["result"], elapsed
+            response, elapsed = await timed_post(
+                http,
+                f"/api/games/{game_id}/actions/{action}",
+                {**payload, "player_id": player_id, "game_id": game_id},
+            )
+            assert response.status_code == 200, response.text
+            return response.json(), elapsed
+
+        samples: List[float] = []
+        turn = game["player_id"]
+        for i in range(TURNS):
+            if i > 0:
+                # Fuera de la medición: solo para elegir qué descartar.
+                hand = await http.get(
+                    f"/api/games/{game_id}/players/{turn}/hand"
+                )
+                card_id = next(
+                    c["card_id"]
+                    for c in hand.json()["cards"]
+                    if c["card_type"] != CardType.EARLY_TRAIN.value
+                )
+                _, ms = await act(turn, "discard", {"card_id": card_id})
+                samples.append(ms)
+            _, ms = await act(turn, "draw", {"source": "deck"})
+            samples.append(ms)
+            result, ms = await act(turn, "finish-turn", {})
+            samples.append(ms)
+            turn = result["next_player_id"]
+
+        for socket in sockets.values():
+            await socket.__aexit__()
+    return {"samples": samples, "action_time_s": sum(samples) / 1000}
+
+
+async def test_actions_per_second_http_vs_websocket(bench_client):
+    # Act
+    results = {
+        transport: await _play(bench_client, transport)
+        for transport in ("http", "ws")
+    }
+
+    # Assert
+    for transport, r in results.items():
+        samples = r["samples"]
+        print(
+            f"\n[bench] game actions over {transport}: n={len(samples)} "
+            f"{len(samples) / r['action_time_s']:.0f} actions/s "
+            f"p50={percentile(samples, 50):.2f}ms "
+            f"p99={percentile(samples, 99):.2f}ms"
+        )
+    assert len(results["ws"]["samples"]) == len(results["http"]["samples"])
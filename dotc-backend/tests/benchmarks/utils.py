@@ -0,0 +1,116 @@
+import math
+import time
+from typing import List
+
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.domain.enums import CardType
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Percentil por el método nearest-rank (q en [0, 100])."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def report(title: str, samples_ms: List[float]) -> None:
+    """Imprime p50/p99/max de una serie de latencias en milisegundos."""
+    print(
+        f"\n[bench] {title}: n={len(samples_ms)} "
+        f"p50={percentile(samples_ms, 50):.1f}ms "
+        f"p99={percentile(samples_ms, 99):.1f}ms "
+        f"max={max(samples_ms):.1f}ms"
+    )
+
+
+class StatementCounter:
+    """Cuenta las sentencias SQL (y los COMMIT) que llegan al engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+        self.commits = 0
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        event.listen(self.engine, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        event.remove(self.engine, "commit", self._on_commit)
+
+
+async def timed_post(client: AsyncClient, url: str, payload: dict):
+    """POST cronometrado. Devuelve (response, latencia en ms)."""
+    start = time.perf_counter()
+    response = await client.post(url, json=payload)
+    return response, (time.perf_counter() - start) * 1000
+
+
+async def create_lobby_game(
+    client: AsyncClient, tag: str, players: int = 2
+) -> dict:
+    """Crea `players` jugadores y una partida en el lobby con todos unidos."""
+    player_ids = []
+    for i in range(players):
+        created = await client.post(
+            "/api/players",
+            json={"name": f"P{i}-{tag}", "birth_date": f"{2000 + i}-01-01"},
+        )
+        player_ids.append(created.json()["player_id"])
+    host_id = player_ids[0]
+    game = await client.post(
+        "/api/games",
+        json={
+            "host_id": host_id,
+            "game_name": f"bench-{tag}",
+            "min_players": 2,
+            "max_players": 6,
+        },
+    )
+    game_id = game.json()["game_id"]
+    for guest_id in player_ids[1:]:
+        await client.post(
+            f"/api/games/{game_id}/join", json={"player_id": guest_id}
+        )
+    return {"game_id": game_id, "host_id": host_id, "players": player_ids}
+
+
+async def create_started_game(
+    client: AsyncClient, tag: str, players: int = 2
+) -> dict:
+    """
+    Crea `players` jugadores y una partida, la inicia y deja al jugador de
+    turno con 5 cartas (descarta una) para que pueda robar.
+    """
+    lobby = await create_lobby_game(client, tag, players)
+    game_id, host_id, player_ids = (
+        lobby["game_id"],
+        lobby["host_id"],
+        lobby["players"],
+    )
+    start = await client.post(
+        f"/api/games/{game_id}/start",
+        json={"player_id": host_id, "game_id": game_id},
+    )
+    turn_id = start.json()["player_id_first_turn"]
+    hand = await client.get(f"/api/games/{game_id}/players/{turn_id}/hand")
+    card_id = next(
+        c["card_id"]
+        for c in hand.json()["cards"]
+        if c["card_type"] != CardType.EARLY_TRAIN.value
+    )
+    await client.post(
+        f"/api/games/{game_id}/actions/discard",
+        json={"player_id": turn_id, "game_id": game_id, "card_id": card_id},
+    )
+    return {"game_id": game_id, "player_id": turn_id, "players": player_ids}
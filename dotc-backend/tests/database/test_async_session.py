@@ -0,0 +1,112 @@
+import asyncio
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.async_session import (
+    ASYNC_DRIVER,
+    GreenletBridgeMiddleware,
+    get_db_driver,
+    make_async_sessionmaker,
+    run_in_greenlet,
+)
+from app.database.commands import DatabaseCommandManager
+from app.database.orm_models import Base
+from app.database.queries import DatabaseQueryManager
+from app.domain.enums import Avatar
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    db_file = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{db_file}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}")
+    Base.metadata.create_all(bind=sync_engine)
+    yield sync_engine, async_engine
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
+async def test_run_in_greenlet_returns_coroutine_result():
+    # Arrange
+    async def work():
+        await asyncio.sleep(0)
+        return 42
+
+    # Act
+    result = await run_in_greenlet(work())
+
+    # Assert
+    assert result == 42
+
+
+async def test_run_in_greenlet_propagates_exceptions():
+    # Arrange
+    async def boom():
+        await asyncio.sleep(0)
+        raise ValueError("falla")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="falla"):
+        await run_in_greenlet(boom())
+
+
+async def test_managers_over_async_session_inside_greenlet(engines):
+    # Arrange
+    sync_engine, async_engine = engines
+    AsyncSession = make_async_sessionmaker(async_engine, sync_engine)
+
+    async def create_and_read():
+        async with AsyncSession() as async_db:
+            queries = DatabaseQueryManager(async_db.sync_session)
+            commands = DatabaseCommandManager(queries)
+            await asyncio.sleep(0)
+            player_id = commands.create_player(
+                "Async", date(2000, 1, 1), Avatar.DEFAULT
+            )
+            return player_id, queries.get_player_name(player_id)
+
+    # Act
+    player_id, name = await run_in_greenlet(create_and_read())
+
+    # Assert
+    assert player_id is not None
+    assert name == "Async"
+
+
+async def test_routing_session_uses_sync_engine_outside_greenlet(engines):
+    # Arrange
+    sync_engine, async_engine = engines
+    AsyncSession = make_async_sessionmaker(async_engine, sync_engine)
+    async_db = AsyncSession()
+
+    # Act
+    outside = async_db.sync_session.get_bind()
+    inside = await run_in_greenlet(_get_bind(async_db.sync_session))
+
+    # Assert
+    assert outside is sync_engine
+    assert inside is async_engine.sync_engine
+    await async_db.close()
+
+
+async def test_greenlet_bridge_is_installed_only_for_aiosqlite():
+    # Arrange
+    from app.main import app
+
+    # Act
+    installed = [m.cls for m in app.user_middleware]
+
+    # Assert
+    assert (GreenletBridgeMiddleware in installed) == (
+        get_db_driver() == ASYNC_DRIVER
+    )
+
+
+async def _get_bind(session):
+    return session.get_bind()
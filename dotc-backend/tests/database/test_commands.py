@@ -18,6 +18,7 @@ from app.domain.enums import (
     PlayCardActionType,
 )
 from app.api.schemas import PlayCardRequest
+from app.domain.models import CardMove, SecretAssignment
 
 # =================================================================
 # 👤 TESTS PARA COMMANDS DE JUGADORES
@@ -72,6 +73,87 @@ def test_set_player_role(command_manager, player_in_game_factory):
     assert player_in_game.player_role == PlayerRole.INNOCENT
 
 
+def test_deal_secrets_sets_roles_and_inserts_secrets(
+    command_manager, db_session, game_factory, player_factory
+):
+    # Arrange
+    game = game_factory()
+    host_id = game.host_id
+    guest = player_factory()
+    command_manager.add_player_to_game(guest.player_id, game.game_id)
+    assignments = [
+        SecretAssignment(
+            player_id=host_id,
+            role=PlayerRole.MURDERER,
+            secrets=[PlayerRole.MURDERER, PlayerRole.INNOCENT, PlayerRole.INNOCENT],
+        ),
+        SecretAssignment(
+            player_id=guest.player_id,
+            role=PlayerRole.INNOCENT,
+            secrets=[PlayerRole.INNOCENT] * 3,
+        ),
+    ]
+
+    # Act
+    result = command_manager.deal_secrets(game.game_id, assignments)
+
+    # Assert
+    assert result == ResponseStatus.OK
+    roles = {
+        row.player_id: row.player_role
+        for row in db_session.scalars(
+            select(PlayerInGameTable).where(
+                PlayerInGameTable.game_id == game.game_id
+            )
+        )
+    }
+    assert roles == {
+        host_id: PlayerRole.MURDERER,
+        guest.player_id: PlayerRole.INNOCENT,
+    }
+    secrets = db_session.scalars(
+        select(SecretCardTable).where(SecretCardTable.game_id == game.game_id)
+    ).all()
+    assert len(secrets) == 6
+    assert [s.role for s in secrets if s.player_id == host_id].count(
+        PlayerRole.MURDERER
+    ) == 1
+    assert not any(s.is_revealed for s in secrets)
+
+
+def test_deal_secrets_player_not_in_game_deals_nothing(
+    command_manager, db_session, game_factory, player_factory
+):
+    # Arrange
+    game = game_factory()
+    outsider = player_factory()
+    assignments = [
+        SecretAssignment(
+            player_id=game.host_id,
+            role=PlayerRole.MURDERER,
+            secrets=[PlayerRole.MURDERER],
+        ),
+        SecretAssignment(
+            player_id=outsider.player_id,
+            role=PlayerRole.INNOCENT,
+            secrets=[PlayerRole.INNOCENT],
+        ),
+    ]
+
+    # Act
+    result = command_manager.deal_secrets(game.game_id, assignments)
+
+    # Assert: el reparto es atómico
+    assert result == ResponseStatus.PLAYER_NOT_FOUND
+    secrets = db_session.scalars(
+        select(SecretCardTable).where(SecretCardTable.game_id == game.game_id)
+    ).all()
+    assert secrets == []
+    host = db_session.get(PlayerInGameTable, (game.game_id, game.host_id))
+    db_session.refresh(host)
+    assert host.player_role != PlayerRole.MURDERER
+
+
 def test_set_player_social_disgrace(
     command_manager, db_session, player_in_game_factory
 ):
@@ -365,6 +447,94 @@ def test_update_card_location(
     assert card.player_id == player.player_id
 
 
+def test_move_cards_moves_all_in_one_batch(
+    command_manager, card_factory, player_factory, game_factory
+):
+    # Arrange
+    game = game_factory()
+    player = player_factory()
+    in_hand = card_factory(game_id=game.game_id, location=CardLocation.DRAW_PILE)
+    to_deck = card_factory(
+        game_id=game.game_id, location=CardLocation.DISCARD_PILE, position=2
+    )
+    moves = [
+        CardMove(
+            card_id=in_hand.card_id,
+            location=CardLocation.IN_HAND,
+            owner_id=player.player_id,
+        ),
+        CardMove(
+            card_id=to_deck.card_id,
+            location=CardLocation.DRAW_PILE,
+            position=7,
+        ),
+    ]
+
+    # Act
+    result = command_manager.move_cards(game.game_id, moves)
+
+    # Assert
+    assert result == ResponseStatus.OK
+    command_manager.session.refresh(in_hand)
+    command_manager.session.refresh(to_deck)
+    assert in_hand.location == CardLocation.IN_HAND
+    assert in_hand.player_id == player.player_id
+    assert to_deck.location == CardLocation.DRAW_PILE
+    assert to_deck.position == 7
+
+
+def test_move_cards_keeps_position_when_not_given(
+    command_manager, card_factory, game_factory
+):
+    # Arrange
+    game = game_factory()
+    card = card_factory(
+        game_id=game.game_id, location=CardLocation.DRAW_PILE, position=3
+    )
+
+    # Act
+    result = command_manager.move_cards(
+        game.game_id,
+        [CardMove(card_id=card.card_id, location=CardLocation.DISCARD_PILE)],
+    )
+
+    # Assert
+    assert result == ResponseStatus.OK
+    command_manager.session.refresh(card)
+    assert card.location == CardLocation.DISCARD_PILE
+    assert card.position == 3
+
+
+def test_move_cards_card_from_other_game_moves_nothing(
+    command_manager, card_factory, game_factory
+):
+    # Arrange
+    game = game_factory()
+    other_game = game_factory()
+    own_card = card_factory(game_id=game.game_id, location=CardLocation.DRAW_PILE)
+    foreign_card = card_factory(
+        game_id=other_game.game_id, location=CardLocation.DRAW_PILE
+    )
+
+    # Act
+    result = command_manager.move_cards(
+        game.game_id,
+        [
+            CardMove(card_id=own_card.card_id, location=CardLocation.DISCARD_PILE),
+            CardMove(
+                card_id=foreign_card.card_id, location=CardLocation.DISCARD_PILE
+            ),
+        ],
+    )
+
+    # Assert: el lote es atómico
+    assert result == ResponseStatus.CARD_NOT_FOUND
+    command_manager.session.refresh(own_card)
+    command_manager.session.refresh(foreign_card)
+    assert own_card.location == CardLocation.DRAW_PILE
+    assert foreign_card.location == CardLocation.DRAW_PILE
+
+
 def test_update_cards_to_set_happy_path(
     command_manager, db_session, game_factory, player_factory, card_factory
 ):
@@ -1140,6 +1310,47 @@ def test_reveal_secret_card_from_wrong_game(
         assert other_card.player_id == owner.player_id
 
 
+# =================================================================
+# 🗳️ TESTS PARA VOTACIONES
+# =================================================================
+
+
+def test_cast_vote_twice_keeps_first_vote(
+    command_manager, query_manager, game_factory, player_factory
+):
+    # Arrange
+    game = game_factory()
+    voter, first, second = (player_factory().player_id for _ in range(3))
+    command_manager.cast_vote(game.game_id, 1, voter, first)
+
+    # Act
+    result = command_manager.cast_vote(game.game_id, 1, voter, second)
+
+    # Assert
+    assert result == ResponseStatus.ALREADY_VOTED
+    tally = query_manager.get_vote_tally(game.game_id, 1)
+    assert tally.total_votes == 1
+    assert tally.counts == {first: 1}
+
+
+def test_clear_votes_only_clears_that_round(
+    command_manager, query_manager, game_factory, player_factory
+):
+    # Arrange
+    game = game_factory()
+    voter, voted = player_factory().player_id, player_factory().player_id
+    command_manager.cast_vote(game.game_id, 1, voter, voted)
+    command_manager.cast_vote(game.game_id, 2, voter, voted)
+
+    # Act
+    result = command_manager.clear_votes(game.game_id, 1)
+
+    # Assert
+    assert result == ResponseStatus.OK
+    assert query_manager.get_vote_tally(game.game_id, 1).total_votes == 0
+    assert query_manager.get_vote_tally(game.game_id, 2).total_votes == 1
+
+
 # =================================================================
 # ⏳ TESTS PARA PENDING ACTIONS
 # =================================================================
@@ -0,0 +1,138 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.engine_settings import (
+    DEFAULT_PROFILE,
+    PROFILES,
+    SQLiteSettings,
+    get_db_echo,
+    install_sqlite_pragmas,
+    load_sqlite_settings,
+)
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Quita del entorno cualquier ajuste de SQLite del desarrollador."""
+    for name in ["DOTC_SQLITE_PROFILE", "DOTC_DB_ECHO"] + [
+        "DOTC_SQLITE_" + field.upper() for field in SQLiteSettings.model_fields
+    ]:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+# ═══════════════════════════════════════════════════════════
+# ⚙️ CARGA DESDE EL ENTORNO
+# ═══════════════════════════════════════════════════════════
+
+
+def test_default_profile_is_tuned(clean_env):
+    # Act
+    settings = load_sqlite_settings()
+
+    # Assert
+    assert settings == PROFILES[DEFAULT_PROFILE]
+    assert settings.journal_mode == "WAL"
+    assert settings.synchronous == "NORMAL"
+
+
+def test_profile_and_overrides_from_env(clean_env):
+    # Arrange
+    clean_env.setenv("DOTC_SQLITE_PROFILE", "Durable")
+    clean_env.setenv("DOTC_SQLITE_BUSY_TIMEOUT", "10000")
+    clean_env.setenv("DOTC_SQLITE_TEMP_STORE", "file")
+
+    # Act
+    settings = load_sqlite_settings()
+
+    # Assert
+    assert settings.synchronous == "FULL"
+    assert settings.busy_timeout == 10000
+    assert settings.temp_store == "FILE"
+
+
+def test_unknown_profile_raises(clean_env):
+    # Arrange
+    clean_env.setenv("DOTC_SQLITE_PROFILE", "turbo")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="turbo"):
+        load_sqlite_settings()
+
+
+def test_invalid_override_is_rejected(clean_env):
+    # Arrange
+    clean_env.setenv("DOTC_SQLITE_SYNCHRONOUS", "SOMETIMES")
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        load_sqlite_settings()
+
+
+def test_echo_is_off_by_default(clean_env):
+    # Act & Assert
+    assert get_db_echo() is False
+    clean_env.setenv("DOTC_DB_ECHO", "true")
+    assert get_db_echo() is True
+
+
+# ═══════════════════════════════════════════════════════════
+# 🔌 APLICACIÓN EN EL EVENTO "connect"
+# ═══════════════════════════════════════════════════════════
+
+
+def test_pragmas_applied_on_every_sync_connection(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    install_sqlite_pragmas(engine, PROFILES["tuned"])
+
+    # Act
+    with engine.connect() as conn:
+        journal = conn.execute(text("PRAGMA journal_mode")).scalar()
+        synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+        busy = conn.execute(text("PRAGMA busy_timeout")).scalar()
+        temp_store = conn.execute(text("PRAGMA temp_store")).scalar()
+    engine.dispose()
+
+    # Assert (synchronous NORMAL = 1, temp_store MEMORY = 2)
+    assert journal == "wal"
+    assert synchronous == 1
+    assert busy == 5000
+    assert temp_store == 2
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied_on_aiosqlite_connection(tmp_path):
+    # Arrange
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}"
+    )
+    install_sqlite_pragmas(async_engine.sync_engine, PROFILES["durable"])
+
+    # Act
+    async with async_engine.connect() as conn:
+        journal = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+    await async_engine.dispose()
+
+    # Assert (synchronous FULL = 2)
+    assert journal == "wal"
+    assert synchronous == 2
+
+
+def test_legacy_profile_keeps_sqlite_defaults(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    install_sqlite_pragmas(engine, PROFILES["legacy"])
+
+    # Act
+    with engine.connect() as conn:
+        journal = conn.execute(text("PRAGMA journal_mode")).scalar()
+        synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+    engine.dispose()
+
+    # Assert (synchronous FULL = 2)
+    assert journal == "delete"
+    assert synchronous == 2
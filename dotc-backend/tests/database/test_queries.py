@@ -9,8 +9,9 @@ from app.database.orm_models import (
 )
 
 # Importa todos los modelos y enums necesarios para las aserciones
-from app.domain.models import Game, PlayerInGame, Card, PlayerInfo, SecretCard, PendingAction
+from app.domain.models import Game, GameHeader, PlayerInGame, Card, PlayerInfo, SecretCard, PendingAction, VoteTally
 from app.domain.enums import GameStatus, CardLocation, PlayerRole, PlayCardActionType
+from app.api.schemas import LobbyFilter
 
 # =================================================================
 # ✅ TESTS PARA CASOS DE ÉXITO (HAPPY PATHS)
@@ -62,6 +63,63 @@ class TestDatabaseQueryManagerSuccess:
         # Assert
         assert game_dto is None
 
+    def test_get_game_header(
+        self, query_manager: DatabaseQueryManager, populated_game
+    ):
+        """La cabecera trae estado, turno y cantidad de jugadores sin cartas."""
+        # Arrange
+        game_id = populated_game.game_id
+
+        # Act
+        header = query_manager.get_game_header(game_id=game_id)
+
+        # Assert
+        assert isinstance(header, GameHeader)
+        assert header.id == game_id
+        assert header.name == populated_game.game_name
+        assert header.status == GameStatus.IN_PROGRESS
+        assert header.host_id == populated_game.host_id
+        assert header.player_count == 4
+        assert header.current_turn_player_id == populated_game.current_player
+
+    def test_get_game_header_not_found(
+        self, query_manager: DatabaseQueryManager
+    ):
+        # Act & Assert
+        assert query_manager.get_game_header(game_id=9999) is None
+
+    def test_get_game_snapshot(
+        self, query_manager: DatabaseQueryManager, populated_game
+    ):
+        """La foto trae cabecera, jugadores ordenados y todas las cartas."""
+        # Arrange
+        game_id = populated_game.game_id
+
+        # Act
+        snapshot = query_manager.get_game_snapshot(game_id=game_id)
+
+        # Assert
+        assert snapshot.header == query_manager.get_game_header(game_id)
+        player_ids = [p.player_id for p in snapshot.players]
+        assert player_ids == sorted(player_ids) and len(player_ids) == 4
+        assert all(p.player_birth_date for p in snapshot.players)
+        locations = [location for _, _, location, _, _ in snapshot.cards]
+        assert locations.count(CardLocation.IN_HAND) == 8
+        assert locations.count(CardLocation.DRAW_PILE) == 10
+        assert locations.count(CardLocation.DISCARD_PILE) == 5
+        hand = {c.card_id for c in query_manager.get_player_hand(game_id, player_ids[0])}
+        assert hand == {
+            card_id
+            for card_id, _, location, owner_id, _ in snapshot.cards
+            if location == CardLocation.IN_HAND and owner_id == player_ids[0]
+        }
+
+    def test_get_game_snapshot_not_found(
+        self, query_manager: DatabaseQueryManager
+    ):
+        # Act & Assert
+        assert query_manager.get_game_snapshot(game_id=9999) is None
+
     def test_list_games_in_lobby(
         self, query_manager: DatabaseQueryManager, lobby_scenario
     ):
@@ -80,6 +138,64 @@ class TestDatabaseQueryManagerSuccess:
         expected_ids = {g.game_id for g in lobby_scenario["lobby"]}
         assert lobby_game_ids == expected_ids
 
+    def test_list_games_in_lobby_with_filters(
+        self, query_manager: DatabaseQueryManager, game_factory
+    ):
+        """Prueba los filtros de estado, prefijo del nombre y lugares libres."""
+        # Arrange
+        alpha = game_factory(name="Alpha", max_players=4)
+        game_factory(name="Beta", max_players=4)
+        full = game_factory(name="alpha llena", max_players=1)
+        started = game_factory(name="Alpha 2", game_status=GameStatus.IN_PROGRESS)
+
+        # Act
+        by_prefix = query_manager.list_games_in_lobby(
+            LobbyFilter(status=GameStatus.LOBBY, name_prefix="ALP")
+        )
+        with_seats = query_manager.list_games_in_lobby(
+            LobbyFilter(name_prefix="alp", has_free_seats=True)
+        )
+        started_only = query_manager.list_games_in_lobby(
+            LobbyFilter(status=GameStatus.IN_PROGRESS)
+        )
+
+        # Assert
+        assert [g.id for g in by_prefix] == [alpha.game_id, full.game_id]
+        assert full.game_id not in {g.id for g in with_seats}
+        assert [g.id for g in started_only] == [started.game_id]
+        assert by_prefix[0].player_count == 1
+
+    def test_list_games_in_lobby_name_prefix_escapes_wildcards(
+        self, query_manager: DatabaseQueryManager, game_factory
+    ):
+        """Prueba que '%' y '_' en el prefijo se buscan literalmente."""
+        # Arrange
+        game_factory(name="100% diversión")
+        game_factory(name="1000 partidas")
+
+        # Act
+        games = query_manager.list_games_in_lobby(
+            LobbyFilter(status=GameStatus.LOBBY, name_prefix="100%")
+        )
+
+        # Assert
+        assert [g.name for g in games] == ["100% diversión"]
+
+    def test_list_games_in_lobby_paginates_by_cursor(
+        self, query_manager: DatabaseQueryManager, game_factory
+    ):
+        """Prueba que after_id y limit recorren las partidas en orden de id."""
+        # Arrange
+        ids = [game_factory(name=f"Partida {i}").game_id for i in range(5)]
+
+        # Act
+        first = query_manager.list_games_in_lobby(limit=2)
+        second = query_manager.list_games_in_lobby(after_id=first[-1].id, limit=2)
+        rest = query_manager.list_games_in_lobby(after_id=second[-1].id)
+
+        # Assert
+        assert [g.id for g in first + second + rest] == ids
+
     # --- Tests para Queries de Jugadores ---
 
     def test_get_player(
@@ -208,6 +324,91 @@ class TestDatabaseQueryManagerSuccess:
         # Assert
         assert deck_size == 10
 
+    def test_get_deck_is_ordered_top_first(
+        self, query_manager: DatabaseQueryManager, game_factory, card_factory
+    ):
+        """Prueba que el mazo viene ordenado del tope (mayor position) al fondo."""
+        # Arrange
+        game = game_factory()
+        for position in (3, 0, 7, 5):
+            card_factory(
+                game_id=game.game_id,
+                location=CardLocation.DRAW_PILE,
+                position=position,
+            )
+
+        # Act
+        deck = query_manager.get_deck(game_id=game.game_id)
+
+        # Assert
+        assert [c.position for c in deck] == [7, 5, 3, 0]
+
+    def test_get_deck_with_limit_reads_only_the_top(
+        self, query_manager: DatabaseQueryManager, game_factory, card_factory
+    ):
+        """Prueba que con limit solo vienen las cartas del tope, en orden."""
+        # Arrange
+        game = game_factory()
+        for position in (3, 0, 7, 5):
+            card_factory(
+                game_id=game.game_id,
+                location=CardLocation.DRAW_PILE,
+                position=position,
+            )
+
+        # Act
+        deck = query_manager.get_deck(game_id=game.game_id, limit=2)
+
+        # Assert
+        assert [c.position for c in deck] == [7, 5]
+
+    def test_get_top_card(
+        self, query_manager: DatabaseQueryManager, game_factory, card_factory
+    ):
+        """Prueba que el tope del mazo es la carta de mayor position."""
+        # Arrange
+        game = game_factory()
+        card_factory(game_id=game.game_id, location=CardLocation.DRAW_PILE, position=1)
+        top = card_factory(
+            game_id=game.game_id, location=CardLocation.DRAW_PILE, position=9
+        )
+        # Una carta con mayor position pero fuera del mazo no cuenta
+        card_factory(game_id=game.game_id, location=CardLocation.DRAFT, position=20)
+
+        # Act
+        card = query_manager.get_top_card(game_id=game.game_id)
+
+        # Assert
+        assert card is not None
+        assert card.card_id == top.card_id
+
+    def test_get_top_card_when_deck_empty(
+        self, query_manager: DatabaseQueryManager, game_factory
+    ):
+        """Prueba que devuelve None si no quedan cartas en el mazo."""
+        # Arrange
+        game = game_factory()
+
+        # Act & Assert
+        assert query_manager.get_top_card(game_id=game.game_id) is None
+
+    def test_get_draft(
+        self, query_manager: DatabaseQueryManager, game_factory, card_factory
+    ):
+        """Prueba que se obtienen solo las cartas del draft."""
+        # Arrange
+        game = game_factory()
+        for _ in range(3):
+            card_factory(game_id=game.game_id, location=CardLocation.DRAFT)
+        card_factory(game_id=game.game_id, location=CardLocation.DRAW_PILE)
+
+        # Act
+        draft = query_manager.get_draft(game_id=game.game_id)
+
+        # Assert
+        assert len(draft) == 3
+        assert all(c.location == CardLocation.DRAFT for c in draft)
+
     def test_get_size_deck_when_empty(
         self, query_manager: DatabaseQueryManager, game_factory, card_factory
     ):
@@ -294,6 +495,28 @@ class TestDatabaseQueryManagerSuccess:
         # Assert
         assert set_cards == []
 
+    def test_get_sets_groups_cards_by_set(
+        self, query_manager: DatabaseQueryManager, game_factory, card_factory
+    ):
+        """Prueba que se obtienen todos los sets de la partida en un dict."""
+        # Arrange
+        game = game_factory()
+        other_game = game_factory()
+        card_factory(game_id=game.game_id, set_id=2)
+        card_factory(game_id=game.game_id, set_id=1)
+        card_factory(game_id=game.game_id, set_id=2)
+        card_factory(game_id=game.game_id, set_id=None)  # Sin set
+        card_factory(game_id=other_game.game_id, set_id=1)  # Otra partida
+
+        # Act
+        sets = query_manager.get_sets(game_id=game.game_id)
+
+        # Assert
+        assert sorted(sets) == [1, 2]
+        assert len(sets[1]) == 1
+        assert len(sets[2]) == 2
+        assert all(c.set_id == 2 for c in sets[2])
+
     def test_get_secret_happy_path(
         self,
         query_manager: DatabaseQueryManager,
@@ -452,6 +675,33 @@ class TestDatabaseQueryManagerSuccess:
             is False
         )
 
+    def test_is_player_in_social_disgrace(
+        self,
+        query_manager: DatabaseQueryManager,
+        game_factory,
+        player_in_game_factory,
+    ):
+        """Prueba la lectura de la desgracia social de un jugador."""
+        # Arrange
+        game = game_factory()
+        disgraced = player_in_game_factory(
+            game_id=game.game_id, social_disgrace=True
+        )
+        clean = player_in_game_factory(
+            game_id=game.game_id, social_disgrace=False
+        )
+
+        # Act & Assert
+        assert query_manager.is_player_in_social_disgrace(
+            game.game_id, disgraced.player_id
+        ) is True
+        assert query_manager.is_player_in_social_disgrace(
+            game.game_id, clean.player_id
+        ) is False
+        assert query_manager.is_player_in_social_disgrace(
+            9999, disgraced.player_id
+        ) is False
+
     def test_is_player_host(
         self,
         query_manager: DatabaseQueryManager,
@@ -546,6 +796,28 @@ def test_get_pending_action_happy_path(query_manager: DatabaseQueryManager, pend
     assert {c.card_id for c in pending_action_dto.cards} == {card1.card_id, card2.card_id}
     assert isinstance(pending_action_dto.cards[0], Card)
 
+def test_get_vote_tally_groups_votes_and_tracks_initiator(
+    query_manager, command_manager, game_factory, player_factory
+):
+    # Arrange: 4 votantes; 2 votan a `a`, el iniciador a `b`, uno se abstiene
+    game = game_factory()
+    voters = [player_factory().player_id for _ in range(4)]
+    a, b = voters[2], voters[3]
+    initiator = voters[0]
+    for voter, voted in zip(voters, [b, a, a, None]):
+        command_manager.cast_vote(game.game_id, 7, voter, voted)
+    command_manager.cast_vote(game.game_id, 8, voters[1], b)  # otra ronda
+
+    # Act
+    tally = query_manager.get_vote_tally(game.game_id, 7, initiator)
+
+    # Assert
+    assert isinstance(tally, VoteTally)
+    assert tally.total_votes == 4
+    assert tally.counts == {a: 2, b: 1}
+    assert tally.initiator_vote == b
+
+
 # =================================================================
 # ❌ TESTS PARA MANEJO DE EXCEPCIONES
 # =================================================================
@@ -630,6 +902,8 @@ class TestDatabaseQueryManagerExceptions:
         )
         assert query_manager_with_exceptions.get_deck(game_id=1) == []
         assert query_manager_with_exceptions.get_discard_pile(game_id=1) == []
+        assert query_manager_with_exceptions.get_draft(game_id=1) == []
+        assert query_manager_with_exceptions.get_top_card(game_id=1) is None
         assert (
             query_manager_with_exceptions.get_player_secrets(
                 game_id=1, player_id=1
@@ -637,6 +911,11 @@ class TestDatabaseQueryManagerExceptions:
             == []
         )
         assert query_manager_with_exceptions.get_set(set_id=1, game_id=1) == []
+        assert query_manager_with_exceptions.get_sets(game_id=1) == {}
+        assert (
+            query_manager_with_exceptions.get_vote_tally(game_id=1, round_id=1)
+            == VoteTally()
+        )
 
         # Métodos que deben devolver un booleano seguro en caso de error
         assert (
@@ -649,11 +928,17 @@ class TestDatabaseQueryManagerExceptions:
             query_manager_with_exceptions.is_player_host(game_id=1, player_id=1)
             is False
         )
+        assert (
+            query_manager_with_exceptions.is_player_in_social_disgrace(
+                game_id=1, player_id=1
+            )
+            is False
+        )
         assert (
             query_manager_with_exceptions.game_name_exists(game_name="any")
             is True
         )  # Consistente con tu implementación
 
         # Verificación final: el rollback debe haber sido llamado por cada método
-        assert mock_session_with_exceptions.rollback.call_count == 21
+        assert mock_session_with_exceptions.rollback.call_count == 26
         
\ No newline at end of file
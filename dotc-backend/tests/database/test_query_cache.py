@@ -0,0 +1,201 @@
+import inspect
+
+import pytest
+
+from app.database.commands import DatabaseCommandManager
+from app.database.interfaces import ICommandManager, IQueryManager
+from app.database.query_cache import (
+    QUERY_CACHE_ENV,
+    READ_TABLES,
+    UNCACHED_READS,
+    WRITE_TABLES,
+    CachedQueryManager,
+    query_cache_enabled,
+)
+from app.domain.enums import CardLocation, GameActionState, GameStatus
+
+
+@pytest.fixture
+def cached(query_manager) -> CachedQueryManager:
+    return CachedQueryManager(query_manager)
+
+
+@pytest.fixture
+def commands(cached: CachedQueryManager):
+    return cached.track(DatabaseCommandManager(queries=cached))
+
+
+def _abstract_methods(interface: type):
+    return {
+        name
+        for name, member in inspect.getmembers(interface, inspect.isfunction)
+        if getattr(member, "__isabstractmethod__", False)
+    }
+
+
+# ═══════════════════════════════════════════════════════════
+# 🗂️ COBERTURA DE LAS INTERFACES
+# ═══════════════════════════════════════════════════════════
+
+
+def test_every_read_is_either_cached_or_explicitly_skipped():
+    # Act
+    reads = _abstract_methods(IQueryManager)
+
+    # Assert
+    assert reads == set(READ_TABLES) | UNCACHED_READS
+
+
+def test_every_command_declares_the_tables_it_writes():
+    # Act
+    writes = _abstract_methods(ICommandManager) - {"unit_of_work"}
+
+    # Assert
+    assert writes == set(WRITE_TABLES)
+
+
+# ═══════════════════════════════════════════════════════════
+# 🔁 MEMOIZACIÓN
+# ═══════════════════════════════════════════════════════════
+
+
+def test_repeated_reads_return_the_same_object(cached, populated_game):
+    # Arrange
+    game_id = populated_game.game_id
+    host_id = populated_game.host_id
+
+    # Act
+    first = cached.get_game(game_id)
+    second = cached.get_game(game_id=game_id)
+    hand = cached.get_player_hand(game_id, host_id)
+    same_hand = cached.get_player_hand(player_id=host_id, game_id=game_id)
+
+    # Assert
+    assert second is first
+    assert same_hand is hand
+    assert cached.misses["get_game"] == 1
+    assert cached.hits["get_game"] == 1
+    assert cached.hits["get_player_hand"] == 1
+
+
+def test_missing_results_are_not_memoized(cached):
+    # Act
+    cached.get_game(9999)
+    cached.get_game(9999)
+
+    # Assert
+    assert cached.misses["get_game"] == 2
+    assert cached.hits["get_game"] == 0
+
+
+def test_other_attributes_are_delegated(cached, query_manager):
+    # Act & Assert
+    assert cached.session is query_manager.session
+    assert cached.list_games_in_lobby() == query_manager.list_games_in_lobby()
+
+
+# ═══════════════════════════════════════════════════════════
+# 🧹 INVALIDACIÓN
+# ═══════════════════════════════════════════════════════════
+
+
+def test_card_write_invalidates_only_card_reads_of_that_game(
+    cached, commands, populated_game, game_factory, card_factory
+):
+    # Arrange
+    game_id = populated_game.game_id
+    host_id = populated_game.host_id
+    other_game = game_factory()
+    card_factory(game_id=other_game.game_id)
+    hand = cached.get_player_hand(game_id, host_id)
+    header = cached.get_game_header(game_id)
+    other_deck = cached.get_deck(other_game.game_id)
+    card_id = cached.get_deck(game_id)[0].card_id
+
+    # Act
+    commands.update_card_location(
+        card_id, game_id, CardLocation.IN_HAND, owner_id=host_id
+    )
+
+    # Assert
+    new_hand = cached.get_player_hand(game_id, host_id)
+    assert len(new_hand) == len(hand) + 1
+    assert cached.get_game_header(game_id) is header
+    assert cached.get_deck(other_game.game_id) is other_deck
+
+
+def test_game_write_refreshes_header_and_full_game(
+    cached, commands, populated_game
+):
+    # Arrange
+    game_id = populated_game.game_id
+    hand = cached.get_player_hand(game_id, populated_game.host_id)
+    cached.get_game_header(game_id)
+    cached.get_game(game_id)
+
+    # Act
+    commands.set_game_action_state(
+        game_id, GameActionState.PENDING_NSF, None, populated_game.host_id
+    )
+
+    # Assert
+    assert cached.get_game_header(game_id).action_state == (
+        GameActionState.PENDING_NSF
+    )
+    assert cached.get_game(game_id).action_state == GameActionState.PENDING_NSF
+    assert cached.get_player_hand(game_id, populated_game.host_id) is hand
+
+
+def test_game_creation_clears_the_whole_cache(cached, commands, populated_game):
+    # Arrange
+    game_id = populated_game.game_id
+    header = cached.get_game_header(game_id)
+
+    # Act
+    commands.create_game("otra", 2, 4, populated_game.host_id)
+
+    # Assert
+    assert cached.get_game_header(game_id) is not header
+
+
+def test_rollback_clears_reads_made_inside_the_unit_of_work(
+    cached, commands, populated_game
+):
+    # Arrange
+    game_id = populated_game.game_id
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with commands.unit_of_work():
+            commands.update_game_status(game_id, GameStatus.FINISHED)
+            assert cached.get_game_status(game_id) == GameStatus.FINISHED
+            raise RuntimeError("falla la acción")
+
+    # Assert
+    assert cached.get_game_status(game_id) == GameStatus.IN_PROGRESS
+
+
+# ═══════════════════════════════════════════════════════════
+# ⚙️ CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════
+
+
+@pytest.mark.parametrize("value, expected", [(None, True), ("OFF", False)])
+def test_query_cache_enabled_reads_the_environment(monkeypatch, value, expected):
+    # Arrange
+    if value is None:
+        monkeypatch.delenv(QUERY_CACHE_ENV, raising=False)
+    else:
+        monkeypatch.setenv(QUERY_CACHE_ENV, value)
+
+    # Act & Assert
+    assert query_cache_enabled() is expected
+
+
+def test_query_cache_enabled_rejects_unknown_values(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(QUERY_CACHE_ENV, "maybe")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        query_cache_enabled()
@@ -0,0 +1,119 @@
+"""
+Regresión de planes de ejecución: corre `EXPLAIN QUERY PLAN` sobre el SQL
+que emiten las queries calientes de cartas y secretos y falla si alguna
+recorre la tabla completa (SCAN) en lugar de usar un índice (SEARCH).
+"""
+
+from contextlib import contextmanager
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+
+# =================================================================
+# 🛠️ HELPERS
+# =================================================================
+
+
+@contextmanager
+def capture_sql(session):
+    """Captura (sql, params) de cada sentencia ejecutada por la sesión."""
+    engine = session.get_bind()
+    captured: List[Tuple[str, tuple]] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, *args):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def explain(session, statement: str, parameters) -> List[str]:
+    """Devuelve las filas 'detail' del EXPLAIN QUERY PLAN de una sentencia."""
+    rows = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    return [row[-1] for row in rows]
+
+
+def assert_no_table_scan(session, run_query):
+    with capture_sql(session) as captured_sql:
+        run_query()
+    assert captured_sql, "La query no emitió SQL."
+    for statement, parameters in captured_sql:
+        plan = explain(session, statement, parameters)
+        scans = [step for step in plan if step.startswith("SCAN")]
+        assert not scans, f"Table scan en:\n{statement}\nplan={plan}"
+
+
+# =================================================================
+# 🔍 QUERIES CALIENTES
+# =================================================================
+
+
+@pytest.mark.parametrize(
+    "query_name",
+    [
+        "get_player_hand",
+        "get_deck",
+        "get_top_card",
+        "get_draft",
+        "get_discard_pile",
+        "get_size_deck",
+        "get_set",
+        "get_max_set_id",
+        "get_player_secrets",
+    ],
+)
+def test_hot_query_uses_index(
+    db_session, query_manager, populated_game, query_name
+):
+    # Arrange
+    game_id = populated_game.game_id
+    player_id = populated_game.players[0].player_id
+    calls = {
+        "get_player_hand": lambda: query_manager.get_player_hand(
+            game_id=game_id, player_id=player_id
+        ),
+        "get_deck": lambda: query_manager.get_deck(game_id=game_id),
+        "get_top_card": lambda: query_manager.get_top_card(game_id=game_id),
+        "get_draft": lambda: query_manager.get_draft(game_id=game_id),
+        "get_discard_pile": lambda: query_manager.get_discard_pile(
+            game_id=game_id
+        ),
+        "get_size_deck": lambda: query_manager.get_size_deck(game_id=game_id),
+        "get_set": lambda: query_manager.get_set(set_id=1, game_id=game_id),
+        "get_max_set_id": lambda: query_manager.get_max_set_id(
+            game_id=game_id
+        ),
+        "get_player_secrets": lambda: query_manager.get_player_secrets(
+            game_id=game_id, player_id=player_id
+        ),
+    }
+
+    # Act & Assert
+    assert_no_table_scan(db_session, calls[query_name])
+
+
+def test_top_of_deck_needs_no_sort(db_session, query_manager, populated_game):
+    """
+    El tope del mazo (ORDER BY position DESC LIMIT 1) sale del índice
+    (game_id, location, position): sin table scan y sin ordenar en memoria.
+    """
+    # Arrange
+    game_id = populated_game.game_id
+
+    # Act
+    with capture_sql(db_session) as captured_sql:
+        query_manager.get_top_card(game_id=game_id)
+
+    # Assert
+    plans = [explain(db_session, sql, params) for sql, params in captured_sql]
+    steps = [step for plan in plans for step in plan]
+    assert steps
+    assert not [s for s in steps if s.startswith("SCAN")], steps
+    assert not [s for s in steps if "TEMP B-TREE" in s], steps
@@ -0,0 +1,230 @@
+from datetime import date
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import event
+
+from app.api.schemas import PlayCardRequest
+from app.database.orm_models import PlayerInGameTable, PlayerTable
+from app.domain.enums import (
+    Avatar,
+    CardLocation,
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayCardActionType,
+)
+from app.game.exceptions import InternalGameError, InvalidAction
+from app.game.helpers.notificators import Notificator
+from app.game.helpers.validators import GameValidator
+from app.game.services.turn_service import TurnService
+
+
+@pytest.fixture
+def commit_counter(db_session):
+    """Cuenta los COMMIT reales que llegan a la conexión."""
+    counter = {"commits": 0}
+
+    def _on_commit(conn):
+        counter["commits"] += 1
+
+    engine = db_session.get_bind()
+    event.listen(engine, "commit", _on_commit)
+    yield counter
+    event.remove(engine, "commit", _on_commit)
+
+
+def _create_player(command_manager, name: str):
+    return command_manager.create_player(
+        name=name, birth_date=date(2000, 1, 1), avatar=Avatar.DEFAULT
+    )
+
+
+def test_unit_of_work_commits_once(
+    command_manager, query_manager, commit_counter
+):
+    # Arrange & Act
+    with command_manager.unit_of_work():
+        p1 = _create_player(command_manager, "Uno")
+        p2 = _create_player(command_manager, "Dos")
+        # Los cambios ya son visibles dentro de la unidad
+        assert query_manager.get_player_name(p1) == "Uno"
+        assert commit_counter["commits"] == 0
+
+    # Assert
+    assert commit_counter["commits"] == 1
+    assert query_manager.get_player_name(p2) == "Dos"
+
+
+def test_unit_of_work_rolls_back_on_game_error(command_manager, db_session):
+    # Arrange & Act
+    with pytest.raises(InvalidAction):
+        with command_manager.unit_of_work():
+            _create_player(command_manager, "Fantasma")
+            raise InvalidAction("Jugada inválida")
+
+    # Assert
+    assert db_session.query(PlayerTable).count() == 0
+
+
+def test_unit_of_work_rolls_back_when_a_command_fails(
+    command_manager, db_session
+):
+    # Arrange & Act
+    with pytest.raises(InternalGameError):
+        with command_manager.unit_of_work():
+            _create_player(command_manager, "Fantasma")
+            # FK inválida: el command falla y hace rollback interno
+            command_manager.create_card(
+                card_type=CardType.NOT_SO_FAST,
+                location=CardLocation.DRAW_PILE,
+                game_id=999,
+            )
+            _create_player(command_manager, "Otro")
+
+    # Assert: ni siquiera lo escrito después del fallo se persiste
+    assert db_session.query(PlayerTable).count() == 0
+
+
+def test_unit_of_work_is_reentrant(command_manager, commit_counter):
+    # Arrange & Act
+    with command_manager.unit_of_work():
+        with command_manager.unit_of_work():
+            _create_player(command_manager, "Anidado")
+        assert commit_counter["commits"] == 0
+
+    # Assert
+    assert commit_counter["commits"] == 1
+
+
+def test_commands_commit_individually_without_unit_of_work(
+    command_manager, commit_counter
+):
+    # Arrange & Act
+    _create_player(command_manager, "Uno")
+    _create_player(command_manager, "Dos")
+
+    # Assert
+    assert commit_counter["commits"] == 2
+
+
+def test_checkpoint_persists_before_a_game_error(command_manager, db_session):
+    # Arrange & Act
+    with pytest.raises(InvalidAction):
+        with command_manager.unit_of_work() as uow:
+            _create_player(command_manager, "Persistido")
+            uow.checkpoint()
+            _create_player(command_manager, "Revertido")
+            raise InvalidAction("Jugada inválida")
+
+    # Assert
+    names = [p.player_name for p in db_session.query(PlayerTable).all()]
+    assert names == ["Persistido"]
+
+
+def test_savepoint_undoes_only_its_block(command_manager, db_session):
+    # Arrange & Act
+    with command_manager.unit_of_work() as uow:
+        _create_player(command_manager, "Antes")
+        with pytest.raises(InvalidAction):
+            with uow.savepoint():
+                _create_player(command_manager, "Revertido")
+                raise InvalidAction("Jugada inválida")
+        _create_player(command_manager, "Después")
+
+    # Assert
+    names = [p.player_name for p in db_session.query(PlayerTable).all()]
+    assert names == ["Antes", "Después"]
+
+
+def test_savepoint_as_first_write_does_not_commit_the_unit(
+    command_manager, db_session
+):
+    # Arrange & Act: el SAVEPOINT es lo primero que llega a la conexión
+    with pytest.raises(InvalidAction):
+        with command_manager.unit_of_work() as uow:
+            with uow.savepoint():
+                _create_player(command_manager, "Fantasma")
+            raise InvalidAction("Jugada inválida")
+
+    # Assert: el RELEASE del savepoint no commiteó por su cuenta
+    assert db_session.query(PlayerTable).count() == 0
+
+
+class _WriteThenRejectExecutor:
+    """Efecto que escribe la saga y después rechaza los targets."""
+
+    def __init__(self, commands):
+        self.commands = commands
+
+    async def execute_effect(self, game_id: int, **kwargs):
+        self.commands.update_pending_saga(game_id, {"type": "a_medias"})
+        raise InvalidAction("El target ya no sirve.")
+
+
+@pytest.mark.asyncio
+async def test_voided_nsf_play_rolls_back_what_its_effect_wrote(
+    db_session,
+    query_manager,
+    command_manager,
+    game_factory,
+    player_factory,
+    card_factory,
+    pending_action_factory,
+):
+    # Arrange: A jugó un evento y B es el único que falta responder (el
+    # host de la partida ya pasó)
+    game = game_factory(game_status=GameStatus.IN_PROGRESS)
+    initiator, responder = player_factory(), player_factory()
+    for player in (initiator, responder):
+        db_session.add(
+            PlayerInGameTable(game_id=game.game_id, player_id=player.player_id)
+        )
+    db_session.commit()
+    card = card_factory(
+        game_id=game.game_id,
+        player_id=initiator.player_id,
+        card_type=CardType.ANOTHER_VICTIM,
+        location=CardLocation.IN_HAND,
+    )
+    pending_action_factory(
+        game_id=game.game_id,
+        player_id=initiator.player_id,
+        target_player_id=responder.player_id,
+        cards=[card],
+        responses_count=1,
+    )
+    command_manager.set_game_action_state(
+        game_id=game.game_id,
+        state=GameActionState.PENDING_NSF,
+        prompted_player_id=None,
+        initiator_id=initiator.player_id,
+    )
+    service = TurnService(
+        queries=query_manager,
+        commands=command_manager,
+        validator=GameValidator(query_manager),
+        notifier=Notificator(AsyncMock()),
+        effect_executor=_WriteThenRejectExecutor(command_manager),
+        turn_utils=Mock(),
+    )
+
+    # Act
+    response = await service.play_nsf(
+        PlayCardRequest(
+            game_id=game.game_id,
+            player_id=responder.player_id,
+            card_ids=[],
+            action_type=PlayCardActionType.INSTANT,
+        )
+    )
+
+    # Assert: la saga que escribió el efecto no sobrevivió al anulado
+    assert "sin efecto" in response.detail
+    assert query_manager.get_pending_saga(game.game_id) is None
+    assert query_manager.get_pending_action(game.game_id) is None
+    header = query_manager.get_game_header(game.game_id)
+    assert header.action_state == GameActionState.NONE
+    assert query_manager.get_card(card.card_id, game.game_id).location == (
+        CardLocation.IN_HAND
+    )
@@ -4,6 +4,7 @@ from types import SimpleNamespace
 
 from app.api.schemas import VoteRequest, GeneralActionResponse
 from app.domain.enums import GameActionState, PlayerRole
+from app.domain.models import SecretCard
 from app.game.exceptions import ActionConflict, InvalidSagaState
 # VoteSuspicionAction abolido en producción; se define stub local para pruebas
 
@@ -351,6 +352,9 @@ async def test_resolve_suspicion_vote_END_TO_END_notifier_call(action, deps):
         "votes": {"10": 20, "20": 20, "30": 10},
     }
     game = make_game(player_ids=[10, 20, 30], saga=saga)
+    deps["queries"].get_player_secrets.return_value = [
+        SecretCard(secret_id=1, game_id=game.id, player_id=20, role=PlayerRole.INNOCENT)
+    ]
 
     # NO parcheamos el efecto. Dejamos que el código real se ejecute.
     # El 'action' ya tiene el 'mock_notifier' inyectado, así que podemos espiarlo.
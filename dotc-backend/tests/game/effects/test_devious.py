@@ -5,7 +5,9 @@ from unittest.mock import AsyncMock, Mock, MagicMock
 from app.game.effects.devious_effects import SocialFauxPasEffect
 from app.database.interfaces import IQueryManager, ICommandManager
 from app.game.helpers.notificators import Notificator
+from app.domain.models import SecretCard
 from app.domain.enums import (
+    PlayerRole,
     ResponseStatus,
     GameActionState,
     CardLocation,
@@ -65,6 +67,12 @@ class TestSocialFauxPasEffect:
         mock_commands.update_card_location.return_value = ResponseStatus.OK
         # El efecto llama a get_card para obtener el objeto a notificar.
         mock_queries.get_card.return_value = mock_card_object
+        mock_queries.get_player_secrets.return_value = [
+            SecretCard(
+                secret_id=1, game_id=game_id, player_id=victim_id,
+                role=PlayerRole.INNOCENT,
+            )
+        ]
 
         # --- Act ---
         result = await effect.execute(
@@ -108,6 +116,34 @@ class TestSocialFauxPasEffect:
         # 5. Verificar que el resultado final sea PAUSED (devious effects pause the game).
         assert result == GameFlowStatus.PAUSED
 
+    @pytest.mark.asyncio
+    async def test_execute_skips_the_prompt_without_hidden_secrets(
+        self,
+        effect: SocialFauxPasEffect,
+        mock_commands: Mock,
+        mock_queries: Mock,
+        mock_notificator: AsyncMock,
+    ):
+        """Si la víctima ya reveló todo, se descarta la carta y el juego sigue."""
+        # --- Arrange ---
+        mock_commands.update_card_location.return_value = ResponseStatus.OK
+        mock_queries.get_card.return_value = MagicMock(card_id=101)
+        mock_queries.get_player_secrets.return_value = [
+            SecretCard(
+                secret_id=1, game_id=701, player_id=1,
+                role=PlayerRole.INNOCENT, is_revealed=True,
+            )
+        ]
+
+        # --- Act ---
+        result = await effect.execute(game_id=701, player_id=1, card_ids=[101])
+
+        # --- Assert ---
+        mock_commands.update_card_location.assert_called_once()
+        mock_commands.set_game_action_state.assert_not_called()
+        mock_notificator.notify_player_to_reveal_secret.assert_not_awaited()
+        assert result == GameFlowStatus.CONTINUE
+
     @pytest.mark.asyncio
     async def test_execute_db_fail_raises_internal_error(
         self, effect: SocialFauxPasEffect, mock_commands: Mock
@@ -12,13 +12,14 @@ from app.game.effects.event_effects import (
     AndThenThereWasOneMoreEffect,
     DelayTheMurdererEscapeEffect,
     EarlyTrainToPaddingtonEffect,
+    PointYourSuspicionsEffect,
 )
 
 # Importar dependencias necesarias para mocks y datos de prueba
 from app.database.interfaces import IQueryManager, ICommandManager
 from app.game.helpers.notificators import Notificator
 from app.game.effect_executor import EffectExecutor
-from app.domain.models import Card, SecretCard
+from app.domain.models import Card, CardMove, SecretCard
 from app.domain.enums import (
     CardType,
     CardLocation,
@@ -488,6 +489,55 @@ class TestAnotherVictimEffect:
                 target_set_id=5,
             )
 
+    @pytest.mark.asyncio
+    async def test_execute_ignores_an_ariadne_oliver_added_by_someone_else(
+        self,
+        another_victim_effect: AnotherVictimEffect,
+        mock_queries: Mock,
+        mock_commands: Mock,
+        mock_notificator: AsyncMock,
+        mock_executor: AsyncMock,
+    ):
+        """
+        Prueba que una Ariadne Oliver sumada por otro jugador no vuelve
+        "corrupto" al set: la víctima es el dueño de los detectives.
+        """
+        # --- Arrange ---
+        stolen_set_cards = [
+            Card(
+                card_id=10,
+                game_id=1,
+                card_type=CardType.HERCULE_POIROT,
+                location=CardLocation.PLAYED,
+                player_id=2,
+                set_id=5,
+            ),
+            Card(
+                card_id=11,
+                game_id=1,
+                card_type=CardType.ARIADNE_OLIVER,
+                location=CardLocation.PLAYED,
+                player_id=3,
+                set_id=5,
+            ),
+        ]
+        mock_queries.get_set.return_value = stolen_set_cards
+        mock_executor.execute_effect.return_value = GameFlowStatus.CONTINUE
+
+        # --- Act ---
+        await another_victim_effect.execute(
+            game_id=1,
+            player_id=1,
+            card_ids=[999],
+            target_set_id=5,
+        )
+
+        # --- Assert ---
+        mock_commands.steal_set.assert_called_once_with(
+            set_id=5, new_owner_id=1, game_id=1
+        )
+        assert mock_notificator.notify_set_stolen.await_args.kwargs["victim_id"] == 2
+
     @pytest.mark.asyncio
     async def test_execute_fails_if_reexecuting_effect_fails(
         self,
@@ -585,7 +635,7 @@ class TestCardsOffTheTableEffect:
         target_hand = [nsf_card1, other_card, nsf_card2]
 
         mock_queries.get_player_hand.return_value = target_hand
-        mock_commands.update_card_location.return_value = ResponseStatus.OK
+        mock_commands.move_cards.return_value = ResponseStatus.OK
 
         cards_to_discard = [nsf_card1, nsf_card2]
 
@@ -603,8 +653,15 @@ class TestCardsOffTheTableEffect:
             player_id=target_player_id, game_id=game_id
         )
 
-        # 2. Verificar que se llamó a descartar para cada carta NSF
-        assert mock_commands.update_card_location.call_count == 2
+        # 2. Verificar que se descartaron las cartas NSF en un solo lote
+        mock_commands.move_cards.assert_called_once_with(
+            game_id,
+            [
+                CardMove(card_id=10, location=CardLocation.DISCARD_PILE),
+                CardMove(card_id=11, location=CardLocation.DISCARD_PILE),
+            ],
+        )
+        mock_commands.update_card_location.assert_not_called()
 
         # 3. Verificar que se notificó correctamente
         mock_notificator.notify_cards_NSF_discarded.assert_awaited_once_with(
@@ -665,7 +722,7 @@ class TestCardsOffTheTableEffect:
 
         # --- Assert ---
         # 1. No se debe llamar a descartar ninguna carta
-        mock_commands.update_card_location.assert_not_called()
+        mock_commands.move_cards.assert_not_called()
 
         # 2. Se debe notificar con una lista vacía de cartas descartadas
         mock_notificator.notify_cards_NSF_discarded.assert_awaited_once_with(
@@ -704,7 +761,7 @@ class TestCardsOffTheTableEffect:
         )
 
         # --- Assert ---
-        mock_commands.update_card_location.assert_not_called()
+        mock_commands.move_cards.assert_not_called()
         mock_notificator.notify_cards_NSF_discarded.assert_awaited_once_with(
             game_id=game_id,
             source_player_id=source_player_id,
@@ -990,11 +1047,10 @@ class TestDelayTheMurdererEscapeEffect:
         discard_pile = [
             card_domain_factory(card_id=i, position=i) for i in range(1, 8)
         ]
-        cards_to_be_moved = discard_pile[2:]
         mock_queries.get_discard_pile.return_value = discard_pile
-        mock_queries.get_deck.return_value = []  # Mazo inicial vacío para simplificar
-        mock_commands.update_card_location.return_value = ResponseStatus.OK
-        mock_queries.get_deck.return_value = cards_to_be_moved
+        mock_queries.get_top_card.return_value = None  # Mazo inicial vacío
+        mock_commands.move_cards.return_value = ResponseStatus.OK
+        mock_queries.get_size_deck.return_value = 5
 
         # --- Act ---
         result = await delay_the_murderer_escape_effect.execute(
@@ -1002,15 +1058,18 @@ class TestDelayTheMurdererEscapeEffect:
         )
 
         # --- Assert ---
-        # 1. Se debe haber llamado a mover 5 cartas
-        assert mock_commands.update_card_location.call_count == 5
+        # 1. Se movieron 5 cartas en un solo lote
+        mock_commands.move_cards.assert_called_once()
+        moved_game_id, moves = mock_commands.move_cards.call_args.args
+        assert moved_game_id == game_id
+        assert len(moves) == 5
+        mock_commands.update_card_location.assert_not_called()
 
-        # 2. Las cartas movidas deben ser las de ID 3 a 7
-        moved_card_ids = {
-            call.kwargs["card_id"]
-            for call in mock_commands.update_card_location.call_args_list
-        }
-        assert moved_card_ids == {3, 4, 5, 6, 7}
+        # 2. Las cartas movidas deben ser las de ID 3 a 7, apiladas sobre
+        #    el mazo (posiciones 0..4, el orden lo decide el barajado)
+        assert {m.card_id for m in moves} == {3, 4, 5, 6, 7}
+        assert all(m.location == CardLocation.DRAW_PILE for m in moves)
+        assert sorted(m.position for m in moves) == [0, 1, 2, 3, 4]
 
         # 3. Se notificó el nuevo tamaño del mazo
         mock_notificator.notify_deck_updated.assert_awaited_once_with(
@@ -1037,17 +1096,13 @@ class TestDelayTheMurdererEscapeEffect:
         discard_pile = [
             card_domain_factory(card_id=i, position=i) for i in range(1, 4)
         ]
-        initial_deck = [
-            card_domain_factory(card_id=100, position=1)
-        ]
+        top_of_deck = card_domain_factory(card_id=100, position=1)
 
         mock_queries.get_discard_pile.return_value = discard_pile
-        mock_queries.get_deck.return_value = initial_deck + discard_pile
-        mock_commands.update_card_location.return_value = ResponseStatus.OK
-
-        # La llamada a get_deck() dentro del efecto devolverá el mazo inicial
-        # MÁS las 3 cartas que se movieron desde el descarte.
-        mock_queries.get_deck.return_value = initial_deck + discard_pile
+        mock_queries.get_top_card.return_value = top_of_deck
+        mock_commands.move_cards.return_value = ResponseStatus.OK
+        # El tamaño del mazo tras mover: la carta inicial MÁS las 3 movidas
+        mock_queries.get_size_deck.return_value = 4
 
         # --- Act ---
         await delay_the_murderer_escape_effect.execute(
@@ -1055,7 +1110,10 @@ class TestDelayTheMurdererEscapeEffect:
         )
 
         # --- Assert ---
-        assert mock_commands.update_card_location.call_count == 3
+        moves = mock_commands.move_cards.call_args.args[1]
+        assert {m.card_id for m in moves} == {1, 2, 3}
+        # Quedan encima del tope actual (position 1)
+        assert sorted(m.position for m in moves) == [2, 3, 4]
         mock_notificator.notify_deck_updated.assert_awaited_once_with(
             game_id=game_id, deck_size=4
         )  # 1 inicial + 3 movidas
@@ -1082,7 +1140,7 @@ class TestDelayTheMurdererEscapeEffect:
         )
 
         # --- Assert ---
-        mock_commands.update_card_location.assert_not_called()
+        mock_commands.move_cards.assert_not_called()
         mock_notificator.notify_deck_updated.assert_not_awaited()
         assert result == GameFlowStatus.CONTINUE
 
@@ -1122,7 +1180,7 @@ class TestEarlyTrainToPaddingtonEffect:
             card_domain_factory(card_id=i, position=i) for i in range(1, 11)
         ]
         mock_queries.get_deck.return_value = deck
-        mock_commands.update_card_location.return_value = ResponseStatus.OK
+        mock_commands.move_cards.return_value = ResponseStatus.OK
 
         # --- Act ---
         result = await early_train_to_paddington_effect.execute(
@@ -1130,15 +1188,15 @@ class TestEarlyTrainToPaddingtonEffect:
         )
 
         # --- Assert ---
-        # 1. Se debe haber llamado a mover 6 cartas
-        assert mock_commands.update_card_location.call_count == 6
-
-        # 2. Las cartas movidas deben ser las de ID 1 a 6
-        moved_card_ids = {
-            call.kwargs["card_id"]
-            for call in mock_commands.update_card_location.call_args_list
-        }
-        assert moved_card_ids == {1, 2, 3, 4, 5, 6}
+        # 1 y 2. Se movieron al descarte las 6 primeras (ID 1 a 6), en un lote
+        mock_commands.move_cards.assert_called_once_with(
+            game_id,
+            [
+                CardMove(card_id=i, location=CardLocation.DISCARD_PILE)
+                for i in range(1, 7)
+            ],
+        )
+        mock_commands.update_card_location.assert_not_called()
 
         # 3. Se notificó el nuevo tamaño del mazo (10 - 6 = 4)
         mock_notificator.notify_deck_updated.assert_awaited_once_with(
@@ -1162,7 +1220,7 @@ class TestEarlyTrainToPaddingtonEffect:
         game_id = 502
         deck = [card_domain_factory(card_id=i, position=i) for i in range(1, 5)]
         mock_queries.get_deck.return_value = deck
-        mock_commands.update_card_location.return_value = ResponseStatus.OK
+        mock_commands.move_cards.return_value = ResponseStatus.OK
 
         # --- Act ---
         await early_train_to_paddington_effect.execute(
@@ -1170,7 +1228,7 @@ class TestEarlyTrainToPaddingtonEffect:
         )
 
         # --- Assert ---
-        assert mock_commands.update_card_location.call_count == 4
+        assert len(mock_commands.move_cards.call_args.args[1]) == 4
         mock_notificator.notify_deck_updated.assert_awaited_once_with(
             game_id=game_id, deck_size=0
         )
@@ -1194,7 +1252,7 @@ class TestEarlyTrainToPaddingtonEffect:
         )
 
         # --- Assert ---
-        mock_commands.update_card_location.assert_not_called()
+        mock_commands.move_cards.assert_not_called()
         mock_notificator.notify_deck_updated.assert_not_awaited()
         assert result == GameFlowStatus.CONTINUE
 
@@ -1673,3 +1731,75 @@ class TestCardTradeEffect:
         # El oponente tendrá 5 cartas del iniciador para elegir después de que
         # se descarte CARD_TRADE
         mock_notificator.notify_player_to_choose_card_for_trade.assert_awaited_once()
+
+
+# =================================================================
+# --- Tests para el Efecto 'PointYourSuspicionsEffect' ---
+# =================================================================
+
+
+@pytest.fixture
+def point_your_suspicions_effect(
+    mock_queries: Mock, mock_commands: Mock, mock_notificator: AsyncMock
+) -> PointYourSuspicionsEffect:
+    """Crea una instancia del efecto con sus dependencias mockeadas."""
+    return PointYourSuspicionsEffect(
+        queries=mock_queries, commands=mock_commands, notifier=mock_notificator
+    )
+
+
+class TestPointYourSuspicionsEffect:
+    @pytest.mark.asyncio
+    async def test_execute_opens_the_round_without_leftover_votes(
+        self,
+        point_your_suspicions_effect: PointYourSuspicionsEffect,
+        mock_queries: Mock,
+        mock_commands: Mock,
+        mock_notificator: AsyncMock,
+    ):
+        """
+        Prueba que la ronda (identificada por la carta jugada) se limpia
+        antes de abrir la votación: si la misma carta ya se jugó, sus votos
+        viejos no cuentan.
+        """
+        # --- Arrange ---
+        game_id = 601
+        card_id = 42
+        mock_queries.get_players_in_game.return_value = [
+            Mock(player_id=1), Mock(player_id=2)
+        ]
+        mock_commands.clear_votes.return_value = ResponseStatus.OK
+
+        # --- Act ---
+        result = await point_your_suspicions_effect.execute(
+            game_id=game_id, player_id=1, card_ids=[card_id]
+        )
+
+        # --- Assert ---
+        assert result == GameFlowStatus.PAUSED
+        called = [c[0] for c in mock_commands.method_calls]
+        assert called.index("clear_votes") < called.index("update_pending_saga")
+        mock_commands.clear_votes.assert_called_once_with(game_id, card_id)
+        saga = mock_commands.update_pending_saga.call_args.args[1]
+        assert saga["round_id"] == card_id
+        assert saga["eligible_voters"] == [1, 2]
+        mock_notificator.notify_players_to_vote.assert_awaited_once_with(game_id)
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_if_the_round_cannot_be_cleared(
+        self,
+        point_your_suspicions_effect: PointYourSuspicionsEffect,
+        mock_queries: Mock,
+        mock_commands: Mock,
+    ):
+        """Prueba que si no se pueden borrar los votos viejos no se vota."""
+        # --- Arrange ---
+        mock_queries.get_players_in_game.return_value = []
+        mock_commands.clear_votes.return_value = ResponseStatus.ERROR
+
+        # --- Act & Assert ---
+        with pytest.raises(InternalGameError):
+            await point_your_suspicions_effect.execute(
+                game_id=601, player_id=1, card_ids=[42]
+            )
+        mock_commands.update_pending_saga.assert_not_called()
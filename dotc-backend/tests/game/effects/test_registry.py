@@ -0,0 +1,116 @@
+from collections import Counter
+from itertools import combinations_with_replacement
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.enums import CardLocation, CardType
+from app.domain.models import Card
+from app.game.effects.registry import (
+    EFFECT_REGISTRY,
+    EVENT_EFFECTS,
+    SET_RULES,
+)
+from app.game.effects.set_effects import (
+    BeresfordUncancellableEffect,
+    RevealChosenSecretEffect,
+    RevealSpecificSecretEffect,
+    StealSecretEffect,
+)
+from app.game.helpers.commutative_dict import PrioritizedCommutativeDict
+
+SET_CARD_TYPES = [
+    CardType.HARLEY_QUIN,
+    CardType.ARIADNE_OLIVER,
+    CardType.MISS_MARPLE,
+    CardType.PARKER_PYNE,
+    CardType.TOMMY_BERESFORD,
+    CardType.LADY_EILEEN,
+    CardType.TUPPENCE_BERESFORD,
+    CardType.HERCULE_POIROT,
+    CardType.MR_SATTERTHWAITE,
+    CardType.NOT_SO_FAST,
+]
+
+
+def cards(*card_types):
+    return [
+        Card(
+            card_id=i,
+            game_id=1,
+            card_type=card_type,
+            location=CardLocation.IN_HAND,
+        )
+        for i, card_type in enumerate(card_types)
+    ]
+
+
+def test_table_matches_the_rule_by_rule_scan_for_every_combo():
+    # Arrange: la clasificación de antes, regla por regla
+    legacy = PrioritizedCommutativeDict()
+    for priority, combo, effect in SET_RULES:
+        legacy.set(combo, effect, priority=priority)
+
+    # Act & Assert
+    for size in range(2, 7):
+        for combo in combinations_with_replacement(SET_CARD_TYPES, size):
+            expected = legacy.get_matching_effect(Counter(combo))
+            assert EFFECT_REGISTRY.classify(cards(*combo)) is expected, combo
+
+
+@pytest.mark.parametrize(
+    "played, effect",
+    [
+        ([CardType.ARIADNE_OLIVER], RevealChosenSecretEffect),
+        ([CardType.CARD_TRADE], EVENT_EFFECTS[CardType.CARD_TRADE]),
+        ([CardType.NOT_SO_FAST], None),
+        ([CardType.HERCULE_POIROT], None),
+        ([], None),
+        (
+            [CardType.TOMMY_BERESFORD, CardType.TUPPENCE_BERESFORD],
+            BeresfordUncancellableEffect,
+        ),
+        ([CardType.MR_SATTERTHWAITE, CardType.HARLEY_QUIN], StealSecretEffect),
+        (
+            [CardType.HERCULE_POIROT] * 3 + [CardType.NOT_SO_FAST],
+            RevealSpecificSecretEffect,
+        ),
+    ],
+)
+def test_classify(played, effect):
+    # Act & Assert
+    assert EFFECT_REGISTRY.classify(cards(*played)) is effect
+
+
+def test_sets_bigger_than_a_hand_are_resolved_and_memoized():
+    # Arrange: un set de Poirot que creció agregando cartas
+    played = [CardType.HERCULE_POIROT] * 5 + [CardType.HARLEY_QUIN] * 4
+
+    # Act
+    first = EFFECT_REGISTRY.classify(cards(*played))
+    second = EFFECT_REGISTRY.classify(cards(*played))
+
+    # Assert
+    assert first is second is RevealSpecificSecretEffect
+
+
+def test_signature_is_a_card_count_that_ignores_order_and_other_cards():
+    # Arrange
+    pyne, quin = CardType.PARKER_PYNE, CardType.HARLEY_QUIN
+
+    # Act
+    signature = EFFECT_REGISTRY.signature(
+        [pyne, CardType.NOT_SO_FAST, quin, CardType.EARLY_TRAIN, pyne]
+    )
+
+    # Assert
+    assert signature == EFFECT_REGISTRY.signature([quin, pyne, pyne])
+    assert signature != EFFECT_REGISTRY.signature([quin, pyne])
+
+
+def test_tables_are_read_only():
+    # Act & Assert
+    with pytest.raises(TypeError):
+        EVENT_EFFECTS[CardType.NOT_SO_FAST] = Mock()
+    with pytest.raises(TypeError):
+        EFFECT_REGISTRY.set_table[0] = Mock()
@@ -176,6 +176,9 @@ async def test_reveal_chosen_secret_success__happy_path():
     mock_write = MagicMock()
     mock_notifier = AsyncMock()
     effect = RevealChosenSecretEffect(mock_read, mock_write, mock_notifier)
+    mock_read.get_player_secrets.return_value = [
+        SecretCard(secret_id=9, game_id=1, player_id=3, role=PlayerRole.INNOCENT)
+    ]
     # effect._move_cards_to_played_area = AsyncMock()
     effect._prompt_for_chosen_secret = AsyncMock()
     # ACT
@@ -197,6 +200,23 @@ async def test_reveal_chosen_secret_no_target_player_id__sad_path():
         await effect.execute(1, 2, [7], target_player_id=None)
 
 
+@pytest.mark.asyncio
+async def test_reveal_chosen_secret_without_hidden_secrets__sad_path():
+    # ARRANGE: el objetivo ya reveló todo, el pedido trabaría la partida
+    mock_read = MagicMock()
+    mock_read.get_player_secrets.return_value = [
+        SecretCard(
+            secret_id=9, game_id=1, player_id=3,
+            role=PlayerRole.INNOCENT, is_revealed=True,
+        )
+    ]
+    effect = RevealChosenSecretEffect(mock_read, MagicMock(), AsyncMock())
+    # ACT & ASSERT
+    with pytest.raises(InvalidAction, match="secretos ocultos"):
+        await effect.execute(1, 2, [7], target_player_id=3)
+    effect.write.set_game_action_state.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_prompt_for_chosen_secret_success__happy_path():
     # ARRANGE
@@ -352,6 +372,9 @@ async def test_steal_secret_success__happy_path():
     mock_write = MagicMock()
     mock_notifier = AsyncMock()
     effect = StealSecretEffect(mock_read, mock_write, mock_notifier)
+    mock_read.get_player_secrets.return_value = [
+        SecretCard(secret_id=9, game_id=1, player_id=3, role=PlayerRole.INNOCENT)
+    ]
     mock_write.set_game_action_state.return_value = None
     mock_notifier.notify_player_to_reveal_secret = AsyncMock()
     # ACT
@@ -0,0 +1,258 @@
+from datetime import date
+
+import pytest
+
+from app.api.schemas import DrawSource
+from app.domain.enums import (
+    Avatar,
+    CardLocation,
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayerRole,
+)
+from app.domain.models import CardMove, GameHeader, GameSnapshot, PlayerInGame
+from app.game.engine.actions import (
+    CardDiscarded,
+    CardDrawn,
+    DiscardCard,
+    DiscardEffectTriggered,
+    DraftRefilled,
+    DrawCard,
+    FinishTurn,
+    MurdererEscaped,
+    TurnPassed,
+)
+from app.game.engine.reducer import apply
+from app.game.engine.state import GameState, diff
+from app.game.exceptions import (
+    ActionConflict,
+    CardNotFound,
+    InvalidAction,
+    NotYourCard,
+    NotYourTurn,
+    PlayerNotInGame,
+)
+
+P1, P2, P3 = 1, 2, 3
+
+
+def make_state(**overrides) -> GameState:
+    """Partida de 3 jugadores en el turno de P1, con mano de 5 cartas."""
+    card_types = {i: CardType.MISS_MARPLE for i in range(1, 31)}
+    card_types[30] = CardType.EARLY_TRAIN
+    defaults = dict(
+        game_id=7,
+        turn_order=(P1, P2, P3),
+        current_turn_player_id=P1,
+        murderer_id=P2,
+        accomplice_id=P3,
+        card_types=card_types,
+        hands={P1: (1, 2, 3, 4, 5), P2: (6, 7), P3: ()},
+        deck=(10, 11, 12),
+        draft=(20, 21),
+        discard_pile=(25, 26),
+    )
+    defaults.update(overrides)
+    return GameState(**defaults)
+
+
+# =================================================================
+# 🃏 ROBAR
+# =================================================================
+
+
+def test_draw_from_deck_takes_the_top_card():
+    # Arrange
+    state = make_state()
+
+    # Act
+    new_state, events = apply(state, DrawCard(player_id=P1, source=DrawSource.DECK))
+
+    # Assert
+    assert new_state.hands[P1] == (1, 2, 3, 4, 5, 10)
+    assert new_state.deck == (11, 12)
+    assert events == [CardDrawn(player_id=P1, card_id=10, source=DrawSource.DECK)]
+    # El estado original no cambia
+    assert state.deck == (10, 11, 12) and state.hands[P1] == (1, 2, 3, 4, 5)
+
+
+def test_draw_from_draft_refills_the_same_slot():
+    # Arrange
+    state = make_state()
+
+    # Act
+    new_state, events = apply(
+        state, DrawCard(player_id=P1, source=DrawSource.DRAFT, card_id=20)
+    )
+
+    # Assert
+    assert new_state.draft == (10, 21)
+    assert new_state.deck == (11, 12)
+    assert events[1] == DraftRefilled(card_taken_id=20, new_card_id=10)
+
+
+def test_draw_from_discard_needs_look_into_the_ashes():
+    # Arrange
+    state = make_state()
+    awaiting = make_state(action_state=GameActionState.AWAITING_SELECTION_FOR_CARD)
+
+    # Act
+    new_state, _ = apply(
+        awaiting, DrawCard(player_id=P1, source=DrawSource.DISCARD, card_id=26)
+    )
+
+    # Assert
+    with pytest.raises(InvalidAction, match="robar del descarte"):
+        apply(state, DrawCard(player_id=P1, source=DrawSource.DISCARD, card_id=26))
+    assert new_state.discard_pile == (25,)
+    assert new_state.action_state is GameActionState.NONE
+
+
+@pytest.mark.parametrize(
+    "action, error",
+    [
+        (DrawCard(player_id=P2, source=DrawSource.DECK), NotYourTurn),
+        (DrawCard(player_id=99, source=DrawSource.DECK), PlayerNotInGame),
+        (DrawCard(player_id=P1, source=DrawSource.DRAFT), InvalidAction),
+        (DrawCard(player_id=P1, source=DrawSource.DRAFT, card_id=10), CardNotFound),
+    ],
+)
+def test_draw_rule_violations(action, error):
+    # Act & Assert
+    with pytest.raises(error):
+        apply(make_state(), action)
+
+
+def test_draw_with_six_cards_is_rejected():
+    # Arrange
+    state = make_state(hands={P1: (1, 2, 3, 4, 5, 6), P2: (), P3: ()})
+
+    # Act & Assert
+    with pytest.raises(InvalidAction, match="ya tienes 6"):
+        apply(state, DrawCard(player_id=P1, source=DrawSource.DECK))
+
+
+def test_last_card_lets_the_murderer_escape():
+    # Arrange
+    state = make_state(deck=(10,), draft=())
+
+    # Act
+    new_state, events = apply(state, DrawCard(player_id=P1, source=DrawSource.DECK))
+
+    # Assert
+    assert new_state.status is GameStatus.FINISHED
+    assert events[-1] == MurdererEscaped(murderer_id=P2, accomplice_id=P3)
+    with pytest.raises(ActionConflict):
+        apply(new_state, FinishTurn(player_id=P1))
+
+
+# =================================================================
+# 🗑️ DESCARTAR Y TERMINAR EL TURNO
+# =================================================================
+
+
+def test_discard_moves_the_card_to_the_pile():
+    # Act
+    new_state, events = apply(make_state(), DiscardCard(player_id=P1, card_id=3))
+
+    # Assert
+    assert new_state.hands[P1] == (1, 2, 4, 5)
+    assert new_state.discard_pile == (25, 26, 3)
+    assert events == [CardDiscarded(player_id=P1, card_id=3)]
+    with pytest.raises(NotYourCard):
+        apply(make_state(), DiscardCard(player_id=P1, card_id=6))
+
+
+def test_discarding_early_train_triggers_its_effect():
+    # Arrange
+    state = make_state(hands={P1: (30,), P2: (), P3: ()})
+
+    # Act
+    _, events = apply(state, DiscardCard(player_id=P1, card_id=30))
+
+    # Assert
+    assert events[-1] == DiscardEffectTriggered(player_id=P1, card_id=30)
+
+
+def test_finish_turn_needs_six_cards_and_wraps_around():
+    # Arrange
+    six = (1, 2, 3, 4, 5, 6)
+    state = make_state(current_turn_player_id=P3, hands={P1: (), P2: (), P3: six})
+
+    # Act
+    new_state, events = apply(state, FinishTurn(player_id=P3))
+
+    # Assert
+    assert new_state.current_turn_player_id == P1
+    assert events == [TurnPassed(player_id=P3, next_player_id=P1)]
+    with pytest.raises(InvalidAction, match="menos de 6"):
+        apply(make_state(), FinishTurn(player_id=P1))
+
+
+# =================================================================
+# 💾 FOTO DE LA BD Y DIFF
+# =================================================================
+
+
+def test_from_snapshot_orders_zones_and_turns():
+    # Arrange
+    def player(pid, birth, role):
+        return PlayerInGame(
+            player_id=pid,
+            player_name=f"p{pid}",
+            player_birth_date=birth,
+            player_avatar=Avatar.DEFAULT,
+            player_role=role,
+        )
+
+    snapshot = GameSnapshot(
+        header=GameHeader(
+            id=7, name="g", min_players=2, max_players=6, host_id=P1,
+            status=GameStatus.IN_PROGRESS, current_turn_player_id=P2,
+        ),
+        players=[
+            player(P1, date(2000, 3, 1), PlayerRole.INNOCENT),
+            player(P2, date(2000, 9, 15), PlayerRole.MURDERER),
+        ],
+        cards=[
+            (1, CardType.MISS_MARPLE, CardLocation.DRAW_PILE, None, 1),
+            (2, CardType.MISS_MARPLE, CardLocation.DRAW_PILE, None, 9),
+            (3, CardType.NOT_SO_FAST, CardLocation.IN_HAND, P1, None),
+            (4, CardType.MISS_MARPLE, CardLocation.DRAFT, None, None),
+            (5, CardType.MISS_MARPLE, CardLocation.PLAYED, P1, None),
+            (6, CardType.EARLY_TRAIN, CardLocation.DISCARD_PILE, None, 30),
+            (7, CardType.EARLY_TRAIN, CardLocation.DISCARD_PILE, None, None),
+            (8, CardType.EARLY_TRAIN, CardLocation.DISCARD_PILE, None, 12),
+        ],
+    )
+
+    # Act
+    state = GameState.from_snapshot(snapshot)
+
+    # Assert
+    assert state.turn_order == (P2, P1)
+    assert state.deck == (2, 1)
+    assert state.hands == {P1: (3,), P2: ()}
+    assert state.draft == (4,)
+    # El descarte va por 'position' (no por id): el tope es la última
+    assert state.discard_pile == (7, 8, 6)
+    assert state.murderer_id == P2 and state.accomplice_id is None
+    assert state.card_types[5] == CardType.MISS_MARPLE
+
+
+def test_diff_lists_only_what_changed():
+    # Arrange
+    state = make_state(action_state=GameActionState.AWAITING_SELECTION_FOR_CARD)
+    drawn, _ = apply(state, DrawCard(player_id=P1, source=DrawSource.DISCARD, card_id=25))
+
+    # Act
+    changes = diff(state, drawn)
+
+    # Assert
+    assert changes.moves == [
+        CardMove(card_id=25, location=CardLocation.IN_HAND, owner_id=P1)
+    ]
+    assert changes.action_state_cleared
+    assert changes.current_turn_player_id is None
+    assert diff(state, state).is_empty
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, MagicMock
 
 # --------------------------------------------------------------------------
 # --- 1. Importaciones de Interfaces y Clases a Mockear ---
@@ -39,6 +39,8 @@ def mock_commands() -> Mock:
     Se reinicia para cada test.
     """
     mock = Mock(spec=ICommandManager)
+    # La unidad de trabajo real commitea al salir; en los tests es un no-op.
+    mock.unit_of_work.return_value = MagicMock()
     return mock
 
 
@@ -129,3 +131,90 @@ def turn_service(
         effect_executor=mock_executor,
         turn_utils=mock_turn_utils,
     )
+
+
+# --------------------------------------------------------------------------
+# --- 5. Foto de la partida para las acciones que pasan por el motor ---
+# --------------------------------------------------------------------------
+from datetime import date
+
+from app.domain.enums import (
+    Avatar,
+    CardLocation,
+    GameStatus,
+    PlayerRole,
+    ResponseStatus,
+)
+from app.domain.models import GameHeader, GameSnapshot, PlayerInGame
+
+
+@pytest.fixture
+def game_snapshot(mock_queries: Mock, mock_commands: Mock):
+    """
+    Fábrica: arma un GameSnapshot con las cartas dadas y lo deja como
+    respuesta de get_game_snapshot. Las lecturas puntuales de un robo
+    (cabecera, mano, tope del mazo, draft, descarte y roles) responden con
+    las mismas cartas. Los commands que usa GameStateStore responden OK
+    salvo que el test diga otra cosa.
+    """
+    mock_commands.move_cards.return_value = ResponseStatus.OK
+    mock_commands.set_current_turn.return_value = ResponseStatus.OK
+
+    def build(
+        *cards,
+        game_id=101,
+        players=(1, 2),
+        current_turn=1,
+        action_state=None,
+        murderer_id=2,
+        accomplice_id=None,
+    ) -> GameSnapshot:
+        roles = {murderer_id: PlayerRole.MURDERER, accomplice_id: PlayerRole.ACCOMPLICE}
+        snapshot = GameSnapshot(
+            header=GameHeader(
+                id=game_id, name="t", min_players=2, max_players=6,
+                host_id=players[0], status=GameStatus.IN_PROGRESS,
+                player_count=len(players), current_turn_player_id=current_turn,
+                action_state=action_state,
+            ),
+            players=[
+                PlayerInGame(
+                    player_id=pid, player_name=f"p{pid}",
+                    # Cumpleaños cada vez más lejos del 15/09: el orden de turno es el de `players`
+                    player_birth_date=date(2000, 9, 15 + i),
+                    player_avatar=Avatar.DEFAULT,
+                    player_role=roles.get(pid, PlayerRole.INNOCENT),
+                )
+                for i, pid in enumerate(players)
+            ],
+            cards=[
+                (c.card_id, c.card_type, c.location, c.player_id, c.position)
+                for c in cards
+            ],
+        )
+        mock_queries.get_game_snapshot.return_value = snapshot
+
+        def located(location):
+            return [c for c in cards if c.location == location]
+
+        deck = sorted(
+            located(CardLocation.DRAW_PILE),
+            key=lambda c: c.position or 0,
+            reverse=True,
+        )
+        mock_queries.get_game_header.return_value = snapshot.header
+        mock_queries.is_player_in_game.side_effect = (
+            lambda game_id, player_id: player_id in players
+        )
+        mock_queries.get_player_hand.side_effect = lambda game_id, player_id: [
+            c for c in located(CardLocation.IN_HAND) if c.player_id == player_id
+        ]
+        mock_queries.get_deck.side_effect = lambda game_id, limit=None: deck[:limit]
+        mock_queries.get_size_deck.return_value = len(deck)
+        mock_queries.get_draft.return_value = located(CardLocation.DRAFT)
+        mock_queries.get_discard_pile.return_value = located(CardLocation.DISCARD_PILE)
+        mock_queries.get_murderer_id.return_value = murderer_id
+        mock_queries.get_accomplice_id.return_value = accomplice_id
+        return snapshot
+
+    return build
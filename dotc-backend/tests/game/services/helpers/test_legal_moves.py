@@ -0,0 +1,344 @@
+from itertools import combinations
+from typing import Dict, List
+
+import pytest
+
+from app.domain.enums import (
+    CardLocation,
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayCardActionType,
+)
+from app.domain.models import Card, GameHeader
+from app.game.effects.registry import EFFECT_REGISTRY
+from app.game.helpers.legal_moves import NSF_ACTION, LegalMoveFinder
+
+GAME_ID = 1
+ME, OTHER = 10, 20
+
+
+def make_header(**fields) -> GameHeader:
+    defaults = dict(
+        id=GAME_ID,
+        name="mesa",
+        min_players=2,
+        max_players=6,
+        host_id=ME,
+        status=GameStatus.IN_PROGRESS,
+        player_count=2,
+        current_turn_player_id=ME,
+        action_state=GameActionState.NONE,
+    )
+    defaults.update(fields)
+    return GameHeader(**defaults)
+
+
+def make_hand(*card_types: CardType, first_id: int = 1) -> List[Card]:
+    return [
+        Card(
+            card_id=first_id + i,
+            game_id=GAME_ID,
+            card_type=card_type,
+            location=CardLocation.IN_HAND,
+            player_id=ME,
+        )
+        for i, card_type in enumerate(card_types)
+    ]
+
+
+def make_set(set_id: int, owner: int, *card_types: CardType) -> List[Card]:
+    return [
+        Card(
+            card_id=100 * set_id + i,
+            game_id=GAME_ID,
+            card_type=card_type,
+            location=CardLocation.PLAYED,
+            player_id=owner,
+            set_id=set_id,
+        )
+        for i, card_type in enumerate(card_types)
+    ]
+
+
+@pytest.fixture
+def finder() -> LegalMoveFinder:
+    return LegalMoveFinder()
+
+
+def find(finder, hand, sets=None, social_disgrace=False, **header_fields):
+    return finder.find(
+        make_header(**header_fields),
+        ME,
+        hand,
+        sets or {},
+        social_disgrace,
+    )
+
+
+def by_action_type(moves, action_type) -> List:
+    return [m for m in moves if m.action_type == action_type]
+
+
+# ═══════════════════════════════════════════════════════════
+# 🃏 SETS NUEVOS Y EVENTOS
+# ═══════════════════════════════════════════════════════════
+
+
+def test_new_sets_match_a_brute_force_over_every_subset(finder):
+    # Arrange
+    hand = make_hand(
+        CardType.HERCULE_POIROT,
+        CardType.HERCULE_POIROT,
+        CardType.HARLEY_QUIN,
+        CardType.TOMMY_BERESFORD,
+        CardType.TUPPENCE_BERESFORD,
+        CardType.NOT_SO_FAST,
+    )
+    set_types = EFFECT_REGISTRY.set_card_types
+    expected = set()
+    for size in range(2, len(hand) + 1):
+        for subset in combinations(hand, size):
+            if all(c.card_type in set_types for c in subset):
+                if EFFECT_REGISTRY.classify(list(subset)):
+                    expected.add(tuple(sorted(c.card_type.value for c in subset)))
+
+    # Act
+    moves = by_action_type(find(finder, hand), PlayCardActionType.FORM_NEW_SET)
+
+    # Assert
+    types_of = {c.card_id: c.card_type.value for c in hand}
+    listed = [tuple(sorted(types_of[i] for i in m.card_ids)) for m in moves]
+    assert len(listed) == len(set(listed))  # una jugada por multiconjunto
+    assert set(listed) == expected
+
+
+def test_interchangeable_cards_use_the_lowest_ids(finder):
+    # Arrange
+    hand = make_hand(*[CardType.PARKER_PYNE] * 3)
+
+    # Act
+    moves = find(finder, hand)
+
+    # Assert
+    assert [(m.card_ids, m.effect) for m in moves] == [
+        ([1, 2], "HideSecretEffect"),
+        ([1, 2, 3], "HideSecretEffect"),
+    ]
+
+
+def test_events_skip_devious_cards_nsf_and_ariadne(finder):
+    # Arrange
+    hand = make_hand(
+        CardType.CARD_TRADE,
+        CardType.CARD_TRADE,
+        CardType.SOCIAL_FAUX_PAS,
+        CardType.BLACKMAILED,
+        CardType.NOT_SO_FAST,
+        CardType.ARIADNE_OLIVER,
+    )
+
+    # Act
+    moves = find(finder, hand)
+
+    # Assert
+    assert [(m.action_type, m.card_ids) for m in moves] == [
+        (PlayCardActionType.PLAY_EVENT, [1]),
+    ]
+    assert moves[0].action == "play"
+
+
+# ═══════════════════════════════════════════════════════════
+# ➕ AGREGAR A UN SET
+# ═══════════════════════════════════════════════════════════
+
+
+def test_detectives_join_only_own_sets_the_registry_accepts(finder):
+    # Arrange
+    hand = make_hand(CardType.MISS_MARPLE, CardType.LADY_EILEEN)
+    sets = {
+        1: make_set(1, ME, *[CardType.MISS_MARPLE] * 3),
+        2: make_set(2, ME, CardType.PARKER_PYNE, CardType.PARKER_PYNE),
+        3: make_set(3, OTHER, *[CardType.MISS_MARPLE] * 3),
+    }
+
+    # Act
+    moves = find(finder, hand, sets)
+
+    # Assert: igual que play_card, cualquier set propio con efecto
+    additions = by_action_type(moves, PlayCardActionType.ADD_TO_EXISTING_SET)
+    assert [(m.card_ids, m.target_set_id) for m in additions] == [
+        ([1], 1),
+        ([1], 2),
+        ([2], 1),
+        ([2], 2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "added, effect",
+    [
+        (CardType.TOMMY_BERESFORD, "BeresfordUncancellableEffect"),
+        (CardType.HARLEY_QUIN, "RevealChosenSecretEffect"),
+    ],
+)
+def test_a_different_detective_can_join_an_own_set(finder, added, effect):
+    # Arrange
+    hand = make_hand(added)
+    sets = {1: make_set(1, ME, CardType.TUPPENCE_BERESFORD)}
+
+    # Act
+    moves = find(finder, hand, sets)
+
+    # Assert
+    additions = by_action_type(moves, PlayCardActionType.ADD_TO_EXISTING_SET)
+    assert [(m.card_ids, m.target_set_id, m.effect) for m in additions] == [
+        ([1], 1, effect)
+    ]
+
+
+def test_an_ariadne_from_someone_else_does_not_make_the_set_foreign(finder):
+    # Arrange
+    hand = make_hand(CardType.MISS_MARPLE)
+    set_cards = make_set(1, ME, *[CardType.MISS_MARPLE] * 3)
+    set_cards += make_set(1, OTHER, CardType.ARIADNE_OLIVER)[:1]
+    set_cards[-1] = set_cards[-1].model_copy(update={"card_id": 199})
+
+    # Act
+    moves = find(finder, hand, {1: set_cards})
+
+    # Assert
+    additions = by_action_type(moves, PlayCardActionType.ADD_TO_EXISTING_SET)
+    assert [(m.card_ids, m.target_set_id) for m in additions] == [([1], 1)]
+
+
+def test_ariadne_joins_any_set_on_the_table(finder):
+    # Arrange
+    hand = make_hand(CardType.ARIADNE_OLIVER)
+    sets = {
+        1: make_set(1, ME, CardType.PARKER_PYNE, CardType.PARKER_PYNE),
+        2: make_set(2, OTHER, CardType.LADY_EILEEN, CardType.LADY_EILEEN),
+    }
+
+    # Act
+    moves = find(finder, hand, sets)
+
+    # Assert
+    assert [(m.action_type, m.target_set_id, m.effect) for m in moves] == [
+        (PlayCardActionType.ADD_TO_EXISTING_SET, 1, "RevealChosenSecretEffect"),
+        (PlayCardActionType.ADD_TO_EXISTING_SET, 2, "RevealChosenSecretEffect"),
+    ]
+
+
+# ═══════════════════════════════════════════════════════════
+# 🚦 ESTADO DE LA PARTIDA
+# ═══════════════════════════════════════════════════════════
+
+
+def test_social_disgrace_only_allows_its_events(finder):
+    # Arrange
+    hand = make_hand(
+        CardType.POINT_YOUR_SUSPICIONS,
+        CardType.DEAD_CARD_FOLLY,
+        CardType.PARKER_PYNE,
+        CardType.PARKER_PYNE,
+    )
+    sets = {1: make_set(1, ME, CardType.PARKER_PYNE, CardType.PARKER_PYNE)}
+
+    # Act
+    moves = find(finder, hand, sets, social_disgrace=True)
+
+    # Assert
+    assert [(m.action_type, m.card_ids) for m in moves] == [
+        (PlayCardActionType.PLAY_EVENT, [1]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "header_fields",
+    [
+        {"current_turn_player_id": OTHER},
+        {"action_state": GameActionState.AWAITING_VOTES},
+        {"status": GameStatus.FINISHED},
+    ],
+)
+def test_no_moves_outside_the_players_window(finder, header_fields):
+    # Arrange
+    hand = make_hand(CardType.CARD_TRADE, CardType.PARKER_PYNE, CardType.PARKER_PYNE)
+
+    # Act & Assert
+    assert find(finder, hand, **header_fields) == ()
+
+
+def test_pending_nsf_offers_one_nsf_unless_player_made_the_last_play(finder):
+    # Arrange
+    header = make_header(
+        action_state=GameActionState.PENDING_NSF, current_turn_player_id=OTHER
+    )
+    hand = make_hand(
+        CardType.NOT_SO_FAST, CardType.NOT_SO_FAST, CardType.CARD_TRADE
+    )
+
+    # Act
+    open_window = finder.find(header, ME, hand, {}, False, nsf_blocked=False)
+    blocked = finder.find(header, ME, hand, {}, False, nsf_blocked=True)
+
+    # Assert
+    assert [(m.action, m.action_type, m.card_ids) for m in open_window] == [
+        (NSF_ACTION, PlayCardActionType.INSTANT, [1]),
+    ]
+    assert blocked == ()
+
+
+# ═══════════════════════════════════════════════════════════
+# 🗄️ CACHÉ
+# ═══════════════════════════════════════════════════════════
+
+
+def test_cache_reuses_moves_until_the_hand_changes(finder):
+    # Arrange
+    hand = make_hand(CardType.PARKER_PYNE, CardType.PARKER_PYNE)
+
+    # Act
+    first = find(finder, hand)
+    second = find(finder, list(reversed(hand)))
+    after_draw = find(finder, hand + make_hand(CardType.CARD_TRADE, first_id=9))
+
+    # Assert
+    assert second is first
+    assert after_draw is not first
+    assert (finder.hits, finder.misses) == (1, 2)
+
+
+def test_cache_is_refreshed_when_the_table_or_turn_changes(finder):
+    # Arrange
+    hand = make_hand(CardType.ARIADNE_OLIVER)
+    sets: Dict[int, List[Card]] = {}
+
+    # Act
+    empty_table = find(finder, hand, sets)
+    with_set = find(
+        finder, hand, {1: make_set(1, OTHER, *[CardType.LADY_EILEEN] * 2)}
+    )
+    not_my_turn = find(finder, hand, current_turn_player_id=OTHER)
+
+    # Assert
+    assert empty_table == ()
+    assert len(with_set) == 1
+    assert not_my_turn == ()
+    assert finder.hits == 0
+
+
+def test_cache_evicts_the_least_recently_used_entry():
+    # Arrange
+    finder = LegalMoveFinder(cache_size=1)
+    hand = make_hand(CardType.CARD_TRADE)
+    header = make_header()
+
+    # Act
+    finder.find(header, ME, hand, {}, False)
+    finder.find(header, OTHER, hand, {}, False)
+    finder.find(header, ME, hand, {}, False)
+
+    # Assert
+    assert (finder.hits, finder.misses) == (0, 3)
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, ANY
 
 from app.game.helpers.notificators import Notificator
+from app.game.helpers.state_deltas import StatePatches
 
 from app.websockets.interfaces import IConnectionManager
 from app.websockets.protocol import details
@@ -513,3 +514,137 @@ class TestNotificator:
         assert call_args.kwargs["game_id"] == game_id
         assert call_args.kwargs["player_id"] == player_id
 
+
+
+# --- Notificaciones diferidas (unidad de trabajo) ---
+
+
+async def test_deferred_sends_after_block_in_order(
+    notificator: Notificator, mock_ws_manager: MagicMock
+):
+    # Arrange & Act
+    async with notificator.deferred():
+        await notificator.notify_new_turn(game_id=1, turn_player_id=2)
+        await notificator.notify_game_removed(game_id=1)
+        # Dentro del bloque todavía no se envió nada
+        mock_ws_manager.broadcast_to_game.assert_not_awaited()
+        mock_ws_manager.broadcast_to_lobby.assert_not_awaited()
+
+    # Assert
+    mock_ws_manager.broadcast_to_game.assert_awaited_once()
+    mock_ws_manager.broadcast_to_lobby.assert_awaited_once()
+    assert notificator.manager is mock_ws_manager
+
+
+async def test_deferred_drops_notifications_on_exception(
+    notificator: Notificator, mock_ws_manager: MagicMock
+):
+    # Arrange & Act
+    with pytest.raises(ValueError):
+        async with notificator.deferred():
+            await notificator.notify_new_turn(game_id=1, turn_player_id=2)
+            raise ValueError("la acción falló")
+
+    # Assert
+    mock_ws_manager.broadcast_to_game.assert_not_awaited()
+    assert notificator.manager is mock_ws_manager
+
+
+async def test_deferred_is_reentrant(
+    notificator: Notificator, mock_ws_manager: MagicMock
+):
+    # Arrange & Act
+    async with notificator.deferred():
+        async with notificator.deferred():
+            await notificator.notify_new_turn(game_id=1, turn_player_id=2)
+        # El bloque interno no envía: lo hace el externo
+        mock_ws_manager.broadcast_to_game.assert_not_awaited()
+
+    # Assert
+    mock_ws_manager.broadcast_to_game.assert_awaited_once()
+
+
+async def test_savepoint_drops_only_what_its_block_queued(
+    notificator: Notificator, mock_ws_manager: MagicMock
+):
+    # Arrange & Act
+    async with notificator.deferred():
+        await notificator.notify_new_turn(game_id=1, turn_player_id=2)
+        with pytest.raises(ValueError):
+            async with notificator.savepoint():
+                await notificator.notify_game_removed(game_id=1)
+                raise ValueError("el efecto rechazó la jugada")
+
+    # Assert
+    mock_ws_manager.broadcast_to_game.assert_awaited_once()
+    mock_ws_manager.broadcast_to_lobby.assert_not_awaited()
+
+
+async def test_deferred_publishes_state_patches_before_queued_messages(
+    mock_ws_manager: MagicMock,
+):
+    # Arrange
+    deltas = MagicMock()
+    deltas.collect.return_value = {
+        1: StatePatches(
+            public=[details.TurnPatch(turn_player_id=2)],
+            private={
+                2: [
+                    details.CardPatch(
+                        card_id=7,
+                        location=CardLocation.IN_HAND,
+                        owner_id=2,
+                        card_type=CardType.HERCULE_POIROT,
+                    )
+                ]
+            },
+        )
+    }
+    notificator = Notificator(ws_manager=mock_ws_manager, deltas=deltas)
+    calls = []
+    mock_ws_manager.broadcast_to_game.side_effect = (
+        lambda game_id, message: calls.append(message.details.event)
+    )
+
+    # Act
+    async with notificator.deferred():
+        await notificator.notify_new_turn(game_id=1, turn_player_id=2)
+
+    # Assert
+    assert calls == [details.WSEvent.STATE_PATCH, details.WSEvent.NEW_TURN]
+    private = mock_ws_manager.send_to_player.call_args.kwargs
+    assert private["player_id"] == 2
+    assert private["message"].details.patches[0].card_id == 7
+
+
+async def test_deferred_discards_state_patches_on_exception(
+    mock_ws_manager: MagicMock,
+):
+    # Arrange
+    deltas = MagicMock()
+    notificator = Notificator(ws_manager=mock_ws_manager, deltas=deltas)
+
+    # Act
+    with pytest.raises(ValueError):
+        async with notificator.deferred():
+            raise ValueError("la acción falló")
+
+    # Assert
+    deltas.discard.assert_called_once()
+    deltas.collect.assert_not_called()
+
+
+async def test_notify_hands_updated_broadcasts_only_in_refetch_mode(
+    notificator: Notificator, mock_ws_manager: MagicMock
+):
+    # Arrange
+    delta_notificator = Notificator(ws_manager=mock_ws_manager, deltas=MagicMock())
+
+    # Act
+    await notificator.notify_hands_updated(game_id=1)
+    await delta_notificator.notify_hands_updated(game_id=1)
+
+    # Assert
+    mock_ws_manager.broadcast_to_game.assert_awaited_once()
+    message = mock_ws_manager.broadcast_to_game.call_args.kwargs["message"]
+    assert message.details.event == details.WSEvent.HANDS_UPDATED
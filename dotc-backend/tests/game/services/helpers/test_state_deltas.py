@@ -0,0 +1,199 @@
+import pytest
+from unittest.mock import Mock
+
+from app.game.helpers.state_deltas import (
+    DELTA_MODE,
+    REFETCH_MODE,
+    STATE_SYNC_ENV,
+    StateDeltas,
+    get_state_sync_mode,
+)
+from app.domain.models import Card, CardMove, SecretCard
+from app.domain.enums import CardLocation, CardType, PlayerRole, ResponseStatus
+from app.websockets.protocol.details import (
+    CardPatch,
+    SecretPatch,
+    SocialDisgracePatch,
+    TurnPatch,
+)
+
+GAME_ID = 1
+
+
+@pytest.fixture
+def deltas(mock_queries: Mock) -> StateDeltas:
+    return StateDeltas(queries=mock_queries)
+
+
+def make_card(card_id: int, location: CardLocation, player_id=None, set_id=None):
+    return Card(
+        card_id=card_id,
+        game_id=GAME_ID,
+        player_id=player_id,
+        location=location,
+        set_id=set_id,
+        card_type=CardType.HERCULE_POIROT,
+    )
+
+
+def make_secret(secret_id: int, player_id: int, is_revealed: bool):
+    return SecretCard(
+        secret_id=secret_id,
+        game_id=GAME_ID,
+        player_id=player_id,
+        role=PlayerRole.MURDERER,
+        is_revealed=is_revealed,
+    )
+
+
+# ═══════════════════════════════════════════════════════════
+# ⚙️ MODO DE SINCRONIZACIÓN
+# ═══════════════════════════════════════════════════════════
+
+
+def test_state_sync_mode_defaults_to_refetch(monkeypatch):
+    # Arrange
+    monkeypatch.delenv(STATE_SYNC_ENV, raising=False)
+    # Act & Assert
+    assert get_state_sync_mode() == REFETCH_MODE
+
+
+def test_state_sync_mode_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(STATE_SYNC_ENV, "DELTA")
+    # Act & Assert
+    assert get_state_sync_mode() == DELTA_MODE
+
+
+def test_state_sync_mode_rejects_unknown(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(STATE_SYNC_ENV, "push")
+    # Act & Assert
+    with pytest.raises(ValueError):
+        get_state_sync_mode()
+
+
+# ═══════════════════════════════════════════════════════════
+# 📝 REGISTRO DE CAMBIOS
+# ═══════════════════════════════════════════════════════════
+
+
+def test_tracker_records_successful_commands(
+    deltas: StateDeltas, mock_commands: Mock
+):
+    # Arrange
+    mock_commands.move_cards.return_value = ResponseStatus.OK
+    mock_commands.update_card_location.return_value = ResponseStatus.OK
+    mock_commands.reveal_secret_card.return_value = ResponseStatus.OK
+    mock_commands.set_current_turn.return_value = ResponseStatus.OK
+    mock_commands.set_player_social_disgrace.return_value = ResponseStatus.OK
+    write = deltas.track(mock_commands)
+
+    # Act
+    write.move_cards(
+        GAME_ID,
+        [CardMove(card_id=7, location=CardLocation.IN_HAND, owner_id=2)],
+    )
+    write.update_card_location(42, GAME_ID, CardLocation.IN_HAND, owner_id=3)
+    write.steal_set(set_id=5, new_owner_id=3, game_id=GAME_ID)
+    write.reveal_secret_card(secret_id=9, game_id=GAME_ID, is_revealed=True)
+    write.set_current_turn(GAME_ID, 3)
+    write.set_player_social_disgrace(
+        player_id=2, game_id=GAME_ID, is_disgraced=True
+    )
+
+    # Assert
+    changes = deltas.changes[GAME_ID]
+    assert changes.card_ids == [7, 42]
+    assert changes.set_ids == [5]
+    assert changes.secret_ids == [9]
+    assert changes.turn_player_id == 3
+    assert changes.disgrace == {2: True}
+    mock_commands.steal_set.assert_called_once_with(5, 3, GAME_ID)
+
+
+def test_tracker_ignores_failed_commands_and_delegates_the_rest(
+    deltas: StateDeltas, mock_commands: Mock
+):
+    # Arrange
+    mock_commands.update_card_location.return_value = ResponseStatus.CARD_NOT_FOUND
+    mock_commands.clear_game_action_state.return_value = ResponseStatus.OK
+    write = deltas.track(mock_commands)
+
+    # Act
+    write.update_card_location(7, GAME_ID, CardLocation.DISCARD_PILE)
+    status = write.clear_game_action_state(GAME_ID)
+
+    # Assert
+    assert status == ResponseStatus.OK
+    assert deltas.changes == {}
+
+
+# ═══════════════════════════════════════════════════════════
+# 🧩 ARMADO DE PARCHES
+# ═══════════════════════════════════════════════════════════
+
+
+def test_collect_hides_hand_cards_and_secrets_from_the_broadcast(
+    deltas: StateDeltas, mock_queries: Mock
+):
+    # Arrange
+    cards = {
+        7: make_card(7, CardLocation.IN_HAND, player_id=2),
+        8: make_card(8, CardLocation.DISCARD_PILE),
+    }
+    mock_queries.get_card.side_effect = lambda card_id, game_id: cards[card_id]
+    mock_queries.get_secret.return_value = make_secret(9, 3, is_revealed=False)
+    deltas.for_game(GAME_ID).card_ids.extend([7, 8, 7])
+    deltas.for_game(GAME_ID).secret_ids.append(9)
+    deltas.for_game(GAME_ID).turn_player_id = 3
+
+    # Act
+    patches = deltas.collect()[GAME_ID]
+
+    # Assert
+    hand, discard, secret, turn = patches.public
+    assert isinstance(hand, CardPatch) and hand.card_type is None
+    assert hand.owner_id == 2
+    assert discard.card_type == CardType.HERCULE_POIROT
+    assert isinstance(secret, SecretPatch) and secret.role is None
+    assert turn == TurnPatch(turn_player_id=3)
+    assert patches.private[2][0].card_type == CardType.HERCULE_POIROT
+    assert patches.private[3][0].role == PlayerRole.MURDERER
+    # Carta repetida: una sola lectura y un solo parche
+    assert mock_queries.get_card.call_count == 2
+    assert deltas.changes == {}
+
+
+def test_collect_reads_stolen_sets_and_revealed_secrets_are_public(
+    deltas: StateDeltas, mock_queries: Mock
+):
+    # Arrange
+    mock_queries.get_set.return_value = [
+        make_card(1, CardLocation.PLAYED, player_id=3, set_id=5),
+        make_card(2, CardLocation.PLAYED, player_id=3, set_id=5),
+    ]
+    mock_queries.get_secret.return_value = make_secret(9, 3, is_revealed=True)
+    deltas.for_game(GAME_ID).set_ids.append(5)
+    deltas.for_game(GAME_ID).card_ids.append(1)
+    deltas.for_game(GAME_ID).secret_ids.append(9)
+    deltas.for_game(GAME_ID).disgrace[3] = True
+
+    # Act
+    patches = deltas.collect()[GAME_ID]
+
+    # Assert
+    assert [p.card_id for p in patches.public if p.op == "card"] == [1, 2]
+    assert patches.public[2].role == PlayerRole.MURDERER
+    assert patches.public[3] == SocialDisgracePatch(player_id=3, is_disgraced=True)
+    assert patches.private == {}
+    mock_queries.get_card.assert_not_called()
+
+
+def test_discard_forgets_changes(deltas: StateDeltas):
+    # Arrange
+    deltas.for_game(GAME_ID).card_ids.append(7)
+    # Act
+    deltas.discard()
+    # Assert
+    assert deltas.collect() == {}
@@ -6,7 +6,7 @@ from datetime import date
 from app.game.helpers.validators import GameValidator
 
 # Importa los modelos y enums necesarios para crear datos de prueba
-from app.domain.models import Game, PlayerInfo, PlayerInGame, Card
+from app.domain.models import Game, GameHeader, PlayerInfo, PlayerInGame, Card
 from app.domain.enums import GameStatus, Avatar, CardType, CardLocation
 
 # Importa las excepciones específicas que el validador debe lanzar
@@ -410,4 +410,69 @@ class TestGameValidator:
         except InvalidAction:
             pytest.fail(
                 "validate_player_count levantó InvalidAction inesperadamente."
-            )
\ No newline at end of file
+            )
+    # --- Variantes livianas (GameHeader) ---
+    def test_validate_game_header_exists_success(
+        self, validator: GameValidator, mock_queries: Mock
+    ):
+        """Devuelve la cabecera sin pedir el Game completo."""
+        # Arrange
+        header = GameHeader(
+            id=1,
+            name="Test Game",
+            min_players=4,
+            max_players=6,
+            host_id=1,
+            status=GameStatus.IN_PROGRESS,
+            current_turn_player_id=1,
+        )
+        mock_queries.get_game_header.return_value = header
+
+        # Act
+        result = validator.validate_game_header_exists(game_id=1)
+
+        # Assert
+        assert result == header
+        mock_queries.get_game_header.assert_called_once_with(1)
+        mock_queries.get_game.assert_not_called()
+
+    def test_validate_game_header_exists_failure(
+        self, validator: GameValidator, mock_queries: Mock
+    ):
+        # Arrange
+        mock_queries.get_game_header.return_value = None
+
+        # Act & Assert
+        with pytest.raises(GameNotFound, match="La partida 1 no existe."):
+            validator.validate_game_header_exists(game_id=1)
+
+    def test_validate_player_is_in_game_failure(
+        self, validator: GameValidator, mock_queries: Mock
+    ):
+        # Arrange
+        mock_queries.is_player_in_game.return_value = False
+
+        # Act & Assert
+        with pytest.raises(PlayerNotInGame):
+            validator.validate_player_is_in_game(game_id=1, player_id=7)
+
+    def test_validate_hand_has_cards(
+        self, validator: GameValidator, mock_queries: Mock
+    ):
+        # Arrange
+        card = Card(
+            card_id=101,
+            game_id=1,
+            player_id=1,
+            card_type=CardType.NOT_SO_FAST,
+            location=CardLocation.IN_HAND,
+        )
+        mock_queries.get_player_hand.return_value = [card]
+
+        # Act
+        result = validator.validate_hand_has_cards(1, 1, [101])
+
+        # Assert
+        assert result == [card]
+        with pytest.raises(NotYourCard):
+            validator.validate_hand_has_cards(1, 1, [999])
@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import Mock, AsyncMock
 
 from app.game.effect_executor import EffectExecutor
+from app.game.effects.event_effects import AnotherVictimEffect
+from app.game.effects.registry import EffectRegistry
 from app.domain.models import Card
 from app.domain.enums import CardType, ResponseStatus, CardLocation
 from app.game.exceptions import InvalidAction, InternalGameError
@@ -54,8 +56,10 @@ async def test_execute_event_effect_happy_path(
     mock_effect_instance.execute.return_value = ResponseStatus.OK
     mock_effect_class = Mock(return_value=mock_effect_instance)
 
-    # Monkeypatch the specific map for EVENT cards
-    effect_executor.EVENT_EFFECT_MAP[card_type_to_test] = mock_effect_class
+    # Registry with only the mocked EVENT card
+    effect_executor.registry = EffectRegistry(
+        {card_type_to_test: mock_effect_class}, []
+    )
 
     # --- Act ---
     result = await effect_executor.execute_effect(
@@ -114,10 +118,10 @@ async def test_execute_set_effect_happy_path(
     )
     mock_effect_class = Mock(return_value=mock_effect_instance)
 
-    # Monkeypatch the SET map
+    # Registry with only the mocked SET rule
     set_key_counts = {CardType.HERCULE_POIROT: 2}
-    effect_executor.SET_EFFECT_MAP.set(
-        set_key_counts, mock_effect_class, priority=1
+    effect_executor.registry = EffectRegistry(
+        {}, [(1, set_key_counts, mock_effect_class)]
     )
 
     # --- Act ---
@@ -182,4 +186,37 @@ async def test_execute_effect_fails_if_combo_not_in_map(
     ):
         await effect_executor.execute_effect(
             game_id=101, played_cards=[card_played], player_id=1
-        )
\ No newline at end of file
+        )
+
+@pytest.mark.asyncio
+async def test_another_victim_receives_the_executor(
+    effect_executor: EffectExecutor,
+):
+    """
+    Tests that effects that re-run other effects get the executor injected.
+    """
+    # --- Arrange ---
+    instances = []
+
+    class FakeAnotherVictim(AnotherVictimEffect):
+        async def execute(self, **kwargs):
+            instances.append(self)
+            return ResponseStatus.OK
+
+    effect_executor.registry = EffectRegistry(
+        {CardType.ANOTHER_VICTIM: FakeAnotherVictim}, []
+    )
+    card_played = Card(
+        card_id=1,
+        game_id=101,
+        card_type=CardType.ANOTHER_VICTIM,
+        location=CardLocation.IN_HAND,
+    )
+
+    # --- Act ---
+    await effect_executor.execute_effect(
+        game_id=101, played_cards=[card_played], player_id=1
+    )
+
+    # --- Assert ---
+    assert instances[0].executor is effect_executor
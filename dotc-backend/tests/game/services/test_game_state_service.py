@@ -6,14 +6,24 @@ from unittest.mock import Mock, AsyncMock
 from app.game.services.game_state_service import GameStateService
 
 # Importa los modelos y enums necesarios para crear datos de prueba
-from app.domain.models import Card, PlayerInGame, PlayerInfo, Game, SecretCard
+from app.domain.models import (
+    Card,
+    PlayerInGame,
+    PlayerInfo,
+    Game,
+    GameHeader,
+    SecretCard,
+)
 from app.domain.enums import (
     GameStatus,
+    GameActionState,
     CardLocation,
     CardType,
     Avatar,
+    PlayCardActionType,
     PlayerRole,
 )
+from app.game.helpers.legal_moves import LegalMoveFinder
 
 # Importa las excepciones que esperamos que el servicio lance
 from app.game.exceptions import GameNotFound, PlayerNotInGame
@@ -344,3 +354,116 @@ def test_get_size_deck_falla_si_juego_no_existe(
     # Verificamos que el flujo se detuvo en la validación y no se consultó la DB.
     mock_validator.validate_game_exists.assert_called_once_with(999)
     mock_queries.get_size_deck.assert_not_called()
+
+
+# =================================================================
+# --- TESTS PARA get_legal_moves ---
+# =================================================================
+
+
+def _header(**fields) -> GameHeader:
+    defaults = dict(
+        id=101,
+        name="mesa",
+        min_players=2,
+        max_players=6,
+        host_id=1,
+        status=GameStatus.IN_PROGRESS,
+        current_turn_player_id=1,
+        action_state=GameActionState.NONE,
+    )
+    defaults.update(fields)
+    return GameHeader(**defaults)
+
+
+def test_get_legal_moves_lee_solo_lo_necesario(
+    game_state_service: GameStateService,
+    mock_validator: Mock,
+    mock_queries: Mock,
+):
+    """
+    Prueba que se enumeran las jugadas sin leer el Game completo ni la
+    acción pendiente cuando no hay una cadena NSF abierta.
+    """
+    # --- Arrange ---
+    game_state_service.legal_moves = LegalMoveFinder()
+    mock_validator.validate_game_header_exists.return_value = _header()
+    mock_queries.get_player_hand.return_value = [
+        Card(
+            card_id=i,
+            game_id=101,
+            card_type=CardType.PARKER_PYNE,
+            location=CardLocation.IN_HAND,
+            player_id=1,
+        )
+        for i in (5, 6)
+    ]
+    mock_queries.get_sets.return_value = {}
+    mock_queries.is_player_in_social_disgrace.return_value = False
+
+    # --- Act ---
+    response = game_state_service.get_legal_moves(game_id=101, player_id=1)
+
+    # --- Assert ---
+    assert [(m.action_type, m.card_ids) for m in response.moves] == [
+        (PlayCardActionType.FORM_NEW_SET, [5, 6])
+    ]
+    mock_validator.validate_player_is_in_game.assert_called_once_with(101, 1)
+    mock_validator.validate_game_exists.assert_not_called()
+    mock_queries.get_pending_action.assert_not_called()
+
+
+def test_get_legal_moves_bloquea_nsf_del_autor_de_la_ultima_jugada(
+    game_state_service: GameStateService,
+    mock_validator: Mock,
+    mock_queries: Mock,
+):
+    """
+    Prueba que en PENDING_NSF el autor de la última jugada no recibe NSF.
+    """
+    # --- Arrange ---
+    game_state_service.legal_moves = LegalMoveFinder()
+    mock_validator.validate_game_header_exists.return_value = _header(
+        action_state=GameActionState.PENDING_NSF
+    )
+    mock_queries.get_player_hand.return_value = [
+        Card(
+            card_id=7,
+            game_id=101,
+            card_type=CardType.NOT_SO_FAST,
+            location=CardLocation.IN_HAND,
+            player_id=1,
+        )
+    ]
+    mock_queries.get_sets.return_value = {}
+    mock_queries.is_player_in_social_disgrace.return_value = False
+    mock_queries.get_pending_action.return_value = Mock(
+        last_action_player_id=1
+    )
+
+    # --- Act ---
+    response = game_state_service.get_legal_moves(game_id=101, player_id=1)
+
+    # --- Assert ---
+    assert response.moves == []
+    mock_queries.get_pending_action.assert_called_once_with(101)
+
+
+def test_get_legal_moves_falla_si_jugador_no_en_partida(
+    game_state_service: GameStateService,
+    mock_validator: Mock,
+    mock_queries: Mock,
+):
+    """
+    Prueba que se lanza 'PlayerNotInGame' antes de leer la mano.
+    """
+    # --- Arrange ---
+    mock_validator.validate_game_header_exists.return_value = _header()
+    mock_validator.validate_player_is_in_game.side_effect = PlayerNotInGame(
+        "El jugador no está en la partida."
+    )
+
+    # --- Act & Assert ---
+    with pytest.raises(PlayerNotInGame):
+        game_state_service.get_legal_moves(game_id=101, player_id=9)
+    mock_queries.get_player_hand.assert_not_called()
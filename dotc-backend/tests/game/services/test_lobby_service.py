@@ -8,6 +8,7 @@ from app.api.schemas import (
     ListGamesResponse,
     LeaveGameRequest,
     LeaveGameResponse,
+    LobbyFilter,
 )
 from app.domain.models import GameStatus, Game, PlayerInfo, PlayerInGame
 from app.domain.enums import Avatar, ResponseStatus
@@ -461,6 +462,69 @@ async def test_list_games_exitoso_sin_partidas(
     mock_queries.list_games_in_lobby.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_list_games_pagina_con_next_cursor(
+    mock_queries, mock_commands, mock_validator, mock_notificator
+):
+    """
+    Prueba que se pide una partida de más para saber si hay otra página y
+    que `next_cursor` es el id de la última partida devuelta.
+    """
+    # 1. Arrange
+    lobby_service = LobbyService(
+        queries=mock_queries,
+        commands=mock_commands,
+        validator=mock_validator,
+        notifier=mock_notificator,
+    )
+    mock_queries.list_games_in_lobby.return_value = [
+        GameLobbyInfo(
+            id=game_id,
+            name=f"Partida {game_id}",
+            player_count=1,
+            min_players=2,
+            max_players=4,
+            host_id=1,
+            game_status=GameStatus.LOBBY,
+            password=None,
+        )
+        for game_id in (11, 12, 13)
+    ]
+    filters = LobbyFilter(status=GameStatus.LOBBY, has_free_seats=True)
+
+    # 2. Act
+    response = lobby_service.list_games(filters, cursor=10, limit=2)
+
+    # 3. Assert
+    assert [g.id for g in response.games] == [11, 12]
+    assert response.next_cursor == 12
+    mock_queries.list_games_in_lobby.assert_called_once_with(
+        filters, after_id=10, limit=3
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_games_ultima_pagina_sin_next_cursor(
+    mock_queries, mock_commands, mock_validator, mock_notificator
+):
+    """Prueba que la última página no trae `next_cursor`."""
+    # 1. Arrange
+    lobby_service = LobbyService(
+        queries=mock_queries,
+        commands=mock_commands,
+        validator=mock_validator,
+        notifier=mock_notificator,
+    )
+    mock_queries.list_games_in_lobby.return_value = []
+
+    # 2. Act
+    response = lobby_service.list_games(cursor=99, limit=2)
+
+    # 3. Assert
+    assert response.games == []
+    assert response.next_cursor is None
+
+
 # =================================================================
 # --- TESTS PARA leave_game ---
 # =================================================================
@@ -17,6 +17,7 @@ from app.domain.enums import (
 )
 from app.game.exceptions import InvalidAction, ActionConflict, InternalGameError
 from app.domain.models import PlayerInGame, Game, PlayerInfo
+from app.domain.models import SecretAssignment
 
 
 @pytest.fixture
@@ -396,15 +397,29 @@ async def test_set_secrets_in_game_happy_path(
         )
         for i in range(1, player_count + 1)
     ]
-    mock_commands.set_player_role.return_value = ResponseStatus.OK
-    mock_commands.create_secret_card.return_value = 1
+    mock_commands.deal_secrets.return_value = ResponseStatus.OK
 
     # --- Act ---
     await game_setup_service._set_secrets_in_game(players, game_id)
 
     # --- Assert ---
-    assert mock_commands.set_player_role.call_count > 0
-    assert mock_commands.create_secret_card.call_count > 0
+    # Todo el reparto va en una sola llamada (ni roles ni secretos sueltos)
+    mock_commands.deal_secrets.assert_called_once()
+    mock_commands.set_player_role.assert_not_called()
+    mock_commands.create_secret_card.assert_not_called()
+    dealt_game_id, assignments = mock_commands.deal_secrets.call_args.args
+    assert dealt_game_id == game_id
+    assert all(isinstance(a, SecretAssignment) for a in assignments)
+    assert sorted(a.player_id for a in assignments) == list(
+        range(1, player_count + 1)
+    )
+    roles = [a.role for a in assignments]
+    assert roles.count(PlayerRole.MURDERER) == 1
+    assert roles.count(PlayerRole.ACCOMPLICE) == (1 if player_count > 4 else 0)
+    for assignment in assignments:
+        assert len(assignment.secrets) == 3
+        # El secreto "especial" coincide con el rol del jugador
+        assert assignment.secrets[0] == assignment.role
 
 
 @pytest.mark.asyncio
@@ -412,7 +427,8 @@ async def test_set_secrets_in_game_db_failure_on_set_role(
     game_setup_service: GameSetupService, mock_commands
 ):
     """
-    Caso de Error: Verifica que si falla la asignación de un rol, el proceso se detiene.
+    Caso de Error: Verifica que si falla el reparto de roles y secretos,
+    se lanza un error (y la unidad de trabajo revierte la partida).
     """
     # --- Arrange ---
     game_id = 1
@@ -425,13 +441,12 @@ async def test_set_secrets_in_game_db_failure_on_set_role(
         )
         for i in range(1, 5)
     ]
-    mock_commands.set_player_role.return_value = ResponseStatus.ERROR
-    error_message = "Error al establecer el rol Asesino"
+    mock_commands.deal_secrets.return_value = ResponseStatus.ERROR
+    error_message = "Error al repartir los roles y secretos."
 
     # --- Act & Assert ---
     with pytest.raises(InternalGameError) as exc_info:
         await game_setup_service._set_secrets_in_game(players, game_id)
 
     assert exc_info.value.detail == error_message
-    mock_commands.set_player_role.assert_called()
-    mock_commands.create_secret_card.assert_not_called()
\ No newline at end of file
+    mock_commands.deal_secrets.assert_called_once()
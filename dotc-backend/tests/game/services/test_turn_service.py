@@ -1,8 +1,9 @@
 import pytest
 from datetime import date
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, create_autospec
 
 from app.game.services.turn_service import TurnService
+from app.game.helpers.notificators import Notificator
 from app.api.schemas import (
     PlayerActionRequest,
     DiscardCardRequest,
@@ -12,8 +13,9 @@ from app.api.schemas import (
     GeneralActionResponse,
     PlayCardActionType,
     RevealSecretRequest,
+    VoteRequest,
 )
-from app.domain.models import Card, PlayerInGame, PlayerInfo, Game, SecretCard, PendingAction
+from app.domain.models import Card, CardMove, PlayerInGame, PlayerInfo, Game, GameHeader, SecretCard, PendingAction, VoteTally
 
 from app.domain.enums import (
     GameStatus,
@@ -35,6 +37,23 @@ from app.game.exceptions import (
 )
 
 
+def header_of(game: Game) -> GameHeader:
+    """Arma la cabecera (GameHeader) equivalente a un Game de prueba."""
+    return GameHeader(
+        id=game.id,
+        name=game.name,
+        min_players=game.min_players,
+        max_players=game.max_players,
+        host_id=game.host.player_id,
+        status=game.status,
+        player_count=len(game.players),
+        current_turn_player_id=game.current_turn_player_id,
+        action_state=game.action_state,
+        action_initiator_id=game.action_initiator_id,
+        prompted_player_id=game.prompted_player_id,
+    )
+
+
 @pytest.fixture
 def turn_service(
     mock_queries: Mock,
@@ -62,120 +81,116 @@ def turn_service(
 # =================================================================
 
 
+def draw_header(game_id: int = 101, **overrides) -> GameHeader:
+    """Cabecera de una partida en curso donde juega el jugador 1."""
+    defaults = dict(
+        id=game_id,
+        name="Test",
+        min_players=4,
+        max_players=12,
+        host_id=1,
+        status=GameStatus.IN_PROGRESS,
+        player_count=4,
+        current_turn_player_id=1,
+    )
+    defaults.update(overrides)
+    return GameHeader(**defaults)
+
+
+def in_hand(card_id: int, player_id: int = 1, card_type=CardType.HERCULE_POIROT) -> Card:
+    return Card(card_id=card_id, game_id=101, card_type=card_type,
+                location=CardLocation.IN_HAND, player_id=player_id)
+
+
+def in_deck(card_id: int, position: int, card_type=CardType.HERCULE_POIROT) -> Card:
+    return Card(card_id=card_id, game_id=101, card_type=card_type,
+                location=CardLocation.DRAW_PILE, position=position)
+
+
+def in_draft(card_id: int, card_type=CardType.NOT_SO_FAST) -> Card:
+    return Card(card_id=card_id, game_id=101, card_type=card_type,
+                location=CardLocation.DRAFT)
+
+
 @pytest.mark.asyncio
 async def test_draw_card_from_deck_success(
     turn_service: TurnService,
+    game_snapshot,
     mock_validator: Mock,
     mock_queries: Mock,
     mock_commands: Mock,
     mock_notificator: AsyncMock,
 ):
     """Tests the happy path of drawing a card FROM THE DECK."""
-    card_to_draw = [Card(
-        card_id=1,
-        game_id=101,
-        card_type=CardType.HERCULE_POIROT,
-        location=CardLocation.DRAW_PILE,
-    ),
-    Card(
-        card_id=2,
-        game_id=101,
-        card_type=CardType.ANOTHER_VICTIM,
-        location=CardLocation.DRAW_PILE,
-    )]
-    game_instance = Game(
-        id=101,
-        name="Test",
-        min_players=4,
-        max_players=12,
-        host=PlayerInfo(
-            player_id=1,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        deck=card_to_draw,
-    )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
+    game_snapshot(in_deck(1, position=2), in_deck(2, position=1))
     request = DrawCardRequest(game_id=101, player_id=1, source=DrawSource.DECK)
     response = await turn_service.draw_card(request)
 
     assert response.drawn_card is not None
     assert response.drawn_card.card_id == 1
-    mock_commands.update_card_location.assert_called_once_with(
-        card_id=1, game_id=101, new_location=CardLocation.IN_HAND, owner_id=1
+    assert response.drawn_card.location == CardLocation.IN_HAND
+    mock_commands.move_cards.assert_called_once_with(
+        101, [CardMove(card_id=1, location=CardLocation.IN_HAND, owner_id=1)]
     )
-    mock_notificator.notify_player_drew.assert_awaited_once()
+    # Solo se lee el tope del mazo, no la foto de toda la partida
+    mock_queries.get_deck.assert_called_once_with(game_id=101, limit=2)
+    mock_queries.get_game_snapshot.assert_not_called()
+    mock_validator.validate_game_exists.assert_not_called()
+    mock_queries.get_game.assert_not_called()
+    mock_notificator.notify_player_drew.assert_awaited_once_with(101, 1, 1)
 
 
 @pytest.mark.asyncio
-async def test_draw_card_from_deck_fails_if_deck_empty(
-    turn_service: TurnService, mock_validator: Mock, mock_queries: Mock
+async def test_draw_card_from_deck_reads_only_what_the_draw_touches(
+    turn_service: TurnService,
+    game_snapshot,
+    mock_queries: Mock,
+    mock_notificator: AsyncMock,
 ):
-    mock_validator.validate_game_exists.return_value = Game(
-        id=101,
-        name="Test",
-        min_players=4,
-        max_players=12,
-        host=PlayerInfo(
-            player_id=1,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        deck=[],
-    )
-    mock_queries.get_player_hand.return_value = []
-    mock_validator.validate_deck_has_cards.side_effect = InvalidAction(
-        detail="No quedan cartas."
+    # Arrange: mazo de 4, otro jugador con mano y una carta en el descarte
+    game_snapshot(
+        *(in_deck(card_id, position=card_id) for card_id in range(1, 5)),
+        in_hand(10, player_id=2),
+        Card(card_id=20, game_id=101, card_type=CardType.NOT_SO_FAST,
+             location=CardLocation.DISCARD_PILE),
     )
     request = DrawCardRequest(game_id=101, player_id=1, source=DrawSource.DECK)
-    with pytest.raises(InvalidAction, match="No quedan cartas."):
+
+    # Act
+    response = await turn_service.draw_card(request)
+
+    # Assert: se roba el tope y el aviso cuenta el mazo entero, no solo el tope
+    assert response.drawn_card.card_id == 4
+    mock_queries.get_player_hand.assert_called_once_with(game_id=101, player_id=1)
+    mock_queries.get_discard_pile.assert_not_called()
+    mock_notificator.notify_player_drew.assert_awaited_once_with(101, 1, 3)
+
+
+@pytest.mark.asyncio
+async def test_draw_card_from_deck_fails_if_deck_empty(
+    turn_service: TurnService,
+    game_snapshot,
+    mock_commands: Mock,
+):
+    game_snapshot(in_draft(7))
+    request = DrawCardRequest(game_id=101, player_id=1, source=DrawSource.DECK)
+    with pytest.raises(InvalidAction, match="No quedan cartas"):
         await turn_service.draw_card(request)
+    mock_commands.move_cards.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_draw_card_from_draft_success(
     turn_service: TurnService,
-    mock_validator: Mock,
+    game_snapshot,
     mock_commands: Mock,
-    mock_queries: Mock,
     mock_notificator: AsyncMock,
 ):
-    card_in_draft = Card(
-        card_id=99,
-        game_id=101,
-        card_type=CardType.NOT_SO_FAST,
-        location=CardLocation.DRAFT,
-    )
-    card_in_deck = Card(
-        card_id=100,
-        game_id=101,
-        card_type=CardType.ANOTHER_VICTIM,
-        location=CardLocation.DRAW_PILE,
-    )
-    game_instance = Game(
-        id=101,
-        name="Test",
-        min_players=4,
-        max_players=12,
-        host=PlayerInfo(
-            player_id=1,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        draft=[card_in_draft],
-        deck=[card_in_deck],
+    game_snapshot(
+        in_draft(99),
+        in_deck(100, position=5, card_type=CardType.ANOTHER_VICTIM),
+        in_deck(101, position=4),
     )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
     request = DrawCardRequest(
         game_id=101, player_id=1, source=DrawSource.DRAFT, card_id=99
     )
@@ -183,37 +198,25 @@ async def test_draw_card_from_draft_success(
 
     assert response.drawn_card is not None
     assert response.drawn_card.card_id == 99
-    mock_commands.update_card_location.assert_any_call(
-        card_id=99, game_id=101, new_location=CardLocation.IN_HAND, owner_id=1
-    )
-    mock_commands.update_card_location.assert_any_call(
-        card_id=100, game_id=101, new_location=CardLocation.DRAFT
-    )
-    mock_notificator.notify_draft_updated.assert_awaited_once_with(
-        101, 99, card_in_deck
-    )
+    # La carta va a la mano y el hueco del draft se rellena con el tope del
+    # mazo, en un único move_cards
+    moves = mock_commands.move_cards.call_args.args[1]
+    assert sorted(moves, key=lambda m: m.card_id) == [
+        CardMove(card_id=99, location=CardLocation.IN_HAND, owner_id=1),
+        CardMove(card_id=100, location=CardLocation.DRAFT),
+    ]
+    mock_notificator.notify_draft_updated.assert_awaited_once()
+    _, taken_id, new_card = mock_notificator.notify_draft_updated.await_args.args
+    assert taken_id == 99
+    assert (new_card.card_id, new_card.location) == (100, CardLocation.DRAFT)
+    assert new_card.card_type == CardType.ANOTHER_VICTIM
 
 
 @pytest.mark.asyncio
 async def test_draw_card_from_draft_fails_if_card_not_in_draft(
-    turn_service: TurnService, mock_validator: Mock, mock_queries: Mock
+    turn_service: TurnService, game_snapshot
 ):
-    game_instance = Game(
-        id=101,
-        name="Test",
-        min_players=4,
-        max_players=12,
-        host=PlayerInfo(
-            player_id=1,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        draft=[],
-    )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
+    game_snapshot(in_deck(1, position=1))
     request = DrawCardRequest(
         game_id=101, player_id=1, source=DrawSource.DRAFT, card_id=99
     )
@@ -223,71 +226,35 @@ async def test_draw_card_from_draft_fails_if_card_not_in_draft(
 
 @pytest.mark.asyncio
 async def test_draw_card_raises_not_your_turn(
-    turn_service: TurnService, mock_validator: Mock, mock_queries: Mock
+    turn_service: TurnService, game_snapshot
 ):
-    mock_validator.validate_is_players_turn.side_effect = NotYourTurn(
-        detail="No es tu turno."
-    )
-    mock_queries.get_player_hand.return_value = []
+    game_snapshot(in_deck(1, position=1), current_turn=2)
     request = DrawCardRequest(game_id=101, player_id=1, source=DrawSource.DECK)
-    with pytest.raises(NotYourTurn, match="No es tu turno."):
+    with pytest.raises(NotYourTurn, match="No es tu turno"):
         await turn_service.draw_card(request)
 
 
 @pytest.mark.asyncio
 async def test_draw_card_raises_internal_error_on_db_fail(
-    turn_service: TurnService, mock_validator: Mock,
-    mock_commands: Mock, mock_queries: Mock
+    turn_service: TurnService, game_snapshot, mock_commands: Mock
 ):
     """Tests that it raises InternalGameError if the DB fails."""
-    card_to_draw = Card(
-        card_id=1,
-        game_id=101,
-        card_type=CardType.HERCULE_POIROT,
-        location=CardLocation.DRAW_PILE,
-    )
-    game_instance = Game(
-        id=101,
-        name="Test",
-        min_players=4,
-        max_players=12,
-        host=PlayerInfo(
-            player_id=1,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        deck=[card_to_draw],
-    )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.ERROR
+    game_snapshot(in_deck(1, position=2), in_deck(2, position=1))
+    mock_commands.move_cards.return_value = ResponseStatus.ERROR
     request = DrawCardRequest(game_id=101, player_id=1, source=DrawSource.DECK)
     with pytest.raises(InternalGameError):
         await turn_service.draw_card(request)
 
+
 @pytest.mark.asyncio
 async def test_draw_card_from_deck_ends_game_if_last_card(
-    turn_service: TurnService, mock_validator: Mock, mock_queries: Mock, mock_commands: Mock, mock_notificator: AsyncMock
+    turn_service: TurnService, game_snapshot, mock_commands: Mock, mock_notificator: AsyncMock
 ):
     """Tests that drawing the last card from the deck (with draft empty) ends the game."""
     # --- Arrange ---
     game_id = 101
     murderer_id = 2
-    last_card = Card(card_id=999, game_id=game_id, card_type=CardType.MURDERER_ESCAPES, location=CardLocation.DRAW_PILE)
-    game_instance = Game(
-        id=game_id, name="Final Turn", min_players=2, max_players=4,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        deck=[last_card],  # Only one card left
-        draft=[]  # Draft is empty
-    )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
-    mock_queries.get_murderer_id.return_value = murderer_id
-    mock_queries.get_accomplice_id.return_value = None
+    game_snapshot(in_deck(999, position=1, card_type=CardType.MURDERER_ESCAPES), murderer_id=murderer_id)
     mock_commands.delete_game.return_value = ResponseStatus.OK
 
     request = DrawCardRequest(game_id=game_id, player_id=1, source=DrawSource.DECK)
@@ -305,25 +272,13 @@ async def test_draw_card_from_deck_ends_game_if_last_card(
 
 @pytest.mark.asyncio
 async def test_draw_card_from_draft_ends_game_if_last_card(
-    turn_service: TurnService, mock_validator: Mock, mock_queries: Mock, mock_commands: Mock, mock_notificator: AsyncMock
+    turn_service: TurnService, game_snapshot, mock_commands: Mock, mock_notificator: AsyncMock
 ):
     """Tests that drawing the last card from the draft (with deck empty) ends the game."""
     # --- Arrange ---
     game_id = 101
     murderer_id = 2
-    last_card = Card(card_id=999, game_id=game_id, card_type=CardType.HARLEY_QUIN, location=CardLocation.DRAFT)
-    game_instance = Game(
-        id=game_id, name="Final Draft", min_players=2, max_players=4,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        deck=[],  # Deck is empty
-        draft=[last_card]  # Only one card left in draft
-    )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
-    mock_queries.get_murderer_id.return_value = murderer_id
-    mock_queries.get_accomplice_id.return_value = 3
+    game_snapshot(in_draft(999, card_type=CardType.HARLEY_QUIN), players=(1, 2, 3), murderer_id=murderer_id, accomplice_id=3)
     mock_commands.delete_game.return_value = ResponseStatus.OK
 
     request = DrawCardRequest(game_id=game_id, player_id=1, source=DrawSource.DRAFT, card_id=999)
@@ -338,7 +293,6 @@ async def test_draw_card_from_draft_ends_game_if_last_card(
     mock_commands.delete_game.assert_called_once_with(game_id=game_id)
     mock_notificator.notify_game_removed.assert_awaited_once_with(game_id)
 
-
 # =================================================================
 # --- TESTS FOR discard_card ---
 # =================================================================
@@ -347,53 +301,35 @@ async def test_draw_card_from_draft_ends_game_if_last_card(
 @pytest.mark.asyncio
 async def test_discard_card_success(
     turn_service: TurnService,
-    mock_validator: Mock,
+    game_snapshot,
     mock_commands: Mock,
     mock_notificator: AsyncMock,
+    mock_executor: AsyncMock,
 ):
     """Tests the happy path of discarding a card."""
-    card_to_discard = Card(
-        card_id=5,
-        game_id=101,
-        card_type=CardType.NOT_SO_FAST,
-        location=CardLocation.IN_HAND,
-        player_id=1,
-    )
-    player_instance = PlayerInGame(
-        player_id=1,
-        player_name="P",
-        player_birth_date=date(2000, 1, 1),
-        player_avatar=Avatar.DEFAULT,
-        hand=[card_to_discard],
-    )
-    mock_validator.validate_player_in_game.return_value = player_instance
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
+    game_snapshot(in_hand(5, card_type=CardType.NOT_SO_FAST), in_hand(6))
     request = DiscardCardRequest(game_id=101, player_id=1, card_id=5)
     await turn_service.discard_card(request)
-    mock_commands.update_card_location.assert_called_once()
+    mock_commands.move_cards.assert_called_once_with(
+        101, [CardMove(card_id=5, location=CardLocation.DISCARD_PILE)]
+    )
     mock_notificator.notify_card_discarded.assert_awaited_once()
+    _, player_id, card = mock_notificator.notify_card_discarded.await_args.args
+    assert (player_id, card.card_id, card.card_type) == (1, 5, CardType.NOT_SO_FAST)
+    mock_executor.execute_effect.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_discard_card_raises_card_not_found(
-    turn_service: TurnService, mock_validator: Mock
+async def test_discard_card_raises_not_your_card(
+    turn_service: TurnService, game_snapshot, mock_commands: Mock
 ):
-    """Tests that it raises CardNotFound if the player doesn't have the card."""
-    player_instance = PlayerInGame(
-        player_id=1,
-        player_name="P",
-        player_birth_date=date(2000, 1, 1),
-        player_avatar=Avatar.DEFAULT,
-        hand=[],
-    )
-    mock_validator.validate_player_in_game.return_value = player_instance
-    mock_validator.validate_player_has_cards.side_effect = CardNotFound(
-        detail="No tenés esa carta, fantasma."
-    )
+    """Tests that it raises NotYourCard if the player doesn't have the card."""
+    game_snapshot(in_hand(99, player_id=2))
     request = DiscardCardRequest(game_id=101, player_id=1, card_id=99)
 
-    with pytest.raises(CardNotFound, match="No tenés esa carta, fantasma."):
+    with pytest.raises(NotYourCard, match="no tiene la carta 99"):
         await turn_service.discard_card(request)
+    mock_commands.move_cards.assert_not_called()
 
 
 # =================================================================
@@ -404,59 +340,38 @@ async def test_discard_card_raises_card_not_found(
 @pytest.mark.asyncio
 async def test_finish_turn_success(
     turn_service: TurnService,
-    mock_validator: Mock,
+    game_snapshot,
     mock_commands: Mock,
-    mock_queries: Mock,
     mock_notificator: AsyncMock,
-    mock_turn_utils: Mock,
 ):
     """Tests the happy path of finishing a turn."""
-    p1 = PlayerInGame(
-        player_id=1,
-        turn_order=1,
-        player_name="p1",
-        player_birth_date=date(2000, 1, 1),
-        player_avatar=Avatar.DEFAULT,
-    )
-    p2 = PlayerInGame(
-        player_id=2,
-        turn_order=2,
-        player_name="p2",
-        player_birth_date=date(2000, 1, 1),
-        player_avatar=Avatar.DEFAULT,
-    )
-    players = [p1, p2]
-    game_instance = Game(
-        id=101,
-        name="T",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(
-            player_id=1,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        players=players,
-        current_turn_player_id=1,
-    )
-
-    mock_validator.validate_game_exists.return_value = game_instance
-    turn_service.read.get_players_in_game.return_value = players
-    mock_turn_utils.sort_players_by_turn_order.return_value = [p1, p2]
-    turn_service.read.get_current_turn.return_value = 1
-    mock_commands.set_current_turn.return_value = ResponseStatus.OK
+    game_snapshot(*(in_hand(card_id) for card_id in range(1, 7)), players=(1, 2))
     request = PlayerActionRequest(game_id=101, player_id=1)
-    mock_queries.get_player_hand.return_value = [Mock()] * 6
 
     response = await turn_service.finish_turn(request)
 
     assert response.next_player_id == 2
     mock_commands.set_current_turn.assert_called_once_with(101, 2)
+    mock_commands.move_cards.assert_not_called()
     mock_notificator.notify_new_turn.assert_awaited_once_with(101, 2)
 
 
+@pytest.mark.asyncio
+async def test_finish_turn_wraps_around_the_turn_order(
+    turn_service: TurnService, game_snapshot, mock_commands: Mock
+):
+    game_snapshot(
+        *(in_hand(card_id, player_id=3) for card_id in range(1, 7)),
+        players=(1, 2, 3),
+        current_turn=3,
+    )
+    response = await turn_service.finish_turn(
+        PlayerActionRequest(game_id=101, player_id=3)
+    )
+    assert response.next_player_id == 1
+    mock_commands.set_current_turn.assert_called_once_with(101, 1)
+
+
 # =================================================================
 # --- TESTS FOR play_card ---
 # =================================================================
@@ -628,7 +543,7 @@ async def test_play_card_beresford_set_is_uncancellable(
     mock_executor.execute_effect.return_value = GameFlowStatus.CONTINUE
     # --- ADAPTACIÓN ---
     mock_commands.create_set.return_value = 1
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
+    mock_commands.move_cards.return_value = ResponseStatus.OK
     mock_queries.get_set.return_value = played_cards
     mock_queries.get_player_name.return_value = "Player"
     mock_queries.get_card.side_effect = lambda cid, gid: {1: tommy_card, 2: tuppence_card}.get(cid)
@@ -647,6 +562,14 @@ async def test_play_card_beresford_set_is_uncancellable(
         target_card_id=request.target_card_id,
         trade_direction=None,
     )
+    # Las dos cartas del set se mueven juntas, en un solo lote
+    mock_commands.move_cards.assert_called_once()
+    moves = mock_commands.move_cards.call_args.args[1]
+    assert [(m.card_id, m.location, m.set_id) for m in moves] == [
+        (1, CardLocation.PLAYED, 1),
+        (2, CardLocation.PLAYED, 1),
+    ]
+    mock_commands.update_card_location.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -954,29 +877,14 @@ async def test_reveal_secret_ends_game_if_murderer_is_revealed(
 @pytest.mark.asyncio
 async def test_draw_card_deck_empty_murderer_wins(
     turn_service: TurnService,
-    mock_validator: Mock,
-    mock_queries: Mock,
+    game_snapshot,
     mock_commands: Mock,
     mock_notificator: AsyncMock,
 ):
     """Tests that drawing the last card from deck triggers MURDERER_WINS."""
     # ARRANGE
     game_id, player_id = 101, 1
-    last_card = Card(
-        card_id=1, game_id=game_id, card_type=CardType.HERCULE_POIROT, location=CardLocation.DRAW_PILE
-    )
-    game_instance = Game(
-        id=game_id, name="Test", min_players=4, max_players=12,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        deck=[last_card],
-        draft=[],
-    )
-    mock_validator.validate_game_exists.return_value = game_instance
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
-    mock_queries.get_murderer_id.return_value = 2
-    mock_queries.get_accomplice_id.return_value = 3
+    game_snapshot(in_deck(1, position=1), players=(1, 2, 3), murderer_id=2, accomplice_id=3)
     mock_commands.delete_game.return_value = ResponseStatus.OK
 
     # ACT
@@ -984,6 +892,7 @@ async def test_draw_card_deck_empty_murderer_wins(
     await turn_service.draw_card(request)
 
     # ASSERT
+    mock_notificator.notify_player_drew.assert_awaited_once_with(game_id, player_id, 0)
     mock_notificator.notify_murderer_wins.assert_awaited_once_with(
         game_id=game_id, murderer_id=2, accomplice_id=3
     )
@@ -1037,10 +946,9 @@ async def test_play_nsf_player_plays_nsf_card(
         target_player_id=None, target_secret_id=None, target_card_id=None, target_set_id=None
     )
 
-    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
     mock_queries.get_pending_action.side_effect = [pending_action, updated_pending]
-    mock_validator.validate_player_in_game.return_value = player_b
-    mock_validator.validate_player_has_cards.return_value = [nsf_card]
+    mock_validator.validate_hand_has_cards.return_value = [nsf_card]
     mock_commands.update_card_location.return_value = ResponseStatus.OK
     mock_commands.increment_nsf_responses.return_value = ResponseStatus.OK
 
@@ -1096,7 +1004,7 @@ async def test_play_nsf_player_passes(
         target_player_id=None, target_secret_id=None, target_card_id=None, target_set_id=None
     )
 
-    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
     mock_queries.get_pending_action.side_effect = [pending_action, updated_pending]
     mock_commands.increment_nsf_responses.return_value = ResponseStatus.OK
     mock_executor.execute_effect.return_value = ResponseStatus.OK
@@ -1150,7 +1058,7 @@ async def test_play_nsf_action_cancelled_odd_nsf_count(
         target_player_id=None, target_secret_id=None, target_card_id=None, target_set_id=None
     )
 
-    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
     mock_queries.get_pending_action.side_effect = [pending_action, pending_action]
     mock_commands.increment_nsf_responses.return_value = ResponseStatus.OK
     mock_commands.update_card_location.return_value = ResponseStatus.OK
@@ -1206,7 +1114,7 @@ async def test_play_nsf_action_resolved_even_nsf_count(
         target_player_id=None, target_secret_id=None, target_card_id=None, target_set_id=None
     )
 
-    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
     mock_queries.get_pending_action.side_effect = [pending_action, pending_action]
     mock_commands.increment_nsf_responses.return_value = ResponseStatus.OK
     mock_executor.execute_effect.return_value = GameFlowStatus.CONTINUE
@@ -1228,6 +1136,100 @@ async def test_play_nsf_action_resolved_even_nsf_count(
     mock_commands.clear_game_action_state.assert_called_once_with(game_id)
 
 
+def last_nsf_pass(
+    mock_validator: Mock, mock_queries: Mock, card: Card, **targets
+) -> PlayCardRequest:
+    """Deja una cadena NSF a un 'pasar' de resolverse sin cancelar la jugada."""
+    game = Game(
+        id=101, name="Test", min_players=3, max_players=4,
+        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
+        status=GameStatus.IN_PROGRESS,
+        action_state=GameActionState.PENDING_NSF,
+        players=[
+            PlayerInGame(player_id=i, player_name=str(i), player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT)
+            for i in (1, 2, 3)
+        ],
+    )
+    fields = dict(target_player_id=None, target_secret_id=None, target_card_id=None, target_set_id=None)
+    fields.update(targets)
+    pending_action = PendingAction(
+        id=1, game_id=101, player_id=1,
+        action_type=PlayCardActionType.PLAY_EVENT,
+        cards=[card], responses_count=2, nsf_count=0,
+        last_action_player_id=1, **fields
+    )
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
+    mock_queries.get_pending_action.return_value = pending_action
+    return PlayCardRequest(
+        game_id=101, player_id=3, card_ids=[],
+        action_type=PlayCardActionType.INSTANT
+    )
+
+
+@pytest.mark.asyncio
+async def test_play_nsf_resolved_card_trade_runs_its_effect(
+    turn_service: TurnService,
+    mock_validator: Mock,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_executor: AsyncMock,
+):
+    """Card Trade resuelto ejecuta su efecto: es el que guarda la saga del intercambio."""
+    # ARRANGE
+    card_trade = in_hand(5, card_type=CardType.CARD_TRADE)
+    request = last_nsf_pass(
+        mock_validator, mock_queries, card_trade,
+        target_player_id=2, target_card_id=9,
+    )
+    mock_executor.execute_effect.return_value = GameFlowStatus.PAUSED
+    mock_commands.update_card_location.return_value = ResponseStatus.OK
+    mock_queries.get_card.return_value = card_trade
+
+    # ACT
+    await turn_service.play_nsf(request)
+
+    # ASSERT
+    mock_executor.execute_effect.assert_awaited_once()
+    assert mock_executor.execute_effect.await_args.kwargs["target_card_id"] == 9
+    mock_commands.update_card_location.assert_called_once_with(
+        5, 101, CardLocation.DISCARD_PILE
+    )
+
+
+@pytest.mark.asyncio
+async def test_play_nsf_resolved_play_rejected_by_its_effect_is_voided(
+    turn_service: TurnService,
+    mock_validator: Mock,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_notificator: AsyncMock,
+    mock_executor: AsyncMock,
+):
+    """Si el efecto rechaza los targets, la jugada se anula en vez de trabar la partida."""
+    # ARRANGE
+    event = in_hand(5, card_type=CardType.ANOTHER_VICTIM)
+    request = last_nsf_pass(mock_validator, mock_queries, event)
+    mock_executor.execute_effect.side_effect = InvalidAction(
+        "No se proporcionó un ID de set objetivo."
+    )
+    mock_queries.get_player_hand.return_value = [event]
+
+    # ACT
+    response = await turn_service.play_nsf(request)
+
+    # ASSERT
+    assert "sin efecto" in response.detail
+    mock_commands.update_card_location.assert_not_called()
+    mock_commands.clear_pending_action.assert_called_once_with(101)
+    mock_commands.clear_game_action_state.assert_called_once_with(101)
+    mock_notificator.notify_action_cancelled.assert_awaited_once_with(
+        game_id=101, player_id=1, cards=[event]
+    )
+    mock_notificator.notify_hand_updated.assert_awaited_once_with(
+        game_id=101, player_id=1, hand=[event]
+    )
+
+
 @pytest.mark.asyncio
 async def test_play_nsf_no_pending_action_raises_conflict(
     turn_service: TurnService,
@@ -1241,7 +1243,7 @@ async def test_play_nsf_no_pending_action_raises_conflict(
         status=GameStatus.IN_PROGRESS,
         action_state=GameActionState.NONE,
     )
-    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
 
     # ACT & ASSERT
     request = PlayCardRequest(
@@ -1275,7 +1277,7 @@ async def test_play_nsf_player_cannot_nsf_own_action(
         target_player_id=None, target_secret_id=None, target_card_id=None, target_set_id=None
     )
 
-    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_game_header_exists.return_value = header_of(game)
     mock_queries.get_pending_action.return_value = pending_action
 
     # ACT & ASSERT
@@ -1337,3 +1339,288 @@ async def test_play_card_cancellable_enters_pending_nsf(
     mock_queries.get_pending_action.assert_called()
     mock_notificator.notify_cards_played.assert_awaited_once()
 
+
+
+@pytest.mark.asyncio
+async def test_play_card_rejected_while_an_nsf_window_is_open(
+    turn_service: TurnService,
+    mock_validator: Mock,
+    mock_commands: Mock,
+):
+    """Una jugada nueva no puede pisar la acción pendiente de respuestas NSF."""
+    # ARRANGE
+    player = PlayerInGame(
+        player_id=1, player_name="Player", hand=[in_hand(1)],
+        player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT
+    )
+    game = Game(
+        id=101, name="Test", min_players=2, max_players=4,
+        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
+        status=GameStatus.IN_PROGRESS,
+        action_state=GameActionState.PENDING_NSF,
+        players=[player]
+    )
+    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_player_in_game.return_value = player
+
+    # ACT & ASSERT
+    request = PlayCardRequest(
+        game_id=101, player_id=1, card_ids=[1],
+        action_type=PlayCardActionType.PLAY_EVENT
+    )
+    with pytest.raises(ActionConflict):
+        await turn_service.play_card(request)
+    mock_commands.create_pending_action.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_play_card_cannot_add_a_detective_to_another_players_set(
+    turn_service: TurnService,
+    mock_validator: Mock,
+    mock_queries: Mock,
+    mock_commands: Mock,
+):
+    """Solo Ariadne Oliver se suma a sets ajenos."""
+    # ARRANGE
+    poirot = in_hand(1)
+    player = PlayerInGame(
+        player_id=1, player_name="Player", hand=[poirot],
+        player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT
+    )
+    game = Game(
+        id=101, name="Test", min_players=2, max_players=4,
+        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
+        status=GameStatus.IN_PROGRESS,
+        players=[player]
+    )
+    mock_validator.validate_game_exists.return_value = game
+    mock_validator.validate_player_in_game.return_value = player
+    mock_validator.validate_player_has_cards.return_value = [poirot]
+    mock_queries.get_card.return_value = poirot
+    mock_queries.get_set.return_value = [in_hand(7, player_id=2), in_hand(8, player_id=2)]
+
+    # ACT & ASSERT
+    request = PlayCardRequest(
+        game_id=101, player_id=1, card_ids=[1], target_set_id=3,
+        action_type=PlayCardActionType.ADD_TO_EXISTING_SET
+    )
+    with pytest.raises(InvalidAction, match="tus propios sets"):
+        await turn_service.play_card(request)
+    mock_commands.create_pending_action.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_resolve_dead_card_folly_moves_all_cards_in_one_batch(
+    turn_service: TurnService,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_notificator: AsyncMock,
+    mock_turn_utils: Mock,
+):
+    """Dead Card Folly mueve todas las cartas elegidas con un solo move_cards."""
+    # ARRANGE
+    game_id = 101
+    players = [
+        PlayerInGame(
+            player_id=pid, player_name=f"P{pid}", player_birth_date=date(2000, 1, 1),
+            player_avatar=Avatar.DEFAULT,
+            hand=[Card(card_id=pid * 10, game_id=game_id, card_type=CardType.HERCULE_POIROT,
+                       location=CardLocation.IN_HAND, player_id=pid)],
+        )
+        for pid in (1, 2, 3)
+    ]
+    game = Game(
+        id=game_id, name="Test", min_players=2, max_players=4,
+        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000, 1, 1), player_avatar=Avatar.DEFAULT),
+        status=GameStatus.IN_PROGRESS,
+        players=players,
+    )
+    mock_queries.get_pending_saga.return_value = {
+        "type": "dead_card_folly",
+        "direction": "left",
+        "choices": {"1": 10, "2": 20, "3": 30},
+    }
+    mock_turn_utils.sort_players_by_turn_order.return_value = players
+    mock_commands.move_cards.return_value = ResponseStatus.OK
+
+    # ACT
+    await turn_service._resolve_dead_card_folly(game)
+
+    # ASSERT: cada carta pasa al jugador de la izquierda, en un único lote
+    mock_commands.move_cards.assert_called_once_with(
+        game_id,
+        [
+            CardMove(card_id=10, location=CardLocation.IN_HAND, owner_id=3),
+            CardMove(card_id=20, location=CardLocation.IN_HAND, owner_id=1),
+            CardMove(card_id=30, location=CardLocation.IN_HAND, owner_id=2),
+        ],
+    )
+    mock_commands.update_card_location.assert_not_called()
+    # Las cartas ya estaban en `game`: no se releen una por una
+    mock_queries.get_card.assert_not_called()
+    mock_commands.clear_game_action_state.assert_called_once_with(game_id)
+    mock_notificator.notify_hands_updated.assert_awaited_once_with(game_id)
+
+
+# =================================================================
+# --- TESTS FOR submit_vote ---
+# =================================================================
+
+
+def vote_saga(**overrides) -> dict:
+    """Saga de Point Your Suspicions con 3 votantes, iniciada por el 1."""
+    saga = {
+        "type": "point_your_suspicions",
+        "source_card_id": 55,
+        "round_id": 55,
+        "initiator_id": 1,
+        "eligible_voters": [1, 2, 3],
+    }
+    saga.update(overrides)
+    return saga
+
+
+@pytest.mark.asyncio
+async def test_submit_vote_is_a_single_insert_without_rewriting_saga(
+    turn_service: TurnService,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_validator: Mock,
+    mock_notificator: AsyncMock,
+):
+    # ARRANGE
+    game_id = 101
+    mock_validator.validate_game_header_exists.return_value = draw_header(
+        action_state=GameActionState.AWAITING_VOTES
+    )
+    mock_queries.get_pending_saga.return_value = vote_saga()
+    mock_commands.cast_vote.return_value = ResponseStatus.OK
+    mock_queries.get_vote_tally.return_value = VoteTally(
+        total_votes=1, counts={3: 1}
+    )
+
+    # ACT
+    response = await turn_service.submit_vote(
+        VoteRequest(player_id=2, game_id=game_id, voted_player_id=3)
+    )
+
+    # ASSERT
+    assert isinstance(response, GeneralActionResponse)
+    mock_commands.cast_vote.assert_called_once_with(game_id, 55, 2, 3)
+    mock_queries.get_vote_tally.assert_called_once_with(game_id, 55, 1)
+    mock_commands.update_pending_saga.assert_not_called()
+    mock_notificator.notify_vote_result.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_submit_vote_twice_raises_conflict(
+    turn_service: TurnService,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_validator: Mock,
+):
+    # ARRANGE
+    mock_validator.validate_game_header_exists.return_value = draw_header(
+        action_state=GameActionState.AWAITING_VOTES
+    )
+    mock_queries.get_pending_saga.return_value = vote_saga()
+    mock_commands.cast_vote.return_value = ResponseStatus.ALREADY_VOTED
+
+    # ACT & ASSERT
+    with pytest.raises(ActionConflict):
+        await turn_service.submit_vote(
+            VoteRequest(player_id=2, game_id=101, voted_player_id=3)
+        )
+    mock_queries.get_vote_tally.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_submit_vote_last_vote_breaks_tie_with_initiator_vote(
+    turn_service: TurnService,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_validator: Mock,
+    mock_notificator: AsyncMock,
+    monkeypatch,
+):
+    # ARRANGE: empate 2 vs 3 (más una abstención); el iniciador votó al 3
+    game_id = 101
+    mock_validator.validate_game_header_exists.return_value = draw_header(
+        action_state=GameActionState.AWAITING_VOTES
+    )
+    mock_queries.get_pending_saga.return_value = vote_saga(
+        eligible_voters=[1, 2, 3, 4]
+    )
+    mock_commands.cast_vote.return_value = ResponseStatus.OK
+    mock_queries.get_vote_tally.return_value = VoteTally(
+        total_votes=4, counts={2: 1, 3: 1}, initiator_vote=3
+    )
+    mock_queries.get_card.return_value = None
+    reveal_effect = Mock()
+    reveal_effect.return_value.execute = AsyncMock()
+    monkeypatch.setattr(
+        "app.game.services.turn_service.RevealChosenSecretEffect", reveal_effect
+    )
+
+    # ACT
+    await turn_service.submit_vote(
+        VoteRequest(player_id=4, game_id=game_id, voted_player_id=None)
+    )
+
+    # ASSERT
+    mock_notificator.notify_vote_result.assert_awaited_once_with(
+        game_id, 3, True
+    )
+    reveal_effect.return_value.execute.assert_awaited_once_with(
+        game_id=game_id, player_id=1, card_ids=[], target_player_id=3
+    )
+    mock_commands.clear_votes.assert_called_once_with(game_id, 55)
+    mock_commands.update_pending_saga.assert_called_once_with(game_id, None)
+
+
+@pytest.mark.asyncio
+async def test_submit_vote_last_vote_discards_the_source_card(
+    turn_service: TurnService,
+    mock_queries: Mock,
+    mock_commands: Mock,
+    mock_validator: Mock,
+    monkeypatch,
+):
+    # ARRANGE: notifier con autospec para que se validen las firmas reales
+    game_id = 101
+    notifier = create_autospec(Notificator, instance=True)
+    turn_service.notifier = notifier
+    mock_validator.validate_game_header_exists.return_value = draw_header(
+        action_state=GameActionState.AWAITING_VOTES
+    )
+    mock_queries.get_pending_saga.return_value = vote_saga()
+    mock_commands.cast_vote.return_value = ResponseStatus.OK
+    mock_queries.get_vote_tally.return_value = VoteTally(
+        total_votes=3, counts={3: 2, 2: 1}, initiator_vote=3
+    )
+    source_card = Card(
+        card_id=55,
+        game_id=game_id,
+        card_type=CardType.POINT_YOUR_SUSPICIONS,
+        location=CardLocation.DISCARD_PILE,
+    )
+    mock_queries.get_card.return_value = source_card
+    reveal_effect = Mock()
+    reveal_effect.return_value.execute = AsyncMock()
+    monkeypatch.setattr(
+        "app.game.services.turn_service.RevealChosenSecretEffect", reveal_effect
+    )
+
+    # ACT
+    await turn_service.submit_vote(
+        VoteRequest(player_id=3, game_id=game_id, voted_player_id=3)
+    )
+
+    # ASSERT
+    mock_commands.update_card_location.assert_called_once_with(
+        55, game_id, CardLocation.DISCARD_PILE
+    )
+    notifier.notify_cards_played.assert_awaited_once_with(
+        game_id, 1, [source_card], is_cancellable=False
+    )
+    mock_commands.clear_votes.assert_called_once_with(game_id, 55)
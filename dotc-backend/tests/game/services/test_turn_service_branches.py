@@ -4,133 +4,90 @@ from unittest.mock import Mock, AsyncMock
 
 from app.game.services.turn_service import TurnService
 from app.api.schemas import DrawCardRequest, DrawSource, DiscardCardRequest, PlayCardRequest, PlayCardActionType, RevealSecretRequest, PlayerActionRequest
-from app.domain.models import Card, PlayerInGame, PlayerInfo, Game, SecretCard
+from app.domain.models import Card, PlayerInGame, PlayerInfo, Game, GameHeader, SecretCard
 from app.domain.enums import CardLocation, CardType, GameStatus, ResponseStatus, GameActionState, Avatar, PlayerRole
 from app.game.exceptions import InvalidAction, CardNotFound, InternalGameError, ResourceNotFound
 
 
-@pytest.mark.asyncio
-async def test_draw_from_discard_wrong_state_raises_invalid_action(turn_service: TurnService, mock_validator: Mock, mock_queries: Mock):
-    game = Game(
-        id=1,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000,1,1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        discard_pile=[Card(card_id=9, game_id=1, card_type=CardType.PARKER_PYNE, location=CardLocation.DISCARD_PILE)],
-        action_state=None,
+def _header(action_state=None) -> GameHeader:
+    return GameHeader(
+        id=1, name="t", min_players=2, max_players=4, host_id=1,
+        status=GameStatus.IN_PROGRESS, current_turn_player_id=1,
+        action_state=action_state,
     )
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = []
+
+
+def _card(card_id: int, location: CardLocation, card_type=CardType.PARKER_PYNE, player_id=None) -> Card:
+    return Card(card_id=card_id, game_id=1, card_type=card_type, location=location, player_id=player_id)
+
+
+@pytest.mark.asyncio
+async def test_draw_from_discard_wrong_state_raises_invalid_action(turn_service: TurnService, game_snapshot):
+    game_snapshot(_card(9, CardLocation.DISCARD_PILE), game_id=1, action_state=None)
     req = DrawCardRequest(game_id=1, player_id=1, source=DrawSource.DISCARD, card_id=9)
     with pytest.raises(InvalidAction):
         await turn_service.draw_card(req)
 
 
 @pytest.mark.asyncio
-async def test_draw_from_discard_missing_card_id(turn_service: TurnService, mock_validator: Mock, mock_queries: Mock):
-    game = Game(
-        id=1,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000,1,1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        discard_pile=[Card(card_id=9, game_id=1, card_type=CardType.PARKER_PYNE, location=CardLocation.DISCARD_PILE)],
-        action_state=GameActionState.AWAITING_SELECTION_FOR_CARD,
-    )
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = []
+async def test_draw_from_discard_missing_card_id(turn_service: TurnService, game_snapshot):
+    game_snapshot(_card(9, CardLocation.DISCARD_PILE), game_id=1, action_state=GameActionState.AWAITING_SELECTION_FOR_CARD)
     req = DrawCardRequest(game_id=1, player_id=1, source=DrawSource.DISCARD)
     with pytest.raises(InvalidAction):
         await turn_service.draw_card(req)
 
 
 @pytest.mark.asyncio
-async def test_draw_from_discard_card_not_found(turn_service: TurnService, mock_validator: Mock, mock_queries: Mock):
-    game = Game(
-        id=1,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000,1,1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        discard_pile=[],
-        action_state=GameActionState.AWAITING_SELECTION_FOR_CARD,
-    )
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = []
+async def test_draw_from_discard_card_not_found(turn_service: TurnService, game_snapshot):
+    game_snapshot(game_id=1, action_state=GameActionState.AWAITING_SELECTION_FOR_CARD)
     req = DrawCardRequest(game_id=1, player_id=1, source=DrawSource.DISCARD, card_id=9)
     with pytest.raises(CardNotFound):
         await turn_service.draw_card(req)
 
 
 @pytest.mark.asyncio
-async def test_draw_from_draft_missing_card_id(turn_service: TurnService, mock_validator: Mock, mock_queries: Mock):
-    game = Game(
-        id=1,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(player_id=1, player_name="p", player_birth_date=date(2000,1,1), player_avatar=Avatar.DEFAULT),
-        status=GameStatus.IN_PROGRESS,
-        draft=[Card(card_id=1, game_id=1, card_type=CardType.TOMMY_BERESFORD, location=CardLocation.DRAFT)],
-    )
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = []
+async def test_draw_from_draft_missing_card_id(turn_service: TurnService, game_snapshot):
+    game_snapshot(_card(1, CardLocation.DRAFT, CardType.TOMMY_BERESFORD), game_id=1)
     req = DrawCardRequest(game_id=1, player_id=1, source=DrawSource.DRAFT)
     with pytest.raises(InvalidAction):
         await turn_service.draw_card(req)
 
 
 @pytest.mark.asyncio
-async def test_discard_card_db_fail(turn_service: TurnService, mock_validator: Mock, mock_commands: Mock):
-    player_instance = PlayerInGame(
-        player_id=1,
-        player_name="P",
-        player_birth_date=date(2000,1,1),
-        player_avatar=Avatar.DEFAULT,
-        hand=[Card(card_id=10, game_id=1, card_type=CardType.PARKER_PYNE, location=CardLocation.IN_HAND)],
-    )
-    mock_validator.validate_player_in_game.return_value = player_instance
-    mock_commands.update_card_location.return_value = ResponseStatus.ERROR
+async def test_draw_with_full_hand_raises_invalid_action(turn_service: TurnService, game_snapshot, mock_commands: Mock):
+    game_snapshot(*(_card(i, CardLocation.IN_HAND, player_id=1) for i in range(6)), _card(9, CardLocation.DRAW_PILE), game_id=1)
+    req = DrawCardRequest(game_id=1, player_id=1, source=DrawSource.DECK)
+    with pytest.raises(InvalidAction, match="ya tienes 6"):
+        await turn_service.draw_card(req)
+    mock_commands.move_cards.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_discard_card_db_fail(turn_service: TurnService, game_snapshot, mock_commands: Mock):
+    game_snapshot(_card(10, CardLocation.IN_HAND, player_id=1), game_id=1)
+    mock_commands.move_cards.return_value = ResponseStatus.ERROR
     req = DiscardCardRequest(game_id=1, player_id=1, card_id=10)
     with pytest.raises(InternalGameError):
         await turn_service.discard_card(req)
 
 
 @pytest.mark.asyncio
-async def test_discard_card_inconsistent_hand_raises_internal(turn_service: TurnService, mock_validator: Mock, mock_commands: Mock):
-    player_instance = PlayerInGame(
-        player_id=1,
-        player_name="P",
-        player_birth_date=date(2000,1,1),
-        player_avatar=Avatar.DEFAULT,
-        hand=[],
-    )
-    mock_validator.validate_player_in_game.return_value = player_instance
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
+async def test_discard_card_game_not_found(turn_service: TurnService, mock_queries: Mock, mock_commands: Mock):
+    mock_queries.get_game_snapshot.return_value = None
     req = DiscardCardRequest(game_id=1, player_id=1, card_id=10)
-    with pytest.raises(InternalGameError):
+    with pytest.raises(ResourceNotFound):
         await turn_service.discard_card(req)
+    mock_commands.move_cards.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_discard_card_early_train_triggers_effect(turn_service: TurnService, mock_validator: Mock, mock_commands: Mock, mock_executor: AsyncMock):
-    card = Card(card_id=5, game_id=1, card_type=CardType.EARLY_TRAIN, location=CardLocation.IN_HAND, player_id=1)
-    player_instance = PlayerInGame(
-        player_id=1,
-        player_name="P",
-        player_birth_date=date(2000,1,1),
-        player_avatar=Avatar.DEFAULT,
-        hand=[card],
-    )
-    mock_validator.validate_player_in_game.return_value = player_instance
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
+async def test_discard_card_early_train_triggers_effect(turn_service: TurnService, game_snapshot, mock_executor: AsyncMock):
+    game_snapshot(_card(5, CardLocation.IN_HAND, CardType.EARLY_TRAIN, player_id=1), game_id=1)
     req = DiscardCardRequest(game_id=1, player_id=1, card_id=5)
     await turn_service.discard_card(req)
     mock_executor.execute_effect.assert_awaited_once()
+    played = mock_executor.execute_effect.await_args.kwargs["played_cards"]
+    assert [(c.card_id, c.card_type) for c in played] == [(5, CardType.EARLY_TRAIN)]
 
 
 @pytest.mark.asyncio
@@ -4,16 +4,15 @@ from unittest.mock import Mock, AsyncMock
 
 from app.game.services.turn_service import TurnService
 from app.api.schemas import DrawCardRequest, DrawSource, PlayerActionRequest
-from app.domain.models import Card, PlayerInGame, PlayerInfo, Game
-from app.domain.enums import CardLocation, CardType, GameStatus, ResponseStatus, GameActionState, Avatar
+from app.domain.models import Card, PlayerInGame
+from app.domain.enums import CardLocation, CardType, ResponseStatus, GameActionState, Avatar
 from app.game.exceptions import InvalidAction, InternalGameError
 
 
 @pytest.mark.asyncio
 async def test_draw_card_from_discard_success(
     turn_service: TurnService,
-    mock_validator: Mock,
-    mock_queries: Mock,
+    game_snapshot,
     mock_commands: Mock,
     mock_notificator: AsyncMock,
 ):
@@ -25,39 +24,33 @@ async def test_draw_card_from_discard_success(
         card_type=CardType.MISS_MARPLE,
         location=CardLocation.DISCARD_PILE,
     )
-    game = Game(
-        id=game_id,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(
-            player_id=player_id,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        discard_pile=[discard_card],
+    deck_card = Card(
+        card_id=56,
+        game_id=game_id,
+        card_type=CardType.MISS_MARPLE,
+        location=CardLocation.DRAW_PILE,
+        position=1,
+    )
+    game_snapshot(
+        discard_card,
+        deck_card,
+        game_id=game_id,
         action_state=GameActionState.AWAITING_SELECTION_FOR_CARD,
-        deck=[Card(card_id=999, game_id=game_id, card_type=CardType.NOT_SO_FAST, location=CardLocation.DRAW_PILE)],
     )
 
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
-
     req = DrawCardRequest(game_id=game_id, player_id=player_id, source=DrawSource.DISCARD, card_id=55)
     resp = await turn_service.draw_card(req)
 
     assert resp.drawn_card.card_id == 55
     mock_commands.clear_game_action_state.assert_called_once_with(game_id=game_id)
+    mock_notificator.notify_player_drew.assert_awaited_once_with(game_id, player_id, 1)
+    mock_notificator.notify_murderer_wins.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_draw_card_from_draft_refill_none_when_deck_empty(
     turn_service: TurnService,
-    mock_validator: Mock,
-    mock_queries: Mock,
+    game_snapshot,
     mock_commands: Mock,
     mock_notificator: AsyncMock,
 ):
@@ -69,26 +62,8 @@ async def test_draw_card_from_draft_refill_none_when_deck_empty(
         card_type=CardType.PARKER_PYNE,
         location=CardLocation.DRAFT,
     )
-    game = Game(
-        id=game_id,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(
-            player_id=player_id,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
-        ),
-        status=GameStatus.IN_PROGRESS,
-        draft=[draft_card],
-        deck=[],
-    )
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = []
-    mock_commands.update_card_location.return_value = ResponseStatus.OK
-    mock_queries.get_murderer_id.return_value = 2
-    mock_queries.get_accomplice_id.return_value = 3
+    # Mazo vacío y una sola carta en el draft
+    game_snapshot(draft_card, game_id=game_id, murderer_id=2)
     mock_commands.delete_game.return_value = ResponseStatus.OK
 
     req = DrawCardRequest(game_id=game_id, player_id=player_id, source=DrawSource.DRAFT, card_id=77)
@@ -103,30 +78,24 @@ async def test_draw_card_from_draft_refill_none_when_deck_empty(
 @pytest.mark.asyncio
 async def test_finish_turn_raises_if_hand_less_than_six(
     turn_service: TurnService,
-    mock_validator: Mock,
-    mock_queries: Mock,
+    game_snapshot,
+    mock_commands: Mock,
 ):
     game_id = 303
     player_id = 1
-    game = Game(
-        id=game_id,
-        name="t",
-        min_players=2,
-        max_players=4,
-        host=PlayerInfo(
-            player_id=player_id,
-            player_name="p",
-            player_birth_date=date(2000, 1, 1),
-            player_avatar=Avatar.DEFAULT,
+    game_snapshot(
+        *(
+            Card(card_id=i, game_id=game_id, card_type=CardType.MISS_MARPLE,
+                 location=CardLocation.IN_HAND, player_id=player_id)
+            for i in range(5)
         ),
-        status=GameStatus.IN_PROGRESS,
+        game_id=game_id,
     )
-    mock_validator.validate_game_exists.return_value = game
-    mock_queries.get_player_hand.return_value = [Mock()] * 5
 
     req = PlayerActionRequest(game_id=game_id, player_id=player_id)
     with pytest.raises(InvalidAction):
         await turn_service.finish_turn(req)
+    mock_commands.set_current_turn.assert_not_called()
 
 
 def test_assign_next_turn_errors(
@@ -0,0 +1,200 @@
+import random
+from datetime import date
+
+from app.domain.enums import (
+    Avatar,
+    CardLocation,
+    CardType,
+    GameActionState,
+    GameStatus,
+    PlayerRole,
+)
+from app.domain.models import Card, Game, PendingAction, PlayerInGame, SecretCard
+from app.simulation.bots import RandomBot, TableView
+from app.websockets.rpc import RPC_ACTIONS
+
+P1, P2, P3 = 1, 2, 3
+
+
+def card(card_id, card_type, owner=None, location=CardLocation.IN_HAND):
+    return Card(
+        card_id=card_id,
+        game_id=7,
+        card_type=card_type,
+        location=location,
+        player_id=owner,
+    )
+
+
+def make_view(hands, **game_fields) -> TableView:
+    """Mesa de 3 jugadores; `hands` es {player_id: [CardType, ...]}."""
+    next_id = iter(range(1, 100))
+    players = [
+        PlayerInGame(
+            player_id=pid,
+            player_name=f"p{pid}",
+            player_birth_date=date(2000, 1, pid),
+            player_avatar=Avatar.DEFAULT,
+            hand=[card(next(next_id), t, pid) for t in hands.get(pid, [])],
+        )
+        for pid in (P1, P2, P3)
+    ]
+    game = Game(
+        id=7,
+        name="sim",
+        min_players=2,
+        max_players=6,
+        host=players[0],
+        status=GameStatus.IN_PROGRESS,
+        players=players,
+        draft=[card(90, CardType.MISS_MARPLE, location=CardLocation.DRAFT)],
+        current_turn_player_id=P1,
+        **game_fields,
+    )
+    secrets = {
+        pid: [
+            SecretCard(
+                secret_id=pid * 10 + i,
+                game_id=7,
+                player_id=pid,
+                role=PlayerRole.INNOCENT,
+                is_revealed=i == 0,
+            )
+            for i in range(3)
+        ]
+        for pid in (P1, P2, P3)
+    }
+    return TableView(game=game, secrets=secrets)
+
+
+def no_chaos_bot(seed=0, **rates) -> RandomBot:
+    return RandomBot(random.Random(seed), chaos_rate=0.0, **rates)
+
+
+# =================================================================
+# 🎲 TURNO NORMAL
+# =================================================================
+
+
+def test_short_hand_draws_before_anything_else():
+    # Arrange
+    view = make_view({P1: [CardType.NOT_SO_FAST] * 5})
+
+    # Act
+    moves = no_chaos_bot(play_rate=0.0).moves(view)
+
+    # Assert
+    assert moves[0].action == "draw"
+    assert all(m.player_id == P1 for m in moves)
+
+
+def test_full_hand_ends_with_finish_or_discard():
+    # Arrange
+    view = make_view({P1: [CardType.NOT_SO_FAST] * 6})
+
+    # Act
+    moves = no_chaos_bot(play_rate=0.0).moves(view)
+
+    # Assert
+    assert {m.action for m in moves} == {"finish-turn", "discard"}
+
+
+def test_plays_cover_events_sets_and_wildcards():
+    # Arrange
+    view = make_view(
+        {
+            P1: [
+                CardType.MISS_MARPLE,
+                CardType.HARLEY_QUIN,
+                CardType.TOMMY_BERESFORD,
+                CardType.TUPPENCE_BERESFORD,
+                CardType.CARD_TRADE,
+                CardType.NOT_SO_FAST,
+            ],
+            P2: [CardType.LADY_EILEEN],
+        }
+    )
+    bot = no_chaos_bot()
+    me = view.game.players[0]
+
+    # Act
+    plays = bot._plays(view, me)
+
+    # Assert
+    labels = sorted(m.label for m in plays)
+    assert labels == [
+        "play:CARD_TRADE",
+        "play:FORM_NEW_SET",  # Marple + Quin
+        "play:FORM_NEW_SET",  # Tommy + Quin
+        "play:FORM_NEW_SET",  # Tommy + Tuppence
+        "play:FORM_NEW_SET",  # Tuppence + Quin
+    ]
+    trade = next(m for m in plays if m.label == "play:CARD_TRADE")
+    target = trade.payload["target_player_id"]
+    # Card trade apunta a una carta de la mano del otro (P3 no tiene)
+    target_hand = [c.card_id for c in view.game.players[target - 1].hand]
+    assert trade.payload["target_card_id"] == (target_hand or [None])[0]
+
+
+# =================================================================
+# ✋ RESPUESTAS A PEDIDOS
+# =================================================================
+
+
+def test_nsf_window_skips_the_author_of_the_last_play():
+    # Arrange
+    view = make_view(
+        {P2: [CardType.NOT_SO_FAST]},
+        action_state=GameActionState.PENDING_NSF,
+    )
+    view.pending = PendingAction(
+        id=1,
+        game_id=7,
+        player_id=P1,
+        action_type="PLAY_EVENT",
+        target_player_id=None,
+        target_secret_id=None,
+        target_card_id=None,
+        target_set_id=None,
+        responses_count=0,
+        nsf_count=0,
+        last_action_player_id=P1,
+    )
+
+    # Act
+    moves = no_chaos_bot(nsf_rate=1.0).moves(view)
+
+    # Assert
+    assert {m.player_id for m in moves} == {P2, P3}
+    assert "play-nsf:nsf" in {m.label for m in moves if m.player_id == P2}
+
+
+def test_reveal_prompt_picks_a_hidden_secret_of_the_prompted_player():
+    # Arrange
+    view = make_view(
+        {},
+        action_state=GameActionState.AWAITING_REVEAL_FOR_CHOICE,
+        prompted_player_id=P3,
+    )
+
+    # Act
+    moves = no_chaos_bot().moves(view)
+
+    # Assert
+    assert [m.player_id for m in moves] == [P3]
+    assert moves[0].payload["secret_id"] in {31, 32}
+
+
+def test_every_move_is_a_valid_rpc_request():
+    # Arrange
+    view = make_view({P1: [CardType.DEAD_CARD_FOLLY, CardType.HERCULE_POIROT] * 2})
+    bot = RandomBot(random.Random(3), play_rate=1.0, chaos_rate=1.0)
+
+    # Act
+    moves = bot.moves(view)
+
+    # Assert
+    for move in moves:
+        model, _ = RPC_ACTIONS[move.action]
+        payload = {**move.payload, "game_id": 7, "player_id": move.player_id}
+        model.model_validate(payload)
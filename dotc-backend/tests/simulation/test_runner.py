@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.orm_models import Base
+from app.simulation.runner import SimulationConfig, SimulationReport, play_games
+
+
+def test_merge_adds_counters_and_keeps_the_first_seed():
+    # Arrange
+    a = SimulationReport(
+        games=2, accepted=10, latencies_ms={"draw:deck": [1.0]},
+        rule_errors={"vote [AWAITING_VOTES] TypeError: x": 1},
+        error_seeds={"vote [AWAITING_VOTES] TypeError: x": 4},
+    )
+    b = SimulationReport(
+        games=1, accepted=5, rejected=2, latencies_ms={"draw:deck": [3.0]},
+        rule_errors={"vote [AWAITING_VOTES] TypeError: x": 2},
+        error_seeds={"vote [AWAITING_VOTES] TypeError: x": 9},
+    )
+
+    # Act
+    a.merge(b)
+
+    # Assert
+    assert (a.games, a.accepted, a.rejected, a.actions) == (3, 15, 2, 17)
+    assert a.latencies_ms["draw:deck"] == [1.0, 3.0]
+    assert a.rule_errors == {"vote [AWAITING_VOTES] TypeError: x": 3}
+    assert a.error_seeds == {"vote [AWAITING_VOTES] TypeError: x": 4}
+
+
+@pytest.mark.asyncio
+async def test_plays_a_real_game_against_the_game_manager(tmp_path):
+    # Arrange
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'sim.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    SimSession = sessionmaker(autoflush=False, bind=engine)
+
+    async def session_source():
+        db = SimSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    config = SimulationConfig(games=1, players=2, max_actions=40)
+
+    # Act
+    report = await play_games(session_source, [5], config)
+    engine.dispose()
+
+    # Assert
+    assert report.games == 1
+    assert report.finished + report.stalled + report.truncated == 1
+    assert report.accepted > 0
+    assert report.latencies_ms["draw:deck"]
+    assert "[sim] 1 partidas" in report.render()
@@ -1,7 +1,97 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
 from app.main import app
-from app.dependencies.dependencies import setup_dependencies, IGameManager
+from app.database.queries import DatabaseQueryManager
+from app.database.query_cache import QUERY_CACHE_ENV, CachedQueryManager
+from app.dependencies.dependencies import (
+    setup_dependencies,
+    get_command_manager,
+    get_query_manager,
+    get_db_session,
+    get_game_manager,
+    open_game_manager,
+    GameManager,
+    IGameManager,
+)
+from app.game.helpers.state_deltas import STATE_SYNC_ENV
 
 
 def test_setup_dependencies_sets_override():
     setup_dependencies(app)
     assert IGameManager in app.dependency_overrides
+
+
+def test_query_manager_is_cached_unless_disabled(monkeypatch):
+    session = Session()
+
+    monkeypatch.delenv(QUERY_CACHE_ENV, raising=False)
+    cached = get_query_manager(session)
+    assert isinstance(cached, CachedQueryManager)
+    assert get_command_manager(cached, None).cache is cached
+
+    monkeypatch.setenv(QUERY_CACHE_ENV, "off")
+    assert isinstance(get_query_manager(session), DatabaseQueryManager)
+
+
+def _wiring(manager) -> dict:
+    """
+    Tipo de cada pieza del GameManager y qué instancias comparten los
+    servicios: lo que tiene que coincidir entre HTTP y RPC.
+    """
+    pieces = [
+        manager.player_service,
+        manager.lobby_service,
+        manager.game_setup_service,
+        manager.game_state_service,
+        manager.turn_service,
+        manager.turn_service.effect_executor,
+    ]
+    first = pieces[0]
+    return {
+        "types": [
+            (type(p), type(p.read), type(p.write), type(p.notifier))
+            for p in pieces
+        ],
+        # Un solo gestor de queries, de commands y notificador por grafo
+        "shared": [
+            (p.read is first.read, p.write is first.write,
+             p.notifier is first.notifier)
+            for p in pieces
+        ],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sync_mode", ["refetch", "delta"])
+async def test_http_and_rpc_build_equally_wired_game_managers(
+    monkeypatch, sync_mode
+):
+    # Arrange: una app que devuelve el GameManager que le arma FastAPI
+    monkeypatch.setenv(STATE_SYNC_ENV, sync_mode)
+    session = Session()
+
+    async def session_source():
+        yield session
+
+    http_app = FastAPI()
+    http_app.dependency_overrides[get_db_session] = session_source
+    built = {}
+
+    @http_app.get("/manager")
+    def capture(manager: Annotated[GameManager, Depends(get_game_manager)]):
+        built["http"] = manager
+
+    # Act
+    with TestClient(http_app) as client:
+        client.get("/manager")
+    async with open_game_manager(session_source) as manager:
+        built["rpc"] = manager
+
+    # Assert
+    assert _wiring(built["rpc"]) == _wiring(built["http"])
+    assert built["rpc"].turn_service.read.session is session
@@ -0,0 +1,292 @@
+import asyncio
+import multiprocessing
+import os
+import socket
+
+import pytest
+import pytest_asyncio
+
+from app.api.schemas import GameLobbyInfo, GameStatus
+from app.game.helpers.notificators import Notificator
+from app.websockets.broker import (
+    BROKER_DIR_ENV,
+    BROKER_ENV,
+    BrokerEnvelope,
+    InProcessBroker,
+    UnixSocketBroker,
+    load_broker,
+)
+from app.websockets.connection_manager import ConnectionManager
+from app.websockets.protocol.details import NewTurnDetails
+from app.websockets.protocol.events import WSEvent
+from app.websockets.protocol.messages import WSMessage
+from tests.benchmarks.test_state_sync_requests import RecordingSocket
+
+pytestmark = pytest.mark.asyncio
+
+GAME_ID = 1
+WAIT_S = 10
+
+
+def new_turn(player_id: int) -> WSMessage:
+    return WSMessage(details=NewTurnDetails(turn_player_id=player_id))
+
+
+def lobby_game() -> GameLobbyInfo:
+    return GameLobbyInfo(
+        id=7,
+        name="Entre workers",
+        min_players=2,
+        max_players=4,
+        player_count=1,
+        host_id=1,
+        game_status=GameStatus.LOBBY,
+        password=None,
+    )
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError("No llegó el mensaje por el broker.")
+        await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def workers(tmp_path):
+    """Dos ConnectionManager del mismo proceso unidos por sockets Unix."""
+    managers = [
+        ConnectionManager(broker=UnixSocketBroker(str(tmp_path)))
+        for _ in range(2)
+    ]
+    for manager in managers:
+        await manager.start()
+    yield managers
+    for manager in managers:
+        await manager.shutdown()
+
+
+# =================================================================
+# 📮 BACKENDS
+# =================================================================
+
+
+async def test_in_process_broker_delivers_locally():
+    # Arrange
+    manager = ConnectionManager(broker=InProcessBroker())
+    ws = RecordingSocket()
+    await manager.connect(ws, game_id=GAME_ID, player_id=2)
+
+    # Act
+    await manager.broadcast_to_game(new_turn(2), GAME_ID)
+    await manager.drain()
+
+    # Assert
+    assert [f["details"]["event"] for f in ws.frames] == [
+        WSEvent.NEW_TURN.value
+    ]
+    await manager.shutdown()
+
+
+async def test_unix_broker_reaches_sockets_on_the_other_worker(workers):
+    # Arrange
+    publisher, holder = workers
+    player, other, lobby = RecordingSocket(), RecordingSocket(), RecordingSocket()
+    await holder.connect(player, game_id=GAME_ID, player_id=2)
+    await holder.connect(other, game_id=GAME_ID, player_id=3)
+    await holder.connect(lobby)
+
+    # Act
+    await publisher.broadcast_to_game(new_turn(2), GAME_ID)
+    await publisher.send_to_player(new_turn(3), GAME_ID, player_id=2)
+    await Notificator(publisher).notify_game_created(lobby_game())
+    await wait_for(lambda: len(player.frames) == 2 and lobby.frames)
+    await holder.drain()
+
+    # Assert
+    assert [f["seq"] for f in player.frames] == [1, 2]
+    assert len(other.frames) == 1
+    assert lobby.frames[0]["details"]["game"]["id"] == 7
+    assert publisher.broker.sent == 3
+    assert holder.broker.received == 3
+
+
+async def test_unix_broker_removes_sockets_of_dead_workers(tmp_path):
+    # Arrange: un socket Unix que quedó en el directorio sin nadie escuchando
+    stale = tmp_path / "worker-dead.sock"
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    dead.bind(str(stale))
+    dead.close()
+    broker = UnixSocketBroker(str(tmp_path))
+
+    # Act
+    await ConnectionManager(broker=broker).broadcast_to_lobby(new_turn(1))
+
+    # Assert
+    assert not stale.exists()
+    assert broker.sent == 0
+
+
+def listening_socket(path) -> socket.socket:
+    """Un 'worker' que escucha en el directorio pero nunca lee."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024)
+    sock.bind(str(path))
+    return sock
+
+
+async def test_unix_broker_counts_dropped_messages_in_stats(tmp_path):
+    # Arrange: un worker que no da abasto
+    stuck = listening_socket(tmp_path / "worker-stuck.sock")
+    manager = ConnectionManager(broker=UnixSocketBroker(str(tmp_path)))
+
+    # Act
+    for player_id in range(2000):
+        await manager.broadcast_to_game(new_turn(player_id), GAME_ID)
+
+    # Assert
+    stats = manager.get_stats().broker
+    assert stats.backend == "unix"
+    assert stats.peers == 1
+    assert stats.dropped > 0
+    assert stats.sent + stats.dropped == 2000
+    stuck.close()
+
+
+async def test_unix_broker_caches_peers_until_a_send_fails(tmp_path):
+    # Arrange
+    first = listening_socket(tmp_path / "worker-a.sock")
+    broker = UnixSocketBroker(str(tmp_path), peer_refresh_s=60)
+    broker.publish(BrokerEnvelope(target="lobby", message=new_turn(1)))
+    late = listening_socket(tmp_path / "worker-b.sock")
+
+    # Act: el directorio no se relee mientras no falle un envío
+    broker.publish(BrokerEnvelope(target="lobby", message=new_turn(1)))
+    sent_with_cache = broker.sent
+    first.close()
+    os.unlink(tmp_path / "worker-a.sock")
+    broker.publish(BrokerEnvelope(target="lobby", message=new_turn(1)))
+    broker.publish(BrokerEnvelope(target="lobby", message=new_turn(1)))
+
+    # Assert
+    assert sent_with_cache == 2
+    assert broker.sent == 3
+    assert broker.stats().peers == 1
+    late.close()
+
+
+async def test_reconnect_since_asks_for_resync_across_workers(workers):
+    # Arrange: la secuencia que vio el cliente es de otro worker
+    publisher, holder = workers
+    await holder.connect(RecordingSocket(), game_id=GAME_ID, player_id=2)
+    await publisher.broadcast_to_game(new_turn(2), GAME_ID)
+    await wait_for(lambda: GAME_ID in holder.replay)
+    reconnected = RecordingSocket()
+
+    # Act
+    await holder.connect(reconnected, game_id=GAME_ID, player_id=3, since=0)
+    await holder.drain()
+
+    # Assert
+    assert [f["details"]["event"] for f in reconnected.frames] == [
+        WSEvent.RESYNC_REQUIRED.value
+    ]
+
+
+async def test_load_broker_from_env(monkeypatch, tmp_path):
+    # Arrange
+    monkeypatch.setenv(BROKER_ENV, "unix")
+    monkeypatch.setenv(BROKER_DIR_ENV, str(tmp_path))
+    # Act
+    broker = load_broker()
+    # Assert
+    assert isinstance(broker, UnixSocketBroker)
+    assert broker.directory == str(tmp_path)
+
+
+async def test_load_broker_rejects_unknown(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(BROKER_ENV, "redis")
+    # Act & Assert
+    with pytest.raises(ValueError):
+        load_broker()
+
+
+# =================================================================
+# 🔀 DOS WORKERS (PROCESOS SEPARADOS)
+# =================================================================
+
+
+async def _hold_sockets(directory: str, ready, results) -> None:
+    manager = ConnectionManager(broker=UnixSocketBroker(directory))
+    await manager.start()
+    player, lobby = RecordingSocket(), RecordingSocket()
+    await manager.connect(player, game_id=GAME_ID, player_id=2)
+    await manager.connect(lobby)
+    ready.set()
+    try:
+        await wait_for(lambda: len(player.frames) == 2 and lobby.frames, WAIT_S)
+    finally:
+        await manager.drain()
+        results.put(
+            {
+                "pid": os.getpid(),
+                "player": [f["details"]["event"] for f in player.frames],
+                "lobby": [f["details"]["event"] for f in lobby.frames],
+            }
+        )
+        await manager.shutdown()
+
+
+async def _publish(directory: str, ready, results) -> None:
+    manager = ConnectionManager(broker=UnixSocketBroker(directory))
+    await manager.start()
+    await asyncio.get_running_loop().run_in_executor(None, ready.wait, WAIT_S)
+    notifier = Notificator(manager)
+    await notifier.notify_new_turn(game_id=GAME_ID, turn_player_id=2)
+    await notifier.notify_hand_updated(game_id=GAME_ID, player_id=2, hand=[])
+    await notifier.notify_game_created(lobby_game())
+    results.put({"pid": os.getpid(), "sent": manager.broker.sent})
+    await manager.shutdown()
+
+
+def holder_worker(directory: str, ready, results) -> None:
+    asyncio.run(_hold_sockets(directory, ready, results))
+
+
+def publisher_worker(directory: str, ready, results) -> None:
+    asyncio.run(_publish(directory, ready, results))
+
+
+async def test_two_workers_deliver_notifications_across_processes(tmp_path):
+    # Arrange
+    context = multiprocessing.get_context("spawn")
+    ready, results = context.Event(), context.Queue()
+    workers = [
+        context.Process(target=target, args=(str(tmp_path), ready, results))
+        for target in (holder_worker, publisher_worker)
+    ]
+
+    # Act
+    for worker in workers:
+        worker.start()
+    loop = asyncio.get_running_loop()
+    reports = [
+        await loop.run_in_executor(None, results.get, True, WAIT_S * 2)
+        for _ in workers
+    ]
+    for worker in workers:
+        await loop.run_in_executor(None, worker.join, WAIT_S)
+
+    # Assert
+    holder = next(r for r in reports if "player" in r)
+    publisher = next(r for r in reports if "sent" in r)
+    assert holder["pid"] != publisher["pid"]
+    assert holder["player"] == [
+        WSEvent.NEW_TURN.value,
+        WSEvent.HAND_UPDATED.value,
+    ]
+    assert holder["lobby"] == [WSEvent.GAME_CREATED.value]
+    assert publisher["sent"] == 3
+    assert all(worker.exitcode == 0 for worker in workers)
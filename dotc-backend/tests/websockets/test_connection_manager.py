@@ -1,22 +1,37 @@
+import asyncio
+
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock
 
-from app.websockets.connection_manager import ConnectionManager
+from app.websockets.connection_manager import ConnectionManager, RESYNC_FRAME
+from app.websockets.slow_consumers import (
+    SlowConsumerPolicy,
+    load_slow_consumer_policy,
+)
+from app.websockets.protocol.events import WSEvent
 from app.websockets.protocol.messages import WSMessage
-from app.websockets.protocol.details import GameCreatedDetails
+from app.websockets.replay import REPLAY_BUFFER_SIZE
+from app.websockets.protocol.details import (
+    GameCreatedDetails,
+    GameOverDetails,
+    GameRemovedDetails,
+)
 from app.api.schemas import GameLobbyInfo, GameStatus
 
 # Marcamos todos los tests en este módulo como asíncronos para pytest.
 pytestmark = pytest.mark.asyncio
 
 
-@pytest.fixture
-def manager() -> ConnectionManager:
+@pytest_asyncio.fixture
+async def manager():
     """
     Fixture de Pytest que proporciona una instancia limpia y nueva
     del ConnectionManager para cada test, asegurando el aislamiento.
     """
-    return ConnectionManager()
+    manager = ConnectionManager()
+    yield manager
+    await manager.shutdown()
 
 
 # =================================================================
@@ -54,7 +69,7 @@ async def test_connect_to_game(manager: ConnectionManager):
 
     # Assert
     mock_websocket.accept.assert_awaited_once()
-    assert manager.connections_by_game[game_id][player_id] == mock_websocket
+    assert manager.connections_by_game[game_id][player_id] == {mock_websocket}
     assert not manager.lobby_connections
 
 
@@ -88,7 +103,7 @@ async def test_disconnect_from_game(manager: ConnectionManager):
     game_id = 1
     player_id = 101
     await manager.connect(mock_websocket, game_id=game_id, player_id=player_id)
-    assert manager.connections_by_game[game_id][player_id] == mock_websocket
+    assert manager.connections_by_game[game_id][player_id] == {mock_websocket}
 
     # Act
     manager.disconnect(mock_websocket)
@@ -138,8 +153,25 @@ async def test_disconnect_from_game_with_remaining_players(
     assert game_id in manager.connections_by_game
     assert len(manager.connections_by_game[game_id]) == 1
     assert 102 not in manager.connections_by_game[game_id]
-    assert manager.connections_by_game[game_id][101] == player1_ws
+    assert manager.connections_by_game[game_id][101] == {player1_ws}
+
+
+
+async def test_second_tab_does_not_replace_first_socket(
+    manager: ConnectionManager,
+):
+    """Dos sockets del mismo jugador conviven; cerrar uno deja el otro."""
+    # Arrange
+    tab1, tab2 = AsyncMock(), AsyncMock()
+    await manager.connect(tab1, game_id=1, player_id=101)
+    await manager.connect(tab2, game_id=1, player_id=101)
 
+    # Act
+    manager.disconnect(tab1)
+
+    # Assert
+    assert manager.connections_by_game[1][101] == {tab2}
+    assert tab1 not in manager.outbound
 
 
 # =================================================================
@@ -147,6 +179,11 @@ async def test_disconnect_from_game_with_remaining_players(
 # =================================================================
 
 
+def stamped(message: WSMessage, seq: int) -> str:
+    """Frame tal como sale hacia una partida: con su número de secuencia."""
+    return message.model_copy(update={"seq": seq}).model_dump_json()
+
+
 @pytest.fixture
 def sample_message() -> WSMessage:
     """Fixture que crea un mensaje de ejemplo para usar en tests."""
@@ -182,6 +219,7 @@ async def test_broadcast_to_lobby(
 
     # Act
     await manager.broadcast_to_lobby(sample_message)
+    await manager.drain()
 
     # Assert
     expected_json = sample_message.model_dump_json()
@@ -210,9 +248,10 @@ async def test_broadcast_to_game(
 
     # Act
     await manager.broadcast_to_game(sample_message, game_id=1)
+    await manager.drain()
 
     # Assert
-    expected_json = sample_message.model_dump_json()
+    expected_json = stamped(sample_message, seq=1)
     game1_ws1.send_text.assert_awaited_once_with(expected_json)
     game1_ws2.send_text.assert_awaited_once_with(expected_json)
     game2_ws.send_text.assert_not_awaited()
@@ -235,6 +274,7 @@ async def test_broadcast_to_nonexistent_game_does_not_fail(
     # Act
     try:
         await manager.broadcast_to_game(sample_message, game_id=non_existent_game_id)
+        await manager.drain()
     except Exception as e:
         pytest.fail(f"broadcast_to_game() raised an unexpected exception: {e}")
 
@@ -258,12 +298,32 @@ async def test_send_to_player(
 
     # Act
     await manager.send_to_player(sample_message, game_id=1, player_id=101)
+    await manager.drain()
 
     # Assert
-    expected_json = sample_message.model_dump_json()
+    expected_json = stamped(sample_message, seq=1)
     player_ws.send_text.assert_awaited_once_with(expected_json)
     other_player_ws.send_text.assert_not_awaited()
 
+async def test_send_to_player_reaches_every_open_socket(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """send_to_player entrega en todas las pestañas abiertas del jugador."""
+    # Arrange
+    tab1, tab2 = AsyncMock(), AsyncMock()
+    await manager.connect(tab1, game_id=1, player_id=101)
+    await manager.connect(tab2, game_id=1, player_id=101)
+
+    # Act
+    await manager.send_to_player(sample_message, game_id=1, player_id=101)
+    await manager.drain()
+
+    # Assert
+    expected_json = stamped(sample_message, seq=1)
+    tab1.send_text.assert_awaited_once_with(expected_json)
+    tab2.send_text.assert_awaited_once_with(expected_json)
+
+
 async def test_send_to_nonexistent_player_does_not_fail(
     manager: ConnectionManager,
     sample_message: WSMessage
@@ -288,6 +348,7 @@ async def test_send_to_nonexistent_player_does_not_fail(
 
     # Case 2: Game does not exist
     await manager.send_to_player(sample_message, game_id=non_existent_game_id, player_id=player_id)
+    await manager.drain()
 
     # Assert
     # Verify that the existing player did not receive any messages
@@ -316,16 +377,318 @@ async def test_player_in_multiple_games_receives_correct_broadcasts(
     other_player_ws = AsyncMock()
     await manager.connect(other_player_ws, game_id=game1_id, player_id=102)
 
-    assert manager.connections_by_game[game1_id][player_id] is ws_game1
-    assert manager.connections_by_game[game2_id][player_id] is ws_game2
+    assert manager.connections_by_game[game1_id][player_id] == {ws_game1}
+    assert manager.connections_by_game[game2_id][player_id] == {ws_game2}
 
     # Act
     # Broadcast a la partida 1
     await manager.broadcast_to_game(sample_message, game_id=game1_id)
+    await manager.drain()
 
     # Assert
-    expected_json = sample_message.model_dump_json()
+    expected_json = stamped(sample_message, seq=1)
     ws_game1.send_text.assert_awaited_once_with(expected_json)
     other_player_ws.send_text.assert_awaited_once_with(expected_json)
     ws_game2.send_text.assert_not_awaited()
-    
\ No newline at end of file
+    
+
+
+# =================================================================
+# 📬 TESTS PARA LAS COLAS DE SALIDA POR CONEXIÓN
+# =================================================================
+
+
+async def hang_forever(_frame: str):
+    """send_text de un cliente colgado: nunca termina."""
+    await asyncio.Event().wait()
+
+
+async def test_slow_socket_does_not_delay_broadcast(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """
+    Un socket que nunca termina de enviar no frena el broadcast ni la
+    entrega a los demás clientes.
+    """
+    # Arrange
+    stalled = AsyncMock()
+    stalled.send_text.side_effect = hang_forever
+    healthy = AsyncMock()
+    await manager.connect(stalled)
+    await manager.connect(healthy)
+
+    # Act
+    await asyncio.wait_for(manager.broadcast_to_lobby(sample_message), 0.1)
+    await asyncio.wait_for(manager.outbound[healthy].drain(), 0.1)
+
+    # Assert
+    healthy.send_text.assert_awaited_once_with(sample_message.model_dump_json())
+    assert stalled in manager.lobby_connections
+
+
+async def test_failing_socket_is_disconnected_without_affecting_others(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """Un envío que falla desconecta ese socket; el resto sigue recibiendo."""
+    # Arrange
+    dead = AsyncMock()
+    dead.send_text.side_effect = RuntimeError("socket cerrado")
+    alive = AsyncMock()
+    await manager.connect(dead, game_id=1, player_id=101)
+    await manager.connect(alive, game_id=1, player_id=102)
+
+    # Act
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await manager.drain()
+
+    # Assert
+    alive.send_text.assert_awaited_once()
+    assert 101 not in manager.connections_by_game[1]
+    assert dead not in manager.outbound
+
+
+async def test_full_send_queue_disconnects_slow_socket(
+    sample_message: WSMessage,
+):
+    """Si la cola de salida se llena, el socket lento se corta con 1013."""
+    # Arrange
+    manager = ConnectionManager(
+        SlowConsumerPolicy(max_queue_depth=2, on_limit="disconnect")
+    )
+    stalled = AsyncMock()
+    stalled.send_text.side_effect = hang_forever
+    await manager.connect(stalled)
+    await asyncio.sleep(0)  # la tarea escritora toma el primer frame
+
+    # Act
+    for _ in range(4):
+        await manager.broadcast_to_lobby(sample_message)
+    await asyncio.sleep(0)
+
+    # Assert
+    assert stalled not in manager.lobby_connections
+    assert stalled not in manager.outbound
+    stalled.close.assert_awaited_once_with(code=1013)
+    assert manager.get_stats().lobby.evicted == 1
+
+
+# =================================================================
+# 🐢 TESTS PARA LA POLÍTICA DE CONSUMIDORES LENTOS
+# =================================================================
+
+
+async def test_full_queue_is_downgraded_to_a_single_resync(
+    sample_message: WSMessage,
+):
+    """
+    Con on_limit="resync" lo pendiente se reemplaza por un aviso
+    RESYNC_REQUIRED y el socket sigue conectado.
+    """
+    # Arrange
+    manager = ConnectionManager(SlowConsumerPolicy(max_queue_depth=3))
+    release = asyncio.Event()
+    socket = AsyncMock()
+
+    async def blocked_send(_frame: str):
+        await release.wait()
+
+    socket.send_text.side_effect = blocked_send
+    await manager.connect(socket, game_id=1, player_id=101)
+
+    # Act: 1 en vuelo + 2 encolados, el 4to desborda; el 5to se descarta
+    for _ in range(5):
+        await manager.broadcast_to_game(sample_message, game_id=1)
+        await asyncio.sleep(0)
+    release.set()
+    await manager.drain()
+
+    # Assert
+    frames = [call.args[0] for call in socket.send_text.await_args_list]
+    assert frames == [stamped(sample_message, seq=1), RESYNC_FRAME]
+    stats = manager.get_stats().games[1]
+    assert stats.resyncs == 1
+    assert stats.frames_dropped == 4
+    assert stats.evicted == 0
+    assert stats.connections[0].resync_pending is False
+    await manager.shutdown()
+
+
+async def test_socket_without_progress_is_evicted(sample_message: WSMessage):
+    """Un socket que no envía nada en max_send_lag_s se desconecta."""
+    # Arrange
+    manager = ConnectionManager(SlowConsumerPolicy(max_send_lag_s=0.01))
+    stalled = AsyncMock()
+    stalled.send_text.side_effect = hang_forever
+    await manager.connect(stalled, game_id=1, player_id=101)
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await asyncio.sleep(0.02)
+
+    # Act
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await asyncio.sleep(0)
+
+    # Assert
+    assert stalled not in manager.outbound
+    assert 1 not in manager.connections_by_game
+    stalled.close.assert_awaited_once_with(code=1013)
+
+
+async def test_stats_group_queues_by_game(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """get_stats publica profundidad y bytes pendientes por partida."""
+    # Arrange
+    stalled = AsyncMock()
+    stalled.send_text.side_effect = hang_forever
+    await manager.connect(stalled, game_id=7, player_id=701)
+    await manager.connect(AsyncMock(), game_id=7, player_id=702)
+    await manager.connect(AsyncMock())
+
+    # Act
+    for _ in range(3):
+        await manager.broadcast_to_game(sample_message, game_id=7)
+    await asyncio.sleep(0)
+    stats = manager.get_stats()
+
+    # Assert
+    game = stats.games[7]
+    assert {c.player_id for c in game.connections} == {701, 702}
+    assert game.queue_depth_max == 3
+    frame_size = len(stamped(sample_message, seq=1).encode())
+    assert game.bytes_pending == 3 * frame_size
+    assert len(stats.lobby.connections) == 1
+
+
+async def test_policy_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("DOTC_WS_MAX_QUEUE_DEPTH", "32")
+    monkeypatch.setenv("DOTC_WS_ON_LIMIT", "DISCONNECT")
+
+    # Act
+    policy = load_slow_consumer_policy()
+
+    # Assert
+    assert policy.max_queue_depth == 32
+    assert policy.on_limit == "disconnect"
+    assert policy.max_pending_bytes == SlowConsumerPolicy().max_pending_bytes
+
+
+# =================================================================
+# 🔁 TESTS PARA SECUENCIA Y REPETICIÓN AL RECONECTAR
+# =================================================================
+
+
+async def test_game_messages_are_numbered_per_game(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """Cada partida numera sus mensajes por separado; el lobby no."""
+    # Arrange
+    ws_game1, ws_game2, ws_lobby = AsyncMock(), AsyncMock(), AsyncMock()
+    await manager.connect(ws_game1, game_id=1, player_id=101)
+    await manager.connect(ws_game2, game_id=2, player_id=201)
+    await manager.connect(ws_lobby)
+
+    # Act
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await manager.send_to_player(sample_message, game_id=1, player_id=101)
+    await manager.broadcast_to_game(sample_message, game_id=2)
+    await manager.broadcast_to_lobby(sample_message)
+    await manager.drain()
+
+    # Assert
+    sent = [call.args[0] for call in ws_game1.send_text.await_args_list]
+    assert sent == [stamped(sample_message, 1), stamped(sample_message, 2)]
+    ws_game2.send_text.assert_awaited_once_with(stamped(sample_message, 1))
+    ws_lobby.send_text.assert_awaited_once_with(sample_message.model_dump_json())
+
+
+async def test_reconnect_since_replays_only_missed_frames(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """
+    Al reconectar con since, el jugador recibe lo que se perdió, incluidos
+    sus mensajes privados pero no los privados de otros.
+    """
+    # Arrange: el 101 vio el seq 1 y se cayó; mientras tanto salen 2, 3 y 4
+    staying, dropped = AsyncMock(), AsyncMock()
+    await manager.connect(staying, game_id=1, player_id=102)
+    await manager.connect(dropped, game_id=1, player_id=101)
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    manager.disconnect(dropped)
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await manager.send_to_player(sample_message, game_id=1, player_id=102)
+    await manager.send_to_player(sample_message, game_id=1, player_id=101)
+    reconnected = AsyncMock()
+
+    # Act
+    await manager.connect(reconnected, game_id=1, player_id=101, since=1)
+    await manager.drain()
+
+    # Assert
+    sent = [call.args[0] for call in reconnected.send_text.await_args_list]
+    assert sent == [stamped(sample_message, 2), stamped(sample_message, 4)]
+
+
+async def test_reconnect_after_buffer_rolled_over_asks_for_resync(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """Si los mensajes perdidos ya no están en memoria, se pide resync."""
+    # Arrange
+    await manager.connect(AsyncMock(), game_id=1, player_id=102)
+    for _ in range(REPLAY_BUFFER_SIZE + 2):
+        await manager.broadcast_to_game(sample_message, game_id=1)
+    reconnected = AsyncMock()
+
+    # Act
+    await manager.connect(reconnected, game_id=1, player_id=101, since=1)
+    await manager.drain()
+
+    # Assert
+    reconnected.send_text.assert_awaited_once()
+    resync = WSMessage.model_validate_json(
+        reconnected.send_text.await_args.args[0]
+    )
+    assert resync.details.event == WSEvent.RESYNC_REQUIRED
+    assert resync.seq == REPLAY_BUFFER_SIZE + 2
+
+
+async def test_game_without_sockets_keeps_only_the_sequence(
+    manager: ConnectionManager, sample_message: WSMessage
+):
+    """Sin sockets en la partida no se guardan frames, solo la secuencia."""
+    # Act
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await manager.send_to_player(sample_message, game_id=1, player_id=101)
+
+    # Assert
+    assert manager.replay[1].last_seq == 2
+    assert not manager.replay[1].frames
+
+
+@pytest.mark.parametrize(
+    "channel, ending",
+    [
+        ("game", GameOverDetails(game_id=1)),
+        ("lobby", GameRemovedDetails(game_id=1)),
+    ],
+    ids=["game-over", "game-removed"],
+)
+async def test_replay_buffer_is_dropped_when_the_game_ends(
+    manager: ConnectionManager, sample_message: WSMessage, channel, ending
+):
+    """Cuando la partida termina o se borra, se descarta su buffer."""
+    # Arrange
+    await manager.connect(AsyncMock(), game_id=1, player_id=101)
+    await manager.broadcast_to_game(sample_message, game_id=1)
+    await manager.broadcast_to_game(sample_message, game_id=2)
+    message = WSMessage(details=ending)
+
+    # Act
+    if channel == "game":
+        await manager.broadcast_to_game(message, game_id=1)
+    else:
+        await manager.broadcast_to_lobby(message)
+
+    # Assert
+    assert 1 not in manager.replay
+    assert 2 in manager.replay
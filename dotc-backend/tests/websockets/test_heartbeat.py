@@ -0,0 +1,219 @@
+import asyncio
+import json
+import time
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+
+from app.websockets.connection_manager import ConnectionManager
+from app.websockets.heartbeat import (
+    CLOSE_CODE_IDLE,
+    HEARTBEAT_ENV_PREFIX,
+    RECONNECT_WINDOW_S,
+    HeartbeatPolicy,
+    is_pong,
+    load_heartbeat_policy,
+)
+from app.websockets.protocol.events import WSEvent
+from app.websockets.router import receive_frames
+
+pytestmark = pytest.mark.asyncio
+
+PONG = json.dumps({"type": "pong"})
+POLICY = HeartbeatPolicy(interval_s=0.01, grace_s=0.01)
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = ConnectionManager(heartbeat=POLICY)
+    yield manager
+    await manager.shutdown()
+
+
+def events(ws: AsyncMock) -> list:
+    return [
+        json.loads(c.args[0])["details"]["event"]
+        for c in ws.send_text.await_args_list
+    ]
+
+
+async def go_silent():
+    await asyncio.sleep(POLICY.max_silence_s * 2)
+
+
+# =================================================================
+# 💓 LATIDOS Y COSECHA
+# =================================================================
+
+
+async def test_heartbeat_is_sent_to_every_socket(manager: ConnectionManager):
+    # Arrange
+    lobby, player = AsyncMock(), AsyncMock()
+    await manager.connect(lobby)
+    await manager.connect(player, game_id=1, player_id=2)
+
+    # Act
+    manager.heartbeat()
+    await manager.drain()
+
+    # Assert
+    assert events(lobby) == [WSEvent.HEARTBEAT.value]
+    assert events(player) == [WSEvent.HEARTBEAT.value]
+
+
+async def test_silent_socket_that_answered_pongs_is_reaped(
+    manager: ConnectionManager,
+):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws, game_id=1, player_id=2)
+    manager.touch(ws, PONG)
+    await go_silent()
+
+    # Act
+    manager.heartbeat()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert not manager.is_connected(ws)
+    assert manager.connections_by_game == {}
+    ws.close.assert_awaited_once_with(code=CLOSE_CODE_IDLE)
+    assert manager.get_stats().lifecycle.reaped == 1
+
+
+async def test_clients_without_pong_are_not_reaped_for_silence(
+    manager: ConnectionManager,
+):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws)
+    await go_silent()
+
+    # Act
+    manager.heartbeat()
+
+    # Assert
+    assert manager.is_connected(ws)
+    ws.close.assert_not_awaited()
+
+
+async def test_any_frame_keeps_the_socket_alive(manager: ConnectionManager):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws)
+    manager.touch(ws, PONG)
+    await go_silent()
+
+    # Act
+    manager.touch(ws, '{"id": 1, "action": "draw"}')
+    manager.heartbeat()
+
+    # Assert
+    assert manager.is_connected(ws)
+
+
+async def test_start_runs_the_heartbeat_loop(manager: ConnectionManager):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws)
+
+    # Act
+    await manager.start()
+    await asyncio.sleep(POLICY.interval_s * 5)
+    await manager.drain()
+
+    # Assert
+    assert WSEvent.HEARTBEAT.value in events(ws)
+
+
+async def test_receive_loop_ends_when_a_half_open_socket_is_reaped(
+    manager: ConnectionManager,
+):
+    # Arrange: un socket que nunca entrega nada (ni el disconnect)
+    ws = AsyncMock()
+    frames = iter([PONG])
+
+    async def receive_text():
+        frame = next(frames, None)
+        if frame is None:
+            await asyncio.Event().wait()
+        return frame
+
+    ws.receive_text.side_effect = receive_text
+    await manager.connect(ws, game_id=1, player_id=2)
+    received = []
+
+    async def loop():
+        async for frame in receive_frames(ws, manager):
+            received.append(frame)
+
+    task = asyncio.create_task(loop())
+    await go_silent()
+
+    # Act
+    manager.heartbeat()
+
+    # Assert
+    await asyncio.wait_for(task, timeout=1)
+    assert received == [PONG]
+
+
+# =================================================================
+# 📊 MÉTRICAS DEL CICLO DE VIDA
+# =================================================================
+
+
+async def test_lifecycle_counts_sockets_and_reconnects(manager: ConnectionManager):
+    # Arrange
+    lobby, first, second, resumed = (AsyncMock() for _ in range(4))
+    await manager.connect(lobby)
+    await manager.connect(first, game_id=1, player_id=2)
+
+    # Act
+    manager.disconnect(first)
+    await manager.connect(second, game_id=1, player_id=2)
+    await manager.connect(resumed, game_id=1, player_id=3, since=0)
+    stats = manager.get_stats().lifecycle
+
+    # Assert
+    assert (stats.lobby_sockets, stats.game_sockets, stats.games) == (1, 2, 1)
+    assert (stats.connects, stats.disconnects, stats.reconnects) == (4, 1, 2)
+    assert manager.get_stats().heartbeat == POLICY
+
+
+async def test_old_disconnections_are_pruned_without_heartbeats():
+    # Arrange: latidos apagados, dos salidas viejas y una reciente
+    manager = ConnectionManager(heartbeat=HeartbeatPolicy(interval_s=0))
+    long_ago = time.monotonic() - RECONNECT_WINDOW_S - 1
+    manager.recently_disconnected[(1, 7)] = long_ago
+    manager.recently_disconnected[(1, 8)] = long_ago
+    first, second = AsyncMock(), AsyncMock()
+
+    # Act
+    await manager.connect(first, game_id=2, player_id=3)
+    manager.recently_disconnected[(1, 9)] = long_ago
+    await manager.connect(second, game_id=2, player_id=4)
+    manager.disconnect(first)
+
+    # Assert
+    assert list(manager.recently_disconnected) == [(2, 3)]
+    await manager.shutdown()
+
+
+async def test_is_pong():
+    # Act & Assert
+    assert is_pong(PONG)
+    assert not is_pong("pong")
+    assert not is_pong('{"event": "pong"}')
+
+
+async def test_load_heartbeat_policy_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(HEARTBEAT_ENV_PREFIX + "INTERVAL_S", "0")
+    monkeypatch.setenv(HEARTBEAT_ENV_PREFIX + "GRACE_S", "5")
+    # Act
+    policy = load_heartbeat_policy()
+    # Assert
+    assert not policy.enabled
+    assert policy.grace_s == 5
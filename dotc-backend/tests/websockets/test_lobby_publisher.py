@@ -0,0 +1,192 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+
+from app.api.schemas import GameLobbyInfo, GameStatus
+from app.websockets.connection_manager import ConnectionManager
+from app.websockets.lobby_publisher import (
+    LOBBY_TICK_ENV,
+    LobbyPublisher,
+    load_lobby_publisher,
+)
+from app.websockets.protocol.details import (
+    GameCreatedDetails,
+    GameRemovedDetails,
+    GameUpdatedDetails,
+    ResyncRequiredDetails,
+)
+from app.websockets.protocol.events import WSEvent
+from app.websockets.protocol.messages import WSMessage
+
+pytestmark = pytest.mark.asyncio
+
+TICK_S = 0.01
+
+
+def lobby_game(game_id: int, player_count: int = 1) -> GameLobbyInfo:
+    return GameLobbyInfo(
+        id=game_id,
+        name=f"Partida {game_id}",
+        min_players=2,
+        max_players=6,
+        player_count=player_count,
+        host_id=1,
+        game_status=GameStatus.LOBBY,
+        password=None,
+    )
+
+
+def created(game_id: int) -> WSMessage:
+    return WSMessage(details=GameCreatedDetails(game=lobby_game(game_id)))
+
+
+def updated(game_id: int, player_count: int) -> WSMessage:
+    return WSMessage(
+        details=GameUpdatedDetails(game=lobby_game(game_id, player_count))
+    )
+
+
+def removed(game_id: int) -> WSMessage:
+    return WSMessage(details=GameRemovedDetails(game_id=game_id))
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = ConnectionManager(lobby_publisher=LobbyPublisher(tick_s=TICK_S))
+    yield manager
+    await manager.shutdown()
+
+
+async def wait_tick(manager: ConnectionManager):
+    await asyncio.sleep(TICK_S * 3)
+    await manager.drain()
+
+
+def sent_frames(ws: AsyncMock) -> list:
+    return [json.loads(c.args[0]) for c in ws.send_text.await_args_list]
+
+
+# =================================================================
+# 🧮 REGLAS DE FUSIÓN
+# =================================================================
+
+
+async def test_storm_is_sent_as_one_diff_per_tick(manager: ConnectionManager):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws)
+
+    # Act
+    await manager.broadcast_to_lobby(created(1))
+    await manager.broadcast_to_lobby(updated(1, player_count=2))
+    await manager.broadcast_to_lobby(updated(2, player_count=3))
+    await manager.broadcast_to_lobby(updated(2, player_count=4))
+    await manager.broadcast_to_lobby(removed(3))
+    await manager.drain()
+    # Assert: nada sale antes del tick
+    ws.send_text.assert_not_awaited()
+    await wait_tick(manager)
+
+    # Assert
+    (frame,) = sent_frames(ws)
+    diff = frame["details"]
+    assert diff["event"] == WSEvent.LOBBY_DIFF.value
+    assert [g["player_count"] for g in diff["created"]] == [2]
+    assert [(g["id"], g["player_count"]) for g in diff["updated"]] == [(2, 4)]
+    assert diff["removed"] == [3]
+    assert manager.lobby_publisher.changes_received == 5
+    assert manager.lobby_publisher.frames_sent == 1
+
+
+async def test_created_then_removed_in_same_tick_is_not_sent(
+    manager: ConnectionManager,
+):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws)
+
+    # Act
+    await manager.broadcast_to_lobby(created(1))
+    await manager.broadcast_to_lobby(removed(1))
+    await wait_tick(manager)
+
+    # Assert
+    ws.send_text.assert_not_awaited()
+
+
+async def test_removed_then_created_with_reused_id_is_an_update():
+    # Arrange
+    publisher = LobbyPublisher(tick_s=60)
+    sent = []
+    publisher.bind(sent.append)
+
+    # Act
+    publisher.publish(removed(1))
+    publisher.publish(created(1))
+    publisher.flush()
+
+    # Assert
+    (message,) = sent
+    assert [g.id for g in message.details.updated] == [1]
+    assert message.details.created == [] and message.details.removed == []
+
+
+async def test_non_lobby_messages_are_sent_immediately(
+    manager: ConnectionManager,
+):
+    # Arrange
+    ws = AsyncMock()
+    await manager.connect(ws)
+    message = WSMessage(details=ResyncRequiredDetails(reason="test"))
+
+    # Act
+    await manager.broadcast_to_lobby(message)
+    await manager.drain()
+
+    # Assert
+    ws.send_text.assert_awaited_once_with(message.model_dump_json())
+
+
+async def test_shutdown_flushes_pending_changes():
+    # Arrange
+    publisher = LobbyPublisher(tick_s=60)
+    manager = ConnectionManager(lobby_publisher=publisher)
+    await manager.broadcast_to_lobby(created(1))
+
+    # Act
+    await manager.shutdown()
+
+    # Assert
+    assert publisher.pending == {}
+    assert publisher.frames_sent == 1
+
+
+# =================================================================
+# ⚙️ CONFIGURACIÓN
+# =================================================================
+
+
+async def test_load_lobby_publisher_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(LOBBY_TICK_ENV, "250")
+    # Act
+    publisher = load_lobby_publisher()
+    # Assert
+    assert publisher.tick_s == 0.25
+
+
+async def test_lobby_coalescing_is_off_by_default(monkeypatch):
+    # Arrange: el frontend todavía solo entiende los eventos originales
+    monkeypatch.delenv(LOBBY_TICK_ENV, raising=False)
+    # Act & Assert
+    assert load_lobby_publisher() is None
+
+
+async def test_load_lobby_publisher_disabled_with_zero(monkeypatch):
+    # Arrange
+    monkeypatch.setenv(LOBBY_TICK_ENV, "0")
+    # Act & Assert
+    assert load_lobby_publisher() is None
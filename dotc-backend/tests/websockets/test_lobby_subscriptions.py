@@ -0,0 +1,216 @@
+import json
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+
+from app.api.schemas import GameLobbyInfo, GameStatus
+from app.websockets.connection_manager import ConnectionManager
+from app.websockets.lobby_publisher import LobbyPublisher
+from app.websockets.lobby_subscriptions import LobbySubscription
+from app.websockets.protocol.details import (
+    GameCreatedDetails,
+    GameRemovedDetails,
+    GameUpdatedDetails,
+)
+from app.websockets.protocol.events import WSEvent
+from app.websockets.protocol.messages import WSMessage
+
+pytestmark = pytest.mark.asyncio
+
+
+def lobby_game(
+    game_id: int,
+    player_count: int = 1,
+    name: str = "Partida",
+    status: GameStatus = GameStatus.LOBBY,
+) -> GameLobbyInfo:
+    return GameLobbyInfo(
+        id=game_id,
+        name=name,
+        min_players=2,
+        max_players=4,
+        player_count=player_count,
+        host_id=1,
+        game_status=status,
+        password=None,
+    )
+
+
+def created(game: GameLobbyInfo) -> WSMessage:
+    return WSMessage(details=GameCreatedDetails(game=game))
+
+
+def updated(game: GameLobbyInfo) -> WSMessage:
+    return WSMessage(details=GameUpdatedDetails(game=game))
+
+
+def events(ws: AsyncMock) -> list:
+    return [
+        json.loads(c.args[0])["details"] for c in ws.send_text.await_args_list
+    ]
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = ConnectionManager()
+    yield manager
+    await manager.shutdown()
+
+
+async def connect(manager: ConnectionManager, **filters) -> AsyncMock:
+    ws = AsyncMock()
+    subscription = LobbySubscription(**filters) if filters else None
+    await manager.connect(ws, subscription=subscription)
+    return ws
+
+
+# =================================================================
+# 🔎 RUTEO POR FILTROS
+# =================================================================
+
+
+async def test_unfiltered_sockets_receive_everything(manager: ConnectionManager):
+    # Arrange
+    ws = await connect(manager)
+    # Act
+    await manager.broadcast_to_lobby(created(lobby_game(1, name="Zeta")))
+    await manager.drain()
+    # Assert
+    assert [e["game"]["id"] for e in events(ws)] == [1]
+    assert manager.lobby_subscriptions == {}
+
+
+async def test_only_matching_games_are_routed(manager: ConnectionManager):
+    # Arrange
+    alpha = await connect(manager, name_prefix="al")
+    free = await connect(manager, has_free_seats=True)
+
+    # Act
+    await manager.broadcast_to_lobby(created(lobby_game(1, name="Alpha")))
+    await manager.broadcast_to_lobby(
+        created(lobby_game(2, player_count=4, name="Beta"))
+    )
+    await manager.drain()
+
+    # Assert
+    assert [e["game"]["id"] for e in events(alpha)] == [1]
+    assert [e["game"]["id"] for e in events(free)] == [1]
+
+
+async def test_game_leaving_the_filter_is_sent_as_removed(
+    manager: ConnectionManager,
+):
+    # Arrange
+    ws = await connect(manager, status=GameStatus.LOBBY, has_free_seats=True)
+    await manager.broadcast_to_lobby(created(lobby_game(1, player_count=3)))
+
+    # Act: se llena, se libera un lugar y arranca
+    await manager.broadcast_to_lobby(updated(lobby_game(1, player_count=4)))
+    await manager.broadcast_to_lobby(updated(lobby_game(1, player_count=4)))
+    await manager.broadcast_to_lobby(updated(lobby_game(1, player_count=3)))
+    await manager.broadcast_to_lobby(
+        updated(lobby_game(1, player_count=3, status=GameStatus.IN_PROGRESS))
+    )
+    await manager.drain()
+
+    # Assert
+    assert [e["event"] for e in events(ws)] == [
+        WSEvent.GAME_CREATED.value,
+        WSEvent.GAME_REMOVED.value,
+        WSEvent.GAME_CREATED.value,
+        WSEvent.GAME_REMOVED.value,
+    ]
+
+
+async def test_unknown_previous_state_is_sent_conservatively(
+    manager: ConnectionManager,
+):
+    # Arrange
+    ws = await connect(manager, has_free_seats=True)
+
+    # Act: partidas que el servidor no vio crearse
+    await manager.broadcast_to_lobby(updated(lobby_game(1, player_count=2)))
+    await manager.broadcast_to_lobby(updated(lobby_game(2, player_count=4)))
+    await manager.broadcast_to_lobby(
+        WSMessage(details=GameRemovedDetails(game_id=3))
+    )
+    await manager.drain()
+
+    # Assert
+    assert [e["event"] for e in events(ws)] == [
+        WSEvent.GAME_UPDATED.value,
+        WSEvent.GAME_REMOVED.value,
+        WSEvent.GAME_REMOVED.value,
+    ]
+
+
+async def test_page_bounds_limit_the_routed_games(manager: ConnectionManager):
+    # Arrange
+    ws = await connect(manager, after=10, until=20)
+
+    # Act
+    for game_id in (10, 11, 20, 21):
+        await manager.broadcast_to_lobby(created(lobby_game(game_id)))
+    await manager.drain()
+
+    # Assert
+    assert [e["game"]["id"] for e in events(ws)] == [11, 20]
+
+
+async def test_equal_subscriptions_share_one_serialization(
+    manager: ConnectionManager, monkeypatch
+):
+    # Arrange
+    sockets = [await connect(manager, name_prefix="a") for _ in range(3)]
+    calls = []
+    original = LobbySubscription.view
+    monkeypatch.setattr(
+        LobbySubscription,
+        "view",
+        lambda self, *args: calls.append(self) or original(self, *args),
+    )
+
+    # Act
+    await manager.broadcast_to_lobby(created(lobby_game(1, name="a")))
+    await manager.drain()
+
+    # Assert
+    assert len(calls) == 1
+    assert all(len(events(ws)) == 1 for ws in sockets)
+
+
+async def test_disconnect_forgets_subscription(manager: ConnectionManager):
+    # Arrange
+    ws = await connect(manager, name_prefix="a")
+    # Act
+    manager.disconnect(ws)
+    # Assert
+    assert manager.lobby_subscriptions == {}
+
+
+async def test_coalesced_diff_is_filtered_per_subscriber():
+    # Arrange
+    publisher = LobbyPublisher(tick_s=60)
+    manager = ConnectionManager(lobby_publisher=publisher)
+    ws = await connect(manager, name_prefix="al")
+    await manager.broadcast_to_lobby(created(lobby_game(1, name="Alpha")))
+    await manager.broadcast_to_lobby(created(lobby_game(2, name="Beta")))
+    publisher.flush()
+
+    # Act
+    await manager.broadcast_to_lobby(updated(lobby_game(1, 2, name="Beta")))
+    await manager.broadcast_to_lobby(updated(lobby_game(2, 2, name="Beta")))
+    publisher.flush()
+    await manager.drain()
+
+    # Assert
+    first, second = events(ws)
+    assert [g["id"] for g in first["created"]] == [1]
+    assert second == {
+        "event": WSEvent.LOBBY_DIFF.value,
+        "created": [],
+        "updated": [],
+        "removed": [1],
+    }
+    await manager.shutdown()
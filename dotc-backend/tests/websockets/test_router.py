@@ -8,6 +8,8 @@ Estos tests verifican que los endpoints estén correctamente definidos.
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.dependencies.dependencies import get_websocket_manager
+from app.websockets.lobby_subscriptions import LobbySubscription
 
 
 class TestWebSocketRouter:
@@ -132,3 +134,28 @@ class TestWebSocketRouterIntegration:
         lobby_routes = [r for r in ws_routes if "mainscreen" in r]
         
         assert len(lobby_routes) >= 1
+
+
+class TestWebSocketLobbySubscription:
+    """Suite de tests para los filtros de /ws/mainscreen."""
+
+    def test_lobby_query_params_build_the_subscription(self):
+        """Verifica que los parámetros de la URL lleguen como suscripción."""
+        # Arrange
+        manager = get_websocket_manager()
+        client = TestClient(app)
+
+        # Act
+        with client.websocket_connect(
+            "/ws/mainscreen?status=LOBBY&name_prefix=Sal&has_free_seats=true&after=5&until=9"
+        ):
+            subscriptions = list(manager.lobby_subscriptions.values())
+
+        # Assert
+        assert LobbySubscription(
+            status="LOBBY",
+            name_prefix="Sal",
+            has_free_seats=True,
+            after=5,
+            until=9,
+        ) in subscriptions
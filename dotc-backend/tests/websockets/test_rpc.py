@@ -0,0 +1,150 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.schemas import DrawCardRequest, DrawCardResponse, GeneralActionResponse
+from app.dependencies.dependencies import get_rpc_dispatcher
+from app.game.exceptions import CardNotFound, GameError, GameFull, NotYourTurn
+from app.main import app
+from app.websockets.rpc import RpcDispatcher, parse_rpc_frame
+
+GAME_ID = 3
+PLAYER_ID = 8
+
+
+@pytest.fixture
+def game_manager() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def dispatcher(game_manager: AsyncMock) -> RpcDispatcher:
+    @asynccontextmanager
+    async def open_game_manager():
+        yield game_manager
+
+    return RpcDispatcher(open_game_manager)
+
+
+# =================================================================
+# 📨 PEDIDOS Y RESPUESTAS
+# =================================================================
+
+
+@pytest.mark.asyncio
+async def test_action_is_routed_with_ids_from_the_socket(
+    dispatcher: RpcDispatcher, game_manager: AsyncMock
+):
+    # Arrange
+    game_manager.draw_card.return_value = DrawCardResponse(detail="ok")
+    frame = {
+        "id": 7,
+        "action": "draw",
+        # Los ids del payload se pisan con los del socket
+        "payload": {"source": "deck", "player_id": 99, "game_id": 99},
+    }
+
+    # Act
+    response = await dispatcher.handle(frame, GAME_ID, PLAYER_ID)
+
+    # Assert
+    assert (response.id, response.ok, response.status) == (7, True, 200)
+    assert response.result["detail"] == "ok"
+    game_manager.draw_card.assert_awaited_once_with(
+        DrawCardRequest(source="deck", game_id=GAME_ID, player_id=PLAYER_ID)
+    )
+
+
+@pytest.mark.parametrize(
+    "error, status",
+    [
+        (CardNotFound("no está"), 404),
+        (GameFull("llena"), 409),
+        (NotYourTurn("no es tu turno"), 403),
+        (GameError("otro"), 500),
+    ],
+)
+@pytest.mark.asyncio
+async def test_game_errors_keep_the_http_status(
+    dispatcher: RpcDispatcher, game_manager: AsyncMock, error, status
+):
+    # Arrange
+    game_manager.discard_card.side_effect = error
+    frame = {"id": "a", "action": "discard", "payload": {"card_id": 1}}
+
+    # Act
+    response = await dispatcher.handle(frame, GAME_ID, PLAYER_ID)
+
+    # Assert
+    assert (response.id, response.ok, response.status) == ("a", False, status)
+    assert response.detail == error.detail
+
+
+@pytest.mark.asyncio
+async def test_unknown_action_and_invalid_payload_are_rejected(
+    dispatcher: RpcDispatcher, game_manager: AsyncMock
+):
+    # Act
+    unknown = await dispatcher.handle(
+        {"id": 1, "action": "cheat"}, GAME_ID, PLAYER_ID
+    )
+    invalid = await dispatcher.handle(
+        {"id": 2, "action": "discard", "payload": {}}, GAME_ID, PLAYER_ID
+    )
+
+    # Assert
+    assert (unknown.id, unknown.status) == (1, 400)
+    assert (invalid.id, invalid.status) == (2, 422)
+    game_manager.discard_card.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_non_rpc_frames_are_ignored():
+    # Act & Assert
+    assert parse_rpc_frame("ping") is None
+    assert parse_rpc_frame('{"event": "X", "details": {}}') is None
+    assert parse_rpc_frame('{"id": 1, "action": "draw"}') == {
+        "id": 1,
+        "action": "draw",
+    }
+
+
+# =================================================================
+# 🔌 POR EL WEBSOCKET DE LA PARTIDA
+# =================================================================
+
+
+def test_reply_comes_back_on_the_same_socket(game_manager: AsyncMock):
+    # Arrange
+    game_manager.finish_turn.return_value = GeneralActionResponse(detail="fin")
+
+    @asynccontextmanager
+    async def open_game_manager():
+        yield game_manager
+
+    app.dependency_overrides[get_rpc_dispatcher] = lambda: RpcDispatcher(
+        open_game_manager
+    )
+    client = TestClient(app)
+
+    # Act
+    try:
+        with client.websocket_connect(
+            f"/ws/game/{GAME_ID}/player/{PLAYER_ID}"
+        ) as ws:
+            ws.send_text("ping")
+            ws.send_json({"id": 42, "action": "finish-turn"})
+            reply = ws.receive_json()
+    finally:
+        app.dependency_overrides.pop(get_rpc_dispatcher, None)
+
+    # Assert
+    assert reply["type"] == "rpc_result"
+    assert (reply["id"], reply["ok"], reply["result"]["detail"]) == (
+        42,
+        True,
+        "fin",
+    )
+    assert game_manager.finish_turn.await_args.args[0].player_id == PLAYER_ID